@@ -0,0 +1,6 @@
+"""Performance benchmarks for the card processing pipeline.
+
+Run a benchmark as a module from the repository root, for example::
+
+    python -m benchmarks.bench_card_stream --size-mb 400
+"""
@@ -0,0 +1,75 @@
+"""Benchmark: BatchProcessor with fixed chunk sizes versus adaptive sizing.
+
+Filters the cards of a synthetic dump with several fixed chunk sizes and with
+an ``AdaptiveBatchSizer`` starting from the smallest one, reporting the
+throughput of each run and, for the adaptive run, the chunk size and worker
+count it settled on and the number of changes it made.
+
+Usage::
+
+    python -m benchmarks.bench_batch_adaptive --size-mb 50 --backend thread --workers 4
+"""
+
+import argparse
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.adaptive import AdaptiveBatchSizer
+from src.processing.batch import BatchProcessor, BatchStatistics
+from .bench_batch_backends import FILTERS, SCHEMA
+from .synthetic import dump_path, load_cards
+
+
+def run(
+    cards: List[dict],
+    backend: str,
+    workers: int,
+    batch_size: int,
+    sizer: Optional[AdaptiveBatchSizer] = None
+) -> Tuple[float, BatchStatistics]:
+    """Process every card and return the elapsed seconds and final statistics."""
+    with BatchProcessor(
+        CardProcessorInterface(CardFilterConfig()),
+        logging.getLogger(__name__),
+        backend=backend,
+        max_workers=workers,
+    ) as processor:
+        start = time.perf_counter()
+        for _, stats in processor.process_batch(
+            cards, filters=FILTERS, schema=SCHEMA, batch_size=batch_size, timeout=600, adaptive=sizer
+        ):
+            pass
+        return time.perf_counter() - start, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--backend", default="thread", help="Executor backend")
+    parser.add_argument("--workers", type=int, default=4, help="Number of workers")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Fixed chunk sizes to try")
+    parser.add_argument("--target-latency", type=float, default=0.1, help="Adaptive target seconds per chunk")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    print(f"{len(cards)} cards, {os.cpu_count()} CPUs, {args.backend} x{args.workers}")
+
+    for batch_size in args.batch_sizes:
+        elapsed, _ = run(cards, args.backend, args.workers, batch_size)
+        print(f"fixed {batch_size:<6}  {elapsed:7.2f}s  {len(cards) / elapsed:10,.0f} cards/s")
+
+    sizer = AdaptiveBatchSizer(target_latency=args.target_latency)
+    elapsed, stats = run(cards, args.backend, args.workers, min(args.batch_sizes), sizer)
+    print(
+        f"adaptive      {elapsed:7.2f}s  {len(cards) / elapsed:10,.0f} cards/s"
+        f"  settled on {stats.batch_size} cards x{stats.workers} after {stats.sizing_changes} changes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: BatchProcessor executor backends.
+
+Runs the same filter and schema projection over the cards of a synthetic dump
+with each executor backend and several worker counts, reporting throughput and
+the speedup over the serial backend. The thread backend is bound by the GIL;
+the process backend scales with the number of cores, but every card is
+pickled to a worker and every result back, so it only pays off when the
+per-card work outweighs that transfer and more than one core is available.
+
+Usage::
+
+    python -m benchmarks.bench_batch_backends --size-mb 50 --workers 1 2 4 8
+"""
+
+import argparse
+import concurrent.futures
+import logging
+import os
+import time
+from typing import Any, Dict, List
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.batch import BatchProcessor
+from .synthetic import dump_path, load_cards
+
+FILTERS: Dict[str, Any] = {
+    "colors": {"contains": "W"},
+    "convertedManaCost": {"lte": 4},
+}
+SCHEMA: List[str] = ["name", "type", "colors", "convertedManaCost", "text"]
+
+
+def run(cards: List[dict], backend: str, workers: int, batch_size: int) -> float:
+    """Process every card with one backend and return the elapsed seconds."""
+    processor = BatchProcessor(
+        CardProcessorInterface(CardFilterConfig()),
+        logging.getLogger(__name__),
+        backend=backend,
+        max_workers=workers,
+    )
+    start = time.perf_counter()
+    for _ in processor.process_batch(cards, filters=FILTERS, schema=SCHEMA, batch_size=batch_size, timeout=600):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to try")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Cards per chunk")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    print(f"{len(cards)} cards, {os.cpu_count()} CPUs")
+
+    serial = run(cards, "serial", 1, args.batch_size)
+    print(f"serial           {serial:7.2f}s  {len(cards) / serial:10,.0f} cards/s")
+
+    backends = ["thread", "process"]
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        backends.append("interpreter")
+    for backend in backends:
+        for workers in args.workers:
+            elapsed = run(cards, backend, workers, args.batch_size)
+            print(
+                f"{backend:<11} x{workers:<3} {elapsed:7.2f}s  {len(cards) / elapsed:10,.0f} cards/s"
+                f"  {serial / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: BatchProcessor with and without pipelined delivery.
+
+Filters the cards of a synthetic dump on the process backend and writes every
+chunk to a JSON lines file as it arrives, once waiting for each chunk before
+submitting the next and once with a window of chunks in flight. Writing can
+be slowed down with ``--write-ms`` to stand in for a slow disk or network
+sink; with the window, the workers filter the next chunks meanwhile. With a
+single core, only the time the writer spends waiting can overlap.
+
+Usage::
+
+    python -m benchmarks.bench_batch_pipeline --size-mb 50 --depths 1 2 4 --write-ms 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import List
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.batch import BatchProcessor
+from .bench_batch_backends import FILTERS, SCHEMA
+from .synthetic import dump_path, load_cards
+
+
+def run(cards: List[dict], backend: str, workers: int, batch_size: int, depth: int, write_ms: float) -> float:
+    """Filter and write every card and return the elapsed seconds."""
+    with BatchProcessor(
+        CardProcessorInterface(CardFilterConfig()),
+        logging.getLogger(__name__),
+        backend=backend,
+        max_workers=workers,
+    ) as processor, tempfile.TemporaryFile("w", encoding="utf-8") as output:
+        # Start the pool outside the measurement
+        processor.process_batch_chunk(cards[:100], FILTERS, SCHEMA, None, timeout=600)
+        start = time.perf_counter()
+        for processed_chunk, _ in processor.process_batch(
+            cards, filters=FILTERS, schema=SCHEMA, batch_size=batch_size, timeout=600, pipeline_depth=depth
+        ):
+            for card in processed_chunk:
+                output.write(json.dumps(card) + "\n")
+            time.sleep(write_ms / 1000)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--backend", default="process", help="Executor backend")
+    parser.add_argument("--workers", type=int, default=2, help="Number of workers")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Cards per chunk")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 4], help="Pipeline depths to try")
+    parser.add_argument("--write-ms", type=float, default=20, help="Extra time spent writing each chunk")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    print(f"{len(cards)} cards, {os.cpu_count()} CPUs, {args.backend} x{args.workers}")
+
+    baseline = None
+    for depth in args.depths:
+        elapsed = run(cards, args.backend, args.workers, args.batch_size, depth, args.write_ms)
+        baseline = baseline or elapsed
+        print(f"depth {depth:<3} {elapsed:7.2f}s  {len(cards) / elapsed:10,.0f} cards/s  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
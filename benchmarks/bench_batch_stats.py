@@ -0,0 +1,107 @@
+"""Benchmark: per-card locked counters versus per-worker counters.
+
+Filters the cards of a synthetic dump on a thread pool, counting each card
+either in shared counters guarded by a lock taken for every card, or in
+``WorkerCounters`` owned by each task and merged into ``BatchStatistics``
+once per chunk, without and with the timing of every card. A full
+``process_batch`` run is then exported with ``BatchStatistics.to_record``.
+
+Usage::
+
+    python -m benchmarks.bench_batch_stats --size-mb 50 --workers 4
+"""
+
+import argparse
+import functools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.batch import BatchProcessor, BatchStatistics
+from src.utils.stats import WorkerCounters
+from .synthetic import dump_path, load_cards
+
+FILTERS: Dict[str, Any] = {"colors": {"contains": "W"}}
+SCHEMA: List[str] = ["name", "type", "colors"]
+
+
+def locked(processor: CardProcessorInterface, chunks: List[List[dict]], workers: int) -> float:
+    """Count every card in shared counters under a lock."""
+    stats = BatchStatistics()
+    lock = threading.Lock()
+
+    def task(chunk: List[dict]) -> None:
+        for card in chunk:
+            result = processor.process_card(card, FILTERS, SCHEMA, None)
+            with lock:
+                if result is None:
+                    stats.filtered_cards += 1
+                else:
+                    stats.processed_cards += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(task, chunks))
+    return time.perf_counter() - start
+
+
+def per_worker(
+    processor: CardProcessorInterface, chunks: List[List[dict]], workers: int, timed: bool = False
+) -> float:
+    """Count, and optionally time, every card in the task's own counters, merged per chunk."""
+    stats = BatchStatistics()
+
+    def task(chunk: List[dict]) -> None:
+        counters = WorkerCounters()
+        for card in chunk:
+            started = time.perf_counter()
+            result = processor.process_card(card, FILTERS, SCHEMA, None)
+            if timed:
+                counters.latency.record(time.perf_counter() - started)
+            if result is None:
+                counters.filtered += 1
+            else:
+                counters.processed += 1
+        stats.merge(counters)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(task, chunks))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Cards per chunk")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    chunks = [cards[i:i + args.batch_size] for i in range(0, len(cards), args.batch_size)]
+    processor = CardProcessorInterface(CardFilterConfig())
+
+    runs = (
+        ("locked per card", locked),
+        ("per-worker", per_worker),
+        ("per-worker timed", functools.partial(per_worker, timed=True)),
+    )
+    for name, run in runs:
+        elapsed = min(run(processor, chunks, args.workers) for _ in range(5))
+        print(f"{name:16} {elapsed:7.3f}s  {len(cards) / elapsed:10,.0f} cards/s")
+
+    with BatchProcessor(processor, logging.getLogger(__name__), max_workers=args.workers) as batch:
+        for _, stats in batch.process_batch(cards, filters=FILTERS, schema=SCHEMA, batch_size=args.batch_size):
+            pass
+    record = stats.to_record()
+    record["card_latency"].pop("buckets")
+    print(json.dumps(record, indent=2))
+
+
+if __name__ == "__main__":
+    main()
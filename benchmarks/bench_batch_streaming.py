@@ -0,0 +1,59 @@
+"""Benchmark: BatchProcessor on a loaded card list versus a card stream.
+
+Processes a synthetic dump twice: once from a list of every card loaded up
+front, once straight from ``CardStreamReader`` with lazy chunking and
+prefetching. Reports the time and the peak traced memory of each run; the
+streamed run's peak should not grow with the size of the dump. Times include
+the tracing overhead, which is heavier for the streamed run's many small
+allocations, so compare them only with each other across dump sizes.
+
+Usage::
+
+    python -m benchmarks.bench_batch_streaming --size-mb 50
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.io.parsers.card_stream import CardStreamReader, open_input_stream
+from src.processing.batch import BatchProcessor
+from .synthetic import dump_path, load_cards
+
+
+def measure(name: str, cards: Callable[[], Iterable[dict]], processor: BatchProcessor) -> None:
+    """Process the cards once, printing the elapsed time and traced peak."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = 0
+    for processed_chunk, stats in processor.process_batch(cards(), schema=["name", "type"], batch_size=1000):
+        count += len(processed_chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {elapsed:7.2f}s  peak {peak / 2**20:7.1f} MiB  {count} of {stats.total_cards} cards")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    path = dump_path(args.size_mb)
+
+    def streamed() -> Iterable[dict]:
+        with open(path, "rb") as dump:
+            for _, card in CardStreamReader(open_input_stream(dump)).iter_cards():
+                yield card
+
+    with BatchProcessor(CardProcessorInterface(CardFilterConfig()), logging.getLogger(__name__)) as processor:
+        measure("list", lambda: load_cards(path), processor)
+        measure("stream", streamed, processor)
+
+
+if __name__ == "__main__":
+    main()
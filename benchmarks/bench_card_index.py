@@ -0,0 +1,95 @@
+"""Benchmark: card resolution by archive scan versus ``CardIndex``.
+
+Resolves the same deck list references against a loaded synthetic archive
+with the former scans (every card of the requested set for the exact match,
+every card of every other set for the fallback) and with ``CardMatcher``,
+which builds a ``CardIndex`` once and reuses it for every deck.
+
+Usage::
+
+    python -m benchmarks.bench_card_index --size-mb 50 --decks 20 --deck-size 60
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from src.analysis.card_resolver import CardMatcher
+from src.utils.models import CardReference
+from .synthetic import dump_path
+
+
+def legacy_find_card(card_ref: CardReference, archive_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Find a card the way the former implementation did."""
+    def matches(name: str) -> bool:
+        return name.startswith(card_ref.name + " //") or name == card_ref.name
+
+    data = archive_data["data"]
+    for card in data.get(card_ref.set_code, {}).get("cards", []):
+        if matches(card.get("name", "")) and str(card.get("number", "")) == card_ref.collector_number:
+            return card
+    for set_code, set_data in data.items():
+        if set_code == card_ref.set_code:
+            continue
+        for card in set_data.get("cards", []):
+            if matches(card.get("name", "")):
+                return card
+    return None
+
+
+def make_decks(archive_data: Dict[str, Any], decks: int, deck_size: int) -> List[List[CardReference]]:
+    """Build deck lists of random cards, a quarter of them from the wrong set."""
+    cards = [card for set_data in archive_data["data"].values() for card in set_data["cards"]]
+    rng = random.Random(1)
+    return [
+        [
+            CardReference(
+                name=card["name"],
+                set_code="XXX" if index % 4 == 0 else card["setCode"],
+                collector_number=str(card["number"]),
+                quantity=1,
+            )
+            for index, card in enumerate(rng.sample(cards, deck_size))
+        ]
+        for _ in range(decks)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--decks", type=int, default=20, help="Number of deck lists to resolve")
+    parser.add_argument("--deck-size", type=int, default=60, help="Number of entries per deck list")
+    args = parser.parse_args()
+
+    with open(dump_path(args.size_mb), encoding="utf-8") as archive_file:
+        archive_data = json.load(archive_file)
+    decks = make_decks(archive_data, args.decks, args.deck_size)
+    references = sum(len(deck) for deck in decks)
+
+    start = time.perf_counter()
+    legacy = [legacy_find_card(card_ref, archive_data) for deck in decks for card_ref in deck]
+    print(f"scan             {time.perf_counter() - start:7.3f}s  {references} references")
+
+    matcher = CardMatcher(logging.getLogger(__name__))
+    start = time.perf_counter()
+    index = matcher.get_index(archive_data)
+    print(f"index build      {time.perf_counter() - start:7.3f}s  {index.card_count} cards")
+
+    # Fallback candidates are always printed; keep them out of the report
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        indexed = [matcher.find_card(card_ref, archive_data) for deck in decks for card_ref in deck]
+    print(f"index lookups    {time.perf_counter() - start:7.3f}s  {references} references")
+
+    if any(a is not b for a, b in zip(legacy, indexed)):
+        raise SystemExit("Indexed resolution differs from the scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark: copy-free card projection in ``process_card``.
+
+Processes the cards of a synthetic dump the former way, copying each card in
+``create_base_card`` and again, or into a projection, in ``apply_schema``,
+and through ``project_card``, which builds the output dict straight from the
+raw card. For each schema, reports the time per card and, measured with
+``tracemalloc``, the peak memory allocated while processing a card and the
+memory the output keeps. The peak includes the output; the difference is the
+intermediate copies.
+
+Usage::
+
+    python -m benchmarks.bench_card_projection --size-mb 50 --sample 5000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from .synthetic import dump_path, load_cards
+
+Project = Callable[[dict], dict]
+
+
+def legacy(processor: CardProcessorInterface, schema: Optional[List[str]], languages: Optional[List[str]]) -> Project:
+    """Project cards the way the former implementation did."""
+    def project(card: dict) -> dict:
+        processed_card = processor.create_base_card(card)
+        processed_card = processor._process_language_data(processed_card, card, languages)
+        return processor._apply_final_schema(processed_card, schema)
+    return project
+
+
+def copy_free(processor: CardProcessorInterface, schema: Optional[List[str]], languages: Optional[List[str]]) -> Project:
+    """Project cards through ``project_card``."""
+    def project(card: dict) -> dict:
+        return processor.project_card(card, schema, languages)
+    return project
+
+
+def timed(project: Project, cards: List[dict]) -> float:
+    """Return the best time per card over three runs, in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for card in cards:
+            project(card)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def allocations(project: Project, cards: List[dict]) -> Tuple[float, float]:
+    """Return the mean peak bytes allocated and bytes kept per card."""
+    peak_total = 0
+    results = []
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for card in cards:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results.append(project(card))
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+        kept = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return peak_total / len(cards), kept / len(cards)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--sample", type=int, default=5000, help="Cards measured with tracemalloc")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    sample = cards[:args.sample]
+    processor = CardProcessorInterface(CardFilterConfig())
+    cases: Dict[str, Tuple[Optional[List[str]], Optional[List[str]]]] = {
+        "default schema": (CardFilterConfig().default_schema, None),
+        "no schema": (None, None),
+        "no schema, German": (None, ["German"]),
+    }
+    print(f"{len(cards)} cards, {len(sample)} traced")
+    for name, (schema, languages) in cases.items():
+        for label, build in (("copying", legacy), ("copy-free", copy_free)):
+            project = build(processor, schema, languages)
+            per_card = timed(project, cards)
+            peak, kept = allocations(project, sample)
+            print(f"{name:18} {label:9} {per_card:6.2f} us/card  {peak:6.0f} B peak/card  {kept:6.0f} B kept/card")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: card stream parse throughput.
+
+Compares the former per-event prefix dispatch, which rebuilt each card from
+``(prefix, event, value)`` tuples, with ``CardStreamReader.iter_cards``, which
+builds whole card objects in ijson's C backend.
+
+Usage::
+
+    python -m benchmarks.bench_card_stream --size-mb 400
+    python -m benchmarks.bench_card_stream --input AllPrintings.json
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict
+
+import ijson
+
+from src.io.parsers.card_stream import CardStreamReader, open_input_stream
+from .synthetic import dump_path, write_dump
+
+
+def legacy_event_loop(path: str) -> int:
+    """Count cards using the former prefix-dispatch event loop."""
+    cards = 0
+    current_card: Dict[str, Any] = {}
+    with open(path, "rb") as infile:
+        for prefix, event, value in ijson.parse(infile):
+            if not prefix.startswith("data.") or prefix.endswith(".block"):
+                continue
+            set_name = prefix.split(".")[1]
+            if prefix.endswith(".cards.item"):
+                if event == "start_map":
+                    current_card = {}
+                elif event == "end_map":
+                    cards += 1
+            elif prefix.startswith(f"data.{set_name}.cards.item."):
+                current_card[prefix.split(".")[-1]] = value
+    return cards
+
+
+def card_stream(path: str) -> int:
+    """Count cards using the object-level card iterator."""
+    with open(path, "rb") as infile:
+        reader = CardStreamReader(open_input_stream(infile))
+        return sum(1 for _ in reader.iter_cards())
+
+
+def run(name: str, func: Callable[[str], int], path: str) -> float:
+    """Time one strategy and print its throughput."""
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    start = time.perf_counter()
+    cards = func(path)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {cards:>9} cards  {elapsed:7.2f}s  {size_mb / elapsed:8.1f} MB/s  {cards / elapsed:10.0f} cards/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="Existing dump to benchmark instead of a synthetic one")
+    parser.add_argument("--size-mb", type=float, default=400, help="Size of the synthetic dump")
+    parser.add_argument("--meta-last", action="store_true", help="Place meta after data in the synthetic dump")
+    args = parser.parse_args()
+
+    if args.input:
+        path = args.input
+    elif args.meta_last:
+        path = dump_path(args.size_mb).replace(".json", "-meta-last.json")
+        if not os.path.exists(path):
+            write_dump(path, args.size_mb, meta_first=False)
+    else:
+        path = dump_path(args.size_mb)
+
+    legacy = run("legacy event loop", legacy_event_loop, path)
+    stream = run("iter_cards", card_stream, path)
+    print(f"speedup: {legacy / stream:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
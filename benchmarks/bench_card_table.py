@@ -0,0 +1,72 @@
+"""Benchmark: filters run over a columnar ``CardTable``.
+
+Loads the cards of a synthetic dump once, then runs a set of queries both
+card by card, through the compiled ``FilterPlan`` on each card's filter view,
+and as ``CardTable`` masks evaluated once per distinct value. Reports the
+time to build the table, the time of each query either way, and checks that
+both select the same rows.
+
+Usage::
+
+    python -m benchmarks.bench_card_table --size-mb 50
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from src.analysis.card_table import CardTable
+from src.analysis.cards import CardProcessorInterface
+from src.processing.filters import compile_filters
+from .synthetic import dump_path, load_cards
+
+QUERIES: Dict[str, Dict[str, Any]] = {
+    "type": {"type": {"contains": "Creature"}},
+    "mana value range": {"manaValue": {"gte": 2, "lte": 4}},
+    "color and cost": {"colors": {"contains": "W"}, "convertedManaCost": {"lte": 3}},
+    "rarity in": {"rarity": {"in": ["rare", "mythic"]}, "edhrecSaltiness": {"gt": 0.5}},
+    "four fields": {
+        "colors": {"contains": "U"}, "manaValue": {"lt": 5},
+        "rarity": {"eq": "common"}, "type": {"eq": "Instant"},
+    },
+}
+
+
+def per_card(cards: List[dict], filters: Dict[str, Any]) -> List[int]:
+    """Select rows by evaluating the compiled plan on every card."""
+    plan = compile_filters(filters)
+    view = CardProcessorInterface.filter_view
+    return [row for row, card in enumerate(cards) if plan.matches(view(card, plan.fields))]
+
+
+def timed(query: Callable[[], List[int]]) -> float:
+    """Return the best time over three runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    start = time.perf_counter()
+    table = CardTable(cards)
+    print(f"{len(cards)} cards, table built in {time.perf_counter() - start:.2f}s")
+
+    for name, filters in QUERIES.items():
+        expected = per_card(cards, filters)
+        assert table.select(filters) == expected
+        before = timed(lambda: per_card(cards, filters))
+        after = timed(lambda: table.select(filters))
+        print(f"{name:16} per card {before:8.1f} ms  table {after:7.2f} ms  "
+              f"{before / after:6.1f}x  ({len(expected)} rows)")
+
+
+if __name__ == "__main__":
+    main()
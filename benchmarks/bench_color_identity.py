@@ -0,0 +1,81 @@
+"""Benchmark: color identity queries on WUBRG bitmasks.
+
+Finds the cards of a synthetic dump allowed under a commander's color
+identity, that is whose ``colorIdentity`` is a subset of it. Times a
+per-card check of every color against a set, the compiled ``subset``
+operator, which compares memoized bitmasks, a ``CardTable`` query
+evaluating it once per distinct identity, and ``CardTable.identity_mask``,
+a lookup once the index is built. All four select the same cards; the
+time of the masks alone, before reading rows back, is reported last.
+
+Usage::
+
+    python -m benchmarks.bench_color_identity --size-mb 50 --identity WU
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from src.analysis.card_table import CardTable
+from src.processing.filters import compile_filters
+from .synthetic import dump_path, load_cards
+
+
+def per_card_sets(cards: List[dict], identity: str) -> List[int]:
+    """Select rows by checking every color of every card against a set."""
+    allowed = set(identity)
+    return [row for row, card in enumerate(cards) if all(color in allowed for color in card["colorIdentity"])]
+
+
+def per_card_plan(cards: List[dict], identity: str) -> List[int]:
+    """Select rows with the compiled ``subset`` operator."""
+    plan = compile_filters({"colorIdentity": {"subset": identity}})
+    return [row for row, card in enumerate(cards) if plan(card)]
+
+
+def timed(query: Callable[[], List[int]]) -> float:
+    """Return the best time over three runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--identity", default="WU", help="Commander color identity")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    identity = args.identity
+    table = CardTable(cards)
+    start = time.perf_counter()
+    table.identity_mask(identity)
+    print(f"{len(cards)} cards, identity index built in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    expected = per_card_sets(cards, identity)
+    queries = {
+        "per card, sets": lambda: per_card_sets(cards, identity),
+        "per card, subset": lambda: per_card_plan(cards, identity),
+        "table subset query": lambda: table.select({"colorIdentity": {"subset": identity}}),
+        "identity index": lambda: table.rows(table.identity_mask(identity)),
+    }
+    baseline = None
+    for name, query in queries.items():
+        assert query() == expected
+        elapsed = timed(query)
+        baseline = baseline or elapsed
+        print(f"{name:20} {elapsed:8.2f} ms  {baseline / elapsed:6.1f}x  ({len(expected)} rows)")
+
+    subset = compile_filters({"colorIdentity": {"subset": identity}})
+    masked = timed(lambda: table.mask(subset))
+    looked_up = timed(lambda: table.identity_mask(identity))
+    print(f"mask only: subset query {masked:.3f} ms, identity index {looked_up:.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: extracting many deck lists one by one versus in one batch.
+
+Writes a directory of random deck lists for a synthetic dump, then extracts
+them with one ``extract_deck_cards`` call per deck, which loads the archive
+every time, and with a single ``extract_decks`` batch, which loads and indexes
+it once.
+
+Usage::
+
+    python -m benchmarks.bench_deck_batch --size-mb 50 --decks 20 --workers 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+from src.analysis.cards import CardProcessorInterface
+from src.analysis.decks import DeckExtractorService, find_deck_lists
+from src.core.config import CardFilterConfig
+from .bench_deck_store import write_deck
+from .synthetic import dump_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--decks", type=int, default=20, help="Number of deck lists")
+    parser.add_argument("--deck-size", type=int, default=60, help="Number of entries per deck list")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads for the batch")
+    args = parser.parse_args()
+
+    archive = dump_path(args.size_mb)
+    service = DeckExtractorService(CardProcessorInterface(CardFilterConfig()), MagicMock())
+
+    with tempfile.TemporaryDirectory() as directory:
+        decks = os.path.join(directory, "decks")
+        os.mkdir(decks)
+        for index in range(args.decks):
+            write_deck(os.path.join(decks, f"deck{index:04d}.txt"), archive, args.deck_size, seed=index)
+
+        # Missing and fallback cards are printed; keep them out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for deck in find_deck_lists(decks):
+                service.extract_deck_cards(archive, deck, os.path.join(directory, "single.json"))
+            one_by_one = time.perf_counter() - start
+
+            start = time.perf_counter()
+            stats = service.extract_decks(archive, decks, os.path.join(directory, "out"), workers=args.workers)
+            batch = time.perf_counter() - start
+
+        print(f"one by one       {one_by_one:7.2f}s  {args.decks} decks")
+        print(f"batch            {batch:7.2f}s  {stats.decks_processed} decks, {stats.cards_found}/{stats.total_cards} found")
+
+
+if __name__ == "__main__":
+    main()
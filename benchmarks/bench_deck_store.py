@@ -0,0 +1,59 @@
+"""Benchmark: deck extraction from a JSON archive versus a card store.
+
+Builds a card store from a synthetic dump once, then extracts the same deck
+list from the JSON archive and from the store, reporting the time of each run.
+
+Usage::
+
+    python -m benchmarks.bench_deck_store --size-mb 50 --deck-size 60
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+from src.analysis.card_store import CardStore
+from src.analysis.cards import CardProcessorInterface
+from src.analysis.decks import DeckExtractorService
+from src.core.config import CardFilterConfig
+from .synthetic import dump_path, load_cards
+
+
+def write_deck(path: str, archive: str, deck_size: int, seed: int = 1) -> None:
+    """Write a deck list of random cards, a quarter of them from the wrong set."""
+    cards = random.Random(seed).sample(load_cards(archive), deck_size)
+    with open(path, "w", encoding="utf-8") as deck:
+        for index, card in enumerate(cards):
+            set_code = "XXX" if index % 4 == 0 else card["setCode"]
+            deck.write(f"1 {card['name']} ({set_code}) {card['number']}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--deck-size", type=int, default=60, help="Number of deck list entries")
+    args = parser.parse_args()
+
+    archive = dump_path(args.size_mb)
+    service = DeckExtractorService(CardProcessorInterface(CardFilterConfig()), MagicMock())
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = os.path.join(directory, "cards.db")
+        deck = os.path.join(directory, "deck.txt")
+        write_deck(deck, archive, args.deck_size)
+
+        start = time.perf_counter()
+        count = CardStore.build(archive, store)
+        print(f"build-index      {time.perf_counter() - start:7.2f}s  {count} cards")
+
+        for name, source in (("JSON archive", archive), ("card store", store)):
+            start = time.perf_counter()
+            stats = service.extract_deck_cards(source, deck, os.path.join(directory, "out.json"))
+            print(f"{name:<16} {time.perf_counter() - start:7.2f}s  {stats.cards_found}/{stats.total_cards} found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: compiled filter plans.
+
+Compares the former per-card filter evaluation, which looked every operator up
+twice per card and converted numeric constants on every comparison, with the
+compiled ``FilterPlan`` that ``CardProcessorInterface`` now reuses. Both
+predicates are timed alone and through ``process_card``.
+
+Usage::
+
+    python -m benchmarks.bench_filter_plan --size-mb 50
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from src.analysis.cards import CardProcessorInterface, FilterStrategy
+from src.core.config import CardFilterConfig
+from src.processing.filters import compile_filters, get_operator_function
+from .synthetic import dump_path, load_cards
+
+FILTERS: Dict[str, Any] = {
+    "colors": {"contains": "W"},
+    "convertedManaCost": {"gte": 1, "lte": 4},
+    "type": {"contains": "Creature"},
+}
+
+
+def legacy_evaluate(card: dict, filters: Dict[str, Any]) -> bool:
+    """Evaluate filters the way the former implementation did."""
+    for conditions in filters.values():
+        for op in conditions:
+            if not get_operator_function(op):
+                raise ValueError(f"Invalid operator: {op}")
+    for field, conditions in filters.items():
+        if field not in card:
+            return False
+        for op, filter_value in conditions.items():
+            if not get_operator_function(op):
+                raise ValueError(f"Invalid operator: {op}")
+            if not FilterStrategy.evaluate_condition(card[field], filter_value, op):
+                return False
+    return True
+
+
+def run(name: str, func: Callable[[dict], Any], cards: List[dict]) -> float:
+    """Time one strategy over every card and print its throughput."""
+    start = time.perf_counter()
+    matched = sum(1 for card in cards if func(card))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {matched:>8} matched  {elapsed:7.3f}s  {len(cards) / elapsed:12,.0f} cards/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    processor = CardProcessorInterface(CardFilterConfig())
+    cards = [processor.create_base_card(card) for card in load_cards(dump_path(args.size_mb))]
+    print(f"{len(cards)} cards")
+
+    plan = compile_filters(FILTERS)
+    legacy = run("legacy predicate", lambda card: legacy_evaluate(card, FILTERS), cards)
+    compiled = run("compiled plan", plan.matches, cards)
+    print(f"predicate speedup: {legacy / compiled:.1f}x")
+
+    legacy_processor = CardProcessorInterface(CardFilterConfig())
+    legacy_processor._apply_filters = legacy_evaluate  # type: ignore[method-assign]
+    before = run("process_card, legacy", lambda card: legacy_processor.process_card(card, FILTERS), cards)
+    after = run("process_card, compiled", lambda card: processor.process_card(card, FILTERS), cards)
+    print(f"process_card speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
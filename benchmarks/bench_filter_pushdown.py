@@ -0,0 +1,124 @@
+"""Benchmark: filter pushdown into the streaming pipeline.
+
+Runs the filter command's pipeline with selective filters, comparing the
+former behaviour, where every card was copied by ``create_base_card`` before
+being filtered and every set was processed, with filters evaluated on the raw
+card and sets skipped when a ``setCode`` condition excludes them.
+
+The card stage (filter, project, serialize) is timed on preloaded cards, and
+the whole pipeline end to end, single-process and with two workers. The
+single-process pipeline is dominated by parsing, which ijson cannot skip; with
+workers, excluded sets are never parsed at all.
+
+Usage::
+
+    python -m benchmarks.bench_filter_pushdown --size-mb 50
+"""
+
+import argparse
+import io
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.filters import compile_filters
+from src.services.file_stream import FileProcessor
+from .synthetic import dump_path
+
+FILTERS: Dict[str, Dict[str, Any]] = {
+    "set code": {"setCode": {"eq": "AAC"}},
+    "white cards": {"colors": {"contains": "W"}},
+    "cheap instants": {"type": {"eq": "Instant"}, "convertedManaCost": {"lte": 2}},
+}
+
+
+class LegacyCardProcessor(CardProcessorInterface):
+    """Processor applying fixed filters after copying each card, as before."""
+
+    def __init__(self, config: CardFilterConfig, filters: Dict[str, Any]):
+        super().__init__(config)
+        self.legacy_filters = filters
+
+    def process_card(self, card_data, filters=None, schema=None, additional_languages=None):
+        self._validate_required_fields(card_data)
+        processed_card = self.create_base_card(card_data)
+        if not self.evaluate_filters(processed_card, self.legacy_filters):
+            return None
+        processed_card = self._process_language_data(processed_card, card_data, additional_languages)
+        return self._apply_final_schema(processed_card, schema)
+
+
+def card_stage(
+    sets: List[Tuple[str, List[dict]]],
+    card_processor: CardProcessorInterface,
+    filters: Optional[Dict[str, Any]]
+) -> float:
+    """Filter, project and serialize preloaded cards, returning the elapsed time."""
+    schema = CardFilterConfig().default_schema
+    include_set = compile_filters(filters).may_match_set if filters else None
+    start = time.perf_counter()
+    for set_code, cards in sets:
+        if include_set is not None and not include_set(set_code):
+            continue
+        for card in cards:
+            processed_card = card_processor.process_card(card, filters, schema)
+            if processed_card is not None:
+                json.dumps(processed_card)
+    return time.perf_counter() - start
+
+
+def filter_dump(
+    path: str,
+    card_processor: CardProcessorInterface,
+    filters: Optional[Dict[str, Any]],
+    workers: int = 1
+) -> float:
+    """Filter a dump with the default schema and return the elapsed time."""
+    config = CardFilterConfig()
+    container = MagicMock()
+    container.config.return_value = config
+    processor = FileProcessor(container)
+
+    start = time.perf_counter()
+    with open(path, "rb") as infile:
+        processor.process_file_stream(
+            infile, io.BytesIO(), card_processor, schema=config.default_schema,
+            filters=filters, show_progress=False, workers=workers
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    path = dump_path(args.size_mb)
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    config = CardFilterConfig()
+    print(f"{size_mb:.0f} MB input")
+
+    with open(path, "rb") as infile:
+        data = json.load(infile)["data"]
+    sets = [(set_code, set_data.get("cards", [])) for set_code, set_data in data.items()]
+    del data
+
+    for name, filters in FILTERS.items():
+        legacy = LegacyCardProcessor(config, filters)
+        for stage, run in (
+            ("card stage", lambda processor, active: card_stage(sets, processor, active)),
+            ("end to end", lambda processor, active: filter_dump(path, processor, active)),
+            ("2 workers", lambda processor, active: filter_dump(path, processor, active, workers=2)),
+        ):
+            before = run(legacy, None)
+            after = run(CardProcessorInterface(config), filters)
+            print(f"{name:<16} {stage:<11} before {before:6.2f}s  after {after:6.2f}s  "
+                  f"speedup {before / after:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: language lookups and translations dropped while parsing.
+
+First times ``select_foreign_data`` over every card of a synthetic dump with
+the requested languages as a list, as callers passed them, and as the
+frozenset ``normalize_languages`` builds once per run. Then streams the
+dump with ``CardStreamReader.iter_cards``, as is and through a
+``ForeignDataPruner`` keeping one language, reporting the time, the bytes
+the parser sees and, measured with ``tracemalloc``, the memory the parsed
+cards hold. The same pruning is applied per set in the ``--workers`` path.
+
+Usage::
+
+    python -m benchmarks.bench_foreign_data --size-mb 50 --languages German
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Iterable, List, Optional, Tuple
+
+from src.io.parsers.card_stream import CardStreamReader, ForeignDataPruner, open_input_stream
+from src.processing.projection import normalize_languages, select_foreign_data
+from .synthetic import dump_path, load_cards
+
+
+def lookups(cards: List[dict], languages: Iterable[str]) -> float:
+    """Return the best time per card over three runs, in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for card in cards:
+            select_foreign_data(card, languages)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def stream(path: str, pruner: Optional[ForeignDataPruner]) -> Tuple[float, int, int]:
+    """Parse the dump, returning seconds, bytes parsed and bytes held by the cards."""
+    with open(path, "rb") as infile:
+        source = open_input_stream(infile)
+        if pruner is not None:
+            source = pruner.wrap(source)
+        counted = _CountingReader(source)
+        start = time.perf_counter()
+        tracemalloc.start()
+        try:
+            cards = [card for _, card in CardStreamReader(counted).iter_cards()]
+            held = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del cards
+        return time.perf_counter() - start, counted.bytes_read, held
+
+
+class _CountingReader:
+    """File-like wrapper counting the bytes read through it."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def timed_stream(path: str, pruner: Optional[ForeignDataPruner]) -> float:
+    """Return the best parse time over three runs, without tracing."""
+    best = float("inf")
+    for _ in range(3):
+        with open(path, "rb") as infile:
+            source = open_input_stream(infile)
+            start = time.perf_counter()
+            for _ in CardStreamReader(source if pruner is None else pruner.wrap(source)).iter_cards():
+                pass
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--languages", nargs="+", default=["German"], help="Requested languages")
+    args = parser.parse_args()
+
+    path = dump_path(args.size_mb)
+    cards = load_cards(path)
+    requested = list(args.languages)
+    print(f"{len(cards)} cards, {os.path.getsize(path) / 2 ** 20:.1f} MB, languages {requested}")
+    for name, languages in (("list", requested), ("frozenset", normalize_languages(requested))):
+        print(f"select_foreign_data {name:9} {lookups(cards, languages):6.2f} us/card")
+    many = requested + [f"Unused {i}" for i in range(8)]
+    for name, languages in (("list", many), ("frozenset", normalize_languages(many))):
+        print(f"10 languages        {name:9} {lookups(cards, languages):6.2f} us/card")
+    del cards
+
+    for name, pruner in (("full parse", None), ("pruned parse", ForeignDataPruner(requested))):
+        elapsed = timed_stream(path, pruner)
+        _, parsed, held = stream(path, pruner)
+        print(f"{name:12} {elapsed:7.2f}s  {parsed / 2 ** 20:7.1f} MB parsed  {held / 2 ** 20:7.1f} MB of cards")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark: membership filters against sets built once.
+
+Filters the cards of a synthetic dump by name against a large watch list
+with ``in`` and ``not_in``, and by keywords with ``contains_any`` and
+``contains_all``. Times the operator functions applied to the filter's list
+for every card, as plans compiled them before, against the compiled plan,
+which tests each card against a frozenset built once. Both select the same
+cards.
+
+Usage::
+
+    python -m benchmarks.bench_membership --size-mb 50 --list-size 5000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from src.processing.filters import compile_filters, get_operator_function
+from .synthetic import dump_path, load_cards
+
+
+def list_scan(filters: Dict[str, Any]) -> Callable[[dict], bool]:
+    """Build a predicate applying each operator function to the filter value."""
+    conditions = [
+        (field, get_operator_function(op), value)
+        for field, field_conditions in filters.items()
+        for op, value in field_conditions.items()
+    ]
+    return lambda card: all(field in card and func(card[field], value) for field, func, value in conditions)
+
+
+def timed(predicate: Callable[[dict], bool], cards: List[dict]) -> float:
+    """Return the best time per card over three runs, in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for card in cards:
+            predicate(card)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    parser.add_argument("--list-size", type=int, default=5000, help="Names in the watch list")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    rng = random.Random(1)
+    names = [card["name"] for card in rng.sample(cards, min(args.list_size, len(cards)))]
+    queries = {
+        "name in": {"name": {"in": names}},
+        "name not_in": {"name": {"not_in": names}},
+        "contains_any": {"keywords": {"contains_any": ["Flying", "Haste", "Deathtouch"]}},
+        "contains_all": {"keywords": {"contains_all": ["Flying", "Vigilance"]}},
+    }
+    print(f"{len(cards)} cards, {len(names)} names in the list")
+    for name, filters in queries.items():
+        before, plan = list_scan(filters), compile_filters(filters)
+        assert [before(card) for card in cards] == [plan(card) for card in cards]
+        scan, hashed = timed(before, cards), timed(plan, cards)
+        print(f"{name:13} list {scan:8.2f} us/card  set {hashed:5.2f} us/card  {scan / hashed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark: numeric comparisons on string-typed fields.
+
+Compares ``power``, ``toughness`` and ``number`` of the cards of a synthetic
+dump, strings such as ``"3"``, ``"*"`` and ``"1+*"``, and the float
+``manaValue``. Each query is timed with the former conversions, calling
+``float()`` and catching its exceptions on every comparison, and with
+``coerce_number``, which reads each distinct string once and reads the
+others as NaN. Both the compiled plan and the operator functions are timed;
+non-numeric values fail the comparison in both.
+
+Usage::
+
+    python -m benchmarks.bench_numeric_coercion --size-mb 50
+"""
+
+import argparse
+import operator
+import time
+from typing import Any, Callable, Dict, List
+
+from src.processing.filters import compile_filters, get_operator_function
+from .synthetic import dump_path, load_cards
+
+QUERIES: Dict[str, Dict[str, Any]] = {
+    "power gte 3": {"power": {"gte": 3}},
+    "power and toughness": {"power": {"gte": 2}, "toughness": {"lte": 2}},
+    "number range": {"number": {"gte": 100, "lt": 200}},
+    "manaValue range": {"manaValue": {"gte": 2, "lte": 4}},
+}
+
+_COMPARISONS = {"gt": operator.gt, "lt": operator.lt, "gte": operator.ge, "lte": operator.le}
+
+
+def legacy_plan(filters: Dict[str, Any]) -> Callable[[dict], bool]:
+    """Build the former compiled predicate, converting on every comparison."""
+    steps = []
+    for field, conditions in filters.items():
+        for op, value in conditions.items():
+            bound, compare = float(value), _COMPARISONS[op]
+
+            def test(card_value: Any, bound: float = bound, compare=compare) -> bool:
+                try:
+                    return compare(float(card_value), bound)
+                except (TypeError, ValueError):
+                    return False
+
+            steps.append((field, test))
+    return lambda card: all(field in card and test(card[field]) for field, test in steps)
+
+
+def _legacy_safe(a: Any, b: Any, compare: Callable[[float, float], bool]) -> bool:
+    """Compare as the former ``_safe_numeric_comparison`` did."""
+    try:
+        return compare(float(a), float(b))
+    except (TypeError, ValueError):
+        return False
+
+
+_LEGACY_OPERATORS = {
+    "gt": lambda a, b: _legacy_safe(a, b, lambda x, y: x > y),
+    "lt": lambda a, b: _legacy_safe(a, b, lambda x, y: x < y),
+    "gte": lambda a, b: _legacy_safe(a, b, lambda x, y: x >= y),
+    "lte": lambda a, b: _legacy_safe(a, b, lambda x, y: x <= y),
+}
+
+
+def legacy_operators(filters: Dict[str, Any]) -> Callable[[dict], bool]:
+    """Build a predicate from the former operator functions."""
+    steps = [
+        (field, _LEGACY_OPERATORS[op], value)
+        for field, conditions in filters.items() for op, value in conditions.items()
+    ]
+    return lambda card: all(field in card and func(card[field], value) for field, func, value in steps)
+
+
+def operators(filters: Dict[str, Any]) -> Callable[[dict], bool]:
+    """Build a predicate from the current operator functions."""
+    steps = [
+        (field, get_operator_function(op), value)
+        for field, conditions in filters.items() for op, value in conditions.items()
+    ]
+    return lambda card: all(field in card and func(card[field], value) for field, func, value in steps)
+
+
+def evaluate(predicate: Callable[[dict], bool], cards: List[dict]) -> List[bool]:
+    """Evaluate every card."""
+    return [predicate(card) for card in cards]
+
+
+def timed(predicate: Callable[[dict], bool], cards: List[dict]) -> float:
+    """Return the best time per card over three runs, in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        evaluate(predicate, cards)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    print(f"{len(cards)} cards")
+    for name, filters in QUERIES.items():
+        before, after = legacy_plan(filters), compile_filters(filters, sample_size=0)
+        assert evaluate(before, cards) == evaluate(after, cards)
+        old, new = timed(before, cards), timed(after, cards)
+        print(f"{name:20} plan       float() {old:5.2f} us/card  cached {new:5.2f} us/card  {old / new:4.1f}x")
+
+        before, after = legacy_operators(filters), operators(filters)
+        assert evaluate(before, cards) == evaluate(after, cards)
+        old, new = timed(before, cards), timed(after, cards)
+        print(f"{name:20} operators  float() {old:5.2f} us/card  cached {new:5.2f} us/card  {old / new:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: set-sharded parallel filtering.
+
+Runs the full filter pipeline (parse, filter, project, serialize) on the
+single-process streaming path and on the set-sharded worker pool, checks that
+both outputs are byte-identical, and reports the speedup per worker count.
+
+The parent's share of the parallel path is locating the sets, which costs
+about as much as parsing the dump once; the speedup is bounded by it and by
+the number of available cores.
+
+Usage::
+
+    python -m benchmarks.bench_parallel_filter --size-mb 400 --workers 2 4 8
+    python -m benchmarks.bench_parallel_filter --input AllPrintings.json
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import time
+from typing import Tuple
+from unittest.mock import MagicMock
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.services.file_stream import FileProcessor
+from .synthetic import dump_path
+
+FILTERS = {"convertedManaCost": {"lte": 3}}
+
+
+def filter_dump(path: str, workers: int) -> Tuple[float, str]:
+    """Filter a dump, returning the elapsed time and the output digest."""
+    config = CardFilterConfig()
+    container = MagicMock()
+    container.config.return_value = config
+    processor = FileProcessor(container)
+    card_processor = CardProcessorInterface(config)
+    outfile = io.BytesIO()
+
+    start = time.perf_counter()
+    with open(path, "rb") as infile:
+        processor.process_file_stream(
+            infile, outfile, card_processor, filters=FILTERS, show_progress=False, workers=workers
+        )
+    elapsed = time.perf_counter() - start
+    return elapsed, hashlib.sha256(outfile.getvalue()).hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="Existing dump to benchmark instead of a synthetic one")
+    parser.add_argument("--size-mb", type=float, default=400, help="Size of the synthetic dump")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4], help="Worker counts to compare")
+    args = parser.parse_args()
+
+    path = args.input or dump_path(args.size_mb)
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"{os.cpu_count()} CPUs, {size_mb:.0f} MB input")
+
+    baseline, expected = filter_dump(path, 1)
+    print(f"{'serial':<12} {baseline:7.2f}s  {size_mb / baseline:8.1f} MB/s")
+    for workers in args.workers:
+        elapsed, digest = filter_dump(path, workers)
+        status = "identical" if digest == expected else "MISMATCH"
+        print(f"{workers:>2} workers   {elapsed:7.2f}s  {size_mb / elapsed:8.1f} MB/s  "
+              f"speedup {baseline / elapsed:.2f}x  {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: schemas compiled once into a projector.
+
+Projects the cards of a synthetic dump with schemas of flat fields and of
+dotted paths, either interpreting the schema for every card, splitting its
+paths and walking the card for each one, or through a ``SchemaProjector``
+compiled once. The interpreted baseline builds the same output. Also
+reports the JSON size of the output against keeping the whole nested
+subtrees the paths point into.
+
+Usage::
+
+    python -m benchmarks.bench_schema_projection --size-mb 50
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from src.processing.projection import CARD_DEFAULTS, compile_schema
+from .synthetic import dump_path, load_cards
+
+SCHEMAS: Dict[str, List[str]] = {
+    "flat": ["name", "type", "colors", "convertedManaCost", "rarity"],
+    "nested": [
+        "name", "type", "legalities.commander", "legalities.modern", "identifiers.scryfallId",
+    ],
+}
+
+Project = Callable[[dict], dict]
+
+
+def interpreted(schema: List[str]) -> Project:
+    """Project cards by walking every path of the schema for every card."""
+    def project(card: dict) -> dict:
+        result: dict = {}
+        for path in schema:
+            parts = path.split(".")
+            if len(parts) == 1:
+                if path in card:
+                    result[path] = card[path]
+                elif path in CARD_DEFAULTS:
+                    default = CARD_DEFAULTS[path]
+                    result[path] = default.copy() if isinstance(default, list) else default
+                continue
+            value, target = card, result
+            for part in parts[:-1]:
+                value = value.get(part) if isinstance(value, dict) else None
+                if not isinstance(value, dict):
+                    break
+                target = target.setdefault(part, {})
+            else:
+                if parts[-1] in value:
+                    target[parts[-1]] = value[parts[-1]]
+        return result
+    return project
+
+
+def timed(project: Project, cards: List[dict]) -> float:
+    """Return the best time per card over three runs, in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for card in cards:
+            project(card)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    print(f"{len(cards)} cards")
+    for name, schema in SCHEMAS.items():
+        baseline, projector = interpreted(schema), compile_schema(schema)
+        assert all(baseline(card) == projector(card) for card in cards[:1000])
+        before, after = timed(baseline, cards), timed(projector, cards)
+        print(f"{name:7} interpreted {before:6.2f} us/card  compiled {after:6.2f} us/card  {before / after:4.2f}x")
+
+    whole = compile_schema(sorted({path.split(".")[0] for path in SCHEMAS["nested"]}))
+    nested = compile_schema(SCHEMAS["nested"])
+    whole_size = sum(len(json.dumps(whole(card))) for card in cards)
+    nested_size = sum(len(json.dumps(nested(card))) for card in cards)
+    print(f"output  whole subtrees {whole_size / len(cards):6.1f} B/card  "
+          f"selected leaves {nested_size / len(cards):6.1f} B/card")
+
+
+if __name__ == "__main__":
+    main()
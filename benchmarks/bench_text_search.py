@@ -0,0 +1,87 @@
+"""Benchmark: oracle text search with compiled operators and a word index.
+
+Gives the cards of a synthetic dump rules text drawn from a set of common
+phrases, then searches it for "draw a card" and rarer phrases. Times the
+substring ``contains`` scan, the compiled ``regex`` and ``text_match``
+operators over every card, and a ``CardTable`` with a ``TokenIndex`` that
+evaluates only the candidate cards. Reports the time to build the index.
+
+Usage::
+
+    python -m benchmarks.bench_text_search --size-mb 50
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from src.analysis.card_table import CardTable
+from src.analysis.text_index import TEXT_FIELDS
+from src.processing.filters import compile_filters
+from .synthetic import dump_path, load_cards
+
+PHRASES = [
+    "Flying.", "Trample.", "When this creature enters, draw a card.", "Destroy target creature.",
+    "Counter target spell.", "Add one mana of any color.", "Scry 2.", "Create a 1/1 white Soldier token.",
+    "You gain 3 life.", "Target player discards a card.", "Return target creature to its owner's hand.",
+    "Exile target artifact or enchantment.", "Put a +1/+1 counter on target creature.",
+]
+
+QUERIES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "draw a card": {
+        "contains": {"text": {"contains": "draw a card"}},
+        "regex": {"text": {"regex": r"draw a card"}},
+        "text_match": {"text": {"text_match": "draw a card"}},
+    },
+    "rare phrase": {
+        "contains": {"text": {"contains": "Exile target artifact"}},
+        "regex": {"text": {"regex": r"Exile target artifact"}},
+        "text_match": {"text": {"text_match": "exile target artifact"}},
+    },
+}
+
+
+def vary_text(cards: List[dict], seed: int = 1) -> None:
+    """Replace the uniform synthetic rules text with random phrases."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(PHRASES))]
+    for card in cards:
+        card["text"] = " ".join(rng.choices(PHRASES, weights, k=rng.randint(1, 3)))
+
+
+def timed(query: Callable[[], Any]) -> float:
+    """Return the best time over three runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the synthetic dump")
+    args = parser.parse_args()
+
+    cards = load_cards(dump_path(args.size_mb))
+    vary_text(cards)
+    start = time.perf_counter()
+    table = CardTable(cards, columns=(), text_fields=TEXT_FIELDS)
+    print(f"{len(cards)} cards, word index built in {time.perf_counter() - start:.2f}s")
+
+    for name, variants in QUERIES.items():
+        plans = {op: compile_filters(filters) for op, filters in variants.items()}
+        for op, plan in plans.items():
+            count = sum(1 for card in cards if plan(card))
+            elapsed = timed(lambda: [card for card in cards if plan(card)])
+            print(f"{name:12} {op:10} per card {elapsed:7.1f} ms  ({count} cards)")
+        expected = [row for row, card in enumerate(cards) if plans["text_match"](card)]
+        assert table.select(plans["text_match"]) == expected
+        elapsed = timed(lambda: table.select(plans["text_match"]))
+        print(f"{name:12} text_match word index {elapsed:7.1f} ms  ({len(expected)} cards)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Synthetic MTGJSON-style card dumps for benchmarking.
+
+The generated cards carry the same kinds of fields as real AllPrintings data,
+including nested ``foreignData``, ``legalities`` and ``identifiers`` subtrees,
+so parse and processing costs are representative.
+"""
+
+import json
+import os
+import random
+import tempfile
+from typing import Dict, Any, Iterator, List, Optional
+
+COLORS = "WUBRG"
+TYPES = ["Creature — Elf Druid", "Instant", "Sorcery", "Artifact", "Enchantment", "Legendary Creature — Angel"]
+RARITIES = ["common", "uncommon", "rare", "mythic"]
+LANGUAGES = ["German", "French", "Japanese", "Spanish", "Italian", "Portuguese (Brazil)", "Russian", "Korean"]
+CARDS_PER_SET = 300
+
+
+def make_card(set_code: str, number: int, rng: random.Random) -> Dict[str, Any]:
+    """Build a single realistic card.
+
+    Args:
+        set_code: Set the card belongs to
+        number: Collector number within the set
+        rng: Random source
+
+    Returns:
+        Dict[str, Any]: Card data
+    """
+    colors = sorted(rng.sample(COLORS, rng.randint(0, 2)))
+    mana_value = float(rng.randint(0, 8))
+    return {
+        "name": f"Card {set_code} {number}",
+        "type": rng.choice(TYPES),
+        "setCode": set_code,
+        "number": str(number),
+        "uuid": f"{set_code.lower()}-{number:05d}",
+        "rarity": rng.choice(RARITIES),
+        "colors": colors,
+        "colorIdentity": colors,
+        "convertedManaCost": mana_value,
+        "manaValue": mana_value,
+        "manaCost": "{2}{W}",
+        "power": rng.choice(["1", "2", "3", "*", "1+*"]),
+        "toughness": rng.choice(["1", "2", "4", "*"]),
+        "text": "When this enters, draw a card. " * rng.randint(1, 4),
+        "keywords": rng.sample(["Flying", "Vigilance", "Trample", "Haste", "Lifelink"], rng.randint(0, 2)),
+        "edhrecSaltiness": round(rng.random(), 2),
+        "availability": ["paper", "mtgo"],
+        "legalities": {"commander": "Legal", "modern": "Legal", "legacy": "Legal", "vintage": "Legal"},
+        "identifiers": {"scryfallId": f"sf-{set_code}-{number}", "multiverseId": str(number)},
+        "purchaseUrls": {"tcgplayer": f"https://example.invalid/{set_code}/{number}"},
+        "foreignData": [
+            {"language": language, "name": f"{language} {number}", "text": "Übersetzter Regeltext. " * 3}
+            for language in LANGUAGES
+        ],
+        "rulings": [{"date": "2024-01-01", "text": "A ruling about this card."}] * rng.randint(0, 3),
+    }
+
+
+def iter_set_codes() -> Iterator[str]:
+    """Yield distinct three-letter set codes."""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    for a in letters:
+        for b in letters:
+            for c in letters:
+                yield a + b + c
+
+
+def write_dump(path: str, size_mb: float, seed: int = 1, meta_first: bool = True) -> int:
+    """Write a synthetic dump of roughly the requested size.
+
+    Args:
+        path: Output path
+        size_mb: Approximate target size in megabytes
+        seed: Random seed for reproducible output
+        meta_first: Whether ``meta`` precedes ``data``
+
+    Returns:
+        int: Number of cards written
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    meta = json.dumps({"date": "2024-11-23", "version": "5.2.2+synthetic"})
+    cards_written = 0
+
+    with open(path, "w", encoding="utf-8") as out:
+        out.write('{"meta":' + meta + ',"data":{' if meta_first else '{"data":{')
+        first = True
+        for set_code in iter_set_codes():
+            if out.tell() >= target:
+                break
+            cards: List[Dict[str, Any]] = [make_card(set_code, n, rng) for n in range(1, CARDS_PER_SET + 1)]
+            set_data = {"baseSetSize": len(cards), "block": None, "name": f"Set {set_code}", "cards": cards, "tokens": []}
+            out.write(("" if first else ",") + json.dumps(set_code) + ":" + json.dumps(set_data))
+            cards_written += len(cards)
+            first = False
+        out.write("}}" if meta_first else '},"meta":' + meta + "}")
+
+    return cards_written
+
+
+def load_cards(path: str) -> List[Dict[str, Any]]:
+    """Load every card of a dump into memory.
+
+    Args:
+        path: Dump path
+
+    Returns:
+        List[Dict[str, Any]]: All cards in input order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)["data"]
+    return [card for set_data in data.values() for card in set_data.get("cards", [])]
+
+
+def dump_path(size_mb: float, directory: Optional[str] = None) -> str:
+    """Return the path of a cached synthetic dump, generating it if needed.
+
+    Args:
+        size_mb: Approximate dump size in megabytes
+        directory: Cache directory, defaults to the system temp directory
+
+    Returns:
+        str: Path of the dump
+    """
+    directory = directory or tempfile.gettempdir()
+    path = os.path.join(directory, f"orthodoxy-synthetic-{size_mb:g}mb.json")
+    if not os.path.exists(path):
+        write_dump(path, size_mb)
+    return path
@@ -0,0 +1,107 @@
+"""Module for the in-memory card index used by deck extraction.
+
+This module indexes a loaded JSON archive once, so that resolving deck list
+references costs a few dictionary lookups instead of a scan of the requested
+set for the exact match and of every other set for the fallback.
+
+Features:
+- Lookups by set code and collector number, by exact name and by front face
+- Built in a single pass; cards are referenced, never copied
+- Candidates returned in archive order, like the scans they replace
+- The same lookup interface as ``CardStore``, so both share one matcher
+
+Example:
+    ```python
+    index = CardIndex(archive_data)
+    for set_code, number, name, card in index.cards_by_name("Lightning Bolt"):
+        print(set_code, number, name)
+    ```
+"""
+
+from heapq import merge
+from typing import Any, Dict, List, Tuple
+
+from .card_store import StoredCard
+
+# Separator between the faces of split and double-faced card names
+FACE_SEPARATOR = " //"
+
+
+class CardIndex:
+    """Hash indexes over the cards of a loaded archive.
+
+    Every card is recorded once, by position in archive order; the indexes
+    map keys to lists of positions.
+
+    Attributes:
+        card_count (int): Number of cards indexed
+    """
+
+    def __init__(self, archive_data: Dict[str, Any]):
+        """Index every card of an archive.
+
+        Args:
+            archive_data: The loaded archive data
+        """
+        self._cards: List[StoredCard] = []
+        self._by_set_number: Dict[Tuple[str, str], List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_front_face: Dict[str, List[int]] = {}
+
+        for set_code, set_data in archive_data.get("data", {}).items():
+            for card in set_data.get("cards", []):
+                self._add(set_code, card)
+
+    @property
+    def card_count(self) -> int:
+        """Number of cards indexed."""
+        return len(self._cards)
+
+    def _add(self, set_code: str, card: Dict[str, Any]) -> None:
+        """Record a card in every index.
+
+        A name such as ``"A // B // C"`` is indexed as a front face under
+        ``"A"`` and ``"A // B"``, the names a deck list may refer to it by.
+
+        Args:
+            set_code: Code of the card's set
+            card: The card data
+        """
+        position = len(self._cards)
+        name = card.get("name", "")
+        number = str(card.get("number", ""))
+        self._cards.append((set_code, number, name, card))
+
+        self._by_set_number.setdefault((set_code, number), []).append(position)
+        self._by_name.setdefault(name, []).append(position)
+
+        face_end = name.find(FACE_SEPARATOR)
+        while face_end != -1:
+            self._by_front_face.setdefault(name[:face_end], []).append(position)
+            face_end = name.find(FACE_SEPARATOR, face_end + 1)
+
+    def cards_by_set_number(self, set_code: str, number: str) -> List[StoredCard]:
+        """Fetch the cards with a collector number in a set.
+
+        Args:
+            set_code: Set code
+            number: Collector number
+
+        Returns:
+            List[StoredCard]: Matching cards in archive order
+        """
+        return [self._cards[position] for position in self._by_set_number.get((set_code, number), ())]
+
+    def cards_by_name(self, name: str) -> List[StoredCard]:
+        """Fetch every printing named ``name`` or whose front face is ``name``.
+
+        Args:
+            name: Card name or front-face name
+
+        Returns:
+            List[StoredCard]: Candidate printings in archive order
+        """
+        exact = self._by_name.get(name, ())
+        faces = self._by_front_face.get(name, ())
+        positions = merge(exact, faces) if exact and faces else exact or faces
+        return [self._cards[position] for position in positions]
@@ -1,11 +1,15 @@
 """Module for card matching functionality.
 
 This module provides functionality for finding and matching cards in archives,
-implementing flexible matching strategies with fallbacks.
+implementing flexible matching strategies with fallbacks. Cards are looked
+up through indexes: a ``CardIndex`` built once per loaded JSON archive, or an
+on-disk ``CardStore``.
 """
 
-from typing import Dict, Optional, Protocol, List
+from typing import Dict, Optional, Protocol, List, Union
 from ..utils.models import CardReference
+from .card_index import CardIndex
+from .card_store import CardStore, StoredCard
 
 
 class LoggingInterface(Protocol):
@@ -14,6 +18,12 @@ class LoggingInterface(Protocol):
     def debug(self, message: str) -> None: ...
 
 
+class CardLookup(Protocol):
+    """Protocol for indexed card sources searched by ``CardMatcher``."""
+    def cards_by_set_number(self, set_code: str, number: str) -> List[StoredCard]: ...
+    def cards_by_name(self, name: str) -> List[StoredCard]: ...
+
+
 class CardMatcher:
     """Handles finding and matching cards in archives.
     
@@ -28,6 +38,8 @@ class CardMatcher:
             logger: Thread-safe logging interface
         """
         self.logger = logger
+        self._index: Optional[CardIndex] = None
+        self._indexed_archive: Optional[Dict] = None
 
     def _matches_card_name(self, card_name: str, reference_name: str) -> bool:
         """Check if a card name matches the reference name.
@@ -74,64 +86,67 @@ class CardMatcher:
         elif match_type == "fallback_used":
             print(f"Using fallback match for {card_ref.name} from different set (exact match in {card_ref.set_code} not found)")
 
-    def _find_exact_match(self, card_ref: CardReference, set_data: Dict, debug: bool = False) -> Optional[Dict]:
+    def _find_exact_match(self, card_ref: CardReference, lookup: CardLookup, debug: bool = False) -> Optional[Dict]:
         """Try to find an exact match by name, set code, and collector number.
         
         Args:
             card_ref: The validated card reference
-            set_data: The set data to search in
+            lookup: The card index or store to search in
             debug: Whether to show debug output
             
         Returns:
             Optional[Dict]: The matching card data, or None if not found
         """
-        for card in self._get_cards_from_set(set_data):
-            card_name = card.get("name", "")
-            if (self._matches_card_name(card_name, card_ref.name) and
-                str(card.get("number", "")) == card_ref.collector_number):
+        for _, _, card_name, card in lookup.cards_by_set_number(card_ref.set_code, card_ref.collector_number):
+            if self._matches_card_name(card_name, card_ref.name):
                 self._print_debug(card_ref, "exact", debug=debug)
                 self.logger.debug(f"Found exact match for {card_ref.name} in requested set {card_ref.set_code}")
                 return card
         return None
 
-    def _find_fallback_match(self, card_ref: CardReference, archive_data: Dict, debug: bool = False) -> Optional[Dict]:
+    def _find_fallback_match(self, card_ref: CardReference, lookup: CardLookup, debug: bool = False) -> Optional[Dict]:
         """Try to find a fallback match by name only.
         
         Args:
             card_ref: The validated card reference
-            archive_data: The archive data to search in
+            lookup: The card index or store to search in
             debug: Whether to show debug output
             
         Returns:
             Optional[Dict]: The first matching card data, or None if not found
         """
-        fallback_match = None
-        fallback_set = ""
-
-        for set_code, set_data in archive_data["data"].items():
-            if set_code == card_ref.set_code:
+        for set_code, card_number, card_name, card in lookup.cards_by_name(card_ref.name):
+            if set_code == card_ref.set_code or not self._matches_card_name(card_name, card_ref.name):
                 continue  # Skip requested set, as it was already checked
-            for card in self._get_cards_from_set(set_data):
-                card_name = card.get("name", "")
-                if self._matches_card_name(card_name, card_ref.name):
-                    self._print_debug(
-                        card_ref,
-                        "fallback_candidate",
-                        set_code,
-                        str(card.get("number", "")),
-                        debug=True
-                    )
-                    if not fallback_match:  # Keep the first match as fallback
-                        fallback_match = card
-                        fallback_set = set_code
-
-        if fallback_match:
-            self._print_debug(card_ref, "fallback_used", fallback_set, debug=debug)
+            self._print_debug(card_ref, "fallback_candidate", set_code, card_number, debug=debug)
+            self._print_debug(card_ref, "fallback_used", set_code, debug=debug)
             self.logger.debug(f"Using fallback match for {card_ref.name} from different set (exact match in {card_ref.set_code} not found)")
-            return fallback_match
+            return card
         return None
 
-    def find_card(self, card_ref: CardReference, archive_data: Dict, debug: bool = False) -> Optional[Dict]:
+    def get_index(self, archive_data: Dict) -> CardIndex:
+        """Return the index of an archive, building it on first use.
+        
+        The index of the most recently searched archive is kept, so resolving
+        many deck lists against the same loaded archive indexes it only once.
+        
+        Args:
+            archive_data: The loaded archive data
+            
+        Returns:
+            CardIndex: The archive's card index
+        """
+        if self._index is None or self._indexed_archive is not archive_data:
+            self._index = CardIndex(archive_data)
+            self._indexed_archive = archive_data
+        return self._index
+
+    def find_card(
+        self,
+        card_ref: CardReference,
+        archive_data: Union[Dict, CardStore],
+        debug: bool = False
+    ) -> Optional[Dict]:
         """Find a card in the archive with fallback matching.
         
         Implements a two-stage search strategy:
@@ -140,23 +155,27 @@ class CardMatcher:
         
         Args:
             card_ref: The validated card reference
-            archive_data: The loaded archive data
+            archive_data: The loaded archive data, or an indexed card store
             debug: Whether to show debug output
             
         Returns:
             Optional[Dict]: The matching card data, or None if not found
         """
-        if "data" not in archive_data:
+        lookup: CardLookup
+        if isinstance(archive_data, CardStore):
+            lookup = archive_data
+        elif "data" not in archive_data:
             self.logger.warning("Archive missing 'data' section")
             return None
+        else:
+            lookup = self.get_index(archive_data)
 
         # Try exact match first
-        if card_ref.set_code in archive_data["data"]:
-            if match := self._find_exact_match(card_ref, archive_data["data"][card_ref.set_code], debug):
-                return match
+        if match := self._find_exact_match(card_ref, lookup, debug):
+            return match
 
         # Try fallback match if exact match fails
-        if match := self._find_fallback_match(card_ref, archive_data, debug):
+        if match := self._find_fallback_match(card_ref, lookup, debug):
             return match
 
         return None
@@ -0,0 +1,321 @@
+"""Module for the persistent, indexed card store used by deck extraction.
+
+This module converts a JSON card archive into an SQLite database once, so
+that deck extraction can look cards up through indexes instead of loading
+and scanning the whole archive on every run.
+
+Features:
+- Single streaming pass over the archive, plain or compressed
+- Lookups by set code and collector number, by front-face name and by uuid
+- Lazy connection: opening a store costs nothing until the first lookup
+- Only the cards actually requested are decoded
+
+Example:
+    ```python
+    CardStore.build("AllPrintings.json.gz", "AllPrintings.db")
+
+    with CardStore("AllPrintings.db") as store:
+        for set_code, number, name, card in store.cards_by_name("Lightning Bolt"):
+            print(set_code, number, name)
+    ```
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import ijson
+
+from ..io.parsers.card_stream import CardStreamReader, open_input_stream
+
+# Leading bytes of every SQLite database file
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+# Version of the store layout, checked when a store is opened
+STORE_FORMAT_VERSION = 1
+
+# Rows inserted per executemany call while building
+_INSERT_BATCH_SIZE = 5000
+
+_SCHEMA = """
+CREATE TABLE store_info (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE cards (
+    id INTEGER PRIMARY KEY,
+    set_code TEXT NOT NULL,
+    number TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    uuid TEXT,
+    data TEXT NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX cards_by_set_number ON cards (set_code, number);
+CREATE INDEX cards_by_name ON cards (name_key);
+CREATE INDEX cards_by_uuid ON cards (uuid);
+"""
+
+# A stored card: set code, collector number, full name and card data
+StoredCard = Tuple[str, str, str, Dict[str, Any]]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a card name for index lookups.
+
+    Split and double-faced cards are keyed by their front face, and names
+    are case-folded, so that ``"Lodestone Needle"`` and
+    ``"Lodestone Needle // Guidestone Compass"`` share a key.
+
+    Args:
+        name: Card name or deck list reference name
+
+    Returns:
+        str: The lookup key
+    """
+    return name.split(" //", 1)[0].strip().casefold()
+
+
+class CardStore:
+    """Read access to a card store built by ``CardStore.build``.
+
+    Lookups return candidate cards in archive order; deciding which candidate
+    matches a deck list reference is left to ``CardMatcher``. A store may be
+    shared between threads; lookups are serialized on its connection.
+
+    Attributes:
+        path (str): Path of the SQLite database
+    """
+
+    def __init__(self, path: str):
+        """Prepare a store for reading without opening it.
+
+        Args:
+            path: Path of the SQLite database
+        """
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "CardStore":
+        """Enter the context, returning the store."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Close the store on exit.
+
+        Returns:
+            bool: False to propagate exceptions
+        """
+        self.close()
+        return False
+
+    @staticmethod
+    def is_store(path: str) -> bool:
+        """Check whether a file is a card store rather than a JSON archive.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            bool: True if the file is an SQLite database
+        """
+        try:
+            with open(path, "rb") as candidate:
+                return candidate.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+        except OSError:
+            return False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The read-only database connection, opened on first use.
+
+        Raises:
+            FileNotFoundError: If the store does not exist
+            ValueError: If the file is not a card store of a supported version
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._open()
+            return self._connection
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the database and check its format version.
+
+        Returns:
+            sqlite3.Connection: The read-only connection
+        """
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Card store not found: {self.path}")
+        connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            row = connection.execute(
+                "SELECT value FROM store_info WHERE key = 'format_version'"
+            ).fetchone()
+        except sqlite3.DatabaseError as e:
+            connection.close()
+            raise ValueError(f"Invalid card store: {self.path}: {str(e)}")
+        if row is None or int(row[0]) != STORE_FORMAT_VERSION:
+            connection.close()
+            raise ValueError(f"Unsupported card store format: {self.path}")
+        return connection
+
+    def close(self) -> None:
+        """Close the database connection, if it was opened."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _select(self, where: str, parameters: Tuple[Any, ...]) -> List[StoredCard]:
+        """Fetch the cards matching a condition, in archive order.
+
+        Args:
+            where: SQL condition on the cards table
+            parameters: Values bound to the condition
+
+        Returns:
+            List[StoredCard]: Matching cards
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT set_code, number, name, data FROM cards WHERE {where} ORDER BY id",
+                parameters,
+            ).fetchall()
+        return [(set_code, number, name, json.loads(data)) for set_code, number, name, data in rows]
+
+    def cards_by_set_number(self, set_code: str, number: str) -> List[StoredCard]:
+        """Fetch the cards with a collector number in a set.
+
+        Args:
+            set_code: Set code
+            number: Collector number
+
+        Returns:
+            List[StoredCard]: Matching cards, usually one per face name
+        """
+        return self._select("set_code = ? AND number = ?", (set_code, number))
+
+    def cards_by_name(self, name: str) -> List[StoredCard]:
+        """Fetch every printing whose name normalizes like the given one.
+
+        Args:
+            name: Card name or front-face name
+
+        Returns:
+            List[StoredCard]: Candidate printings in archive order
+        """
+        return self._select("name_key = ?", (normalize_name(name),))
+
+    def card_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """Fetch a card by its uuid.
+
+        Args:
+            uuid: Card uuid
+
+        Returns:
+            Optional[Dict[str, Any]]: The card data, or None if not found
+        """
+        cards = self._select("uuid = ?", (uuid,))
+        return cards[0][3] if cards else None
+
+    def get_meta(self) -> Dict[str, Any]:
+        """Return the ``meta`` section of the source archive.
+
+        Returns:
+            Dict[str, Any]: The archive metadata, empty if it had none
+        """
+        with self._lock:
+            row = self.connection.execute("SELECT value FROM store_info WHERE key = 'meta'").fetchone()
+        return json.loads(row[0]) if row else {}
+
+    @staticmethod
+    def _rows(cards: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[Any, ...]]:
+        """Convert streamed cards into table rows.
+
+        Args:
+            cards: ``(set_code, card)`` pairs
+
+        Yields:
+            Tuple: Row values for the cards table
+        """
+        for set_code, card in cards:
+            name = str(card.get("name", ""))
+            yield (
+                set_code,
+                str(card.get("number", "")),
+                name,
+                normalize_name(name),
+                card.get("uuid"),
+                json.dumps(card),
+            )
+
+    @classmethod
+    def build(cls, archive_path: str, store_path: str) -> int:
+        """Convert a JSON archive into a card store.
+
+        The archive is streamed in a single pass, so memory use does not grow
+        with its size. The store is written to a temporary file and moved into
+        place once complete, so an interrupted build never leaves a partial
+        store behind.
+
+        Args:
+            archive_path: Path to the JSON archive, plain or compressed
+            store_path: Path of the store to create or replace
+
+        Returns:
+            int: Number of cards stored
+
+        Raises:
+            FileNotFoundError: If the archive does not exist
+            ValueError: If the archive is not valid JSON
+        """
+        if not os.path.exists(archive_path):
+            raise FileNotFoundError(f"Archive file not found: {archive_path}")
+
+        temporary_path = f"{store_path}.tmp"
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+        connection = sqlite3.connect(temporary_path)
+        try:
+            connection.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;")
+            connection.executescript(_SCHEMA)
+
+            count = 0
+            with open(archive_path, "rb") as archive_file:
+                reader = CardStreamReader(open_input_stream(archive_file))
+                rows = cls._rows(reader.iter_cards())
+                batch: List[Tuple[Any, ...]] = []
+                try:
+                    for row in rows:
+                        batch.append(row)
+                        if len(batch) >= _INSERT_BATCH_SIZE:
+                            connection.executemany("INSERT INTO cards VALUES (NULL, ?, ?, ?, ?, ?, ?)", batch)
+                            count += len(batch)
+                            batch.clear()
+                except ijson.JSONError as e:
+                    raise ValueError(f"Invalid JSON in archive: {str(e)}") from e
+                connection.executemany("INSERT INTO cards VALUES (NULL, ?, ?, ?, ?, ?, ?)", batch)
+                count += len(batch)
+
+            connection.executescript(_INDEXES)
+            connection.executemany(
+                "INSERT INTO store_info VALUES (?, ?)",
+                [
+                    ("format_version", str(STORE_FORMAT_VERSION)),
+                    ("meta", json.dumps(reader.meta or {})),
+                    ("card_count", str(count)),
+                ],
+            )
+            connection.commit()
+        except BaseException:
+            connection.close()
+            os.remove(temporary_path)
+            raise
+        connection.close()
+
+        os.replace(temporary_path, store_path)
+        return count
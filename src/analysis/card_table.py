@@ -0,0 +1,437 @@
+"""Columnar card table for running many filters over one loaded dump.
+
+Cards are loaded once into columns. Each column dictionary-encodes a field:
+every distinct value is stored once and each row holds the code of its value.
+A condition is then evaluated once per distinct value rather than once per
+card, and the matching codes are turned into a row mask by a single
+``bytes.translate`` over the codes. Masks hold one byte per row packed into a
+Python int, so the conditions on several fields are combined with integer
+``&``, and matching rows are read back by searching the mask's bytes; all of
+these run in C.
+
+Features:
+- Columns for mana values, saltiness, colors, color identity, rarity, type
+  and set code loaded up front; other fields loaded on their first use
+- The operators of ``FilterPlan``, with the same semantics, including the
+  defaults given to missing fields, combined by ``$and``, ``$or`` and
+  ``$not`` as masks combine by ``&``, ``|`` and complement
+- Results as row indices, counts or records projected by a schema
+- The cards allowed under each color identity masked once, on first use
+- An optional word index answering ``text_match`` conditions, so that only
+  the candidate cards it returns are evaluated
+- Cards referenced, never copied
+
+Example:
+    ```python
+    table = CardTable.from_archive(archive_data)
+    rows = table.select({"colors": {"contains": "W"}, "manaValue": {"lte": 2}})
+    count = table.count({"rarity": {"in": ["rare", "mythic"]}})
+    records = table.records({"type": {"eq": "Instant"}}, schema=["name", "setCode"])
+    allowed = table.rows(table.identity_mask("WU") & table.mask({"type": {"eq": "Instant"}}))
+    ```
+
+Note:
+    Columns are loaded lazily, so a table shared between threads should have
+    its columns loaded before it is shared.
+"""
+
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..processing.filters import (
+    COLOR_BITS, AnyOf, Condition, FilterNode, FilterPlan, Not, ValueTest,
+    card_color_mask, color_mask, compile_filters,
+)
+from ..processing.projection import CARD_DEFAULTS, SchemaProjector, compile_schema, normalize_languages
+from .cards import CardProcessorInterface
+from .text_index import TokenIndex
+
+# Columns loaded when a table is built
+DEFAULT_COLUMNS: Tuple[str, ...] = (
+    "manaValue", "convertedManaCost", "edhrecSaltiness",
+    "colors", "colorIdentity",
+    "rarity", "type", "setCode",
+)
+
+# Codes, including the one of missing values, that fit the one-byte codes
+# masked with ``bytes.translate``; columns with more distinct values keep the
+# rows of each value instead
+_BYTE_CODES = 256
+
+# Field holding the colors a commander must allow
+IDENTITY_FIELD = "colorIdentity"
+
+# Number of distinct WUBRG identities
+_IDENTITIES = 1 << len(COLOR_BITS)
+
+# Code of the rows lacking the field, with no default
+_MISSING_CODE = 0
+
+# A matching row in the bytes of a mask
+_MATCHED_ROW = re.compile(b"\x01")
+
+# Marker for fields without a value
+_MISSING = object()
+
+
+def _encoding_key(value: Any) -> Optional[Any]:
+    """Key under which a card value is dictionary-encoded.
+
+    Values of different types never share a key, so values with the same
+    key behave alike under every operator. Lists are keyed by their items.
+
+    Args:
+        value: Card value
+
+    Returns:
+        Optional[Any]: The key, or None if the value cannot be hashed
+    """
+    key = (list, tuple(value)) if isinstance(value, list) else (type(value), value)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class CardColumn:
+    """The dictionary-encoded values of one card field.
+
+    Attributes:
+        field (str): The card field
+        values (List[Any]): Distinct values by code; code 0 stands for rows
+            lacking the field
+        size (int): Number of rows
+    """
+
+    def __init__(self, field: str, cards: Sequence[dict]):
+        """Encode a field of every card.
+
+        Cards lacking the field take its default, as when filtering cards one
+        at a time; cards lacking a field without a default match no condition
+        on it.
+
+        Args:
+            field: Card field to encode
+            cards: Cards of the table
+        """
+        default = CARD_DEFAULTS.get(field, _MISSING)
+        values: List[Any] = [_MISSING]
+        index: Dict[Any, int] = {}
+        codes = array("I")
+        for card in cards:
+            value = card.get(field, default)
+            if value is _MISSING:
+                codes.append(_MISSING_CODE)
+                continue
+            key = _encoding_key(value)
+            code = index.get(key) if key is not None else None
+            if code is None:
+                code = len(values)
+                values.append(value)
+                if key is not None:
+                    index[key] = code
+            codes.append(code)
+
+        self.field = field
+        self.values = values
+        self.size = len(codes)
+        self._codes: Optional[bytes] = None
+        self._rows: Optional[List[array]] = None
+        if len(values) <= _BYTE_CODES:
+            self._codes = bytes(codes.tolist())
+        else:
+            self._rows = [array("I") for _ in values]
+            for row, code in enumerate(codes):
+                self._rows[code].append(row)
+
+    def mask(self, tests: Tuple[ValueTest, ...]) -> int:
+        """Mask the rows whose value passes every test.
+
+        Args:
+            tests: Compiled tests of the field
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows
+        """
+        values = self.values
+        return self.codes_mask(code for code in range(1, len(values)) if all(test(values[code]) for test in tests))
+
+    def codes_mask(self, codes: Iterable[int]) -> int:
+        """Mask the rows holding any of some codes.
+
+        Args:
+            codes: Codes of the values to mask
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows
+        """
+        matching = list(codes)
+        if not matching:
+            return 0
+
+        if self._codes is not None:
+            table = bytearray(_BYTE_CODES)
+            for code in matching:
+                table[code] = 1
+            return int.from_bytes(self._codes.translate(table), "little")
+
+        rows = self._rows or []
+        mask = bytearray(self.size)
+        for code in matching:
+            for row in rows[code]:
+                mask[row] = 1
+        return int.from_bytes(mask, "little")
+
+
+class CardTable:
+    """Cards loaded into dictionary-encoded columns for repeated filtering.
+
+    Attributes:
+        cards (List[dict]): The cards, by row
+    """
+
+    def __init__(
+        self,
+        cards: Iterable[dict],
+        columns: Iterable[str] = DEFAULT_COLUMNS,
+        text_fields: Iterable[str] = ()
+    ):
+        """Load cards.
+
+        Args:
+            cards: Cards to load
+            columns: Fields loaded up front; others are loaded on first use
+            text_fields: Fields to index by word, such as ``TEXT_FIELDS``,
+                for ``text_match`` conditions; none by default
+        """
+        self.cards: List[dict] = list(cards)
+        self._columns: Dict[str, CardColumn] = {}
+        self._identity_index: Optional[List[int]] = None
+        self._all_rows = int.from_bytes(b"\x01" * len(self.cards), "little")
+        for field in columns:
+            self.column(field)
+        text_fields = tuple(text_fields)
+        self.text_index: Optional[TokenIndex] = TokenIndex(self.cards, text_fields) if text_fields else None
+
+    @classmethod
+    def from_archive(
+        cls,
+        archive_data: Dict[str, Any],
+        columns: Iterable[str] = DEFAULT_COLUMNS,
+        text_fields: Iterable[str] = ()
+    ) -> "CardTable":
+        """Load every card of a loaded archive, in archive order.
+
+        Args:
+            archive_data: The loaded archive data
+            columns: Fields loaded up front
+            text_fields: Fields to index by word
+
+        Returns:
+            CardTable: The table
+        """
+        cards = (
+            card
+            for set_data in archive_data.get("data", {}).values()
+            for card in set_data.get("cards", [])
+        )
+        return cls(cards, columns, text_fields)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.cards)
+
+    def column(self, field: str) -> CardColumn:
+        """Get the column of a field, loading it on first use.
+
+        Args:
+            field: Card field
+
+        Returns:
+            CardColumn: The column
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = CardColumn(field, self.cards)
+        return column
+
+    def identity_mask(self, identity: Any) -> int:
+        """Mask the rows whose color identity is within an identity.
+
+        These are the cards a commander of that identity allows. The rows of
+        each of the 32 identities are masked once, on first use, so that
+        every later query is a lookup.
+
+        Args:
+            identity: Color letters, as a string such as ``"WU"`` or a list
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows
+
+        Raises:
+            ValueError: If the identity is not made of color letters
+        """
+        colors = color_mask(identity)
+        if self._identity_index is None:
+            self._identity_index = self._build_identity_index()
+        return self._identity_index[colors]
+
+    def _build_identity_index(self) -> List[int]:
+        """Mask the rows allowed under each identity.
+
+        Returns:
+            List[int]: Row masks indexed by identity bitmask
+        """
+        column = self.column(IDENTITY_FIELD)
+        codes_by_identity: List[List[int]] = [[] for _ in range(_IDENTITIES)]
+        for code in range(1, len(column.values)):
+            identity = card_color_mask(column.values[code])
+            if identity is not None:
+                codes_by_identity[identity].append(code)
+
+        # Start from the rows of each exact identity, then fold in every
+        # identity one color smaller, so each entry covers all its subsets
+        index = [column.codes_mask(codes) for codes in codes_by_identity]
+        for bit in COLOR_BITS.values():
+            for identity in range(_IDENTITIES):
+                if identity & bit:
+                    index[identity] |= index[identity ^ bit]
+        return index
+
+    def mask(self, filters: Union[Dict[str, Any], FilterPlan, None]) -> int:
+        """Mask the rows matching filter conditions.
+
+        Args:
+            filters: Filter conditions, a compiled plan, or None for every row
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows; masks
+                combine with ``&`` and ``|``
+
+        Raises:
+            ValueError: If the conditions are invalid
+        """
+        plan = filters if isinstance(filters, FilterPlan) else compile_filters(filters)
+        if self.text_index is not None:
+            candidates = self.text_index.candidates(plan)
+            if candidates is not None:
+                return self._candidates_mask(self.text_index.residual(plan), candidates)
+
+        return self._node_mask(plan.root)
+
+    def _node_mask(self, node: FilterNode) -> int:
+        """Mask the rows matching a node of a filter expression.
+
+        Args:
+            node: Compiled filter expression
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows
+        """
+        if isinstance(node, Condition):
+            return self.column(node.field).mask((node.test,))
+        if isinstance(node, Not):
+            return self._all_rows ^ self._node_mask(node.clause)
+        if isinstance(node, AnyOf):
+            mask = 0
+            for clause in node.clauses:
+                mask |= self._node_mask(clause)
+            return mask
+
+        mask = self._all_rows
+        for clause in node.clauses:
+            mask &= self._node_mask(clause)
+            if not mask:
+                break
+        return mask
+
+    def _candidates_mask(self, plan: FilterPlan, candidates: List[int]) -> int:
+        """Mask the candidate rows matching a plan, evaluated card by card.
+
+        Args:
+            plan: Conditions the text index left to evaluate
+            candidates: Rows the text index found
+
+        Returns:
+            int: Row mask with one byte per row, 1 for matching rows
+        """
+        cards, fields = self.cards, plan.fields
+        mask = bytearray(len(cards))
+        if not fields:
+            for row in candidates:
+                mask[row] = 1
+            return int.from_bytes(mask, "little")
+
+        view = CardProcessorInterface.filter_view
+        for row in candidates:
+            if plan.matches(view(cards[row], fields)):
+                mask[row] = 1
+        return int.from_bytes(mask, "little")
+
+    def rows(self, mask: int) -> List[int]:
+        """Read the rows of a mask.
+
+        Args:
+            mask: Row mask from ``mask``
+
+        Returns:
+            List[int]: Matching rows, in ascending order
+        """
+        data = mask.to_bytes(len(self.cards), "little")
+        return [match.start() for match in _MATCHED_ROW.finditer(data)]
+
+    def select(self, filters: Union[Dict[str, Any], FilterPlan, None]) -> List[int]:
+        """Find the rows matching filter conditions.
+
+        Args:
+            filters: Filter conditions, a compiled plan, or None for every row
+
+        Returns:
+            List[int]: Matching rows, in ascending order
+
+        Raises:
+            ValueError: If the conditions are invalid
+        """
+        return self.rows(self.mask(filters))
+
+    def count(self, filters: Union[Dict[str, Any], FilterPlan, None]) -> int:
+        """Count the rows matching filter conditions.
+
+        Args:
+            filters: Filter conditions, a compiled plan, or None for every row
+
+        Returns:
+            int: Number of matching rows
+
+        Raises:
+            ValueError: If the conditions are invalid
+        """
+        return self.mask(filters).bit_count()
+
+    def records(
+        self,
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None] = None,
+        additional_languages: Optional[Iterable[str]] = None
+    ) -> List[dict]:
+        """Project the cards matching filter conditions.
+
+        Args:
+            filters: Filter conditions, a compiled plan, or None for every row
+            schema: Field names or dotted paths, None for every field, or a
+                compiled projector
+            additional_languages: Languages of the translations to keep
+
+        Returns:
+            List[dict]: Matching cards as ``process_card`` would output them,
+                in row order
+
+        Raises:
+            ValueError: If the conditions or the schema are invalid
+        """
+        projector = compile_schema(schema)
+        languages = normalize_languages(additional_languages)
+        cards = self.cards
+        return [projector(cards[row], languages) for row in self.select(filters)]
@@ -6,12 +6,13 @@ support through a robust processing interface.
 
 Features:
 - Type-safe card filtering with comprehensive validation
-- Schema-based field selection with validation
+- Schema-based field selection with validation, including nested fields
+  selected by dotted paths such as ``legalities.commander``
 - Multi-language support with proper encoding
-- Null-safe default value handling
+- Null-safe default value handling, resolved only for missing fields
 - Type-aware operator evaluation
 - Comprehensive error handling
-- Memory-efficient processing
+- Memory-efficient processing: one output dict per card, no intermediate copies
 
 Example:
     Basic usage with type safety:
@@ -45,9 +46,13 @@ Note:
     - Null values are han"I dled gracefully
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
 from src.core.config import CardFilterConfig
-from src.processing.filters import get_operator_function
+from src.processing.deadlines import checkpoint
+from src.processing.filters import (
+    NOT_A_NUMBER, NUMERIC_OPERATORS, FilterPlan, coerce_number, compile_filters, get_operator_function,
+)
+from src.processing.projection import CARD_DEFAULTS, SchemaProjector, compile_schema, select_foreign_data
 
 
 class FilterStrategy:
@@ -119,10 +124,10 @@ class FilterStrategy:
             raise ValueError(f"Invalid operator: {op}")
 
         try:
-            if op in ['gt', 'lt', 'gte', 'lte']:
-                try:
-                    card_value, filter_value = float(card_value), float(filter_value)
-                except (TypeError, ValueError):
+            if op in NUMERIC_OPERATORS:
+                # Non-numeric card values read as NaN and fail the comparison
+                card_value, filter_value = coerce_number(card_value), coerce_number(filter_value)
+                if filter_value is NOT_A_NUMBER:
                     raise ValueError("Invalid value type for numeric operator")
             return operator_func(card_value, filter_value)
         except Exception as e:
@@ -146,6 +151,11 @@ class CardProcessorInterface:
     Attributes:
         config (CardFilterConfig): Validated configuration settings
         filter_strategy (FilterStrategy): Type-safe filter evaluation
+        
+    Note:
+        Filters are compiled into a ``FilterPlan`` and schemas into a
+        ``SchemaProjector`` on first use, and each is reused for as long as
+        equal filter conditions or schemas are passed.
 
     Example:
         ```python
@@ -175,6 +185,42 @@ class CardProcessorInterface:
         """
         self.config = config
         self.filter_strategy = FilterStrategy()
+        self._filter_plan: Optional[FilterPlan] = None
+        self._projector: SchemaProjector = compile_schema(None)
+        self._projector_schema: Optional[List[str]] = None
+
+    def get_filter_plan(self, filters: Union[Dict[str, Any], FilterPlan, None]) -> FilterPlan:
+        """Get the compiled plan for filter conditions.
+        
+        The most recently compiled plan is cached together with a snapshot of
+        its conditions, so passing the same filters for every card compiles
+        them once, while a filter dict modified in place is recompiled.
+        
+        Args:
+            filters: Filter conditions, or an already compiled plan
+            
+        Returns:
+            FilterPlan: The compiled plan
+            
+        Raises:
+            ValueError: If the conditions are invalid
+            
+        Example:
+            ```python
+            plan = processor.get_filter_plan({"colors": {"contains": "R"}})
+            red_cards = [card for card in cards if plan(processor.create_base_card(card))]
+            ```
+        """
+        if isinstance(filters, FilterPlan):
+            return filters
+
+        plan = self._filter_plan
+        if plan is not None and plan.conditions == filters:
+            return plan
+
+        plan = compile_filters(filters)
+        self._filter_plan = plan
+        return plan
 
     def create_base_card(self, card_data: dict) -> dict:
         """Creates a base card dictionary with null-safe defaults.
@@ -206,29 +252,111 @@ class CardProcessorInterface:
         """
         base_card = card_data.copy()
         
-        # Required fields with validation
-        base_card.setdefault("name", None)
-        base_card.setdefault("type", None)
-        
-        # Optional fields with type-safe defaults
-        base_card.setdefault("colors", [])
-        base_card.setdefault("colorIdentity", [])
-        base_card.setdefault("convertedManaCost", 0)
-        base_card.setdefault("text", "")
-        base_card.setdefault("edhrecSaltiness", 0.0)
-        base_card.setdefault("language", "English")
-        base_card.setdefault("foreignData", [])
-        base_card.setdefault("availability", [])
+        for field, default in CARD_DEFAULTS.items():
+            if field not in base_card:
+                base_card[field] = default.copy() if isinstance(default, list) else default
         
         return base_card
 
+    @staticmethod
+    def filter_view(card_data: dict, fields: Tuple[str, ...]) -> dict:
+        """Expose the filtered fields of a raw card with defaults applied.
+        
+        Filters see the same values as on ``create_base_card``'s output, but
+        without copying the card: the card itself is returned when it has
+        every field, otherwise a small dict holding only the filtered fields.
+        
+        Args:
+            card_data: Raw card data
+            fields: Field names the filter reads
+            
+        Returns:
+            dict: Mapping to evaluate the filter against; must not be modified
+        """
+        if all(field in card_data for field in fields):
+            return card_data
+
+        view = {}
+        for field in fields:
+            if field in card_data:
+                view[field] = card_data[field]
+            elif field in CARD_DEFAULTS:
+                view[field] = CARD_DEFAULTS[field]
+        return view
+
+    def get_projector(self, schema: Union[List[str], SchemaProjector, None]) -> SchemaProjector:
+        """Get the compiled projector for a schema.
+        
+        Like filter plans, the most recently compiled projector is cached
+        together with a snapshot of its schema.
+        
+        Args:
+            schema: Field names or dotted paths, None for every field, or an
+                already compiled projector
+            
+        Returns:
+            SchemaProjector: The compiled projector
+            
+        Raises:
+            ValueError: If a path is invalid
+        """
+        if isinstance(schema, SchemaProjector):
+            return schema
+
+        if schema == self._projector_schema:
+            return self._projector
+
+        projector = compile_schema(schema)
+        self._projector = projector
+        if schema is not None:
+            schema = schema[:] if isinstance(schema, (list, tuple)) else list(schema)
+        self._projector_schema = schema
+        return projector
+
+    def project_card(
+        self,
+        card_data: dict,
+        schema: Union[List[str], SchemaProjector, None],
+        additional_languages: Optional[List[str]]
+    ) -> dict:
+        """Build the output of ``process_card`` straight from the raw card.
+        
+        The result equals applying ``create_base_card``, the language data and
+        ``apply_schema`` in turn, keys in the same order, but it is the only
+        dict built: schema fields are read from the raw card, and defaults are
+        looked up, and list defaults copied, only for fields the card lacks.
+        Values are shared with the raw card, as they were with the copies.
+        Dotted paths select nested values (see ``SchemaProjector``).
+        
+        Args:
+            card_data: Raw card data, left unmodified
+            schema: Validated field selection, None for every field, or a
+                compiled projector
+            additional_languages: Validated language codes
+            
+        Returns:
+            dict: The processed card
+            
+        Example:
+            ```python
+            card = processor.project_card(
+                {"name": "Opt", "type": "Instant", "legalities": {"modern": "Legal", ...}},
+                schema=["name", "colors", "legalities.modern"],
+                additional_languages=None
+            )
+            # {"name": "Opt", "colors": [], "legalities": {"modern": "Legal"}}
+            ```
+        """
+        return self.get_projector(schema)(card_data, additional_languages)
+
     @staticmethod
     def filter_foreign_data(card_data: dict, additional_languages: Optional[List[str]]) -> List[dict]:
         """Filters foreign data entries with language validation.
         
         Args:
             card_data: Card data containing translations
-            additional_languages: Validated language codes
+            additional_languages: Validated language codes; a frozenset from
+                ``normalize_languages`` is matched without scanning
             
         Returns:
             List[dict]: Filtered and validated foreign data
@@ -241,15 +369,7 @@ class CardProcessorInterface:
             )
             ```
         """
-        if not additional_languages:
-            return []
-
-        foreign_data = card_data.get("foreignData", [])
-        return [
-            entry
-            for entry in foreign_data
-            if entry.get("language") in additional_languages
-        ]
+        return select_foreign_data(card_data, additional_languages)
 
     @staticmethod
     def apply_schema(card: dict, schema: Optional[List[str]]) -> dict:
@@ -283,16 +403,20 @@ class CardProcessorInterface:
             return {}
         return {key: card[key] for key in schema if key in card}
 
-    def evaluate_filters(self, card: dict, filter_conditions: Dict[str, Any]) -> bool:
+    def evaluate_filters(
+        self,
+        card: dict,
+        filter_conditions: Union[Dict[str, Any], FilterPlan, None]
+    ) -> bool:
         """Evaluates if a card matches filters with type safety.
         
-        This method applies all filter conditions to a card using the
-        type-safe filter strategy. All conditions must be met for the
-        card to pass the filter.
+        This method applies all filter conditions to a card through their
+        compiled plan. All conditions must be met for the card to pass the
+        filter, except as combined by ``$and``, ``$or`` and ``$not``.
         
         Args:
             card: Card data to evaluate
-            filter_conditions: Type-checked filter conditions
+            filter_conditions: Type-checked filter conditions or a compiled plan
             
         Returns:
             bool: True if card matches all conditions
@@ -309,44 +433,45 @@ class CardProcessorInterface:
                     "convertedManaCost": {"lte": 3}  # Numeric
                 }
             )
+            matches = processor.evaluate_filters(
+                card_data,
+                filter_conditions={
+                    "$or": [{"rarity": {"eq": "mythic"}}, {"colors": {"eq": []}}],
+                    "$not": {"type": {"contains": "Land"}},
+                }
+            )
             ```
         """
         if not filter_conditions:
             return True
 
-        for field, conditions in filter_conditions.items():
-            if field not in card:
-                return False
-                
-            card_value = card[field]
-            for op, filter_value in conditions.items():
-                if not get_operator_function(op):
-                    raise ValueError(f"Invalid operator: {op}")
-                try:
-                    if not self.filter_strategy.evaluate_condition(card_value, filter_value, op):
-                        return False
-                except ValueError as e:
-                    raise ValueError(str(e))
-                    
-        return True
+        return self.get_filter_plan(filter_conditions).matches(card)
 
     def process_card(
         self,
         card_data: dict,
-        filters: Optional[Dict[str, Any]] = None,
-        schema: Optional[List[str]] = None,
+        filters: Union[Dict[str, Any], FilterPlan, None] = None,
+        schema: Union[List[str], SchemaProjector, None] = None,
         additional_languages: Optional[List[str]] = None,
     ) -> Optional[dict]:
         """Processes a single card with comprehensive validation.
         
         This is the main method for processing individual cards. It applies
         type-safe filters, schema validation, and proper encoding handling
-        in a specific order to ensure consistent results.
+        in a specific order to ensure consistent results. Filters are
+        evaluated on the raw card, so rejected cards cost no more than the
+        filter itself, and the output is projected from the raw card by
+        ``project_card`` without copying it first.
+
+        Between steps, the card's deadline is checked (see
+        ``src.processing.deadlines``), so batch processing can stop a card
+        that overruns it; outside a batch the checks do nothing.
         
         Args:
             card_data: Raw card data to process
-            filters: Type-checked filter conditions
-            schema: Validated field selection
+            filters: Type-checked filter conditions or a compiled plan
+            schema: Validated field selection, as field names or dotted
+                paths, or a compiled projector
             additional_languages: Validated language codes
             
         Returns:
@@ -354,25 +479,19 @@ class CardProcessorInterface:
             
         Raises:
             ValueError: If validation fails or processing errors occur
+            CardTimeoutError: If the card overruns its deadline or is cancelled
         """
         try:
-            # Validate and prepare card data
+            # Validate card data and apply type-safe filters to the raw card
             self._validate_required_fields(card_data)
-            processed_card = self.create_base_card(card_data)
-
-            # Apply type-safe filters
-            if not self._apply_filters(processed_card, filters):
+            if not self._apply_filters(card_data, filters):
                 return None
+            checkpoint()
 
-            # Process language data with validation
-            processed_card = self._process_language_data(
-                processed_card, 
-                card_data,
-                additional_languages
-            )
-
-            # Apply schema with validation
-            return self._apply_final_schema(processed_card, schema)
+            # Project the schema fields, with language data, into one dict
+            processed_card = self.project_card(card_data, schema, additional_languages)
+            checkpoint()
+            return processed_card
             
         except ValueError as e:
             raise ValueError(f"Error processing card: {str(e)}")
@@ -382,19 +501,23 @@ class CardProcessorInterface:
         if not all(field in card_data for field in ["name", "type"]):
             raise ValueError("Card missing required fields")
 
-    def _validate_filter_operators(self, filters: Optional[Dict[str, Any]]) -> None:
-        """Validates filter operators with type checking."""
+    def _validate_filter_operators(self, filters: Union[Dict[str, Any], FilterPlan, None]) -> None:
+        """Validates filter operators once by compiling them."""
         if not filters:
             return
 
-        for conditions in filters.values():
-            for op in conditions.keys():
-                if not get_operator_function(op):
-                    raise ValueError(f"Invalid operator: {op}")
+        self.get_filter_plan(filters)
 
-    def _apply_filters(self, processed_card: dict, filters: Optional[Dict[str, Any]]) -> bool:
+    def _apply_filters(
+        self,
+        processed_card: dict,
+        filters: Union[Dict[str, Any], FilterPlan, None]
+    ) -> bool:
         """Applies filters with type safety.
         
+        Missing fields take their ``create_base_card`` defaults, so raw and
+        base cards are filtered alike.
+        
         Returns:
             bool: True if card passes filters
         """
@@ -402,8 +525,8 @@ class CardProcessorInterface:
             return True
 
         try:
-            self._validate_filter_operators(filters)
-            return self.evaluate_filters(processed_card, filters)
+            plan = self.get_filter_plan(filters)
+            return plan.matches(self.filter_view(processed_card, plan.fields))
         except ValueError as e:
             raise ValueError(f"Filter evaluation failed: {str(e)}")
 
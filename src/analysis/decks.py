@@ -2,19 +2,66 @@
 
 This module provides functionality for extracting complete card data from a JSON
 archive based on deck list references, implementing comprehensive validation,
-type safety, and error handling.
+type safety, and error handling. The archive may also be a card store built by
+``CardStore.build``, in which case only the referenced cards are read. Many deck
+lists can be extracted in one batch against a single loaded archive.
 """
 
-from typing import Dict, List, Optional, Union, Protocol
+import contextlib
+import functools
+import glob
+import os
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union, Protocol
 from datetime import datetime
-from ..utils.models import CardReference, DeckListStats
-from ..io.parsers.deck import DeckListParser
+from ..utils.models import CardReference, DeckBatchStats, DeckListStats
+from ..io.parsers.deck import DeckListParser, DeckParserError
 from ..analysis.cards import CardProcessorInterface
 from .archive import ArchiveLoader
 from .card_resolver import CardMatcher
+from .card_store import CardStore
 from .schema import SchemaValidator
 from .writer import DeckWriter
 
+# Worker threads used by extract_decks unless told otherwise
+DEFAULT_DECK_WORKERS = 4
+
+# Decks queued per worker thread before waiting for results
+DECKS_PER_WORKER = 4
+
+
+def find_deck_lists(source: str) -> List[str]:
+    """List the deck list files of a directory or matching a glob pattern.
+    
+    Args:
+        source: Directory, whose non-hidden files are taken, or glob pattern,
+            where ``**`` matches nested directories
+            
+    Returns:
+        List[str]: Deck list paths, sorted
+        
+    Raises:
+        FileNotFoundError: If no deck list file is found
+    """
+    if os.path.isdir(source):
+        paths = [
+            os.path.join(source, name) for name in os.listdir(source)
+            if not name.startswith(".")
+        ]
+    else:
+        paths = glob.glob(source, recursive=True)
+
+    deck_paths = sorted(path for path in paths if os.path.isfile(path))
+    if not deck_paths:
+        raise FileNotFoundError(f"No deck list files found: {source}")
+    return deck_paths
+
+
+def deck_name(deck_path: str) -> str:
+    """Return the name of a deck: its file name without the extension."""
+    return os.path.splitext(os.path.basename(deck_path))[0]
+
 
 class LoggingInterface(Protocol):
     """Protocol defining the logging interface with type safety."""
@@ -52,15 +99,40 @@ class DeckExtractorService:
         self.card_matcher = CardMatcher(logger=logger)
         self.stats = DeckListStats()
 
-    def _load_archive(self, archive_path: str) -> Dict:
-        """Delegate archive loading to ArchiveLoader."""
+    def _load_archive(self, archive_path: str) -> Union[Dict, CardStore]:
+        """Open a card store lazily, or delegate archive loading to ArchiveLoader."""
+        if CardStore.is_store(archive_path):
+            return CardStore(archive_path)
         return ArchiveLoader.load_archive(archive_path)
 
+    def build_index(self, archive_path: str, store_path: str) -> int:
+        """Convert a JSON archive into an indexed card store.
+        
+        Args:
+            archive_path: Path to the JSON archive, plain or compressed
+            store_path: Path of the card store to create
+            
+        Returns:
+            int: Number of cards indexed
+            
+        Raises:
+            FileNotFoundError: If the archive doesn't exist
+            ValueError: If the archive is not valid JSON
+        """
+        count = CardStore.build(archive_path, store_path)
+        self.logger.info(f"Indexed {count} cards from {archive_path} into {store_path}")
+        return count
+
     def _get_required_fields(self, schema: Union[str, Dict, None]) -> Optional[List[str]]:
         """Delegate schema validation to SchemaValidator."""
         return SchemaValidator.get_required_fields(schema)
 
-    def _find_card(self, card_ref: CardReference, archive_data: Dict, debug: bool = False) -> Optional[Dict]:
+    def _find_card(
+        self,
+        card_ref: CardReference,
+        archive_data: Union[Dict, CardStore],
+        debug: bool = False
+    ) -> Optional[Dict]:
         """Delegate card finding to CardMatcher."""
         return self.card_matcher.find_card(card_ref, archive_data, debug)
 
@@ -78,7 +150,7 @@ class DeckExtractorService:
         proper validation, error handling, and statistics tracking.
         
         Args:
-            archive_path: Path to the JSON archive file
+            archive_path: Path to the JSON archive file or card store
             decklist_path: Path to the deck list file
             output_path: Path for the output JSON file
             schema: Optional schema for validation
@@ -96,13 +168,77 @@ class DeckExtractorService:
 
         # Load and validate the archive
         archive_data = self._load_archive(archive_path)
+        try:
+            return self._extract_from_archive(archive_data, decklist_path, output_path, schema, debug)
+        finally:
+            if isinstance(archive_data, CardStore):
+                archive_data.close()
 
+    def _extract_from_archive(
+        self,
+        archive_data: Union[Dict, CardStore],
+        decklist_path: str,
+        output_path: str,
+        schema: Optional[Union[str, Dict]],
+        debug: bool
+    ) -> DeckListStats:
+        """Extract a deck list's cards from a loaded archive or open store.
+        
+        Args:
+            archive_data: The loaded archive data, or a card store
+            decklist_path: Path to the deck list file
+            output_path: Path for the output JSON file
+            schema: Optional schema for validation
+            debug: Whether to show debug output
+            
+        Returns:
+            DeckListStats: Detailed extraction statistics
+        """
         # Get required fields from schema
         required_fields = self._get_required_fields(schema)
 
+        extracted_cards, missing_cards, self.stats = self._resolve_deck(
+            archive_data, decklist_path, required_fields, debug
+        )
+
+        # Report missing cards
+        if missing_cards:
+            print("\nMissing cards:")
+            for card in missing_cards:
+                print(f"  {card}")
+
+        # Write the output with validation
+        DeckWriter.write_deck(output_path, extracted_cards)
+
+        return self.stats
+
+    def _resolve_deck(
+        self,
+        archive_data: Union[Dict, CardStore],
+        decklist_path: str,
+        required_fields: Optional[List[str]],
+        debug: bool
+    ) -> Tuple[List[Dict], List[str], DeckListStats]:
+        """Parse a deck list and resolve its cards, without side effects.
+        
+        Safe to call from several threads at once, provided the archive's
+        index has already been built.
+        
+        Args:
+            archive_data: The loaded archive data, or a card store
+            decklist_path: Path to the deck list file
+            required_fields: Optional fields to keep in each card
+            debug: Whether to show debug output
+            
+        Returns:
+            Tuple[List[Dict], List[str], DeckListStats]: The processed cards,
+                descriptions of the missing cards and the deck's statistics
+        """
+        stats = DeckListStats()
+
         # Parse the deck list with validation
         card_references = self.deck_parser.parse_deck_list(decklist_path)
-        self.stats.total_cards = len(card_references)
+        stats.total_cards = len(card_references)
 
         # Extract matching cards with validation
         extracted_cards = []
@@ -124,18 +260,129 @@ class DeckExtractorService:
                     # Add quantity information
                     processed_card["quantity"] = card_ref.quantity
                     extracted_cards.append(processed_card)
-                    self.stats.cards_found += 1
+                    stats.cards_found += 1
             else:
-                self.stats.cards_missing += 1
+                stats.cards_missing += 1
                 missing_cards.append(f"{card_ref.name} ({card_ref.set_code}) {card_ref.collector_number}")
 
-        # Report missing cards
-        if missing_cards:
-            print("\nMissing cards:")
-            for card in missing_cards:
-                print(f"  {card}")
+        return extracted_cards, missing_cards, stats
 
-        # Write the output with validation
-        DeckWriter.write_deck(output_path, extracted_cards)
+    def extract_decks(
+        self,
+        archive_path: str,
+        decklists: str,
+        output_path: str,
+        schema: Optional[Union[str, Dict]] = None,
+        jsonl: bool = False,
+        workers: int = DEFAULT_DECK_WORKERS,
+        debug: bool = False
+    ) -> DeckBatchStats:
+        """Extract card data for many deck lists against one archive.
+        
+        The archive is loaded and indexed once, decks are resolved in a pool
+        of worker threads sharing that index, and outputs are written in deck
+        list order. A deck list that cannot be read or parsed is recorded in
+        the statistics and does not stop the batch.
+        
+        Args:
+            archive_path: Path to the JSON archive file or card store
+            decklists: Directory of deck list files, or a glob pattern
+            output_path: Directory receiving one ``<deck>.json`` per deck list,
+                or with ``jsonl`` the JSON Lines file receiving every deck
+            schema: Optional schema for validation
+            jsonl: Whether to write a single JSON Lines file
+            workers: Number of worker threads resolving decks
+            debug: Whether to show debug output
+            
+        Returns:
+            DeckBatchStats: Statistics aggregated over every deck
+            
+        Raises:
+            FileNotFoundError: If the archive or the deck lists don't exist
+            ValueError: If the archive is invalid or two deck lists share a name
+            IOError: If writing the output fails
+        """
+        deck_paths = find_deck_lists(decklists)
+        deck_names = [deck_name(path) for path in deck_paths]
+        if not jsonl:
+            duplicates = sorted(name for name, count in Counter(deck_names).items() if count > 1)
+            if duplicates:
+                raise ValueError(f"Deck lists share output names: {', '.join(duplicates)}")
+            os.makedirs(output_path, exist_ok=True)
+
+        self.stats = DeckBatchStats()
+        required_fields = self._get_required_fields(schema)
+
+        archive_data = self._load_archive(archive_path)
+        try:
+            if not isinstance(archive_data, CardStore) and "data" in archive_data:
+                # Index once, before the worker threads share it
+                index = self.card_matcher.get_index(archive_data)
+                self.logger.info(f"Indexed {index.card_count} cards from {archive_path}")
 
+            with contextlib.ExitStack() as stack:
+                jsonl_file = stack.enter_context(open(output_path, "w", encoding="utf-8")) if jsonl else None
+                workers = max(1, workers)
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                resolve = functools.partial(
+                    self._resolve_deck, archive_data, required_fields=required_fields, debug=debug
+                )
+
+                for deck_path, name, result in self._map_decks(
+                    executor, resolve, deck_paths, deck_names, workers * DECKS_PER_WORKER
+                ):
+                    try:
+                        extracted_cards, missing_cards, stats = result.result()
+                    except (FileNotFoundError, ValueError, DeckParserError) as e:
+                        self.logger.error(f"Skipping deck list {deck_path}: {str(e)}")
+                        self.stats.failed_decks[deck_path] = str(e)
+                        continue
+
+                    if missing_cards:
+                        print(f"\nMissing cards in {deck_path}:")
+                        for card in missing_cards:
+                            print(f"  {card}")
+
+                    if jsonl_file is not None:
+                        DeckWriter.write_deck_line(jsonl_file, name, deck_path, extracted_cards)
+                    else:
+                        DeckWriter.write_deck(os.path.join(output_path, f"{name}.json"), extracted_cards)
+                    self.stats.add(stats)
+        finally:
+            if isinstance(archive_data, CardStore):
+                archive_data.close()
+
+        self.logger.info(
+            f"Extracted {self.stats.decks_processed} deck lists, "
+            f"{len(self.stats.failed_decks)} failed"
+        )
         return self.stats
+
+    @staticmethod
+    def _map_decks(
+        executor: ThreadPoolExecutor,
+        resolve: Callable[[str], Tuple[List[Dict], List[str], DeckListStats]],
+        deck_paths: List[str],
+        deck_names: List[str],
+        max_pending: int
+    ) -> Iterator[Tuple[str, str, Future]]:
+        """Submit decks with a bounded number in flight, yielding them in order.
+        
+        Args:
+            executor: Pool resolving the decks
+            resolve: Function resolving one deck list path
+            deck_paths: Deck list paths
+            deck_names: Output name of each deck list
+            max_pending: Maximum number of decks submitted but not yet yielded
+            
+        Yields:
+            Tuple[str, str, Future]: Path, name and completed resolution of each deck
+        """
+        pending: Deque[Tuple[str, str, Future]] = deque()
+        for deck_path, name in zip(deck_paths, deck_names):
+            pending.append((deck_path, name, executor.submit(resolve, deck_path)))
+            if len(pending) >= max_pending:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
@@ -0,0 +1,127 @@
+"""Inverted word index over the text fields of loaded cards.
+
+The index maps every word of a card's rules text, type line and keywords to
+the rows of the cards holding it. A ``text_match`` condition on an indexed
+field is then answered by intersecting the rows of its words, the shortest
+first, instead of reading the text of every card.
+
+Features:
+- Words split exactly as ``text_match`` splits them, so candidates are the
+  matching cards themselves
+- Defaults given to missing fields, as when filtering cards one at a time
+- Several ``text_match`` conditions intersected into one candidate list
+- The conditions left to evaluate on the candidates compiled separately
+
+Example:
+    ```python
+    index = TokenIndex(cards)
+    rows = index.candidates(compile_filters({"text": {"text_match": "draw a card"}}))
+    ```
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..processing.filters import TEXT_MATCH_OPERATOR, FilterPlan, compile_filters, text_tokens
+from ..processing.projection import CARD_DEFAULTS
+
+# Fields indexed by default
+TEXT_FIELDS: Tuple[str, ...] = ("text", "type", "keywords")
+
+
+class TokenIndex:
+    """Rows of the cards holding each word of the indexed fields.
+
+    Attributes:
+        fields (Tuple[str, ...]): The indexed fields
+        size (int): Number of rows
+    """
+
+    def __init__(self, cards: Sequence[dict], fields: Iterable[str] = TEXT_FIELDS):
+        """Index cards.
+
+        Args:
+            cards: Cards, by row
+            fields: Fields to index
+        """
+        self.fields = tuple(fields)
+        self.size = len(cards)
+        self._postings: Dict[str, Dict[str, array]] = {field: {} for field in self.fields}
+        for field in self.fields:
+            postings = self._postings[field]
+            default = CARD_DEFAULTS.get(field)
+            for row, card in enumerate(cards):
+                for word in text_tokens(card.get(field, default)):
+                    rows = postings.get(word)
+                    if rows is None:
+                        rows = postings[word] = array("I")
+                    rows.append(row)
+
+    def rows(self, field: str, query: str) -> List[int]:
+        """Find the rows whose field has every word of a query.
+
+        Args:
+            field: Indexed field
+            query: Words to match, as for ``text_match``
+
+        Returns:
+            List[int]: Matching rows, in ascending order
+
+        Raises:
+            KeyError: If the field is not indexed
+        """
+        postings = self._postings[field]
+        lists = sorted((postings.get(word, ()) for word in text_tokens(query)), key=len)
+        if not lists:
+            return []
+        rows = set(lists[0])
+        for other in lists[1:]:
+            if not rows:
+                break
+            rows.intersection_update(other)
+        return sorted(rows)
+
+    def candidates(self, plan: FilterPlan) -> Optional[List[int]]:
+        """Find the rows that can match a plan from its ``text_match`` conditions.
+
+        Args:
+            plan: Compiled filter plan
+
+        Returns:
+            Optional[List[int]]: Rows matching every ``text_match`` condition
+                on an indexed field, in ascending order, or None if the plan
+                has no such condition
+        """
+        candidates: Optional[List[int]] = None
+        for field, conditions in plan.conditions.items():
+            if field not in self._postings or TEXT_MATCH_OPERATOR not in conditions:
+                continue
+            rows = self.rows(field, conditions[TEXT_MATCH_OPERATOR])
+            candidates = rows if candidates is None else sorted(set(candidates).intersection(rows))
+            if not candidates:
+                break
+        return candidates
+
+    def residual(self, plan: FilterPlan) -> FilterPlan:
+        """Compile the conditions of a plan the index does not answer.
+
+        The index splits text into the same words as ``text_match``, so its
+        candidates match every ``text_match`` condition on an indexed field
+        and only the other conditions are left to evaluate.
+
+        Args:
+            plan: Compiled filter plan
+
+        Returns:
+            FilterPlan: Plan of the remaining conditions; it matches every
+                card if none remain
+        """
+        remaining = {}
+        for field, conditions in plan.conditions.items():
+            if field in self._postings and TEXT_MATCH_OPERATOR in conditions:
+                conditions = {op: value for op, value in conditions.items() if op != TEXT_MATCH_OPERATOR}
+                if not conditions:
+                    continue
+            # Fields without conditions stay, as they require the field
+            remaining[field] = conditions
+        return plan if remaining == plan.conditions else compile_filters(remaining)
@@ -6,7 +6,7 @@ implementing proper error handling and metadata tracking.
 
 import json
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, TextIO
 from ..core.config import load_config
 
 
@@ -48,3 +48,25 @@ class DeckWriter:
 
         except IOError as e:
             raise IOError(f"Error writing output file: {str(e)}")
+
+    @staticmethod
+    def write_deck_line(output_file: TextIO, deck_name: str, deck_path: str, extracted_cards: List[Dict]) -> None:
+        """Write one deck as a line of a JSON Lines file.
+        
+        Args:
+            output_file: Open text file receiving the line
+            deck_name: Name of the deck, taken from its deck list file
+            deck_path: Path of the deck list file
+            extracted_cards: List of processed card data
+            
+        Raises:
+            IOError: If writing to output file fails
+        """
+        try:
+            output_file.write(json.dumps({
+                "deck": deck_name,
+                "path": deck_path,
+                "cards": extracted_cards
+            }) + "\n")
+        except IOError as e:
+            raise IOError(f"Error writing output file: {str(e)}")
@@ -155,6 +155,7 @@ class CardFilterConfig(BaseModel):
         buffer_size (int): Buffer size for file operations
         default_schema (List[str]): Default fields to include
         valid_operators (Set[str]): Valid filter operators
+        max_workers (Optional[int]): Batch processing workers, None for the backend default
         log_file (str): Log file path
         log_format (str): Log message format
         log_level (str): Logging level
@@ -196,6 +197,13 @@ class CardFilterConfig(BaseModel):
         default={"eq", "contains", "gt", "lt"}, description="Valid filter operators"
     )
 
+    # Batch processing settings
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of batch processing workers; None uses the backend default",
+    )
+
     # Logging settings with validation
     log_file: str = Field(default="filter_cards.log", description="Log file path")
     log_format: str = Field(
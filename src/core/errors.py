@@ -16,6 +16,7 @@ Exception Hierarchy:
   |- InvalidFilterError (filter validation)
   |- SchemaValidationError (data validation)
   |- CardProcessingError (card processing)
+  |   |- CardTimeoutError (card deadline exceeded or cancelled)
   |- BatchProcessingError (batch processing)
 
 Example:
@@ -330,6 +331,41 @@ class CardProcessingError(CardFilterError):
         super().__init__(message)
 
 
+class CardTimeoutError(CardProcessingError):
+    """Raised when a card overruns its processing deadline or is cancelled.
+    
+    Batch processing gives every card a deadline. Card processors check it
+    at cooperative checkpoints (see ``src.processing.deadlines.checkpoint``),
+    where this exception stops the card; the batch then quarantines it
+    instead of letting it stall the pipeline.
+    
+    Example:
+        ```python
+        try:
+            with card_deadline(timeout=0.5):
+                processor.process_card(card_data)
+        except CardTimeoutError as e:
+            print(f"Gave up after {e.elapsed:.2f}s")
+        ```
+    
+    Attributes:
+        message (str): Detailed error message
+        elapsed (float): Seconds the card had been processed for
+        cancelled (bool): Whether the card was cancelled rather than timed out
+    """
+    def __init__(self, message: str, elapsed: float = 0.0, cancelled: bool = False):
+        """Initialize the exception with the deadline details.
+        
+        Args:
+            message (str): Detailed error message
+            elapsed (float): Seconds the card had been processed for
+            cancelled (bool): Whether the card was cancelled
+        """
+        self.elapsed = elapsed
+        self.cancelled = cancelled
+        super().__init__(message)
+
+
 class BatchProcessingError(CardFilterError):
     """Raised when an error occurs during batch processing operations.
     
@@ -15,22 +15,40 @@ Features:
 Commands:
     filter: Filter cards based on various criteria
         Arguments:
-            input_file: Path to the source JSON file containing card data
+            input_file: Path to the source JSON file containing card data (- for stdin)
             output_file: Path where filtered card data will be written
             --schema: Optional path to a JSON schema file for attribute filtering
             --dump-schema: Optional path to output the default schema
             --filters: JSON string of filter criteria
             --additional-languages: List of languages to include besides English
             --config: Path to YAML or JSON configuration file
+            --no-progress: Disable the progress bar
+            --workers: Number of worker processes that filter sets in parallel
+            --prune-translations: Drop unrequested translations before parsing
 
     extract-deck: Extract card data for a deck list
         Arguments:
-            archive: Path to the JSON archive containing all card data
+            archive: Path to the JSON archive or card store containing all card data
             decklist: Path to the deck list file
             output: Path where extracted card data will be written
             --schema: Optional path to a JSON schema file for attribute filtering
             --debug: Show detailed debug output during extraction
 
+    extract-decks: Extract card data for every deck list of a directory or glob
+        Arguments:
+            archive: Path to the JSON archive or card store containing all card data
+            decklists: Directory of deck list files, or a quoted glob pattern
+            output: Output directory, or JSON Lines file with --jsonl
+            --jsonl: Write every deck to a single JSON Lines file
+            --schema: Optional path to a JSON schema file for attribute filtering
+            --workers: Number of worker threads resolving decks
+            --debug: Show detailed debug output during extraction
+
+    build-index: Convert a JSON archive into an indexed card store for extract-deck
+        Arguments:
+            archive: Path to the JSON archive, plain or compressed
+            store: Path where the card store will be written
+
 Example usage:
     Filter white cards:
     $ python -m orthodoxy filter input.json output.json --filters '{"colors": {"contains": "W"}}'
@@ -40,6 +58,13 @@ Example usage:
 
     Extract deck cards:
     $ python -m orthodoxy extract-deck cards.json deck.txt deck_cards.json
+
+    Extract every deck list of a directory into one JSON Lines file:
+    $ python -m orthodoxy extract-decks cards.json decks/ decks.jsonl --jsonl
+
+    Index the archive once, then extract from the store:
+    $ python -m orthodoxy build-index cards.json cards.db
+    $ python -m orthodoxy extract-deck cards.db deck.txt deck_cards.json
 """
 
 import json
@@ -48,6 +73,7 @@ import argparse
 from typing import Optional, Dict, Any
 from ..utils.container import Container
 from ..services.analysis import CardFilterService
+from ..analysis.decks import DEFAULT_DECK_WORKERS
 
 
 def setup_filter_parser(subparsers):
@@ -82,13 +108,21 @@ Examples:
 
   # Export the default schema to see available card attributes
   python -m orthodoxy filter cards.json output.json --dump-schema schema.json
+
+  # Stream a compressed dump from standard input
+  curl -s https://mtgjson.com/api/v5/AllPrintings.json.gz | \\
+    python -m orthodoxy filter - output.json --filters '{"colors": {"contains": "W"}}'
+
+  # Filter sets in parallel on four processes
+  python -m orthodoxy filter cards.json output.json --workers 4
 """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument(
         "input_file",
         type=str,
-        help="Path to the input JSON file containing the card data to filter."
+        help="""Path to the input JSON file containing the card data to filter, or - to read
+from standard input. Gzip, bzip2 and xz compressed inputs are detected automatically."""
     )
     parser.add_argument(
         "output_file",
@@ -99,7 +133,8 @@ Examples:
         "--schema",
         type=str,
         help="""Path to a JSON schema file that defines which card attributes to include in the output JSON.
-Use this to customize which fields (like name, mana_cost, type_line) appear in the output."""
+Use this to customize which fields (like name, mana_cost, type_line) appear in the output.
+Nested fields are selected with dotted paths, such as legalities.commander."""
     )
     parser.add_argument(
         "--dump-schema",
@@ -110,8 +145,11 @@ Use this to customize which fields (like name, mana_cost, type_line) appear in t
         "--filters",
         type=str,
         help="""JSON string containing filter criteria. Format: {"field": {"operator": "value"}}.
-Available operators: equals, contains, greater_than, less_than, regex.
-Example: '{"colors": {"contains": "W"}, "cmc": {"less_than": 4}}'"""
+Available operators: eq, gt, lt, gte, lte, contains, in, not_in, contains_any,
+contains_all, regex, text_match (every word, any order, ignoring case), and on
+colors subset, superset, exact, any. Combine filters with "$and" and "$or"
+(lists of filters) and "$not" (a filter).
+Example: '{"colorIdentity": {"subset": "WU"}, "$not": {"type": {"contains": "Land"}}}'"""
     )
     parser.add_argument(
         "--additional-languages",
@@ -125,6 +163,26 @@ Example: --additional-languages German Spanish Japanese"""
         type=str,
         help="Path to a YAML or JSON configuration file with additional settings."
     )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable the progress bar. It is also disabled automatically when not writing to a terminal."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="""Number of worker processes that filter sets in parallel. The default of 1 streams
+the input in a single process; with more workers the whole uncompressed input is memory-mapped
+or held in memory. The output is identical either way."""
+    )
+    parser.add_argument(
+        "--prune-translations",
+        action="store_true",
+        help="""Drop translations in languages not given with --additional-languages from the raw input
+before it is parsed. This lowers memory use at some CPU cost; the output is unchanged. Ignored when
+the filters read foreignData."""
+    )
     return parser
 
 
@@ -168,13 +226,17 @@ Examples:
 
   # Show detailed debug output during extraction
   python -m orthodoxy extract-deck cards.json deck.txt output.json --debug
+
+  # Extract from a card store built with build-index, without loading the archive
+  python -m orthodoxy extract-deck cards.db deck.txt output.json
 """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument(
         "archive",
         type=str,
-        help="Path to the JSON archive file containing the complete card database."
+        help="""Path to the JSON archive file containing the complete card database, or to a
+card store created with build-index."""
     )
     parser.add_argument(
         "decklist",
@@ -191,7 +253,8 @@ optionally prefixed with a quantity (e.g., "4 Lightning Bolt" or "2x Mountain").
         "--schema",
         type=str,
         help="""Path to a JSON schema file that defines which card attributes to include in the output JSON.
-Use this to customize which fields (like name, mana_cost, type_line) appear in the output."""
+Use this to customize which fields (like name, mana_cost, type_line) appear in the output.
+Nested fields are selected with dotted paths, such as legalities.commander."""
     )
     parser.add_argument(
         "--debug",
@@ -201,6 +264,111 @@ Use this to customize which fields (like name, mana_cost, type_line) appear in t
     return parser
 
 
+def setup_extract_decks_parser(subparsers):
+    """Set up the parser for the extract-decks command."""
+    parser = subparsers.add_parser(
+        'extract-decks',
+        help="Extract card data for many deck lists at once",
+        description="""
+Extract card data for every deck list of a directory or glob pattern.
+
+The archive is loaded and indexed once for the whole batch, and deck lists are
+resolved in parallel. Each deck is written to <output>/<deck name>.json, named after
+its deck list file, or with --jsonl as one line of a single JSON Lines file:
+
+  {"deck": "<deck name>", "path": "<deck list path>", "cards": [...]}
+
+A deck list that cannot be read or parsed is reported and skipped. Statistics are
+aggregated over all decks.
+
+Examples:
+  # Extract every deck list of a directory into an output directory
+  python -m orthodoxy extract-decks cards.json decks/ extracted/
+
+  # Extract the deck lists matching a glob pattern into one JSON Lines file
+  python -m orthodoxy extract-decks cards.json "decks/**/*.txt" decks.jsonl --jsonl
+
+  # Use eight worker threads and a card store built with build-index
+  python -m orthodoxy extract-decks cards.db decks/ extracted/ --workers 8
+""",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "archive",
+        type=str,
+        help="""Path to the JSON archive file containing the complete card database, or to a
+card store created with build-index."""
+    )
+    parser.add_argument(
+        "decklists",
+        type=str,
+        help="""Directory of deck list files, or a glob pattern matching them (quote it so
+the shell does not expand it). "**" matches nested directories."""
+    )
+    parser.add_argument(
+        "output",
+        type=str,
+        help="Directory where one JSON file per deck is written, or the JSON Lines file with --jsonl."
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write all decks to a single JSON Lines file instead of one file per deck."
+    )
+    parser.add_argument(
+        "--schema",
+        type=str,
+        help="""Path to a JSON schema file that defines which card attributes to include in the output JSON."""
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_DECK_WORKERS,
+        help=f"Number of worker threads resolving decks (default: {DEFAULT_DECK_WORKERS})."
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Show detailed debug output during extraction."
+    )
+    return parser
+
+
+def setup_build_index_parser(subparsers):
+    """Set up the parser for the build-index command."""
+    parser = subparsers.add_parser(
+        'build-index',
+        help="Convert a JSON archive into an indexed card store",
+        description="""
+Convert a JSON card archive into an indexed card store.
+
+The archive is read once and written to an SQLite database indexed by set code and
+collector number, by card name and by uuid. Passing the store to extract-deck instead
+of the archive avoids loading the whole archive on every run: only the cards a deck
+list references are read.
+
+Examples:
+  # Index an archive
+  python -m orthodoxy build-index AllPrintings.json AllPrintings.db
+
+  # Compressed archives are read directly
+  python -m orthodoxy build-index AllPrintings.json.xz AllPrintings.db
+""",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "archive",
+        type=str,
+        help="Path to the JSON archive file. Gzip, bzip2 and xz compressed archives are detected automatically."
+    )
+    parser.add_argument(
+        "store",
+        type=str,
+        help="Path where the card store will be written. An existing store is replaced."
+    )
+    return parser
+
+
 def handle_filter_command(args: argparse.Namespace, container: Container) -> None:
     """Handle the filter command."""
     card_filter_service = CardFilterService(container)
@@ -221,6 +389,9 @@ def handle_filter_command(args: argparse.Namespace, container: Container) -> Non
         dump_schema=args.dump_schema,
         filters=filters,
         additional_languages=args.additional_languages,
+        show_progress=not args.no_progress,
+        workers=args.workers,
+        prune_translations=args.prune_translations,
     )
 
 
@@ -272,6 +443,65 @@ def handle_extract_deck_command(args: argparse.Namespace, container: Container)
         sys.exit(1)
 
 
+def handle_extract_decks_command(args: argparse.Namespace, container: Container) -> None:
+    """Handle the extract-decks command."""
+    deck_extractor = container.deck_extractor_service()
+    logger = container.logging_service()
+
+    schema = None
+    if args.schema:
+        try:
+            with open(args.schema, 'r', encoding='utf-8') as schema_file:
+                schema = json.load(schema_file)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.error(f"Error loading schema file: {str(e)}")
+            print(f"Error: Failed to load schema file - {str(e)}")
+            sys.exit(1)
+
+    try:
+        stats = deck_extractor.extract_decks(
+            archive_path=args.archive,
+            decklists=args.decklists,
+            output_path=args.output,
+            schema=schema,
+            jsonl=args.jsonl,
+            workers=args.workers,
+            debug=args.debug
+        )
+    except (FileNotFoundError, ValueError, IOError) as e:
+        logger.error(str(e))
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+    if stats.failed_decks:
+        print("\nFailed deck lists:")
+        for deck_path, error in stats.failed_decks.items():
+            print(f"  {deck_path}: {error}")
+
+    # Print statistics
+    print("\nDeck Extraction Statistics:")
+    print(f"Decks extracted: {stats.decks_processed}")
+    print(f"Decks failed: {len(stats.failed_decks)}")
+    print(f"Total unique cards: {stats.total_cards}")
+    print(f"Cards found: {stats.cards_found}")
+    print(f"Cards missing: {stats.cards_missing}")
+    print(f"Success rate: {stats.success_rate:.1f}%")
+
+
+def handle_build_index_command(args: argparse.Namespace, container: Container) -> None:
+    """Handle the build-index command."""
+    deck_extractor = container.deck_extractor_service()
+    logger = container.logging_service()
+
+    try:
+        count = deck_extractor.build_index(args.archive, args.store)
+        print(f"Indexed {count} cards into {args.store}")
+    except (FileNotFoundError, ValueError, IOError) as e:
+        logger.error(str(e))
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+
 def main():
     """Main entry point for the card filter application."""
     container = Container()
@@ -280,7 +510,8 @@ def main():
     parser = argparse.ArgumentParser(
         description="""Process Magic: The Gathering card data.
 
-This tool provides two main commands that both output card data in JSON format:
+This tool provides commands that output card data in JSON format, and a command
+that prepares an archive for fast deck extraction:
 
   filter        - Filter cards from a JSON file based on various criteria.
                  Outputs matching cards as a JSON file.
@@ -288,7 +519,13 @@ This tool provides two main commands that both output card data in JSON format:
   extract-deck  - Extract card data for a deck list from a card database.
                  Outputs the deck's cards as a JSON file.
 
-Both commands support using a schema file (--schema) to control which card
+  extract-decks - Extract card data for a directory of deck lists at once.
+                 Outputs one JSON file per deck, or a JSON Lines file.
+
+  build-index   - Convert a card archive into an indexed card store that
+                 extract-deck can read without loading the whole archive.
+
+All output commands support using a schema file (--schema) to control which card
 attributes appear in the output JSON.
 
 Use -h or --help with any command to see detailed usage information.
@@ -297,7 +534,7 @@ Example: python -m orthodoxy filter --help""",
     )
     subparsers = parser.add_subparsers(
         dest='command',
-        metavar='{filter, extract-deck}',
+        metavar='{filter, extract-deck, extract-decks, build-index}',
         help='Available commands',
         description='Choose a command to execute:'
     )
@@ -305,6 +542,8 @@ Example: python -m orthodoxy filter --help""",
     # Set up command parsers
     setup_filter_parser(subparsers)
     setup_extract_deck_parser(subparsers)
+    setup_extract_decks_parser(subparsers)
+    setup_build_index_parser(subparsers)
 
     args = parser.parse_args()
 
@@ -313,6 +552,10 @@ Example: python -m orthodoxy filter --help""",
             handle_filter_command(args, container)
         elif args.command == 'extract-deck':
             handle_extract_deck_command(args, container)
+        elif args.command == 'extract-decks':
+            handle_extract_decks_command(args, container)
+        elif args.command == 'build-index':
+            handle_build_index_command(args, container)
         else:
             parser.print_help()
             exit(1)
@@ -0,0 +1,832 @@
+"""Streaming reader for MTGJSON-style card dumps.
+
+This module provides single-pass access to large card dump files. The input is
+read exactly once and never seeked, which means it works on non-seekable sources
+such as pipes and standard input, and on gzip, bzip2 and xz compressed streams.
+
+Features:
+- Transparent decompression based on the stream's magic bytes
+- Single-pass event streaming with no seeking
+- Object-level card streaming through ijson's C backend
+- Capture of the top-level ``meta`` object wherever it appears in the stream
+- Allocation-free location of each set's byte range for parallel processing
+- Optional pruning of ``foreignData`` entries in unrequested languages from
+  the raw bytes, before they are parsed
+
+Example:
+    ```python
+    with open("AllPrintings.json.gz", "rb") as raw:
+        reader = CardStreamReader(open_input_stream(raw))
+        for set_code, card in reader.iter_cards():
+            print(set_code, card["name"], card.get("legalities"))
+        print(reader.meta)  # Available once the stream has been consumed
+    ```
+
+Note:
+    Card objects are built set by set, so peak memory is bounded by the
+    largest set in the dump rather than by the dump itself.
+"""
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+import mmap
+import re
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+import ijson
+
+# Magic bytes of the supported compression formats, mapped to stream openers
+_COMPRESSION_SIGNATURES: Tuple[Tuple[bytes, Callable[[BinaryIO], Any]], ...] = (
+    (b"\x1f\x8b", lambda stream: gzip.GzipFile(fileobj=stream, mode="rb")),
+    (b"BZh", lambda stream: bz2.BZ2File(stream, mode="rb")),
+    (b"\xfd7zXZ\x00", lambda stream: lzma.LZMAFile(stream, mode="rb")),
+)
+_SIGNATURE_LENGTH = max(len(signature) for signature, _ in _COMPRESSION_SIGNATURES)
+
+# Buffers the set scanner can search: bytes or a memory-mapped file
+DumpBuffer = Union[bytes, mmap.mmap]
+
+# Skips whitespace, scalars and whole strings, stopping on the next structural
+# bracket, which is captured. Strings are consumed in one step, so brackets
+# inside them (mana costs, rules text) are never mistaken for structure.
+_NEXT_BRACKET = re.compile(rb'(?:[^"\[\]{}]++|"(?:[^"\\]++|\\.)*+")*+([\[\]{}])', re.DOTALL)
+_STRING = re.compile(rb'\s*("(?:[^"\\]++|\\.)*+")\s*:\s*', re.DOTALL)
+_SCALAR = re.compile(rb'\s*("(?:[^"\\]++|\\.)*+"|[^\s,}\]]+)\s*', re.DOTALL)
+_SEPARATOR = re.compile(rb'\s*([,}])', re.DOTALL)
+_OPENING = re.compile(rb'\s*([\[{])', re.DOTALL)
+_OPEN_BRACKETS = frozenset(b"[{")
+
+# A ``meta`` key, the candidate start of metadata following the data section
+_META_KEY = re.compile(rb'[{,]\s*"meta"\s*:', re.DOTALL)
+
+# A ``foreignData`` key and the bracket opening its array. Quotes inside
+# strings are always escaped, so a brace or comma followed by a bare quote
+# only ever opens a real key.
+_FOREIGN_DATA_KEY = re.compile(rb'[{,]\s*"foreignData"\s*:\s*(\[)', re.DOTALL)
+_ITEM_SEPARATOR = re.compile(rb'\s*([,\]])', re.DOTALL)
+
+# One ``foreignData`` entry nesting containers at most one level deep, with
+# its top-level ``language`` value and the separator that follows it; deeper
+# entries are walked member by member instead
+_STRING_VALUE = rb'"(?:[^"\\]++|\\.)*+"'
+_FLAT_CONTAINER = (
+    rb'\{(?:[^"{}\[\]]++|' + _STRING_VALUE + rb')*+\}|\[(?:[^"{}\[\]]++|' + _STRING_VALUE + rb')*+\]'
+)
+_ENTRY = re.compile(
+    rb'\s*(\{(?:"language"\s*:\s*(' + _STRING_VALUE + rb')|[^"{}\[\]]++|' + _STRING_VALUE
+    + rb'|' + _FLAT_CONTAINER + rb')*+\})\s*([,\]])',
+    re.DOTALL
+)
+_ARRAY_END = re.compile(rb'\s*\]', re.DOTALL)
+_LANGUAGE_KEY = b'"language"'
+
+# Bytes read from the underlying stream per refill by the pruning reader
+_PRUNING_READ_SIZE = 64 * 1024
+
+
+def _peek_header(infile: BinaryIO) -> Tuple[BinaryIO, bytes]:
+    """Read the leading bytes of a stream without consuming them.
+
+    Args:
+        infile: Binary input stream
+
+    Returns:
+        Tuple containing:
+            - The stream to continue reading from (possibly a buffered wrapper)
+            - The leading bytes of the stream
+    """
+    if hasattr(infile, "peek"):
+        return infile, cast(Any, infile).peek(_SIGNATURE_LENGTH)[:_SIGNATURE_LENGTH]
+
+    if infile.seekable():
+        position = infile.tell()
+        header = infile.read(_SIGNATURE_LENGTH)
+        infile.seek(position)
+        return infile, header
+
+    buffered = cast(BinaryIO, io.BufferedReader(cast(Any, infile)))
+    return buffered, buffered.peek(_SIGNATURE_LENGTH)[:_SIGNATURE_LENGTH]
+
+
+def open_input_stream(infile: BinaryIO) -> BinaryIO:
+    """Prepare a binary input stream for parsing, decompressing it if needed.
+
+    Args:
+        infile: Binary input stream, plain or gzip/bzip2/xz compressed
+
+    Returns:
+        BinaryIO: Stream yielding the uncompressed JSON bytes
+    """
+    stream, header = _peek_header(infile)
+    for signature, opener in _COMPRESSION_SIGNATURES:
+        if header.startswith(signature):
+            return cast(BinaryIO, opener(stream))
+    return stream
+
+
+def _container_end(buffer: DumpBuffer, start: int) -> Optional[int]:
+    """Find the end of the array or object opening at a position.
+
+    Args:
+        buffer: JSON bytes
+        start: Offset of the opening bracket
+
+    Returns:
+        Optional[int]: Offset just past the matching closing bracket, or
+            None if the buffer ends first
+    """
+    match_next = _NEXT_BRACKET.match
+    position = start + 1
+    depth = 1
+    while depth:
+        match = match_next(buffer, position)
+        if match is None:
+            return None
+        position = match.end()
+        depth += 1 if buffer[position - 1] in _OPEN_BRACKETS else -1
+    return position
+
+
+def _value_span(buffer: DumpBuffer, start: int) -> Optional[Tuple[int, int]]:
+    """Find the extent of the value starting at or after a position.
+
+    Args:
+        buffer: JSON bytes
+        start: Offset at which to look for the value
+
+    Returns:
+        Optional[Tuple[int, int]]: Start and end offsets of the value, or
+            None if no complete value is found
+    """
+    opening = _OPENING.match(buffer, start)
+    if opening is not None:
+        end = _container_end(buffer, opening.start(1))
+        return None if end is None else (opening.start(1), end)
+    scalar = _SCALAR.match(buffer, start)
+    if scalar is None:
+        return None
+    return scalar.start(1), scalar.end(1)
+
+
+
+def _leads_with_meta(head: bytes) -> Optional[bool]:
+    """Tell whether the first top-level key of a document is ``meta``.
+
+    Args:
+        head: The first bytes of the document
+
+    Returns:
+        Optional[bool]: Whether the first key is ``meta``, or None if ``head``
+            is too short to tell
+    """
+    opening = _OPENING.match(head)
+    if opening is None:
+        return None if not head.strip() else False
+    if opening.group(1) != b"{":
+        return False
+    key = _STRING.match(head, opening.end())
+    if key is not None:
+        return json.loads(key.group(1)) == "meta"
+    rest = head[opening.end():].lstrip()
+    return None if not rest or rest.startswith(b'"') else False
+
+
+def _trailing_meta(tail: bytes) -> Optional[Any]:
+    """Decode a top-level ``meta`` member from the end of a document.
+
+    ``tail`` is any suffix of the document that starts before the member.
+    Quotes inside strings are always escaped, so a brace or comma followed by
+    a bare ``"meta"`` key is a real key; it is the top-level one only if the
+    members after its value run to the document's closing brace.
+
+    Args:
+        tail: The final bytes of the document
+
+    Returns:
+        Optional[Any]: The decoded metadata, or None if the tail holds no
+            top-level ``meta`` member
+    """
+    for key in reversed(list(_META_KEY.finditer(tail))):
+        span = _value_span(tail, key.end())
+        position = span[1] if span is not None else None
+        while position is not None:
+            separator = _SEPARATOR.match(tail, position)
+            if separator is None:
+                break
+            if separator.group(1) == b"}":
+                if not tail[separator.end():].strip():
+                    return json.loads(tail[span[0]:span[1]])
+                break
+            member = _STRING.match(tail, separator.end())
+            member_span = _value_span(tail, member.end()) if member is not None else None
+            position = member_span[1] if member_span is not None else None
+    return None
+
+class ForeignDataPruner:
+    """Drops ``foreignData`` entries in unrequested languages from raw JSON.
+
+    Translations usually make up most of a card dump, while only one or two
+    languages are requested. The pruner rewrites the bytes of each
+    ``foreignData`` array to hold only the entries in the requested
+    languages, so the others are never parsed into objects. Each entry is
+    matched by a single regular expression capturing its top-level
+    ``language`` value; entries nested too deeply for it are walked with the
+    bracket scanner of ``CardDumpScanner``. Strings are skipped whole, and
+    only the language is decoded, and only when it is escaped.
+
+    Arrays holding anything but objects are left as they are, and the others
+    are rewritten without whitespace between entries. Filters reading
+    ``foreignData`` see the pruned entries, so pruning is meant for runs
+    whose filters do not.
+
+    Attributes:
+        languages (FrozenSet[str]): Languages of the entries kept; empty drops
+            every entry
+
+    Example:
+        ```python
+        pruner = ForeignDataPruner({"German"})
+        pruner.prune(b'{"foreignData":[{"language":"German"},{"language":"French"}]}')
+        # b'{"foreignData":[{"language":"German"}]}'
+        ```
+    """
+
+    def __init__(self, languages: Iterable[str]):
+        """Initialize the pruner.
+
+        Args:
+            languages: Languages of the entries to keep
+        """
+        self.languages: FrozenSet[str] = frozenset(languages)
+        self._encoded = frozenset(json.dumps(language, ensure_ascii=False).encode("utf-8")
+                                  for language in self.languages)
+
+    def _is_requested(self, value: bytes) -> bool:
+        """Tell whether a raw ``language`` value is a requested language."""
+        if value in self._encoded:
+            return True
+        if b"\\" not in value:
+            return False
+        try:
+            return json.loads(value) in self.languages
+        except (ValueError, TypeError):
+            return False
+
+    def _keeps(self, buffer: DumpBuffer, start: int) -> bool:
+        """Tell whether the ``foreignData`` entry opening at a position is kept.
+
+        Args:
+            buffer: JSON bytes holding the whole entry
+            start: Offset of the entry's opening brace
+
+        Returns:
+            bool: Whether the entry has a requested ``language``
+        """
+        position = start + 1
+        while True:
+            key = _STRING.match(buffer, position)
+            if key is None:
+                return False
+            span = _value_span(buffer, key.end())
+            if span is None:
+                return False
+            if key.group(1) == _LANGUAGE_KEY:
+                return self._is_requested(bytes(buffer[span[0]:span[1]]))
+            separator = _SEPARATOR.match(buffer, span[1])
+            if separator is None or separator.group(1) != b",":
+                return False
+            position = separator.end()
+
+    def prune_array(self, buffer: DumpBuffer, start: int) -> Optional[Tuple[bytes, int]]:
+        """Rewrite the ``foreignData`` array opening at a position.
+
+        Args:
+            buffer: JSON bytes
+            start: Offset of the array's opening bracket
+
+        Returns:
+            Optional[Tuple[bytes, int]]: The pruned array and the offset just
+                past the original one, or None if the buffer ends first
+        """
+        empty = _ARRAY_END.match(buffer, start + 1)
+        if empty is not None:
+            return b"[]", empty.end()
+
+        kept: List[bytes] = []
+        match_entry = _ENTRY.match
+        position = start + 1
+        while True:
+            entry = match_entry(buffer, position)
+            if entry is not None:
+                language = entry.group(2)
+                if language is not None and self._is_requested(language):
+                    kept.append(entry.group(1))
+                separator = entry.group(3)
+                position = entry.end()
+            else:
+                opening = _OPENING.match(buffer, position)
+                item_end = None
+                if opening is not None and opening.group(1) == b"{":
+                    item_end = _container_end(buffer, opening.start(1))
+                following = None if item_end is None else _ITEM_SEPARATOR.match(buffer, item_end)
+                if opening is None or following is None:
+                    # Not an array of objects, or not read in full yet
+                    end = _container_end(buffer, start)
+                    return None if end is None else (bytes(buffer[start:end]), end)
+                if self._keeps(buffer, opening.start(1)):
+                    kept.append(bytes(buffer[opening.start(1):item_end]))
+                separator = following.group(1)
+                position = following.end()
+            if separator == b"]":
+                return b"[" + b",".join(kept) + b"]", position
+
+    def prune(self, buffer: DumpBuffer) -> bytes:
+        """Prune every ``foreignData`` array of a complete JSON document.
+
+        Args:
+            buffer: JSON bytes, such as the raw value of one set
+
+        Returns:
+            bytes: The document with only the requested translations
+
+        Raises:
+            json.JSONDecodeError: If a ``foreignData`` array is not closed
+        """
+        pieces: List[bytes] = []
+        position = 0
+        search = _FOREIGN_DATA_KEY.search
+        while True:
+            match = search(buffer, position)
+            if match is None:
+                pieces.append(bytes(buffer[position:]))
+                return b"".join(pieces)
+            pruned = self.prune_array(buffer, match.start(1))
+            if pruned is None:
+                raise json.JSONDecodeError("Unterminated foreignData array", "", match.start(1))
+            pieces.append(bytes(buffer[position:match.start(1)]))
+            pieces.append(pruned[0])
+            position = pruned[1]
+
+    def wrap(self, stream: BinaryIO) -> BinaryIO:
+        """Prune a stream as it is read.
+
+        Args:
+            stream: Uncompressed binary input stream
+
+        Returns:
+            BinaryIO: File-like reader yielding the pruned bytes
+        """
+        return cast(BinaryIO, _ForeignDataPruningReader(stream, self))
+
+
+class _ForeignDataPruningReader:
+    """File-like wrapper pruning ``foreignData`` arrays from a stream.
+
+    Bytes are passed through as soon as they cannot belong to a
+    ``foreignData`` key; an array is held back until it is complete, then
+    rewritten by the pruner. Only the array being read, at most, is buffered.
+    """
+
+    def __init__(self, stream: BinaryIO, pruner: ForeignDataPruner):
+        """Initialize the wrapper.
+
+        Args:
+            stream: Uncompressed binary input stream
+            pruner: Pruner rewriting the arrays
+        """
+        self._stream = stream
+        self._pruner = pruner
+        self._pending = b""
+        self._output = bytearray()
+        self._exhausted = False
+
+    def _drain(self) -> None:
+        """Move the pruned, complete part of the pending bytes to the output."""
+        buffer = self._pending
+        position = 0
+        while True:
+            match = _FOREIGN_DATA_KEY.search(buffer, position)
+            if match is None:
+                # A key may still start at the last brace or comma
+                held = max(buffer.rfind(b",", position), buffer.rfind(b"{", position))
+                held = len(buffer) if held < 0 else held
+                break
+            pruned = self._pruner.prune_array(buffer, match.start(1))
+            if pruned is None:
+                held = match.start()
+                break
+            self._output += buffer[position:match.start(1)]
+            self._output += pruned[0]
+            position = pruned[1]
+        self._output += buffer[position:held]
+        self._pending = buffer[held:]
+
+    def read(self, size: int = -1) -> bytes:
+        """Read pruned bytes.
+
+        Args:
+            size: Maximum number of bytes to read, or -1 for the rest
+
+        Returns:
+            bytes: Pruned bytes; empty at the end of the stream
+        """
+        while not self._exhausted and (size < 0 or len(self._output) < size):
+            chunk = self._stream.read(max(size, _PRUNING_READ_SIZE))
+            if not chunk:
+                self._output += self._pending
+                self._pending = b""
+                self._exhausted = True
+                break
+            self._pending += chunk
+            self._drain()
+
+        if size < 0 or size > len(self._output):
+            size = len(self._output)
+        data = bytes(self._output[:size])
+        del self._output[:size]
+        return data
+
+
+class _MetaCapturingReader:
+    """File-like wrapper that extracts ``meta`` from the bytes passing through.
+
+    Until the main parser produces its first set, a second push parser is fed
+    every chunk it reads, looking only for the top-level ``meta`` value. That
+    covers ``meta`` anywhere before the data section at almost no cost, and
+    the secondary parser is then discarded so the data section is tokenized
+    only once. A ``meta`` member following the data section is recovered from
+    the bytes read after the last set.
+
+    Attributes:
+        meta: The top-level metadata object, or None until it has been read
+        meta_first: Whether ``meta`` is the first top-level key, or None
+            until the start of the document has been read
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize the wrapper.
+
+        Args:
+            stream: Uncompressed binary input stream
+        """
+        self._stream = stream
+        self._found = ijson.sendable_list()
+        self._meta_parser: Optional[Any] = ijson.items_coro(self._found, "meta", use_float=True)
+        self._last_chunk = b""
+        self._tail: Optional[List[bytes]] = None
+        self._head = b""
+        self.meta: Optional[Any] = None
+        self.meta_first: Optional[bool] = None
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the underlying stream, scanning the chunk for metadata.
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            bytes: The chunk read from the underlying stream
+        """
+        chunk = self._stream.read(size)
+        if chunk:
+            self._last_chunk = chunk
+            if self._tail is not None:
+                self._tail.append(chunk)
+
+        if self.meta_first is None:
+            self._head += chunk
+            if chunk or size == 0:
+                self.meta_first = _leads_with_meta(self._head)
+            else:
+                self.meta_first = bool(_leads_with_meta(self._head))
+            if self.meta_first is not None:
+                self._head = b""
+
+        if self._meta_parser is None:
+            return chunk
+
+        if chunk:
+            self._meta_parser.send(chunk)
+        elif size != 0:
+            self._meta_parser.close()
+
+        if self._found:
+            self.meta = self._found[0]
+            self._meta_parser = None
+        return chunk
+
+    def mark_set(self) -> None:
+        """Note that the main parser has just produced a set.
+
+        ``meta`` can no longer precede the data section, so the secondary
+        parser is discarded. Unless the metadata has been found, the bytes
+        from the chunk holding the end of the set onwards are kept, since a
+        trailing ``meta`` member starts after the last set.
+        """
+        self._meta_parser = None
+        self._tail = [self._last_chunk] if self.meta is None else None
+
+    def finish(self) -> None:
+        """Recover a ``meta`` member following the data section.
+
+        Called once the main parser has consumed the whole stream.
+        """
+        if self.meta is None and self._tail:
+            self.meta = _trailing_meta(b"".join(self._tail))
+        self._tail = None
+
+
+class CardStreamReader:
+    """Single-pass reader over the JSON events of a card dump.
+
+    The reader streams either whole card objects or raw parser events. In
+    both cases ``meta`` is assembled separately and exposed through the
+    ``meta`` attribute once it has been read, so consumers never need to seek
+    back to find the metadata.
+
+    Attributes:
+        infile: Uncompressed binary input stream
+        meta: The top-level metadata object, or None until it has been read
+        meta_first: Whether ``meta`` is the first top-level key, or None
+            until the first key has been read
+    """
+
+    def __init__(self, infile: BinaryIO):
+        """Initialize the reader.
+
+        Args:
+            infile: Uncompressed binary input stream
+        """
+        self.infile = infile
+        self.meta: Optional[Any] = None
+        self.meta_first: Optional[bool] = None
+
+    def events(self) -> Iterator[Tuple[str, str, Any]]:
+        """Stream parser events, diverting the ``meta`` section.
+
+        Numbers are produced as floats rather than Decimals so that cards can
+        be serialized with the standard json module.
+
+        Yields:
+            Tuple[str, str, Any]: ``(prefix, event, value)`` parser events
+
+        Raises:
+            ijson.JSONError: If the input is not valid JSON
+        """
+        builder: Optional[ijson.ObjectBuilder] = None
+
+        for prefix, event, value in ijson.parse(self.infile, use_float=True):
+            if builder is not None:
+                if prefix:
+                    builder.event(event, value)
+                    continue
+                self.meta = builder.value
+                builder = None
+
+            if not prefix and event == "map_key" and self.meta_first is None:
+                self.meta_first = value == "meta"
+            if not prefix and event == "map_key" and value == "meta":
+                builder = ijson.ObjectBuilder()
+                continue
+
+            yield prefix, event, value
+
+    def iter_sets(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream the sets of the data section as whole objects.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: ``(set_code, set_data)`` pairs in input order
+
+        Raises:
+            ijson.JSONError: If the input is not valid JSON
+        """
+        source = _MetaCapturingReader(self.infile)
+        try:
+            for set_code, set_data in ijson.kvitems(source, "data", use_float=True):
+                source.mark_set()
+                self.meta_first = source.meta_first
+                if source.meta is not None:
+                    self.meta = source.meta
+                yield set_code, set_data
+            source.finish()
+        finally:
+            self.meta_first = source.meta_first
+            if source.meta is not None:
+                self.meta = source.meta
+
+    def iter_cards(
+        self,
+        include_set: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream every card of the data section as a complete object.
+
+        Nested values such as ``foreignData``, ``legalities`` and
+        ``identifiers`` are preserved. Sets without cards are skipped.
+
+        Args:
+            include_set: Optional predicate on the set code; cards of sets
+                it rejects are not yielded
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: ``(set_code, card)`` pairs in input order
+
+        Raises:
+            ijson.JSONError: If the input is not valid JSON
+        """
+        for set_code, set_data in self.iter_sets():
+            if include_set is not None and not include_set(set_code):
+                continue
+            cards = set_data.get("cards") if isinstance(set_data, dict) else None
+            if not cards:
+                continue
+            for card in cards:
+                yield set_code, card
+
+
+def load_input_buffer(infile: BinaryIO) -> DumpBuffer:
+    """Make the whole uncompressed input available for random access.
+
+    Uncompressed regular files are memory-mapped, so they are never copied
+    into the process. Compressed inputs, pipes and standard input are
+    decompressed and read into memory.
+
+    Args:
+        infile: Binary input stream, plain or gzip/bzip2/xz compressed
+
+    Returns:
+        DumpBuffer: The uncompressed JSON document
+    """
+    stream = open_input_stream(infile)
+    if stream is infile:
+        try:
+            if infile.seekable() and infile.tell() == 0:
+                return mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass
+    return stream.read()
+
+
+class CardDumpScanner:
+    """Locates the sets of a card dump without building any objects.
+
+    The scanner walks the structural brackets of the document to find where
+    each set of the ``data`` section starts and ends, so the raw bytes of a
+    set can be handed to another process and parsed there. Only the set keys
+    and the ``meta`` object are decoded.
+
+    Attributes:
+        buffer: The uncompressed JSON document
+        meta: The top-level metadata object, or None until it has been scanned
+        meta_first: Whether ``meta`` is the first top-level key, or None
+            until the scan has started
+    """
+
+    def __init__(self, buffer: DumpBuffer):
+        """Initialize the scanner.
+
+        Args:
+            buffer: The uncompressed JSON document
+        """
+        self.buffer = buffer
+        self.meta: Optional[Any] = None
+        self.meta_first: Optional[bool] = None
+
+    def _error(self, message: str, position: int) -> json.JSONDecodeError:
+        """Build a decode error pointing at a position in the document.
+
+        Args:
+            message: Description of the problem
+            position: Offset of the problem in the document
+
+        Returns:
+            json.JSONDecodeError: The error to raise
+        """
+        return json.JSONDecodeError(message, "", position)
+
+    def _skip_container(self, start: int) -> int:
+        """Find the end of the array or object opening at a position.
+
+        Args:
+            start: Offset of the opening bracket
+
+        Returns:
+            int: Offset just past the matching closing bracket
+
+        Raises:
+            json.JSONDecodeError: If the container is not closed
+        """
+        end = _container_end(self.buffer, start)
+        if end is None:
+            raise self._error("Unterminated container", start)
+        return end
+
+    def _skip_value(self, start: int) -> Tuple[int, int]:
+        """Find the extent of the value starting at or after a position.
+
+        Args:
+            start: Offset at which to look for the value
+
+        Returns:
+            Tuple[int, int]: Start and end offsets of the value
+
+        Raises:
+            json.JSONDecodeError: If no value is found
+        """
+        opening = _OPENING.match(self.buffer, start)
+        if opening is not None:
+            return opening.start(1), self._skip_container(opening.start(1))
+        scalar = _SCALAR.match(self.buffer, start)
+        if scalar is None:
+            raise self._error("Expecting value", start)
+        return scalar.start(1), scalar.end(1)
+
+    def _read_key(self, position: int) -> Tuple[str, int]:
+        """Read an object key and the colon that follows it.
+
+        Args:
+            position: Offset at which the key is expected
+
+        Returns:
+            Tuple[str, int]: The decoded key and the offset at which its value begins
+
+        Raises:
+            json.JSONDecodeError: If no key is found
+        """
+        key = _STRING.match(self.buffer, position)
+        if key is None:
+            raise self._error("Expecting property name", position)
+        return json.loads(key.group(1)), key.end()
+
+    def _next_member(self, position: int) -> Tuple[bool, int]:
+        """Read the separator after an object member or opening brace.
+
+        Args:
+            position: Offset just past the opening brace or the previous value
+
+        Returns:
+            Tuple[bool, int]: Whether another member follows, and the offset
+                after the separator
+
+        Raises:
+            json.JSONDecodeError: If neither a comma nor a closing brace is found
+        """
+        separator = _SEPARATOR.match(self.buffer, position)
+        if separator is None:
+            raise self._error("Expecting ',' delimiter", position)
+        return separator.group(1) == b",", separator.end()
+
+    def _open_object(self, position: int) -> Tuple[bool, int]:
+        """Enter the object opening at or after a position.
+
+        Args:
+            position: Offset at which the object is expected
+
+        Returns:
+            Tuple[bool, int]: Whether the object has members, and the offset
+                of its first key or just past its closing brace
+
+        Raises:
+            json.JSONDecodeError: If no object is found
+        """
+        opening = _OPENING.match(self.buffer, position)
+        if opening is None or opening.group(1) != b"{":
+            raise self._error("Expecting object", position)
+        empty = _SEPARATOR.match(self.buffer, opening.end())
+        if empty is not None and empty.group(1) == b"}":
+            return False, empty.end()
+        return True, opening.end()
+
+    def iter_set_ranges(self) -> Iterator[Tuple[str, int, int]]:
+        """Locate every set of the data section, in input order.
+
+        ``meta`` is decoded when the scan reaches it, so it is available
+        before the first set if it precedes the data section.
+
+        Yields:
+            Tuple[str, int, int]: Set code and the start and end offsets of
+                its raw JSON value
+
+        Raises:
+            json.JSONDecodeError: If the document is malformed
+        """
+        more, position = self._open_object(0)
+        self.meta_first = more and self._read_key(position)[0] == "meta"
+        while more:
+            key, position = self._read_key(position)
+            if key == "data":
+                more_sets, position = self._open_object(position)
+                while more_sets:
+                    set_code, position = self._read_key(position)
+                    set_start, position = self._skip_value(position)
+                    yield set_code, set_start, position
+                    more_sets, position = self._next_member(position)
+                more, position = self._next_member(position)
+                continue
+
+            value_start, position = self._skip_value(position)
+            if key == "meta":
+                self.meta = json.loads(self.buffer[value_start:position])
+            more, position = self._next_member(position)
@@ -51,7 +51,7 @@ Note:
 from typing import Optional, TextIO, BinaryIO, Union, Any, cast
 from dataclasses import dataclass
 import json
-from io import StringIO, BytesIO
+from io import TextIOBase, RawIOBase, BufferedIOBase
 
 from ...utils.models import WriterState, WriterStats
 from ...core.config import CardFilterConfig
@@ -140,9 +140,9 @@ class CardSetWriter:
         Note:
             Handles both text and binary modes with proper encoding
         """
-        if isinstance(self.outfile, (StringIO, TextIO)):
+        if isinstance(self.outfile, TextIOBase):
             self.outfile.write(data)
-        elif isinstance(self.outfile, (BytesIO, BinaryIO)):
+        elif isinstance(self.outfile, (RawIOBase, BufferedIOBase)):
             self.outfile.write(data.encode('utf-8'))
         else:
             raise TypeError(f"Unsupported file type: {type(self.outfile)}")
@@ -165,7 +165,7 @@ class CardSetWriter:
 
         if self.current_set is not None:
             self._flush_buffer()
-            self._write("}")
+            self._write("]}")
 
         if self.first_set_written:
             self._write(",")
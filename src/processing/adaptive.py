@@ -0,0 +1,269 @@
+"""Adaptive chunk sizing for batch processing.
+
+This module provides the controller behind ``BatchProcessor.process_batch``'s
+adaptive mode. After every chunk it is given the measured latency and
+throughput, samples the resident memory of the process, and picks the chunk
+size and number of workers for the chunks that follow.
+
+Features:
+- Chunk size steered toward a target latency per chunk
+- Chunks shrunk while resident memory exceeds a budget
+- Worker count tuned by hill climbing on measured throughput
+- Every change recorded as a ``SizingDecision``
+
+Example:
+    ```python
+    sizer = AdaptiveBatchSizer(target_latency=0.25, memory_budget_mb=512)
+    for processed_chunk, stats in processor.process_batch(cards, adaptive=sizer):
+        ...
+    print(stats.batch_size, stats.workers)
+    for decision in stats.sizing_decisions:
+        print(decision.reason)
+    ```
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Latency per chunk the sizer steers toward, in seconds
+DEFAULT_TARGET_LATENCY = 0.5
+
+# Bounds of the chunk size
+DEFAULT_MIN_BATCH_SIZE = 10
+DEFAULT_MAX_BATCH_SIZE = 10_000
+
+# Relative change below which the chunk size is left alone
+SIZE_TOLERANCE = 0.1
+
+# Relative throughput loss that makes a worker count change be undone
+THROUGHPUT_TOLERANCE = 0.05
+
+# Chunks processed with a settled worker count before probing again
+SETTLE_CHUNKS = 8
+
+# Most recent sizing decisions kept in batch statistics
+MAX_SIZING_DECISIONS = 256
+
+
+def current_rss() -> Optional[int]:
+    """Measure the resident memory of the current process.
+
+    Reads ``/proc/self/statm`` where available. Elsewhere, the peak resident
+    memory reported by ``getrusage`` stands in for the current one.
+
+    Returns:
+        Optional[int]: Resident memory in bytes, or None if it cannot be measured
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class SizingDecision:
+    """A change of chunk size or worker count, with the measurement behind it.
+
+    Attributes:
+        chunk (int): Index of the chunk whose measurement led to the change
+        cards (int): Number of cards in that chunk
+        latency (float): Seconds spent waiting for the chunk
+        cards_per_second (float): Cards delivered per second since the
+            previous chunk, including the caller's own handling time
+        rss_bytes (Optional[int]): Resident memory after the chunk
+        batch_size (int): Chunk size chosen for the following chunks
+        workers (int): Worker count chosen for the following chunks
+        reason (str): Why the change was made
+    """
+    chunk: int
+    cards: int
+    latency: float
+    cards_per_second: float
+    rss_bytes: Optional[int]
+    batch_size: int
+    workers: int
+    reason: str
+
+
+class AdaptiveBatchSizer:
+    """Chooses chunk sizes and worker counts from measured performance.
+
+    The chunk size is set from the measured time per card so that a chunk
+    takes about ``target_latency``, changing at most twofold per chunk. While
+    resident memory is above ``memory_budget_mb`` it is halved instead, and
+    it never grows while memory is near the budget. Memory is that of the
+    calling process; worker processes are not included.
+
+    The worker count starts at the pool size and is tuned by hill climbing:
+    it is changed one worker at a time while throughput holds, and the last
+    change is undone when throughput falls. After undoing a change, the count
+    is kept for ``SETTLE_CHUNKS`` chunks before probing again.
+
+    Attributes:
+        target_latency (float): Seconds per chunk to steer toward
+        memory_budget (Optional[int]): Resident memory budget in bytes
+        min_batch_size (int): Smallest chunk size
+        max_batch_size (int): Largest chunk size
+        batch_size (int): Chunk size for the next chunks
+        workers (int): Worker count for the next chunks
+        max_workers (int): Largest worker count
+    """
+
+    def __init__(
+        self,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+        memory_budget_mb: Optional[float] = None,
+        min_batch_size: int = DEFAULT_MIN_BATCH_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        rss_reader: Callable[[], Optional[int]] = current_rss
+    ):
+        """Configure the sizer.
+
+        Args:
+            target_latency: Seconds per chunk to steer toward
+            memory_budget_mb: Resident memory budget in megabytes, or None
+                to ignore memory
+            min_batch_size: Smallest chunk size
+            max_batch_size: Largest chunk size
+            rss_reader: Function measuring resident memory in bytes
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if target_latency <= 0:
+            raise ValueError(f"target_latency must be positive, got {target_latency}")
+        if memory_budget_mb is not None and memory_budget_mb <= 0:
+            raise ValueError(f"memory_budget_mb must be positive, got {memory_budget_mb}")
+        if not 1 <= min_batch_size <= max_batch_size:
+            raise ValueError(
+                f"Invalid batch size bounds: {min_batch_size} to {max_batch_size}"
+            )
+
+        self.target_latency = target_latency
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024) if memory_budget_mb else None
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self._rss_reader = rss_reader
+        self.reset(min_batch_size, 1)
+
+    def reset(self, batch_size: int, max_workers: int) -> None:
+        """Start over for a new batch.
+
+        Args:
+            batch_size: Initial chunk size, clamped to the bounds
+            max_workers: Size of the worker pool
+        """
+        self.batch_size = self._clamp(batch_size)
+        self.max_workers = max(1, max_workers)
+        self.workers = self.max_workers
+        self._chunks = 0
+        self._direction = -1
+        self._baseline_rate: Optional[float] = None
+        self._settle = 0
+
+    def _clamp(self, batch_size: int) -> int:
+        """Bound a chunk size."""
+        return max(self.min_batch_size, min(self.max_batch_size, batch_size))
+
+    def record(self, cards: int, latency: float, interval: float) -> Optional[SizingDecision]:
+        """Take the measurement of a chunk and adjust the next chunks.
+
+        Args:
+            cards: Number of cards in the chunk
+            latency: Seconds spent waiting for the chunk
+            interval: Seconds since the previous chunk was delivered, or since
+                the batch started for the first one
+
+        Returns:
+            Optional[SizingDecision]: The change made, or None if the chunk
+                size and worker count were kept
+        """
+        chunk = self._chunks
+        self._chunks += 1
+        if cards <= 0:
+            return None
+
+        rss = self._rss_reader() if self.memory_budget is not None else None
+        rate = cards / interval if interval > 0 else 0.0
+        batch_size, workers, reason = self.batch_size, self.workers, None
+
+        if rss is not None and rss > self.memory_budget:
+            batch_size = self._clamp(self.batch_size // 2)
+            if batch_size != self.batch_size:
+                reason = f"memory {rss / 1048576:.0f} MiB above budget"
+        elif latency > 0:
+            ideal = round(self.target_latency * cards / latency)
+            ideal = max(self.batch_size // 2, min(self.batch_size * 2, ideal))
+            if rss is not None and rss > 0.9 * self.memory_budget:
+                ideal = min(ideal, self.batch_size)
+            ideal = self._clamp(ideal)
+            if abs(ideal - self.batch_size) > SIZE_TOLERANCE * self.batch_size:
+                batch_size = ideal
+                reason = f"latency {latency:.3f}s against target {self.target_latency:.3f}s"
+
+        if reason is None:
+            workers, reason = self._tune_workers(rate)
+        else:
+            # Throughput at another chunk size says nothing about the workers
+            self._baseline_rate = None
+
+        if reason is None or (batch_size, workers) == (self.batch_size, self.workers):
+            return None
+        self.batch_size, self.workers = batch_size, workers
+        return SizingDecision(
+            chunk=chunk,
+            cards=cards,
+            latency=latency,
+            cards_per_second=rate,
+            rss_bytes=rss,
+            batch_size=batch_size,
+            workers=workers,
+            reason=reason,
+        )
+
+    def _tune_workers(self, rate: float) -> Tuple[int, Optional[str]]:
+        """Take one hill-climbing step on the worker count.
+
+        Args:
+            rate: Throughput measured with the current worker count
+
+        Returns:
+            Tuple[int, Optional[str]]: Worker count for the next chunks and
+                the reason for changing it, or None if unchanged
+        """
+        if self.max_workers == 1:
+            return self.workers, None
+
+        if self._baseline_rate is not None:
+            baseline, self._baseline_rate = self._baseline_rate, None
+            if rate < baseline * (1 - THROUGHPUT_TOLERANCE):
+                self._direction = -self._direction
+                self._settle = SETTLE_CHUNKS
+                return (
+                    self.workers + self._direction,
+                    f"throughput fell to {rate:,.0f} cards/s from {baseline:,.0f}",
+                )
+
+        if self._settle:
+            self._settle -= 1
+            return self.workers, None
+
+        workers = self.workers + self._direction
+        if not 1 <= workers <= self.max_workers:
+            self._direction = -self._direction
+            workers = self.workers + self._direction
+        self._baseline_rate = rate
+        return workers, f"probing {workers} workers at {rate:,.0f} cards/s"
@@ -5,10 +5,15 @@ cards, implementing advanced features for concurrent execution, resource
 management, and error handling.
 
 Key Features:
-- Parallel processing using ThreadPoolExecutor with dynamic worker scaling
-- Automatic batch size optimization based on system resources
-- Comprehensive timeout handling with graceful recovery
-- Detailed progress tracking and statistics collection
+- Pluggable executor backends: serial, thread, process and interpreter
+- A persistent, lazily started worker pool; chunks are submitted as a few
+  tasks, not one future per card
+- Adaptive chunk size and worker count, steered by measured latency,
+  throughput and resident memory (see ``AdaptiveBatchSizer``)
+- Per-card deadlines with cooperative cancellation; cards overrunning them
+  are quarantined, and stragglers never block shutdown
+- Detailed progress tracking and statistics collection: per-worker counters
+  and per-card timing histograms, merged once per chunk
 - Robust error handling with context preservation
 - Memory-efficient processing through dynamic chunking
 - Resource cleanup with proper thread management
@@ -16,10 +21,10 @@ Key Features:
 Example:
     Basic usage with automatic resource management:
     ```python
-    processor = BatchProcessor(card_processor, logger)
-    for processed_cards, stats in processor.process_batch(cards_data):
-        print(f"Processed {stats.processed_cards} cards")
-        print(f"Success rate: {stats.processed_cards/stats.total_cards:.2%}")
+    with BatchProcessor(card_processor, logger) as processor:
+        for processed_cards, stats in processor.process_batch(cards_data):
+            print(f"Processed {stats.processed_cards} cards")
+            print(f"Success rate: {stats.processed_cards/stats.total_cards:.2%}")
     ```
 
     Advanced usage with custom processing parameters:
@@ -39,6 +44,13 @@ Example:
         print(f"- Success Rate: {stats.processed_cards/stats.total_cards:.2%}")
     ```
 
+    CPU-bound filtering in worker processes:
+    ```python
+    processor = BatchProcessor(card_processor, logger, backend="process", max_workers=8)
+    for processed_cards, stats in processor.process_batch(cards_data, filters=filters):
+        ...
+    ```
+
 Note:
     The module implements comprehensive error handling and resource cleanup,
     ensuring system resources are properly managed even in failure scenarios.
@@ -46,12 +58,268 @@ Note:
     capabilities.
 """
 
-from typing import Optional, List, Dict, Any, Iterator, Tuple, Protocol, Set, Union
+import concurrent.futures
+import functools
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence, Sized
+from enum import Enum
+from typing import (
+    Optional, List, Dict, Any, Callable, Deque, Generator, Iterable, Iterator, Tuple, Protocol, Set,
+    TypeVar, Union
+)
 from concurrent.futures import (
-    ThreadPoolExecutor, Future, wait, ALL_COMPLETED,
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor, Future, wait, ALL_COMPLETED,
     TimeoutError as FuturesTimeoutError
 )
 from dataclasses import dataclass, field
+from ..core.config import CardFilterConfig
+from .adaptive import MAX_SIZING_DECISIONS, AdaptiveBatchSizer, SizingDecision
+from .deadlines import CardDeadline, Quarantine, QuarantinedCard, card_deadline
+from .filters import FilterPlan, compile_filters
+from .projection import SchemaProjector, compile_schema, normalize_languages
+from ..core.errors import CardTimeoutError
+from ..utils.stats import LatencyHistogram, RateWindow, WorkerCounters
+
+
+class ExecutorBackend(Enum):
+    """Execution strategies available to BatchProcessor.
+
+    SERIAL processes every card in the calling thread. The other backends
+    split each chunk into one sub-chunk per worker. THREAD runs them in a
+    thread pool, which suits I/O-bound processors but is bound by the GIL for
+    pure-Python filtering. PROCESS and INTERPRETER run them in worker
+    processes or subinterpreters, sidestepping the GIL; the card processor
+    must then be picklable.
+    """
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+    INTERPRETER = "interpreter"
+
+
+# Thread count used by the thread backend when none is given
+DEFAULT_THREAD_WORKERS = 10
+
+# Chunks at or below this size are processed in the calling thread, unless
+# an AdaptiveBatchSizer chooses the worker count
+SEQUENTIAL_CHUNK_SIZE = 5
+
+# Chunks read ahead from streamed inputs
+DEFAULT_PREFETCH_CHUNKS = 2
+
+# Chunks in flight in pipelined mode; 1 waits for each chunk before the next
+DEFAULT_PIPELINE_DEPTH = 1
+
+T = TypeVar("T")
+
+# Result of a chunk processed as one task: processed cards, the task's card
+# counts and timings, the name and error message of failures not yet logged,
+# and cards not yet quarantined (workers in other processes cannot reach the
+# parent's logger or quarantine)
+ChunkResult = Tuple[List[dict], WorkerCounters, List[Tuple[str, str]], List[QuarantinedCard]]
+
+# Per-worker state installed by _init_chunk_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_chunk_worker(card_processor: "CardProcessorInterface") -> None:
+    """Install the card processor in a worker process or subinterpreter.
+
+    Args:
+        card_processor: Processor for card data
+    """
+    _worker_state["card_processor"] = card_processor
+
+
+def process_card_chunk(
+    cards: List[dict],
+    filters: Union[Dict[str, Any], FilterPlan, None],
+    schema: Union[List[str], SchemaProjector, None],
+    additional_languages: Optional[List[str]],
+    timeout: Optional[float] = None
+) -> ChunkResult:
+    """Process a chunk of cards in a worker initialized by ``_init_chunk_worker``.
+
+    Only the processed cards, the counters, the failures and the quarantined
+    cards travel back to the parent, rather than one result tuple per card.
+
+    Args:
+        cards: Cards to process
+        filters: Type-checked filter conditions
+        schema: Validated field selection
+        additional_languages: Language codes to include
+        timeout: Deadline of each card in seconds, or None for no deadline
+
+    Returns:
+        ChunkResult: Processed cards, counters, failures and quarantined
+            cards, which also count as failed
+    """
+    card_processor = _worker_state["card_processor"]
+    processed_cards = []
+    failures = []
+    quarantined = []
+    counters = WorkerCounters()
+    latency = counters.latency
+
+    with card_deadline(timeout) as deadline:
+        for card in cards:
+            deadline.restart()
+            try:
+                result = card_processor.process_card(
+                    card_data=card,
+                    filters=filters,
+                    schema=schema,
+                    additional_languages=additional_languages
+                )
+            except CardTimeoutError as e:
+                latency.record(e.elapsed)
+                quarantined.append(QuarantinedCard(card.get('name', 'Unknown'), e.elapsed, str(e)))
+                continue
+            except Exception as e:
+                latency.record(deadline.elapsed)
+                failures.append((card.get('name', 'Unknown'), str(e)))
+                continue
+            latency.record(deadline.elapsed)
+            if deadline.expired:
+                quarantined.append(QuarantinedCard(
+                    card.get('name', 'Unknown'), deadline.elapsed, f"Card finished past its {timeout:g}s deadline"
+                ))
+            elif result is None:
+                counters.filtered += 1
+            else:
+                processed_cards.append(result)
+
+    counters.processed = len(processed_cards)
+    counters.failed = len(failures) + len(quarantined)
+    return processed_cards, counters, failures, quarantined
+
+
+def create_executor(
+    backend: ExecutorBackend,
+    max_workers: int,
+    card_processor: "CardProcessorInterface"
+) -> Executor:
+    """Create the worker pool of a parallel backend.
+
+    Args:
+        backend: THREAD, PROCESS or INTERPRETER
+        max_workers: Number of workers
+        card_processor: Processor installed in each process or subinterpreter
+
+    Returns:
+        Executor: The worker pool
+
+    Raises:
+        ValueError: If the backend has no pool or is unavailable
+    """
+    if backend is ExecutorBackend.THREAD:
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if backend is ExecutorBackend.PROCESS:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_chunk_worker,
+            initargs=(card_processor,)
+        )
+    if backend is ExecutorBackend.INTERPRETER:
+        interpreter_pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+        if interpreter_pool is None:
+            raise ValueError("The interpreter backend requires Python 3.14 or later")
+        return interpreter_pool(
+            max_workers=max_workers,
+            initializer=_init_chunk_worker,
+            initargs=(card_processor,)
+        )
+    raise ValueError(f"Backend {backend.value} does not use a worker pool")
+
+
+def iter_chunks(
+    cards: Iterable[dict],
+    batch_size: Union[int, Callable[[], int]]
+) -> Generator[List[dict], None, None]:
+    """Slice cards into chunks lazily.
+    
+    Lists and other sequences are sliced in place; any other iterable is
+    consumed ``batch_size`` cards at a time, so it is never held in memory
+    as a whole.
+    
+    Args:
+        cards: Cards to slice
+        batch_size: Maximum number of cards per chunk, or a function called
+            before each chunk to get it
+        
+    Yields:
+        List[dict]: Non-empty chunks in input order
+    """
+    next_size = batch_size if callable(batch_size) else lambda: batch_size
+
+    if isinstance(cards, Sequence):
+        start = 0
+        while start < len(cards):
+            end = start + next_size()
+            chunk = cards[start:end]
+            yield chunk if isinstance(chunk, list) else list(chunk)
+            start = end
+        return
+
+    iterator = iter(cards)
+    while chunk := list(itertools.islice(iterator, next_size())):
+        yield chunk
+
+
+def prefetch(items: Iterable[T], depth: int) -> Generator[T, None, None]:
+    """Read items ahead on a background thread through a bounded queue.
+    
+    Reading the input, such as parsing a card stream, overlaps with the
+    processing of earlier items, while at most ``depth`` items wait in the
+    queue. Exceptions raised while reading are re-raised to the consumer.
+    When the consumer stops early, the reader stops at its next item.
+    
+    Args:
+        items: Items to read; only the background thread iterates them
+        depth: Maximum number of items read ahead
+        
+    Yields:
+        T: Each item, in order
+    """
+    queue_: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(kind: str, value: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue_.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        try:
+            for item in items:
+                if not put("item", item):
+                    return
+        except BaseException as e:
+            put("error", e)
+            return
+        put("end", None)
+
+    reader = threading.Thread(target=read, name="batch-prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            kind, value = queue_.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop.set()
 
 
 class LoggingInterface(Protocol):
@@ -80,8 +348,10 @@ class CardProcessorInterface(Protocol):
         process_card: Process a single card with type-safe operations
             Args:
                 card_data (dict): Raw card data to process
-                filters (Optional[Dict[str, Any]]): Type-checked filter conditions
-                schema (Optional[List[str]]): Validated field selection
+                filters (Union[Dict[str, Any], FilterPlan, None]): Type-checked
+                    filter conditions or a compiled plan
+                schema (Union[List[str], SchemaProjector, None]): Validated
+                    field selection or a compiled projector
                 additional_languages (Optional[List[str]]): Language codes
             Returns:
                 Optional[dict]: Processed card data, or None if filtered out
@@ -89,8 +359,8 @@ class CardProcessorInterface(Protocol):
     def process_card(
         self,
         card_data: dict,
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
         additional_languages: Optional[List[str]]
     ) -> Optional[dict]: ...
 
@@ -99,19 +369,65 @@ class CardProcessorInterface(Protocol):
 class BatchStatistics:
     """Statistics tracking for batch processing operations.
     
-    This class maintains atomic counters for various aspects of batch processing,
+    This class maintains counters for various aspects of batch processing,
     providing thread-safe insights into the processing results and performance.
 
+    Workers never touch these statistics while processing cards: each task
+    fills its own ``WorkerCounters``, which are merged here once per chunk
+    under a lock. Besides the counts, the statistics hold a histogram of the
+    processing time of every card and the recent throughput, and export to
+    a flat record with ``to_record``.
+
+    When the input is streamed, the total is not known in advance:
+    ``total_cards`` then holds the cards read so far, or the caller's estimate
+    if larger, and ``total_known`` stays False until the input is exhausted.
+
+    ``batch_size`` and ``workers`` are the settings in use for the next
+    chunks. With adaptive sizing they change as the batch runs: every change
+    is counted in ``sizing_changes`` and the latest ``MAX_SIZING_DECISIONS``
+    are kept in ``sizing_decisions``, so long runs hold a bounded history.
+
+    Cards that overran their deadline count as failed and are also listed in
+    ``quarantined``.
+
     Attributes:
-        total_cards (int): Total number of cards in batch
+        total_cards (int): Total number of cards in batch, or a lower bound or
+            estimate while ``total_known`` is False
         processed_cards (int): Successfully processed cards
         filtered_cards (int): Cards filtered out by criteria
         failed_cards (int): Cards that failed processing
+        total_known (bool): Whether ``total_cards`` is exact
+        batch_size (int): Chunk size in use
+        workers (int): Number of workers each chunk is split across
+        sizing_decisions (Deque[SizingDecision]): Most recent changes made by
+            adaptive sizing
+        sizing_changes (int): Number of changes made by adaptive sizing
+        quarantined (List[QuarantinedCard]): Cards that overran their deadline
+        card_latency (LatencyHistogram): Processing time of every card
+            processed as part of a chunk task
+        throughput (RateWindow): Cards counted per second, over the last
+            ``DEFAULT_RATE_WINDOW`` seconds
+        started (float): ``time.perf_counter()`` when the batch started
     """
     total_cards: int = 0
     processed_cards: int = 0
     filtered_cards: int = 0
     failed_cards: int = 0
+    total_known: bool = True
+    batch_size: int = 0
+    workers: int = 0
+    sizing_decisions: Deque[SizingDecision] = field(
+        default_factory=lambda: deque(maxlen=MAX_SIZING_DECISIONS)
+    )
+    sizing_changes: int = 0
+    quarantined: List[QuarantinedCard] = field(default_factory=list)
+    card_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    throughput: RateWindow = field(default_factory=RateWindow, repr=False, compare=False)
+    started: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Create the lock guarding updates."""
+        self._lock = threading.Lock()
 
     def update(self, processed: int, filtered: int, failed: int) -> None:
         """Update statistics with results from a processing batch.
@@ -123,9 +439,61 @@ class BatchStatistics:
             filtered (int): Number of cards filtered out
             failed (int): Number of cards that failed processing
         """
-        self.processed_cards += processed
-        self.filtered_cards += filtered
-        self.failed_cards += failed
+        with self._lock:
+            self.processed_cards += processed
+            self.filtered_cards += filtered
+            self.failed_cards += failed
+            self.throughput.add(processed + filtered + failed)
+
+    def merge(self, counters: WorkerCounters) -> None:
+        """Add the counts and card times gathered by a worker.
+        
+        Thread-safe; called once per chunk rather than once per card.
+        
+        Args:
+            counters (WorkerCounters): Counters of a task or chunk
+        """
+        with self._lock:
+            self.processed_cards += counters.processed
+            self.filtered_cards += counters.filtered
+            self.failed_cards += counters.failed
+            self.card_latency.merge(counters.latency)
+            self.throughput.add(counters.cards)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the batch started."""
+        return time.perf_counter() - self.started
+
+    @property
+    def cards_per_second(self) -> float:
+        """Cards counted per second over the recent window."""
+        with self._lock:
+            return self.throughput.rate()
+
+    def to_record(self) -> Dict[str, Any]:
+        """Export the statistics as a JSON-serializable record.
+        
+        Returns:
+            Dict[str, Any]: Counts, settings, elapsed time, recent throughput,
+                number of quarantined cards and of sizing decisions, and the
+                card time histogram as a nested record
+        """
+        with self._lock:
+            return {
+                "total_cards": self.total_cards,
+                "processed_cards": self.processed_cards,
+                "filtered_cards": self.filtered_cards,
+                "failed_cards": self.failed_cards,
+                "total_known": self.total_known,
+                "batch_size": self.batch_size,
+                "workers": self.workers,
+                "elapsed": self.elapsed,
+                "cards_per_second": self.throughput.rate(),
+                "quarantined_cards": len(self.quarantined),
+                "sizing_decisions": self.sizing_changes,
+                "card_latency": self.card_latency.to_record(),
+            }
 
 
 class BatchErrorHandler:
@@ -170,6 +538,26 @@ class BatchErrorHandler:
         """
         self.logger.error(f"Batch processing error: {str(error)}")
 
+    def log_card_quarantined(self, entry: QuarantinedCard) -> None:
+        """Log a warning about a card quarantined for overrunning its deadline.
+        
+        Args:
+            entry (QuarantinedCard): The quarantined card
+        """
+        self.logger.warning(
+            f"Card {entry.name} quarantined after {entry.elapsed:.3f}s: {entry.reason}"
+        )
+
+    def log_straggler_warning(self, count: int) -> None:
+        """Log a warning about abandoned tasks left running at shutdown.
+        
+        Args:
+            count (int): Number of tasks still running
+        """
+        self.logger.warning(
+            f"Shutting down without waiting for {count} tasks still running"
+        )
+
     def log_timeout_warning(self, count: int) -> None:
         """Log a warning about cards that exceeded the timeout limit.
         
@@ -195,17 +583,27 @@ class ParallelProcessor:
     - Error context preservation
     - Memory-efficient processing
 
+    Tasks still running when their wait times out cannot be stopped from
+    outside; they are cancelled cooperatively where possible and kept in
+    ``stragglers`` so that shutting the pool down need not wait for them.
+
     Attributes:
         error_handler (BatchErrorHandler): Thread-safe error handler
+        quarantine (Quarantine): Cards quarantined by workers
+        stragglers (Set[Future]): Abandoned tasks that were still running
     """
 
-    def __init__(self, error_handler: BatchErrorHandler):
+    def __init__(self, error_handler: BatchErrorHandler, quarantine: Optional[Quarantine] = None):
         """Initialize the parallel processor with error handling.
         
         Args:
             error_handler (BatchErrorHandler): Thread-safe error handler
+            quarantine (Optional[Quarantine]): Where to record quarantined
+                cards; a new one by default
         """
         self.error_handler = error_handler
+        self.quarantine = quarantine if quarantine is not None else Quarantine()
+        self.stragglers: Set[Future] = set()
 
     def process_parallel(
         self,
@@ -228,9 +626,138 @@ class ParallelProcessor:
                 - Number of filtered cards
                 - Number of failed cards
         """
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
             futures = self._submit_tasks(executor, cards, processor_func)
             return self._process_futures(futures, timeout)
+        finally:
+            # Do not join tasks that overran the timeout
+            executor.shutdown(wait=not self.pending_stragglers(), cancel_futures=True)
+
+    def pending_stragglers(self) -> int:
+        """Count the abandoned tasks that are still running.
+        
+        Returns:
+            int: Number of stragglers not finished yet
+        """
+        self.stragglers = {future for future in self.stragglers if not future.done()}
+        return len(self.stragglers)
+
+    def process_chunks(
+        self,
+        executor: Executor,
+        chunks: List[List[dict]],
+        task: Callable[[List[dict]], ChunkResult],
+        timeout: float,
+        cancel: Optional[threading.Event] = None
+    ) -> Tuple[List[dict], WorkerCounters]:
+        """Process sub-chunks on a worker pool, one task per sub-chunk.
+        
+        Results are merged in input order. A sub-chunk that fails as a whole
+        or does not finish in time counts all of its cards as failed.
+        
+        Args:
+            executor: Worker pool
+            chunks: Sub-chunks to process
+            task: Function processing one sub-chunk; must be picklable for
+                process and interpreter pools
+            timeout: Maximum time (seconds) to wait for completion
+            cancel: Token the task checks, set if it does not finish in time
+
+        Returns:
+            Tuple containing:
+                - List of successfully processed cards
+                - Counters of the tasks, merged
+        """
+        return self.collect_chunks(chunks, self.submit_chunks(executor, chunks, task), timeout, cancel)
+
+    def submit_chunks(
+        self,
+        executor: Executor,
+        chunks: List[List[dict]],
+        task: Callable[[List[dict]], ChunkResult]
+    ) -> List[Future]:
+        """Submit one task per sub-chunk without waiting for them.
+        
+        A sub-chunk the pool refuses, for instance because it is broken or
+        shut down, gets a future holding the error, so that collecting it
+        counts its cards as failed like any other failed task.
+        
+        Args:
+            executor: Worker pool
+            chunks: Sub-chunks to process
+            task: Function processing one sub-chunk
+        
+        Returns:
+            List[Future]: One future per sub-chunk, in input order
+        """
+        futures = []
+        for chunk in chunks:
+            try:
+                future = executor.submit(task, chunk)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            futures.append(future)
+        return futures
+
+    def collect_chunks(
+        self,
+        chunks: List[List[dict]],
+        futures: List[Future],
+        timeout: float,
+        cancel: Optional[threading.Event] = None
+    ) -> Tuple[List[dict], WorkerCounters]:
+        """Wait for the tasks of ``submit_chunks`` and merge their results.
+        
+        Cards quarantined by the tasks are logged and recorded in
+        ``quarantine``. Tasks that do not finish in time count all their
+        cards as failed; ``cancel`` is then set, so that tasks checking it
+        stop at their next card checkpoint.
+        
+        Args:
+            chunks: Sub-chunks that were submitted
+            futures: Their futures, in the same order
+            timeout: Maximum time (seconds) to wait for completion
+            cancel: Token the tasks check
+        
+        Returns:
+            Tuple containing:
+                - List of successfully processed cards, in input order
+                - Counters of the tasks, merged; cards of failed or unfinished
+                  tasks count as failed
+        """
+        done, not_done = wait(futures, timeout=timeout, return_when=ALL_COMPLETED)
+
+        processed: List[dict] = []
+        merged = WorkerCounters()
+        timed_out = 0
+        for chunk, future in zip(chunks, futures):
+            if future in not_done or future.cancelled():
+                timed_out += len(chunk)
+                continue
+            try:
+                processed_cards, counters, failures, quarantined = future.result()
+            except Exception as e:
+                self.error_handler.log_batch_error(e)
+                merged.failed += len(chunk)
+                continue
+            processed.extend(processed_cards)
+            merged.merge(counters)
+            for card_name, message in failures:
+                self.error_handler.log_card_error(card_name, Exception(message))
+            for entry in quarantined:
+                self.error_handler.log_card_quarantined(entry)
+            self.quarantine.extend(quarantined)
+
+        if timed_out:
+            self.error_handler.log_timeout_warning(timed_out)
+            if cancel is not None:
+                cancel.set()
+            self._cancel_futures(not_done)
+
+        merged.failed += timed_out
+        return processed, merged
 
     def _submit_tasks(
         self,
@@ -266,7 +793,9 @@ class ParallelProcessor:
         """
         try:
             done, not_done = wait(futures, timeout=timeout, return_when=ALL_COMPLETED)
-            results = self._handle_completed_futures(done)
+            results = self._handle_completed_futures(
+                [future for future in futures if future in done]
+            )
             failed_from_timeout = self._handle_timeout(not_done)
             
             return (
@@ -293,11 +822,12 @@ class ParallelProcessor:
         filtered_count: int = 0
         failed_count: int = 0
 
-    def _handle_completed_futures(self, done: Set[Future]) -> ProcessingResults:
+    def _handle_completed_futures(self, done: List[Future]) -> ProcessingResults:
         """Process completed futures with error handling.
         
         Args:
-            done: Set of completed futures
+            done: Completed futures, in submission order, which is the order
+                their cards are returned in
 
         Returns:
             ProcessingResults: Collected results
@@ -387,11 +917,15 @@ class ParallelProcessor:
     def _cancel_futures(self, futures: Union[Set[Future], List[Future]]) -> None:
         """Cancel futures and release resources.
         
+        Futures already running cannot be cancelled and are kept as
+        stragglers.
+        
         Args:
             futures: Futures to cancel and clean up
         """
         for future in futures:
-            future.cancel()
+            if not future.cancel() and not future.done():
+                self.stragglers.add(future)
 
 
 class BatchProcessor:
@@ -416,7 +950,7 @@ class BatchProcessor:
         # Process cards with resource management
         for processed_cards, stats in processor.process_batch(
             cards_data,
-            filters={"rarity": {"equals": "rare"}},
+            filters={"rarity": {"eq": "rare"}},
             schema=["name", "manaCost", "rarity"],
             batch_size=50,  # Optimize memory usage
             timeout=10.0    # Ensure timely completion
@@ -427,39 +961,180 @@ class BatchProcessor:
             print(f"Success rate: {stats.processed_cards/stats.total_cards:.2%}")
         ```
 
+    Every card gets ``timeout`` seconds. Card processors that call
+    ``src.processing.deadlines.checkpoint`` are stopped at their next
+    checkpoint once the deadline passes; cards stopped this way or finishing
+    late count as failed and are recorded in ``quarantine``. As a last
+    resort, a sub-chunk is abandoned once it has taken ``timeout`` seconds
+    per card, and its remaining thread tasks are cancelled cooperatively.
+
     Attributes:
         card_processor (CardProcessorInterface): Type-safe card processor
         logger (LoggingInterface): Thread-safe logger
         error_handler (BatchErrorHandler): Error handling system
         parallel_processor (ParallelProcessor): Parallel processing manager
+        backend (ExecutorBackend): Execution strategy for chunks
+        max_workers (Optional[int]): Worker count, or None for the backend default
+        quarantine (Quarantine): Most recent cards that overran their deadline
     """
 
-    def __init__(self, card_processor: CardProcessorInterface, logger: LoggingInterface):
+    def __init__(
+        self,
+        card_processor: CardProcessorInterface,
+        logger: LoggingInterface,
+        backend: Union[str, ExecutorBackend] = ExecutorBackend.THREAD,
+        max_workers: Optional[int] = None,
+        config: Optional[CardFilterConfig] = None
+    ):
         """Initialize the BatchProcessor with required components.
         
+        The worker pool is not started here but on first use, and then kept
+        until ``close`` is called.
+        
         Args:
-            card_processor: Type-safe card processor implementation
+            card_processor: Type-safe card processor implementation; must be
+                picklable for the process and interpreter backends
             logger: Thread-safe logging interface
+            backend: Execution strategy, as an ExecutorBackend or its name
+            max_workers: Number of workers; defaults to the configured
+                ``max_workers``, then to 10 threads, or to the CPU count for
+                the process and interpreter backends
+            config: Optional configuration providing ``max_workers``
+
+        Raises:
+            ValueError: If the backend is unknown or unavailable
         """
+        try:
+            self.backend = ExecutorBackend(backend)
+        except ValueError:
+            names = ", ".join(member.value for member in ExecutorBackend)
+            raise ValueError(f"Unknown executor backend: {backend} (expected one of {names})")
+        if (self.backend is ExecutorBackend.INTERPRETER
+                and not hasattr(concurrent.futures, "InterpreterPoolExecutor")):
+            raise ValueError("The interpreter backend requires Python 3.14 or later")
+
         self.card_processor = card_processor
         self.logger = logger  # Store logger for backward compatibility
         self.error_handler = BatchErrorHandler(logger)
-        self.parallel_processor = ParallelProcessor(self.error_handler)
+        self.quarantine = Quarantine()
+        self.parallel_processor = ParallelProcessor(self.error_handler, self.quarantine)
+        self.max_workers = max_workers or (config.max_workers if config is not None else None)
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self) -> "BatchProcessor":
+        """Enter the context, returning the processor."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Shut the worker pool down on exit.
+
+        Returns:
+            bool: False to propagate exceptions
+        """
+        self.close(cancel=exc_type is not None)
+        return False
+
+    @property
+    def ships_chunks(self) -> bool:
+        """Whether chunks are processed by worker processes or subinterpreters."""
+        return self.backend in (ExecutorBackend.PROCESS, ExecutorBackend.INTERPRETER)
+
+    @property
+    def workers(self) -> int:
+        """Number of workers of the pool."""
+        if self.max_workers:
+            return self.max_workers
+        if self.ships_chunks:
+            return os.cpu_count() or 1
+        return DEFAULT_THREAD_WORKERS
+
+    @property
+    def executor(self) -> Executor:
+        """The worker pool, started on first use and kept until ``close``.
+
+        Raises:
+            ValueError: If the serial backend is selected
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = create_executor(self.backend, self.workers, self.card_processor)
+            return self._executor
+
+    def close(self, cancel: bool = False) -> None:
+        """Shut the worker pool down, if it was started.
+
+        If tasks abandoned after a timeout are still running, queued tasks
+        are dropped and the pool is shut down without waiting for them.
+        A later chunk starts a new pool.
+
+        Args:
+            cancel: Whether to drop queued tasks instead of finishing them
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            stragglers = self.parallel_processor.pending_stragglers()
+            if stragglers:
+                self.error_handler.log_straggler_warning(stragglers)
+            executor.shutdown(wait=not stragglers, cancel_futures=cancel or bool(stragglers))
+
+    def _cancel_token(self) -> Optional[threading.Event]:
+        """Create a cancellation token for the tasks of a chunk.
+
+        Returns:
+            Optional[threading.Event]: A token, or None for worker processes
+                and subinterpreters, which only honor card deadlines
+        """
+        return None if self.ships_chunks else threading.Event()
+
+    @staticmethod
+    def _wait_limit(sub_chunks: List[List[dict]], timeout: float) -> float:
+        """Time to wait for sub-chunks processed in parallel.
+
+        Args:
+            sub_chunks: Sub-chunks of a chunk
+            timeout: Deadline of each card
+
+        Returns:
+            float: The card deadline times the size of the largest sub-chunk
+        """
+        return timeout * max(len(sub_chunk) for sub_chunk in sub_chunks)
+
+    def _split_chunk(self, cards: List[dict], workers: Optional[int] = None) -> List[List[dict]]:
+        """Split a chunk into one contiguous sub-chunk per worker.
+        
+        Args:
+            cards: Cards of the chunk
+            workers: Number of workers to split across; defaults to all
+
+        Returns:
+            List[List[dict]]: Non-empty sub-chunks in input order
+        """
+        size = -(-len(cards) // min(workers or self.workers, len(cards)))
+        return [cards[i:i + size] for i in range(0, len(cards), size)]
 
     def process_single_card(
         self,
         card: dict,
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
         additional_languages: Optional[List[str]],
+        deadline: Optional[CardDeadline] = None
     ) -> Tuple[Optional[dict], bool, bool]:
         """Process a single card with comprehensive error handling.
         
+        A card stopped at a checkpoint for overrunning its deadline or for
+        being cancelled, or finishing past its deadline, is quarantined and
+        counted as failed.
+        
         Args:
             card: Card data to process
             filters: Type-checked filter conditions
             schema: Validated field selection
             additional_languages: Language codes to include
+            deadline: Deadline entered by the caller, restarted for this card;
+                None for no deadline
 
         Returns:
             Tuple containing:
@@ -467,6 +1142,9 @@ class BatchProcessor:
                 - Whether the card was filtered
                 - Whether processing failed
         """
+        name = card.get('name', 'Unknown')
+        if deadline is not None:
+            deadline.restart()
         try:
             result = self.card_processor.process_card(
                 card_data=card,
@@ -474,31 +1152,48 @@ class BatchProcessor:
                 schema=schema,
                 additional_languages=additional_languages
             )
-            return result, result is None, False
+        except CardTimeoutError as e:
+            self.error_handler.log_card_quarantined(self.quarantine.add(name, e.elapsed, str(e)))
+            return None, False, True
         except Exception as e:
-            self.error_handler.log_card_error(card.get('name', 'Unknown'), e)
+            self.error_handler.log_card_error(name, e)
             return None, False, True
 
+        if deadline is not None and deadline.expired:
+            self.error_handler.log_card_quarantined(self.quarantine.add(
+                name, deadline.elapsed, f"Card finished past its {deadline.timeout:g}s deadline"
+            ))
+            return None, False, True
+        return result, result is None, False
+
     def process_batch_chunk(
         self,
         cards: List[dict],
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
         additional_languages: Optional[List[str]],
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        workers: Optional[int] = None,
+        counters: Optional[WorkerCounters] = None
     ) -> Tuple[List[dict], int, int]:
         """Process a chunk of cards with optimized execution strategy.
         
-        Implements adaptive processing strategy based on batch size:
-        - Small batches (<= 5 cards): Sequential processing
-        - Larger batches: Parallel processing with resource management
+        Implements adaptive processing strategy based on batch size and backend:
+        - Small batches (<= 5 cards), the serial backend and a single worker
+          requested: Sequential processing
+        - Other backends: The chunk is split into one sub-chunk per worker and
+          each sub-chunk is submitted to the persistent pool as a single task
 
         Args:
             cards: List of cards to process
             filters: Type-checked filter conditions
             schema: Validated field selection
             additional_languages: Language codes to include
-            timeout: Maximum processing time per card
+            timeout: Deadline of each card in seconds
+            workers: Number of workers to split the chunk across; defaults
+                to the whole pool
+            counters: Counters receiving the chunk's counts and the time
+                of every card
 
         Returns:
             Tuple containing:
@@ -507,45 +1202,224 @@ class BatchProcessor:
                 - Number of failed cards
         """
         # Process cards sequentially if batch is small
-        if len(cards) <= 5:
-            processed_cards = []
-            filtered_count = 0
-            failed_count = 0
-            
+        sequential = workers == 1 if workers else len(cards) <= SEQUENTIAL_CHUNK_SIZE
+        if sequential or self.backend is ExecutorBackend.SERIAL:
+            processed_cards, chunk_counters, _, _ = self._process_sequential(
+                cards, filters, schema, additional_languages, timeout
+            )
+        else:
+            sub_chunks = self._split_chunk(cards, workers)
+            cancel = self._cancel_token()
+            processed_cards, chunk_counters = self.parallel_processor.process_chunks(
+                self.executor,
+                sub_chunks,
+                self._chunk_task(filters, schema, additional_languages, timeout, cancel),
+                self._wait_limit(sub_chunks, timeout),
+                cancel
+            )
+
+        if counters is not None:
+            counters.merge(chunk_counters)
+        return processed_cards, chunk_counters.filtered, chunk_counters.failed
+
+    def _chunk_task(
+        self,
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
+        additional_languages: Optional[List[str]],
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> Callable[[List[dict]], ChunkResult]:
+        """Build the task that processes one sub-chunk on the worker pool.
+        
+        Worker processes and subinterpreters run the module-level task with
+        their own card processor; threads share this processor.
+        
+        Args:
+            filters: Type-checked filter conditions
+            schema: Validated field selection
+            additional_languages: Language codes to include
+            timeout: Deadline of each card in seconds
+            cancel: Cancellation token, for threads only
+        
+        Returns:
+            Callable[[List[dict]], ChunkResult]: The task
+        """
+        if self.ships_chunks:
+            return functools.partial(
+                process_card_chunk,
+                filters=filters,
+                schema=schema,
+                additional_languages=additional_languages,
+                timeout=timeout
+            )
+        return functools.partial(
+            self._process_sequential,
+            filters=filters,
+            schema=schema,
+            additional_languages=additional_languages,
+            timeout=timeout,
+            cancel=cancel
+        )
+
+    def _process_sequential(
+        self,
+        cards: List[dict],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
+        additional_languages: Optional[List[str]],
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> ChunkResult:
+        """Process cards one after another in the current thread.
+        
+        Once ``cancel`` is set, the remaining cards are skipped: the caller
+        has abandoned the task and counted them as failed already.
+        
+        Args:
+            cards: Cards to process
+            filters: Type-checked filter conditions
+            schema: Validated field selection
+            additional_languages: Language codes to include
+            timeout: Deadline of each card in seconds
+            cancel: Token abandoning the task when set
+
+        Returns:
+            ChunkResult: Processed cards and counters; failures are logged and
+                cards quarantined here
+        """
+        processed_cards = []
+        counters = WorkerCounters()
+        latency = counters.latency
+        
+        with card_deadline(timeout, cancel) as deadline:
             for card in cards:
+                if cancel is not None and cancel.is_set():
+                    break
                 result, is_filtered, is_failed = self.process_single_card(
-                    card, filters, schema, additional_languages
+                    card, filters, schema, additional_languages, deadline=deadline
                 )
+                latency.record(deadline.elapsed)
                 if result is not None:
                     processed_cards.append(result)
                 if is_filtered:
-                    filtered_count += 1
+                    counters.filtered += 1
                 if is_failed:
-                    failed_count += 1
-                    
-            return processed_cards, filtered_count, failed_count
-        
-        # Process larger batches in parallel with resource management
-        def process_card(card):
-            return self.process_single_card(
-                card, filters, schema, additional_languages
+                    counters.failed += 1
+                
+        counters.processed = len(processed_cards)
+        return processed_cards, counters, [], []
+
+    def _process_each(
+        self,
+        chunks: Iterable[List[dict]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
+        additional_languages: Optional[List[str]],
+        timeout: float,
+        sizer: Optional[AdaptiveBatchSizer]
+    ) -> Iterator[Tuple[List[dict], WorkerCounters]]:
+        """Process chunks one at a time, each finished before the next starts.
+        
+        Args:
+            chunks: Chunks to process
+            filters: Type-checked filter conditions
+            schema: Validated field selection
+            additional_languages: Language codes to include
+            timeout: Deadline of each card in seconds
+            sizer: Adaptive sizer choosing the worker count, if any
+        
+        Yields:
+            Tuple containing, for each chunk:
+                - List of successfully processed cards
+                - Counters of the chunk
+        """
+        for chunk in chunks:
+            counters = WorkerCounters()
+            try:
+                processed_cards, _, _ = self.process_batch_chunk(
+                    chunk, filters, schema, additional_languages, timeout,
+                    workers=sizer.workers if sizer is not None else None,
+                    counters=counters
+                )
+            except Exception as e:
+                self.error_handler.log_batch_error(e)
+                yield [], WorkerCounters(failed=len(chunk))
+                continue
+            yield processed_cards, counters
+
+    def _process_pipelined(
+        self,
+        chunks: Iterable[List[dict]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
+        additional_languages: Optional[List[str]],
+        timeout: float,
+        depth: int,
+        sizer: Optional[AdaptiveBatchSizer]
+    ) -> Iterator[Tuple[List[dict], WorkerCounters]]:
+        """Process chunks through a sliding window of in-flight chunks.
+        
+        Up to ``depth`` chunks are submitted to the worker pool at once. The
+        oldest is yielded as soon as it is complete, while the pool works on
+        the others, so results keep input order and the consumer's handling
+        of one chunk overlaps with the processing of the next ones.
+        
+        Args:
+            chunks: Chunks to process
+            filters: Type-checked filter conditions
+            schema: Validated field selection
+            additional_languages: Language codes to include
+            timeout: Deadline of each card in seconds; the wait for a chunk
+                is counted from when it becomes the oldest in flight
+            depth: Maximum number of chunks in flight
+            sizer: Adaptive sizer choosing the worker count, if any
+        
+        Yields:
+            Tuple containing, for each chunk in input order:
+                - List of successfully processed cards
+                - Counters of the chunk
+        """
+        window: Deque[Tuple[List[List[dict]], List[Future], Optional[threading.Event]]] = deque()
+
+        def collect() -> Tuple[List[dict], WorkerCounters]:
+            sub_chunks, futures, cancel = window.popleft()
+            return self.parallel_processor.collect_chunks(
+                sub_chunks, futures, self._wait_limit(sub_chunks, timeout), cancel
             )
-            
-        return self.parallel_processor.process_parallel(
-            cards=cards,
-            processor_func=process_card,
-            timeout=timeout,
-            max_workers=min(len(cards), 10)
-        )
+
+        try:
+            for chunk in chunks:
+                sub_chunks = self._split_chunk(chunk, sizer.workers if sizer is not None else None)
+                cancel = self._cancel_token()
+                task = self._chunk_task(filters, schema, additional_languages, timeout, cancel)
+                window.append(
+                    (sub_chunks, self.parallel_processor.submit_chunks(self.executor, sub_chunks, task), cancel)
+                )
+                if len(window) >= depth:
+                    yield collect()
+            while window:
+                yield collect()
+        finally:
+            # The consumer stopped early: drop the chunks it will never see
+            for _, futures, cancel in window:
+                if cancel is not None:
+                    cancel.set()
+                for future in futures:
+                    future.cancel()
 
     def process_batch(
         self,
-        cards_data: List[dict],
-        filters: Optional[Dict[str, Any]] = None,
-        schema: Optional[List[str]] = None,
+        cards_data: Iterable[dict],
+        filters: Union[Dict[str, Any], FilterPlan, None] = None,
+        schema: Union[List[str], SchemaProjector, None] = None,
         additional_languages: Optional[List[str]] = None,
         batch_size: int = 100,
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        total_estimate: Optional[int] = None,
+        prefetch_chunks: int = DEFAULT_PREFETCH_CHUNKS,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        adaptive: Optional[AdaptiveBatchSizer] = None
     ) -> Iterator[Tuple[List[dict], BatchStatistics]]:
         """Process a batch of cards with comprehensive resource management.
         
@@ -553,19 +1427,59 @@ class BatchProcessor:
         as they become available along with detailed statistics. Implements
         proper resource management and error handling throughout the process.
 
+        Cards may come from any iterable, such as a card stream. Chunks are
+        then sliced lazily and read ahead on a background thread, at most
+        ``prefetch_chunks`` at a time, so memory use does not grow with the
+        input. The total is exact for lists; for other inputs it is reported
+        as a running count, or the estimate if larger, until the input is
+        exhausted (see ``BatchStatistics.total_known``).
+
+        Chunks are yielded in input order. By default each chunk is finished
+        before the next is submitted; with a ``pipeline_depth`` above 1, the
+        parallel backends keep that many chunks in flight, so the workers
+        carry on with the next chunks while the caller handles the current
+        one, for instance by writing it out.
+
+        With an ``adaptive`` sizer, ``batch_size`` is only the starting chunk
+        size: after each chunk, the sizer picks the size and the number of
+        workers of the next chunks from the measured latency, throughput and
+        memory. A single worker processes chunks in the calling thread. The
+        settings in use and the changes made are reported in the statistics.
+        Chunks already read ahead keep the size they were cut at.
+
+        The filters and the schema are compiled once, before the first chunk,
+        and the same ``FilterPlan`` and ``SchemaProjector`` filter and project
+        every card; worker processes receive them pickled by their conditions
+        and paths and compile them once per chunk task. The additional
+        languages are likewise normalized once into a frozenset.
+
         Args:
-            cards_data: List of cards to process
-            filters: Type-checked filter conditions
-            schema: Validated field selection
+            cards_data: Cards to process, as a list or any iterable
+            filters: Type-checked filter conditions, or an already compiled
+                plan
+            schema: Validated field selection, as field names or dotted paths
+                to nested fields, or an already compiled projector
             additional_languages: Language codes to include
-            batch_size: Size of processing chunks
-            timeout: Maximum processing time per card
+            batch_size: Size of processing chunks, or the initial size with
+                an adaptive sizer
+            timeout: Deadline of each card in seconds
+            total_estimate: Expected number of cards, for streamed inputs
+            prefetch_chunks: Chunks read ahead from streamed inputs; 0 reads
+                them in the calling thread
+            pipeline_depth: Maximum number of chunks in flight; ignored by
+                the serial backend
+            adaptive: Sizer adjusting chunk size and worker count as the
+                batch runs; reset at the start of every batch
 
         Yields:
             Iterator[Tuple[List[dict], BatchStatistics]]: Tuple containing:
                 - List of processed cards in current chunk
                 - Updated statistics for entire batch
 
+        Raises:
+            ValueError: If pipeline_depth is below 1 or the filters or the
+                schema are invalid
+
         Example:
             ```python
             processor = BatchProcessor(card_processor, logger)
@@ -579,35 +1493,120 @@ class BatchProcessor:
                 print(f"Chunk processed: {len(processed_chunk)} cards")
                 print(f"Progress: {stats.processed_cards}/{stats.total_cards}")
                 print(f"Success rate: {stats.processed_cards/stats.total_cards:.2%}")
+
+            # Stream cards straight from a dump
+            cards = (card for _, card in reader.iter_cards())
+            for processed_chunk, stats in processor.process_batch(cards, total_estimate=300_000):
+                ...
+
+            # Write each chunk while the workers process the next ones
+            for processed_chunk, stats in processor.process_batch(cards_data, pipeline_depth=4):
+                writer.write_cards(processed_chunk)
+
+            # Let chunks grow or shrink toward half a second each
+            sizer = AdaptiveBatchSizer(target_latency=0.5, memory_budget_mb=1024)
+            for processed_chunk, stats in processor.process_batch(cards_data, adaptive=sizer):
+                print(f"{stats.batch_size} cards per chunk on {stats.workers} workers")
             ```
         """
-        if not cards_data:
-            return
+        if pipeline_depth < 1:
+            raise ValueError(f"pipeline_depth must be at least 1, got {pipeline_depth}")
+        if filters:
+            filters = compile_filters(filters)
+        if schema is not None:
+            schema = compile_schema(schema)
+        additional_languages = normalize_languages(additional_languages)
+
+        parallel = self.backend is not ExecutorBackend.SERIAL
+        stats = BatchStatistics(batch_size=batch_size, workers=self.workers if parallel else 1)
+        if adaptive is not None:
+            adaptive.reset(batch_size, stats.workers)
+            stats.batch_size = adaptive.batch_size
+            chunks: Generator[List[dict], None, None] = iter_chunks(
+                cards_data, lambda: adaptive.batch_size
+            )
+        else:
+            chunks = iter_chunks(cards_data, batch_size)
+        if isinstance(cards_data, Sized):
+            stats.total_cards = len(cards_data)
+        else:
+            stats.total_cards = total_estimate or 0
+            stats.total_known = False
+            if prefetch_chunks > 0:
+                chunks = prefetch(chunks, prefetch_chunks)
+
+        counted_chunks = self._count_chunks(chunks, stats)
+        if pipeline_depth > 1 and parallel:
+            results = self._process_pipelined(
+                counted_chunks, filters, schema, additional_languages, timeout, pipeline_depth, adaptive
+            )
+        else:
+            results = self._process_each(
+                counted_chunks, filters, schema, additional_languages, timeout, adaptive
+            )
+
+        quarantine_mark = self.quarantine.total
+        try:
+            delivered = time.perf_counter()
+            while True:
+                waited = time.perf_counter()
+                result = next(results, None)
+                if result is None:
+                    break
+                processed_chunk, counters = result
+
+                # Merge the workers' counters atomically, once per chunk
+                stats.merge(counters)
+                if self.quarantine.total != quarantine_mark:
+                    quarantined, quarantine_mark = self.quarantine.since(quarantine_mark)
+                    stats.quarantined.extend(quarantined)
+
+                if adaptive is not None:
+                    now = time.perf_counter()
+                    decision = adaptive.record(
+                        counters.cards,
+                        latency=now - waited,
+                        interval=now - delivered
+                    )
+                    delivered = now
+                    if decision is not None:
+                        stats.sizing_decisions.append(decision)
+                        stats.sizing_changes += 1
+                        stats.batch_size = decision.batch_size
+                        stats.workers = decision.workers
 
-        stats = BatchStatistics(total_cards=len(cards_data))
-        
-        # Process cards in memory-efficient chunks
-        for i in range(0, len(cards_data), batch_size):
-            chunk = cards_data[i:i + batch_size]
-            try:
-                processed_chunk, filtered_count, failed_count = self.process_batch_chunk(
-                    chunk,
-                    filters,
-                    schema,
-                    additional_languages,
-                    timeout
-                )
-                
-                # Update statistics atomically
-                stats.update(
-                    processed=len(processed_chunk),
-                    filtered=filtered_count,
-                    failed=failed_count
-                )
-                
                 yield processed_chunk, stats
-                
-            except Exception as e:
-                self.error_handler.log_batch_error(e)
-                stats.update(processed=0, filtered=0, failed=len(chunk))
-                yield [], stats
+        finally:
+            results.close()
+            chunks.close()
+
+    @staticmethod
+    def _count_chunks(
+        chunks: Iterator[List[dict]],
+        stats: BatchStatistics
+    ) -> Generator[List[dict], None, None]:
+        """Pass chunks through, keeping a streamed input's total up to date.
+        
+        Looks one chunk ahead, so the total is exact by the time the last
+        chunk is handed on.
+        
+        Args:
+            chunks: Chunks to pass through
+            stats: Statistics whose total is updated while it is not known
+        
+        Yields:
+            List[dict]: Each chunk, in order
+        """
+        cards_read = 0
+        chunk = next(chunks, None)
+        while chunk is not None:
+            next_chunk = next(chunks, None)
+            cards_read += len(chunk)
+            if not stats.total_known:
+                if next_chunk is None:
+                    stats.total_cards = cards_read
+                    stats.total_known = True
+                else:
+                    stats.total_cards = max(stats.total_cards, cards_read)
+            yield chunk
+            chunk = next_chunk
@@ -0,0 +1,231 @@
+"""Per-card deadlines, cooperative cancellation and quarantine.
+
+Python cannot interrupt a running thread, so batch processing enforces card
+deadlines cooperatively: a task enters a ``card_deadline`` and restarts it for
+each card, and card processors call ``checkpoint`` between the steps of their
+work. A checkpoint raises ``CardTimeoutError`` once the card's deadline has
+passed or its cancellation token is set; outside a deadline it does nothing.
+Cards stopped this way, or finishing past their deadline, are recorded in a
+``Quarantine`` with their names and elapsed times.
+
+Features:
+- Deadlines carried in a context variable, so processor signatures are unchanged
+- Cancellation tokens shared by every card of a task
+- One deadline per task, restarted per card; a checkpoint costs a context
+  variable lookup and a clock read
+- A bounded, thread-safe quarantine of the most recent offenders
+
+Example:
+    ```python
+    cancel = threading.Event()
+    with card_deadline(timeout=0.5, cancel=cancel) as deadline:
+        for card_data in cards:
+            deadline.restart()
+            try:
+                result = processor.process_card(card_data)  # calls checkpoint()
+            except CardTimeoutError as e:
+                quarantine.add(card_data["name"], e.elapsed, str(e))
+    ```
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Iterable, List, Optional, Tuple
+
+from ..core.errors import CardTimeoutError
+
+# Entries kept by a Quarantine; older ones are dropped first
+DEFAULT_QUARANTINE_SIZE = 1000
+
+
+class CardDeadline:
+    """The deadline and cancellation token of the card being processed.
+
+    Used as a context manager, it becomes the deadline ``checkpoint`` checks
+    within the block. A task enters one deadline and restarts it for every
+    card, which is cheaper than entering a new one per card.
+
+    Attributes:
+        timeout (Optional[float]): Seconds allowed, or None for no deadline
+        started (float): ``time.perf_counter()`` when the card started
+        cancel (Optional[threading.Event]): Token cancelling the card when set
+    """
+
+    __slots__ = ("timeout", "started", "cancel", "_expires", "_token")
+
+    def __init__(self, timeout: Optional[float], cancel: Optional[threading.Event] = None):
+        """Start the deadline now.
+
+        Args:
+            timeout: Seconds allowed, or None for no deadline
+            cancel: Token cancelling the card when set
+        """
+        self.timeout = timeout
+        self.cancel = cancel
+        self._token = None
+        self.restart()
+
+    def restart(self) -> None:
+        """Start the deadline over, for the next card."""
+        self.started = time.perf_counter()
+        self._expires = self.started + self.timeout if self.timeout is not None else math.inf
+
+    def __enter__(self) -> "CardDeadline":
+        """Make this the current card's deadline."""
+        self._token = _current_deadline.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Restore the previous deadline.
+
+        Returns:
+            bool: False to propagate exceptions
+        """
+        _current_deadline.reset(self._token)
+        return False
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the card started."""
+        return time.perf_counter() - self.started
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.perf_counter() > self._expires
+
+    def check(self) -> None:
+        """Stop the card if it is cancelled or past its deadline.
+
+        Raises:
+            CardTimeoutError: If the card must stop
+        """
+        if time.perf_counter() > self._expires:
+            elapsed = self.elapsed
+            raise CardTimeoutError(
+                f"Card exceeded its {self.timeout:g}s deadline after {elapsed:.3f}s", elapsed
+            )
+        if self.cancel is not None and self.cancel.is_set():
+            raise CardTimeoutError("Card processing cancelled", self.elapsed, cancelled=True)
+
+
+_current_deadline: ContextVar[Optional[CardDeadline]] = ContextVar("card_deadline", default=None)
+
+
+def checkpoint() -> None:
+    """Stop the current card if it is cancelled or past its deadline.
+
+    Card processors call this between steps of their work. Outside
+    ``card_deadline`` it does nothing.
+
+    Raises:
+        CardTimeoutError: If the current card must stop
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def card_deadline(timeout: Optional[float], cancel: Optional[threading.Event] = None) -> CardDeadline:
+    """Give the cards processed in a ``with`` block a deadline starting now.
+
+    Args:
+        timeout: Seconds allowed, or None for no deadline
+        cancel: Token cancelling the card when set
+
+    Returns:
+        CardDeadline: The deadline, to restart for every card; its
+            ``elapsed`` times the current card
+    """
+    return CardDeadline(timeout, cancel)
+
+
+@dataclass
+class QuarantinedCard:
+    """A card stopped or dropped for overrunning its deadline.
+
+    Attributes:
+        name (str): Card name
+        elapsed (float): Seconds spent on the card
+        reason (str): Why the card was quarantined
+    """
+    name: str
+    elapsed: float
+    reason: str
+
+
+class Quarantine:
+    """Thread-safe record of the most recent quarantined cards.
+
+    Only the latest ``size`` entries are kept, but ``total`` counts every
+    card ever added, so callers can tell which entries are new to them.
+
+    Attributes:
+        size (int): Maximum number of entries kept
+        total (int): Number of cards ever quarantined
+    """
+
+    def __init__(self, size: int = DEFAULT_QUARANTINE_SIZE):
+        """Create an empty quarantine.
+
+        Args:
+            size: Maximum number of entries kept
+        """
+        self.size = size
+        self.total = 0
+        self._entries: Deque[QuarantinedCard] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of entries kept."""
+        return len(self._entries)
+
+    def add(self, name: str, elapsed: float, reason: str) -> QuarantinedCard:
+        """Quarantine a card.
+
+        Args:
+            name: Card name
+            elapsed: Seconds spent on the card
+            reason: Why the card was quarantined
+
+        Returns:
+            QuarantinedCard: The new entry
+        """
+        entry = QuarantinedCard(name, elapsed, reason)
+        self.extend([entry])
+        return entry
+
+    def extend(self, entries: Iterable[QuarantinedCard]) -> None:
+        """Quarantine cards recorded elsewhere, such as in a worker process.
+
+        Args:
+            entries: Entries to add
+        """
+        with self._lock:
+            for entry in entries:
+                self._entries.append(entry)
+                self.total += 1
+
+    def since(self, total: int) -> Tuple[List[QuarantinedCard], int]:
+        """Return the entries added after ``total`` cards had been quarantined.
+
+        Args:
+            total: A previous value of ``total``
+
+        Returns:
+            Tuple[List[QuarantinedCard], int]: The newer entries still kept,
+                oldest first, and the current ``total`` to pass next time
+        """
+        with self._lock:
+            count = min(self.total - total, len(self._entries))
+            entries = list(self._entries)[len(self._entries) - count:] if count > 0 else []
+            return entries, self.total
+
+    def clear(self) -> None:
+        """Drop every entry; ``total`` keeps counting."""
+        with self._lock:
+            self._entries.clear()
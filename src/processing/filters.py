@@ -6,12 +6,17 @@ robust type checking and conversion for numeric comparisons, string operations,
 and collection membership tests.
 
 Features:
-- Type-safe numeric comparisons with automatic conversion
+- Type-safe numeric comparisons with automatic conversion, each distinct
+  string read as a number once
 - Safe string operations with null handling
-- Collection membership testing with type validation
+- Collection membership testing with type validation, against sets
+  built once for large value lists
+- Color set operators (subset, superset, exact, any) on WUBRG bitmasks
+- Regular expression and word-based text matching, compiled once per filter
 - Error-safe operation with graceful fallbacks
 - Extensible operator mapping system
 - Comprehensive type checking and validation
+- Filter compilation into a reusable per-card predicate
 
 Example:
     Basic usage with type safety:
@@ -29,6 +34,10 @@ Example:
     # String/list containment with type checking
     has_color = contains_op(["R", "G"], "R")  # True
     has_color = contains_op(None, "R")  # False (null safety)
+
+    # Compile a whole filter once and reuse it for every card
+    plan = compile_filters({"colors": {"contains": "R"}, "convertedManaCost": {"lte": 3}})
+    plan({"colors": ["R"], "convertedManaCost": 1.0})  # True
     ```
 
 Note:
@@ -38,7 +47,65 @@ Note:
     environments.
 """
 
-from typing import Any, Callable, Optional, Union, List
+import copy
+import operator
+import re
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# Sentinel for values that cannot be read as numbers; as a NaN it compares
+# false with every number, and identity tells it from a NaN read from a card
+NOT_A_NUMBER = float("nan")
+
+# Strings already read as numbers, such as power, toughness and collector
+# numbers; bounded, since each card field holds few distinct strings
+_NUMBER_CACHE: Dict[str, float] = {}
+_NUMBER_CACHE_SIZE = 65536
+
+
+def _parse_number(value: Any) -> float:
+    """Read a value as a float, or ``NOT_A_NUMBER`` if it cannot be."""
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return NOT_A_NUMBER
+
+
+def coerce_number(value: Any) -> float:
+    """Read a card or filter value as a float, without raising.
+    
+    Floats are returned as they are and strings are parsed once, then
+    looked up, so comparing a value costs no conversion and raises no
+    exception, even for strings such as ``"*"`` or ``"1+*"``.
+    
+    Args:
+        value: Value to read, such as ``3``, ``"3"`` or ``"*"``
+        
+    Returns:
+        float: The number, or ``NOT_A_NUMBER`` for values ``float()``
+            rejects
+        
+    Example:
+        ```python
+        coerce_number("3")  # 3.0
+        coerce_number("*") is NOT_A_NUMBER  # True
+        coerce_number("*") > 2  # False, as for any NaN
+        ```
+    """
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is str:
+        number = _NUMBER_CACHE.get(value)
+        if number is None:
+            number = _parse_number(value)
+            if len(_NUMBER_CACHE) < _NUMBER_CACHE_SIZE:
+                _NUMBER_CACHE[value] = number
+        return number
+    return _parse_number(value)
 
 
 def _safe_numeric_comparison(a: Any, b: Any, op: Callable[[float, float], bool]) -> bool:
@@ -66,12 +133,11 @@ def _safe_numeric_comparison(a: Any, b: Any, op: Callable[[float, float], bool])
         result = _safe_numeric_comparison(None, 3, lambda x, y: x > y)  # False
         ```
     """
-    try:
-        a_num = float(a)
-        b_num = float(b)
-        return op(a_num, b_num)
-    except (TypeError, ValueError):
-        return False
+    # Values that are not numbers read as NaN, which every comparison rejects
+    return op(
+        a if type(a) is float else coerce_number(a),
+        b if type(b) is float else coerce_number(b),
+    )
 
 
 def _eq(a: Any, b: Any) -> bool:
@@ -121,7 +187,7 @@ def _gt(a: Any, b: Any) -> bool:
         result = _gt("a", "b")  # False (invalid numeric)
         ```
     """
-    return _safe_numeric_comparison(a, b, lambda x, y: x > y)
+    return _safe_numeric_comparison(a, b, operator.gt)
 
 
 def _lt(a: Any, b: Any) -> bool:
@@ -145,7 +211,7 @@ def _lt(a: Any, b: Any) -> bool:
         result = _lt("abc", 3)  # False (invalid numeric)
         ```
     """
-    return _safe_numeric_comparison(a, b, lambda x, y: x < y)
+    return _safe_numeric_comparison(a, b, operator.lt)
 
 
 def _gte(a: Any, b: Any) -> bool:
@@ -169,7 +235,7 @@ def _gte(a: Any, b: Any) -> bool:
         result = _gte("4.5", 3)  # True (decimal conversion)
         ```
     """
-    return _safe_numeric_comparison(a, b, lambda x, y: x >= y)
+    return _safe_numeric_comparison(a, b, operator.ge)
 
 
 def _lte(a: Any, b: Any) -> bool:
@@ -193,7 +259,7 @@ def _lte(a: Any, b: Any) -> bool:
         result = _lte("2.5", 3)  # True (decimal conversion)
         ```
     """
-    return _safe_numeric_comparison(a, b, lambda x, y: x <= y)
+    return _safe_numeric_comparison(a, b, operator.le)
 
 
 def _contains(a: Any, b: Any) -> bool:
@@ -265,6 +331,362 @@ def _in(a: Any, b: Any) -> bool:
         return False
 
 
+# Filter value types holding several values for the membership operators
+_VALUE_COLLECTIONS = (list, tuple, set, frozenset)
+
+
+def _not_in(a: Any, b: Any) -> bool:
+    """Not in operator with type checking.
+    
+    The negation of the in operator for valid containers.
+    
+    Args:
+        a: Value to look for
+        b: Container to check (must be iterable)
+        
+    Returns:
+        bool: True if a is not in b, False otherwise
+        
+    Note:
+        Returns False for non-iterable containers or null values
+        instead of raising TypeError
+        
+    Example:
+        ```python
+        result = _not_in("Sol Ring", ["Mana Crypt", "Mana Vault"])  # True
+        result = _not_in("R", ["R", "G"])  # False
+        result = _not_in("value", None)  # False (null safety)
+        ```
+    """
+    try:
+        return a not in b
+    except (TypeError, ValueError):
+        return False
+
+
+def _contains_any(a: Any, b: Any) -> bool:
+    """Contains any operator with type checking.
+    
+    Checks if a container holds at least one of several values, each
+    tested as by the contains operator.
+    
+    Args:
+        a: Container to check (must be iterable)
+        b: Values to look for, as a list, tuple or set
+        
+    Returns:
+        bool: True if any value of b is in a, False otherwise
+        
+    Example:
+        ```python
+        result = _contains_any(["Flying", "Haste"], ["Haste", "Trample"])  # True
+        result = _contains_any(["Flying"], [])  # False
+        result = _contains_any(None, ["Flying"])  # False (null safety)
+        ```
+    """
+    if not isinstance(b, _VALUE_COLLECTIONS):
+        return False
+    return any(_contains(a, value) for value in b)
+
+
+def _contains_all(a: Any, b: Any) -> bool:
+    """Contains all operator with type checking.
+    
+    Checks if a container holds every one of several values, each tested
+    as by the contains operator.
+    
+    Args:
+        a: Container to check (must be iterable)
+        b: Values to look for, as a list, tuple or set
+        
+    Returns:
+        bool: True if every value of b is in a, False otherwise
+        
+    Example:
+        ```python
+        result = _contains_all(["Flying", "Haste"], ["Haste", "Flying"])  # True
+        result = _contains_all(["Flying"], ["Flying", "Haste"])  # False
+        result = _contains_all(None, [])  # False (null safety)
+        ```
+    """
+    if not isinstance(b, _VALUE_COLLECTIONS):
+        return False
+    try:
+        iter(a)
+    except TypeError:
+        return False
+    return all(_contains(a, value) for value in b)
+
+
+def _regex(a: Any, b: Any) -> bool:
+    """Regular expression operator with type checking.
+    
+    Searches a string value for a pattern anywhere in it.
+    
+    Args:
+        a: String to search
+        b: Pattern, as a string or compiled pattern
+        
+    Returns:
+        bool: True if the pattern matches somewhere in a, False otherwise
+        
+    Note:
+        Returns False for non-string values and invalid patterns instead of
+        raising
+        
+    Example:
+        ```python
+        result = _regex("Draw a card.", r"draw (a|two) cards?")  # False (case)
+        result = _regex("Draw a card.", r"(?i)draw (a|two) cards?")  # True
+        result = _regex(None, "draw")  # False (null safety)
+        ```
+    """
+    if not isinstance(a, str):
+        return False
+    try:
+        return re.search(b, a) is not None
+    except (TypeError, re.error):
+        return False
+
+
+# A word of card text, as indexed and matched by ``text_match``
+_WORD = re.compile(r"\w+")
+
+
+def _text_of(value: Any) -> Optional[str]:
+    """Lower-case the text of a string or of the strings of a list.
+    
+    Args:
+        value: Card value
+        
+    Returns:
+        Optional[str]: The text, or None if the value holds no text
+    """
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (list, tuple)):
+        return " ".join(item for item in value if isinstance(item, str)).lower()
+    return None
+
+
+def text_tokens(value: Any) -> FrozenSet[str]:
+    """Split a card value into the words ``text_match`` matches.
+    
+    Words are runs of letters, digits and underscores, lower-cased; a list
+    value contributes the words of each of its strings.
+    
+    Args:
+        value: Card value, such as rules text, a type line or keywords
+        
+    Returns:
+        FrozenSet[str]: The words, empty for values holding no text
+        
+    Example:
+        ```python
+        text_tokens("Draw a card.")  # frozenset({"draw", "a", "card"})
+        text_tokens(["Flying", "First strike"])  # frozenset({"flying", "first", "strike"})
+        ```
+    """
+    text = _text_of(value)
+    return frozenset(_WORD.findall(text)) if text else frozenset()
+
+
+def _text_match(a: Any, b: Any) -> bool:
+    """Text match operator with type checking.
+    
+    Checks if every word of a query occurs as a word of a text value, in
+    any order and ignoring case.
+    
+    Args:
+        a: Text value, as a string or a list of strings
+        b: Query string
+        
+    Returns:
+        bool: True if a has every word of b, False otherwise
+        
+    Example:
+        ```python
+        result = _text_match("When this enters, draw a card.", "Draw a card")  # True
+        result = _text_match("Draw two cards.", "draw a card")  # False
+        result = _text_match(["Flying", "Haste"], "haste")  # True
+        ```
+    """
+    if not isinstance(b, str):
+        return False
+    words = text_tokens(b)
+    return bool(words) and words <= text_tokens(a)
+
+
+# Bits of the colors in a WUBRG bitmask
+COLOR_BITS: Dict[str, int] = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+
+# Set comparisons of a card's color bitmask with the filter's
+_COLOR_COMPARISONS: Dict[str, Callable[[int, int], bool]] = {
+    "subset": lambda card, colors: not card & ~colors,
+    "superset": lambda card, colors: card & colors == colors,
+    "exact": operator.eq,
+    "any": lambda card, colors: bool(card & colors),
+}
+
+
+def color_mask(colors: Any) -> int:
+    """Encode colors as a WUBRG bitmask.
+    
+    Args:
+        colors: Color letters, as a string such as ``"WU"`` or a list, tuple
+            or set of letters
+        
+    Returns:
+        int: Bitmask with the ``COLOR_BITS`` of every color set; 0 for
+            colorless
+        
+    Raises:
+        ValueError: If the value is not made of color letters
+        
+    Example:
+        ```python
+        color_mask(["W", "U"])  # 3
+        color_mask("G")  # 16
+        color_mask([])  # 0
+        ```
+    """
+    if not isinstance(colors, (str, list, tuple, set, frozenset)):
+        raise ValueError(f"Invalid colors: {colors!r}")
+    mask = 0
+    for letter in colors:
+        bit = COLOR_BITS.get(letter) if isinstance(letter, str) else None
+        if bit is None:
+            raise ValueError(f"Invalid color: {letter!r}")
+        mask |= bit
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _cached_color_mask(colors: Union[str, Tuple[Any, ...]]) -> int:
+    """Encode colors, memoized: cards share a few dozen color lists."""
+    return color_mask(colors)
+
+
+def card_color_mask(card_value: Any) -> Optional[int]:
+    """Encode the colors of a card as a WUBRG bitmask.
+    
+    Each distinct color list is encoded once and then looked up.
+    
+    Args:
+        card_value: Card value, normally a list of color letters
+        
+    Returns:
+        Optional[int]: The bitmask, or None if the value is not made of
+            color letters
+    """
+    if isinstance(card_value, list):
+        card_value = tuple(card_value)
+    elif not isinstance(card_value, (str, tuple)):
+        return None
+    try:
+        return _cached_color_mask(card_value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _color_comparison(a: Any, b: Any, op: str) -> bool:
+    """Safely compare the colors of a card with filter colors as bitmasks.
+    
+    Args:
+        a: Card colors
+        b: Filter colors
+        op: Color operator string
+        
+    Returns:
+        bool: Result of the comparison, or False for values not made of
+            color letters
+    """
+    card = card_color_mask(a)
+    try:
+        colors = color_mask(b)
+    except ValueError:
+        return False
+    return card is not None and _COLOR_COMPARISONS[op](card, colors)
+
+
+def _subset(a: Any, b: Any) -> bool:
+    """Subset operator on colors.
+    
+    Args:
+        a: Card colors
+        b: Filter colors
+        
+    Returns:
+        bool: True if every color of a is in b, such as a color identity
+            allowed under a commander's
+        
+    Example:
+        ```python
+        result = _subset(["W"], "WU")  # True
+        result = _subset([], "WU")  # True (colorless)
+        result = _subset(["W", "B"], "WU")  # False
+        ```
+    """
+    return _color_comparison(a, b, "subset")
+
+
+def _superset(a: Any, b: Any) -> bool:
+    """Superset operator on colors.
+    
+    Args:
+        a: Card colors
+        b: Filter colors
+        
+    Returns:
+        bool: True if a has every color of b
+        
+    Example:
+        ```python
+        result = _superset(["W", "U", "B"], "WU")  # True
+        result = _superset(["W"], "WU")  # False
+        ```
+    """
+    return _color_comparison(a, b, "superset")
+
+
+def _exact(a: Any, b: Any) -> bool:
+    """Exact operator on colors, in any order.
+    
+    Args:
+        a: Card colors
+        b: Filter colors
+        
+    Returns:
+        bool: True if a and b have the same colors
+        
+    Example:
+        ```python
+        result = _exact(["U", "W"], "WU")  # True
+        result = _exact([], [])  # True
+        ```
+    """
+    return _color_comparison(a, b, "exact")
+
+
+def _any(a: Any, b: Any) -> bool:
+    """Any operator on colors.
+    
+    Args:
+        a: Card colors
+        b: Filter colors
+        
+    Returns:
+        bool: True if a has at least one color of b
+        
+    Example:
+        ```python
+        result = _any(["R", "G"], "WG")  # True
+        result = _any([], "WUBRG")  # False
+        ```
+    """
+    return _color_comparison(a, b, "any")
+
+
 # Map of operator strings to type-safe functions
 OPERATORS = {
     "eq": _eq,
@@ -274,6 +696,15 @@ OPERATORS = {
     "lte": _lte,
     "contains": _contains,
     "in": _in,
+    "not_in": _not_in,
+    "contains_any": _contains_any,
+    "contains_all": _contains_all,
+    "regex": _regex,
+    "text_match": _text_match,
+    "subset": _subset,
+    "superset": _superset,
+    "exact": _exact,
+    "any": _any,
 }
 
 
@@ -318,3 +749,753 @@ def get_operator_function(op: str) -> Optional[Callable[[Any, Any], bool]]:
         ```
     """
     return OPERATORS.get(op)
+
+
+# Operators that compare card values numerically
+NUMERIC_OPERATORS = frozenset({"gt", "lt", "gte", "lte"})
+
+COLOR_OPERATORS = frozenset(_COLOR_COMPARISONS)
+
+MEMBERSHIP_OPERATORS = frozenset({"in", "not_in", "contains_any", "contains_all"})
+
+# Operator matching the words of card text, which a ``TokenIndex`` can answer
+TEXT_MATCH_OPERATOR = "text_match"
+
+# Float comparisons used by compiled numeric conditions
+_NUMERIC_COMPARISONS: Dict[str, Callable[[float, float], bool]] = {
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+}
+
+# A compiled test on one card value
+ValueTest = Callable[[Any], bool]
+
+# Card field holding the code of the set a card belongs to
+SET_CODE_FIELD = "setCode"
+
+
+def _compile_numeric(op: str, filter_value: Any) -> ValueTest:
+    """Compile a numeric condition with its constant converted once.
+    
+    Card values are read by ``coerce_number``, inlined for floats and for
+    strings already read, so a comparison is a float compare. Values such
+    as ``"*"`` read as ``NOT_A_NUMBER`` and, as a NaN, fail every comparison.
+    
+    Args:
+        op: Numeric operator string
+        filter_value: Value to compare against
+        
+    Returns:
+        ValueTest: Test returning False for non-numeric card values, as the
+            operator functions do
+        
+    Raises:
+        ValueError: If the filter value is not numeric
+    """
+    bound = coerce_number(filter_value)
+    if bound is NOT_A_NUMBER:
+        raise ValueError(f"Invalid value type for numeric operator {op}: {filter_value!r}")
+    compare = _NUMERIC_COMPARISONS[op]
+    numbers = _NUMBER_CACHE
+
+    def test(card_value: Any) -> bool:
+        kind = type(card_value)
+        if kind is float:
+            return compare(card_value, bound)
+        number = numbers.get(card_value) if kind is str else None
+        if number is None:
+            number = coerce_number(card_value)
+        return compare(number, bound)
+
+    return test
+
+
+def _compile_color(op: str, filter_value: Any) -> ValueTest:
+    """Compile a color condition with its colors encoded once.
+    
+    Args:
+        op: Color operator string
+        filter_value: Filter colors
+        
+    Returns:
+        ValueTest: Test comparing the card's color bitmask with integer bit
+            operations; values not made of color letters do not match
+        
+    Raises:
+        ValueError: If the filter value is not made of color letters
+    """
+    try:
+        colors = color_mask(filter_value)
+    except ValueError:
+        raise ValueError(f"Invalid value for color operator {op}: {filter_value!r}")
+    compare = _COLOR_COMPARISONS[op]
+    mask_of = card_color_mask
+
+    def test(card_value: Any) -> bool:
+        card = mask_of(card_value)
+        return card is not None and compare(card, colors)
+
+    return test
+
+
+def _compile_membership(op: str, filter_value: Any) -> Optional[ValueTest]:
+    """Compile a membership condition against a frozenset built once.
+    
+    Each card then costs one hash lookup for ``in`` and ``not_in``, and one
+    set operation over the card's list for ``contains_any`` and
+    ``contains_all``, whatever the number of filter values. Unhashable card
+    values, which a set cannot hold, fall back to the operator function.
+    
+    Args:
+        op: Membership operator string
+        filter_value: Values to compare against
+        
+    Returns:
+        Optional[ValueTest]: The test, or None if the filter values cannot
+            be held in a set, such as a string for ``in`` or unhashable values
+        
+    Raises:
+        ValueError: If a multi-value operator is not given a list of values
+    """
+    if not isinstance(filter_value, _VALUE_COLLECTIONS):
+        if op in ("contains_any", "contains_all"):
+            raise ValueError(f"Operator {op} requires a list of values, got {filter_value!r}")
+        return None
+    try:
+        values = frozenset(filter_value)
+    except TypeError:
+        return None
+    fallback = OPERATORS[op]
+
+    if op == "in":
+        def test(card_value: Any) -> bool:
+            try:
+                return card_value in values
+            except TypeError:
+                return fallback(card_value, filter_value)
+    elif op == "not_in":
+        def test(card_value: Any) -> bool:
+            try:
+                return card_value not in values
+            except TypeError:
+                return fallback(card_value, filter_value)
+    elif op == "contains_any":
+        def test(card_value: Any) -> bool:
+            if isinstance(card_value, (list, tuple)):
+                try:
+                    return not values.isdisjoint(card_value)
+                except TypeError:
+                    pass
+            return fallback(card_value, filter_value)
+    else:
+        def test(card_value: Any) -> bool:
+            if isinstance(card_value, (list, tuple)):
+                try:
+                    return values.issubset(card_value)
+                except TypeError:
+                    pass
+            return fallback(card_value, filter_value)
+
+    return test
+
+
+def _compile_regex(filter_value: Any) -> ValueTest:
+    """Compile a regex condition with its pattern compiled once.
+    
+    Args:
+        filter_value: Pattern string
+        
+    Returns:
+        ValueTest: Test searching string card values for the pattern
+        
+    Raises:
+        ValueError: If the pattern is not a string or does not compile
+    """
+    if not isinstance(filter_value, str):
+        raise ValueError(f"Invalid value for operator regex: {filter_value!r}")
+    try:
+        search = re.compile(filter_value).search
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern {filter_value!r}: {e}")
+
+    def test(card_value: Any) -> bool:
+        return isinstance(card_value, str) and search(card_value) is not None
+
+    return test
+
+
+def _compile_text_match(filter_value: Any) -> ValueTest:
+    """Compile a text match condition with its query split into words once.
+    
+    Each word is first looked for as a substring of the card text, which
+    rejects most cards without splitting their text into words.
+    
+    Args:
+        filter_value: Query string
+        
+    Returns:
+        ValueTest: Test matching the words of the card value
+        
+    Raises:
+        ValueError: If the query is not a string or has no words
+    """
+    if not isinstance(filter_value, str) or not text_tokens(filter_value):
+        raise ValueError(f"Operator {TEXT_MATCH_OPERATOR} requires a query with words, got {filter_value!r}")
+    words = text_tokens(filter_value)
+    ordered = tuple(sorted(words, key=len, reverse=True))
+    find_words = _WORD.findall
+
+    def test(card_value: Any) -> bool:
+        text = card_value.lower() if isinstance(card_value, str) else _text_of(card_value)
+        if not text:
+            return False
+        for word in ordered:
+            if word not in text:
+                return False
+        return words.issubset(find_words(text))
+
+    return test
+
+
+def _compile_condition(op: str, filter_value: Any) -> ValueTest:
+    """Compile a single operator condition.
+    
+    Args:
+        op: Operator string
+        filter_value: Value to compare against
+        
+    Returns:
+        ValueTest: Test applied to the card value
+        
+    Raises:
+        ValueError: If the operator is unknown or the value is invalid
+    """
+    operator_func = get_operator_function(op)
+    if operator_func is None:
+        raise ValueError(f"Invalid operator: {op}")
+    if op in NUMERIC_OPERATORS:
+        return _compile_numeric(op, filter_value)
+    if op in COLOR_OPERATORS:
+        return _compile_color(op, filter_value)
+    if op == "regex":
+        return _compile_regex(filter_value)
+    if op == TEXT_MATCH_OPERATOR:
+        return _compile_text_match(filter_value)
+    if op in MEMBERSHIP_OPERATORS:
+        test = _compile_membership(op, filter_value)
+        if test is not None:
+            return test
+
+    def generic_test(card_value: Any) -> bool:
+        return operator_func(card_value, filter_value)
+
+    return generic_test
+
+
+# Keys combining filters: a list of filters for ``$and`` and ``$or``, a single
+# filter for ``$not``
+AND_KEY, OR_KEY, NOT_KEY = "$and", "$or", "$not"
+
+# Estimated relative cost of evaluating each operator on one card value
+_OPERATOR_COSTS: Dict[str, float] = {
+    "eq": 1.0, "in": 1.0, "not_in": 1.0, "contains": 1.5,
+    "gt": 2.0, "lt": 2.0, "gte": 2.0, "lte": 2.0,
+    "subset": 2.0, "superset": 2.0, "exact": 2.0, "any": 2.0,
+    "contains_any": 3.0, "contains_all": 3.0,
+    "regex": 10.0, "text_match": 10.0,
+}
+
+_DEFAULT_COST = 1.5
+
+# Estimated share of cards passing each operator, until measured
+_OPERATOR_SELECTIVITY: Dict[str, float] = {
+    "eq": 0.1, "in": 0.2, "not_in": 0.8, "contains": 0.3, "exact": 0.1,
+    "regex": 0.1, "text_match": 0.1,
+}
+_DEFAULT_SELECTIVITY = 0.5
+
+# Cost and selectivity of a condition requiring only that a field is present
+_PRESENCE_COST = 0.5
+_PRESENCE_SELECTIVITY = 0.9
+
+# Cards whose outcomes are sampled before a plan reorders its conditions
+SELECTIVITY_SAMPLE_SIZE = 1000
+
+# Marker for fields a card lacks
+_ABSENT = object()
+
+
+class FilterNode(ABC):
+    """A node of a compiled filter expression.
+    
+    Attributes:
+        cost (float): Expected cost of evaluating the node on one card
+        selectivity (float): Expected share of cards the node matches
+    """
+
+    cost: float = 1.0
+    selectivity: float = _DEFAULT_SELECTIVITY
+
+    @abstractmethod
+    def conditions(self) -> Iterator["Condition"]:
+        """Iterate over the conditions below the node."""
+
+    def optimize(self) -> None:
+        """Reorder the clauses below the node and update its estimates."""
+
+    @abstractmethod
+    def compile(self) -> Callable[[dict], bool]:
+        """Build the predicate of the node over a card."""
+
+    def set_codes(self) -> Optional[FrozenSet[str]]:
+        """Set codes a matching card can have, or None if unrestricted."""
+        return None
+
+
+class Condition(FilterNode):
+    """One operator condition on one field.
+    
+    A card lacking the field never matches. The share of cards matching is
+    estimated per operator until cards are observed.
+    
+    Attributes:
+        field (str): Card field
+        op (Optional[str]): Operator, or None for a condition only requiring
+            the field to be present
+        value (Any): Filter value
+        test (ValueTest): Compiled test of the card value
+        observed (int): Number of cards observed
+        passed (int): Number of observed cards that matched
+    """
+
+    def __init__(self, field: str, op: Optional[str], value: Any = None):
+        """Compile a condition.
+        
+        Args:
+            field: Card field
+            op: Operator string, or None for a presence condition
+            value: Filter value
+            
+        Raises:
+            ValueError: If the operator is unknown or the value is invalid
+        """
+        self.field = field
+        self.op = op
+        self.value = value
+        if op is None:
+            self.test: ValueTest = lambda card_value: True
+            self.cost = _PRESENCE_COST
+            self._estimate = _PRESENCE_SELECTIVITY
+        else:
+            self.test = _compile_condition(op, value)
+            self.cost = _OPERATOR_COSTS.get(op, _DEFAULT_COST)
+            self._estimate = _OPERATOR_SELECTIVITY.get(op, _DEFAULT_SELECTIVITY)
+        self.selectivity = self._estimate
+        self.observed = 0
+        self.passed = 0
+
+    def conditions(self) -> Iterator["Condition"]:
+        yield self
+
+    def observe(self, card: dict) -> None:
+        """Record whether a card matches the condition.
+        
+        Args:
+            card: Card data
+        """
+        value = card.get(self.field, _ABSENT)
+        matched = value is not _ABSENT and self.test(value)
+        self.observed += 1
+        self.passed += bool(matched)
+
+    def optimize(self) -> None:
+        if self.observed:
+            # Smoothed, so that no sampled condition is taken to be certain
+            self.selectivity = (self.passed + 1) / (self.observed + 2)
+
+    def compile(self) -> Callable[[dict], bool]:
+        field, test = self.field, self.test
+
+        def match_condition(card: dict) -> bool:
+            return field in card and test(card[field])
+
+        return match_condition
+
+    def set_codes(self) -> Optional[FrozenSet[str]]:
+        if self.field != SET_CODE_FIELD:
+            return None
+        if self.op == "eq" and isinstance(self.value, str):
+            return frozenset((self.value,))
+        if self.op == "in" and isinstance(self.value, _VALUE_COLLECTIONS):
+            return frozenset(code for code in self.value if isinstance(code, str))
+        return None
+
+    def __repr__(self) -> str:
+        return f"Condition({self.field!r}, {self.op!r}, {self.value!r})"
+
+
+class AllOf(FilterNode):
+    """Clauses that must all match, cheapest and most selective first.
+    
+    Attributes:
+        clauses (List[FilterNode]): The clauses, in evaluation order
+    """
+
+    def __init__(self, clauses: Iterable[FilterNode]):
+        """Combine clauses, merging nested ``AllOf`` clauses into this one.
+        
+        Args:
+            clauses: Clauses to combine
+        """
+        self.clauses: List[FilterNode] = []
+        for clause in clauses:
+            self.clauses.extend(clause.clauses if isinstance(clause, AllOf) else (clause,))
+
+    def conditions(self) -> Iterator[Condition]:
+        for clause in self.clauses:
+            yield from clause.conditions()
+
+    def optimize(self) -> None:
+        for clause in self.clauses:
+            clause.optimize()
+        # Rejecting a card early saves the later clauses: rank each clause by
+        # its cost per card it rejects. The clauses are sorted into a new list,
+        # so a thread reading them never sees one being sorted
+        self.clauses = sorted(self.clauses, key=lambda clause: clause.cost / max(1.0 - clause.selectivity, 1e-9))
+        self.cost, self.selectivity = 0.0, 1.0
+        for clause in self.clauses:
+            self.cost += self.selectivity * clause.cost
+            self.selectivity *= clause.selectivity
+
+    def compile(self) -> Callable[[dict], bool]:
+        if not self.clauses:
+            return lambda card: True
+        if len(self.clauses) == 1:
+            return self.clauses[0].compile()
+
+        if all(isinstance(clause, Condition) for clause in self.clauses):
+            steps = tuple((clause.field, clause.test) for clause in self.clauses)
+
+            def match_conditions(card: dict) -> bool:
+                for field, test in steps:
+                    value = card.get(field, _ABSENT)
+                    if value is _ABSENT or not test(value):
+                        return False
+                return True
+
+            return match_conditions
+
+        predicates = tuple(clause.compile() for clause in self.clauses)
+
+        def match_all(card: dict) -> bool:
+            for predicate in predicates:
+                if not predicate(card):
+                    return False
+            return True
+
+        return match_all
+
+    def set_codes(self) -> Optional[FrozenSet[str]]:
+        allowed: Optional[FrozenSet[str]] = None
+        for clause in self.clauses:
+            codes = clause.set_codes()
+            if codes is not None:
+                allowed = codes if allowed is None else allowed & codes
+        return allowed
+
+    def __repr__(self) -> str:
+        return f"AllOf({self.clauses!r})"
+
+
+class AnyOf(FilterNode):
+    """Clauses of which one must match, cheapest and least selective first.
+    
+    Attributes:
+        clauses (List[FilterNode]): The clauses, in evaluation order
+    """
+
+    def __init__(self, clauses: Iterable[FilterNode]):
+        """Combine clauses, merging nested ``AnyOf`` clauses into this one.
+        
+        Args:
+            clauses: Clauses to combine
+        """
+        self.clauses: List[FilterNode] = []
+        for clause in clauses:
+            self.clauses.extend(clause.clauses if isinstance(clause, AnyOf) else (clause,))
+
+    def conditions(self) -> Iterator[Condition]:
+        for clause in self.clauses:
+            yield from clause.conditions()
+
+    def optimize(self) -> None:
+        for clause in self.clauses:
+            clause.optimize()
+        # Accepting a card early saves the later clauses: rank each clause by
+        # its cost per card it accepts
+        self.clauses = sorted(self.clauses, key=lambda clause: clause.cost / max(clause.selectivity, 1e-9))
+        self.cost, rejected = 0.0, 1.0
+        for clause in self.clauses:
+            self.cost += rejected * clause.cost
+            rejected *= 1.0 - clause.selectivity
+        self.selectivity = 1.0 - rejected
+
+    def compile(self) -> Callable[[dict], bool]:
+        if len(self.clauses) == 1:
+            return self.clauses[0].compile()
+        predicates = tuple(clause.compile() for clause in self.clauses)
+
+        def match_any(card: dict) -> bool:
+            for predicate in predicates:
+                if predicate(card):
+                    return True
+            return False
+
+        return match_any
+
+    def set_codes(self) -> Optional[FrozenSet[str]]:
+        allowed: FrozenSet[str] = frozenset()
+        for clause in self.clauses:
+            codes = clause.set_codes()
+            if codes is None:
+                return None
+            allowed |= codes
+        return allowed
+
+    def __repr__(self) -> str:
+        return f"AnyOf({self.clauses!r})"
+
+
+class Not(FilterNode):
+    """A clause that must not match.
+    
+    Cards lacking the clause's fields do not match the clause, and so match
+    its negation.
+    
+    Attributes:
+        clause (FilterNode): The negated clause
+    """
+
+    def __init__(self, clause: FilterNode):
+        """Negate a clause.
+        
+        Args:
+            clause: Clause to negate
+        """
+        self.clause = clause
+
+    def conditions(self) -> Iterator[Condition]:
+        return self.clause.conditions()
+
+    def optimize(self) -> None:
+        self.clause.optimize()
+        self.cost = self.clause.cost
+        self.selectivity = 1.0 - self.clause.selectivity
+
+    def compile(self) -> Callable[[dict], bool]:
+        predicate = self.clause.compile()
+
+        def match_not(card: dict) -> bool:
+            return not predicate(card)
+
+        return match_not
+
+    def __repr__(self) -> str:
+        return f"Not({self.clause!r})"
+
+
+def parse_filter(filters: Dict[str, Any]) -> FilterNode:
+    """Parse filter conditions into an expression tree.
+    
+    A filter maps fields to ``{operator: value}`` conditions, all of which
+    must hold. It may also hold ``$and`` and ``$or``, each a list of
+    filters, and ``$not``, a filter, combined with the rest as one more
+    condition.
+    
+    Args:
+        filters: Filter conditions
+        
+    Returns:
+        FilterNode: The expression, with clauses in filter order
+        
+    Raises:
+        ValueError: If the filter is malformed or a condition is invalid
+        
+    Example:
+        ```python
+        parse_filter({
+            "$or": [{"colors": {"contains": "W"}}, {"colorIdentity": {"eq": []}}],
+            "$not": {"type": {"contains": "Land"}},
+        })
+        ```
+    """
+    if not isinstance(filters, dict):
+        raise ValueError(f"Invalid filter: expected a mapping, got {filters!r}")
+
+    clauses: List[FilterNode] = []
+    for key, value in filters.items():
+        if key in (AND_KEY, OR_KEY):
+            if not isinstance(value, (list, tuple)) or not value:
+                raise ValueError(f"{key} requires a non-empty list of filters")
+            combine = AllOf if key == AND_KEY else AnyOf
+            clauses.append(combine(parse_filter(clause) for clause in value))
+        elif key == NOT_KEY:
+            clause = parse_filter(value)
+            clauses.append(clause.clause if isinstance(clause, Not) else Not(clause))
+        elif isinstance(key, str) and key.startswith("$"):
+            raise ValueError(f"Invalid boolean operator: {key}")
+        elif not isinstance(value, dict):
+            raise ValueError(f"Invalid conditions for field {key}: expected a mapping of operators")
+        elif not value:
+            clauses.append(Condition(key, None))
+        else:
+            clauses.extend(Condition(key, op, filter_value) for op, filter_value in value.items())
+    return clauses[0] if len(clauses) == 1 else AllOf(clauses)
+
+
+class FilterPlan:
+    """Filter conditions compiled into a single card predicate.
+    
+    Operators are resolved, validated and their constants converted once,
+    when the plan is built. Calling the plan then only evaluates the
+    conditions: a card matches when it has every filtered field and every
+    condition on it holds, with ``$and``, ``$or`` and ``$not`` combining
+    conditions as in ``parse_filter``.
+    
+    Clauses are evaluated in order of estimated cost per card decided:
+    under ``$and``, cheap conditions rejecting many cards come first, and
+    under ``$or``, cheap conditions accepting many cards. Selectivity is
+    first estimated per operator, then measured on the first cards the
+    plan evaluates, after which the plan reorders its clauses once. No
+    condition raises for a card value, so the order never changes which
+    cards match.
+    
+    Attributes:
+        conditions (Dict[str, Any]): Copy of the filter conditions the plan was built from
+        root (FilterNode): The compiled expression
+        fields (Tuple[str, ...]): Filtered field names, in filter order
+        matches (Callable[[dict], bool]): The compiled predicate
+        set_codes (Optional[FrozenSet[str]]): Set codes a matching card can
+            have, or None if the filter does not restrict ``setCode``
+        
+    Example:
+        ```python
+        plan = FilterPlan({"type": {"eq": "Instant"}, "convertedManaCost": {"lte": 2}})
+        matching = [card for card in cards if plan(card)]
+        ```
+    """
+
+    def __init__(self, conditions: Dict[str, Any], sample_size: int = SELECTIVITY_SAMPLE_SIZE):
+        """Compile filter conditions.
+        
+        Args:
+            conditions: Filter conditions as ``{field: {operator: value}}``,
+                with ``$and``, ``$or`` and ``$not`` combining filters
+            sample_size: Cards sampled before reordering clauses by their
+                measured selectivity; 0 keeps the estimated order
+            
+        Raises:
+            ValueError: If an operator is unknown, a numeric constant is not
+                numeric, or a field's conditions are not a mapping
+        """
+        self.root = parse_filter(conditions) if conditions else AllOf(())
+        self.conditions = copy.deepcopy(conditions)
+        self.fields = tuple(dict.fromkeys(condition.field for condition in self.root.conditions()))
+        self.set_codes = self.root.set_codes()
+        self.sample_size = sample_size
+
+        self.root.optimize()
+        self._predicate = self.root.compile()
+        self._observed = tuple(self.root.conditions()) if sample_size > 0 else ()
+        self._sampled = 0
+        self._sample_lock = threading.Lock()
+        self.matches: Callable[[dict], bool] = self._sample if len(self._observed) > 1 else self._predicate
+
+    def _sample(self, card: dict) -> bool:
+        """Evaluate a card while measuring the selectivity of every condition.
+        
+        Threads sharing the plan sample under a lock, so that the counts
+        stay exact and only one of them reorders the clauses.
+        
+        Args:
+            card: Card data to evaluate
+            
+        Returns:
+            bool: True if the card matches
+        """
+        with self._sample_lock:
+            if self._sampled < self.sample_size:
+                for condition in self._observed:
+                    condition.observe(card)
+                self._sampled += 1
+                if self._sampled >= self.sample_size:
+                    self.root.optimize()
+                    self._predicate = self.root.compile()
+                    self.matches = self._predicate
+            predicate = self._predicate
+        return predicate(card)
+
+    def may_match_set(self, set_code: str) -> bool:
+        """Check whether any card of a set could match the plan.
+        
+        Relies on every card's ``setCode`` being the code of the set it is
+        listed under, as in MTGJSON dumps, so that whole sets can be skipped
+        before their cards are read.
+        
+        Args:
+            set_code: Code of the set
+            
+        Returns:
+            bool: False if no card of the set can match
+        """
+        return self.set_codes is None or set_code in self.set_codes
+
+    def __call__(self, card: dict) -> bool:
+        """Check whether a card matches every condition.
+        
+        Args:
+            card: Card data to evaluate
+            
+        Returns:
+            bool: True if the card matches
+        """
+        return self.matches(card)
+
+    def __reduce__(self):
+        """Pickle the plan by its conditions, recompiling on load."""
+        return FilterPlan, (self.conditions, self.sample_size)
+
+
+def compile_filters(
+    filters: Union[Dict[str, Any], FilterPlan, None],
+    sample_size: int = SELECTIVITY_SAMPLE_SIZE
+) -> FilterPlan:
+    """Compile filter conditions into a reusable predicate.
+    
+    Args:
+        filters: Filter conditions as ``{field: {operator: value}}``, with
+            ``$and``, ``$or`` and ``$not`` combining filters, or None to
+            match every card
+        sample_size: Cards sampled before reordering clauses by their
+            measured selectivity; 0 keeps the estimated order
+            
+    Returns:
+        FilterPlan: The compiled plan; a plan is returned as is
+        
+    Raises:
+        ValueError: If the conditions are invalid
+        
+    Example:
+        ```python
+        plan = compile_filters({"colors": {"contains": "W"}})
+        plan({"colors": ["W", "U"]})  # True
+        plan({"name": "Shivan Dragon"})  # False (field missing)
+        
+        plan = compile_filters({"$or": [{"rarity": {"eq": "mythic"}}, {"$not": {"type": {"eq": "Land"}}}]})
+        ```
+    """
+    if isinstance(filters, FilterPlan):
+        return filters
+    return FilterPlan(filters or {}, sample_size)
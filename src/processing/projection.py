@@ -0,0 +1,356 @@
+"""Schema projection compiled once per run.
+
+This module turns a schema, a list of field paths, into a projector building
+the output card straight from the raw card. Paths may be dotted to select
+nested values, such as ``legalities.commander``, so that only the selected
+leaves of a subtree are carried into the output rather than the whole
+subtree.
+
+Features:
+- Paths parsed, validated and merged into a tree once, not per card
+- One output dict per card, with nested dicts only for selected subtrees
+- Defaults given only to missing top-level fields
+- ``foreignData`` filtered by language against a set normalized once per run
+- Projectors are picklable, recompiled from their paths on load
+
+Example:
+    ```python
+    projector = compile_schema(["name", "legalities.commander", "identifiers.scryfallId"])
+    projector(card)
+    # {"name": "Sol Ring", "legalities": {"commander": "Legal"},
+    #  "identifiers": {"scryfallId": "..."}}
+    ```
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+# Values given to missing card fields; list defaults are copied per card
+CARD_DEFAULTS: Dict[str, Any] = {
+    # Required fields with validation
+    "name": None,
+    "type": None,
+    # Optional fields with type-safe defaults
+    "colors": [],
+    "colorIdentity": [],
+    "convertedManaCost": 0,
+    "text": "",
+    "edhrecSaltiness": 0.0,
+    "language": "English",
+    "foreignData": [],
+    "availability": [],
+}
+
+# Field holding translations, filtered by language rather than projected
+FOREIGN_DATA_FIELD = "foreignData"
+
+# Field dropped from cards projected without a schema
+LANGUAGE_FIELD = "language"
+
+# Separator of the parts of a nested field path
+PATH_SEPARATOR = "."
+
+# Selected fields below a field; None selects the whole value
+PathTree = Dict[str, Optional["PathTree"]]
+
+# Kinds of top-level projection steps
+_FIELD, _NESTED, _FOREIGN = range(3)
+
+# Marker for fields without a default
+_NO_DEFAULT = object()
+
+
+def normalize_languages(additional_languages: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Normalize requested languages into a set for constant-time lookups.
+
+    Done once per run, so that each translation of each card is matched with
+    a hash lookup rather than a scan of the requested languages.
+
+    Args:
+        additional_languages: Language names, in any iterable
+
+    Returns:
+        Optional[FrozenSet[str]]: The languages, or None if none are requested
+    """
+    if not additional_languages:
+        return None
+    if isinstance(additional_languages, frozenset):
+        return additional_languages
+    return frozenset(additional_languages)
+
+
+def select_foreign_data(card_data: dict, additional_languages: Optional[Iterable[str]]) -> List[dict]:
+    """Select the translations of a card in the requested languages.
+
+    Args:
+        card_data: Raw card data
+        additional_languages: Language names to keep, ideally normalized by
+            ``normalize_languages``
+
+    Returns:
+        List[dict]: Matching ``foreignData`` entries, in card order
+    """
+    if not additional_languages:
+        return []
+    return [
+        entry
+        for entry in card_data.get(FOREIGN_DATA_FIELD, [])
+        if entry.get("language") in additional_languages
+    ]
+
+
+def parse_schema(schema: Iterable[str]) -> PathTree:
+    """Merge field paths into a tree of selected fields.
+
+    Top-level fields keep the order in which they first appear. A field
+    selected whole absorbs any paths below it.
+
+    Args:
+        schema: Field names or dotted paths
+
+    Returns:
+        PathTree: The selected fields
+
+    Raises:
+        ValueError: If a path is not a string, has an empty part, or reaches
+            into ``foreignData``
+    """
+    tree: PathTree = {}
+    for path in schema:
+        if not isinstance(path, str):
+            raise ValueError(f"Invalid schema field: {path!r}")
+        parts = path.split(PATH_SEPARATOR)
+        if not all(parts):
+            raise ValueError(f"Invalid schema field: {path!r}")
+        if parts[0] == FOREIGN_DATA_FIELD and len(parts) > 1:
+            raise ValueError(f"{FOREIGN_DATA_FIELD} can only be selected as a whole, got {path!r}")
+
+        level = tree
+        for part in parts[:-1]:
+            child = level.setdefault(part, {})
+            if child is None:
+                break  # An enclosing field is selected whole
+            level = child
+        else:
+            level[parts[-1]] = None
+    return tree
+
+
+def _project_nested(value: dict, tree: PathTree) -> dict:
+    """Copy the selected fields of a nested value.
+
+    Args:
+        value: Nested mapping from the card
+        tree: Fields selected in it
+
+    Returns:
+        dict: The selected fields present in the value; fields whose own
+            selection is empty are left out
+    """
+    result = {}
+    for key, subtree in tree.items():
+        if key in value:
+            item = value[key]
+            if subtree is None:
+                result[key] = item
+            elif isinstance(item, dict):
+                nested = _project_nested(item, subtree)
+                if nested:
+                    result[key] = nested
+    return result
+
+
+class SchemaProjector:
+    """A schema compiled into a function building output cards.
+
+    Projecting a card equals copying it, giving missing fields their
+    defaults, replacing ``foreignData`` with the translations in the
+    requested languages and keeping only the schema's fields, in that order,
+    but builds no dict besides the output. Without a schema every field is
+    kept except ``language``, and ``foreignData`` only with languages.
+    Within a schema, a missing ``foreignData`` is added last, and empty,
+    when no languages are requested.
+
+    A dotted path selects a nested value: the output holds the dicts leading
+    to it, with only the selected fields. Paths through missing fields or
+    non-dict values select nothing, and defaults apply to top-level fields
+    only.
+
+    Card processors receive the projector itself in place of the schema
+    and project cards by calling it; its paths are in ``schema``.
+
+    Attributes:
+        schema (Optional[Tuple[str, ...]]): The paths, or None for every field
+        tree (Optional[PathTree]): The paths merged into a tree
+        project (Callable[[dict, Optional[Iterable[str]]], dict]): The
+            compiled projection
+
+    Example:
+        ```python
+        projector = SchemaProjector(["name", "legalities.commander", "foreignData"])
+        projector({"name": "Opt", "legalities": {"commander": "Legal", "modern": "Legal"}},
+                  ["German"])
+        # {"name": "Opt", "legalities": {"commander": "Legal"}, "foreignData": []}
+        ```
+    """
+
+    def __init__(self, schema: Optional[Iterable[str]], defaults: Optional[Dict[str, Any]] = None):
+        """Compile a schema.
+
+        Args:
+            schema: Field names or dotted paths, or None for every field
+            defaults: Values of missing top-level fields; ``CARD_DEFAULTS``
+                by default
+
+        Raises:
+            ValueError: If a path is invalid
+        """
+        self.defaults = CARD_DEFAULTS if defaults is None else defaults
+        if schema is None:
+            self.schema = None
+            self.tree = None
+            self.project = self._build_full(self.defaults)
+        else:
+            self.schema = tuple(schema)
+            self.tree = parse_schema(self.schema)
+            self.project = self._build(self.tree, self.defaults)
+
+    @staticmethod
+    def _build_full(defaults: Dict[str, Any]) -> Callable[[dict, Optional[Iterable[str]]], dict]:
+        """Build the projection keeping every field.
+
+        Args:
+            defaults: Values of missing fields
+
+        Returns:
+            Callable[[dict, Optional[Iterable[str]]], dict]: The projection
+        """
+        default_items = tuple(defaults.items())
+
+        def project_full(card: dict, additional_languages: Optional[Iterable[str]] = None) -> dict:
+            result = card.copy()
+            for field, default in default_items:
+                if field not in result:
+                    result[field] = default.copy() if isinstance(default, list) else default
+            result.pop(LANGUAGE_FIELD, None)
+            if additional_languages:
+                result[FOREIGN_DATA_FIELD] = select_foreign_data(card, additional_languages)
+            else:
+                result.pop(FOREIGN_DATA_FIELD, None)
+            return result
+
+        return project_full
+
+    @staticmethod
+    def _build(tree: PathTree, defaults: Dict[str, Any]) -> Callable[[dict, Optional[Iterable[str]]], dict]:
+        """Build the projection of a schema.
+
+        Args:
+            tree: Selected fields
+            defaults: Values of missing top-level fields
+
+        Returns:
+            Callable[[dict, Optional[Iterable[str]]], dict]: The projection
+        """
+        steps = []
+        for field, subtree in tree.items():
+            if field == FOREIGN_DATA_FIELD:
+                steps.append((_FOREIGN, field, None, _NO_DEFAULT))
+            elif subtree is None:
+                steps.append((_FIELD, field, None, defaults.get(field, _NO_DEFAULT)))
+            else:
+                steps.append((_NESTED, field, subtree, _NO_DEFAULT))
+        has_foreign_data = FOREIGN_DATA_FIELD in tree
+
+        if all(kind == _FIELD and default is _NO_DEFAULT for kind, _, _, default in steps):
+            fields = tuple(tree)
+
+            def project_fields(card: dict, additional_languages: Optional[Iterable[str]] = None) -> dict:
+                return {field: card[field] for field in fields if field in card}
+
+            return project_fields
+
+        compiled = tuple(steps)
+
+        def project(card: dict, additional_languages: Optional[Iterable[str]] = None) -> dict:
+            result = {}
+            for kind, field, subtree, default in compiled:
+                if kind == _FIELD:
+                    if field in card:
+                        result[field] = card[field]
+                    elif default is not _NO_DEFAULT:
+                        result[field] = default.copy() if isinstance(default, list) else default
+                elif kind == _NESTED:
+                    value = card.get(field)
+                    if isinstance(value, dict):
+                        nested = _project_nested(value, subtree)
+                        if nested:
+                            result[field] = nested
+                elif additional_languages:
+                    result[field] = select_foreign_data(card, additional_languages)
+            if has_foreign_data and not additional_languages:
+                # Dropped with the language data, then added back last and empty
+                result[FOREIGN_DATA_FIELD] = []
+            return result
+
+        return project
+
+    def __call__(self, card: dict, additional_languages: Optional[Iterable[str]] = None) -> dict:
+        """Project a card.
+
+        Args:
+            card: Raw card data, left unmodified
+            additional_languages: Languages of the translations to keep
+
+        Returns:
+            dict: The output card, sharing its values with the raw card
+        """
+        return self.project(card, additional_languages)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by paths and defaults with another projector."""
+        if isinstance(other, SchemaProjector):
+            return self.schema == other.schema and self.defaults == other.defaults
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by paths."""
+        return hash(self.schema)
+
+    def __repr__(self) -> str:
+        """Show the compiled schema."""
+        return f"SchemaProjector({list(self.schema) if self.schema is not None else None!r})"
+
+    def __reduce__(self):
+        """Pickle the projector by its schema, recompiling on load."""
+        return SchemaProjector, (
+            list(self.schema) if self.schema is not None else None,
+            None if self.defaults is CARD_DEFAULTS else self.defaults,
+        )
+
+
+def compile_schema(
+    schema: Optional[Iterable[str]],
+    defaults: Optional[Dict[str, Any]] = None
+) -> SchemaProjector:
+    """Compile a schema into a reusable projector.
+
+    Args:
+        schema: Field names or dotted paths, or None for every field
+        defaults: Values of missing top-level fields; ``CARD_DEFAULTS`` by default
+
+    Returns:
+        SchemaProjector: The compiled projector; a projector is returned as is
+
+    Raises:
+        ValueError: If a path is invalid
+
+    Example:
+        ```python
+        projector = compile_schema(["name", "purchaseUrls.tcgplayer"])
+        for card in cards:
+            writer.write_processed_card(projector(card))
+        ```
+    """
+    if isinstance(schema, SchemaProjector) and defaults is None:
+        return schema
+    return SchemaProjector(schema, defaults)
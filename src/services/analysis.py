@@ -43,7 +43,9 @@ Example:
     ```
 """
 
-from typing import Optional, List, Dict, Any, cast, BinaryIO
+import sys
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, cast, BinaryIO, ContextManager, IO
 
 from ..utils.container import Container
 from ..utils.interfaces import LoggingInterface, CardProcessorInterface, FileHandlerInterface
@@ -51,6 +53,9 @@ from ..core.errors import CardFilterError
 from .file_stream import FileProcessor
 from .filter_parser import CardParser
 
+# Input path that selects standard input instead of a file
+STDIN_PATH = "-"
+
 
 class CardFilterServiceError(CardFilterError):
     """Base exception for card filter service errors with context.
@@ -134,6 +139,20 @@ class CardFilterService:
         """
         return self.parser.parse_filter_string(filter_str)
 
+    def _open_input(self, input_file: str) -> ContextManager[IO[Any]]:
+        """Open the input stream, using standard input for ``-``.
+        
+        Args:
+            input_file: Input path, or ``-`` for standard input
+            
+        Returns:
+            ContextManager[IO[Any]]: Context manager yielding a binary stream
+        """
+        if input_file == STDIN_PATH:
+            # Standard input is owned by the interpreter, so it is not closed here
+            return nullcontext(sys.stdin.buffer)
+        return self.file_service.open_file(input_file, mode='rb')
+
     def process_cards(
         self,
         input_file: str,
@@ -142,6 +161,9 @@ class CardFilterService:
         dump_schema: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         additional_languages: Optional[List[str]] = None,
+        show_progress: bool = True,
+        workers: int = 1,
+        prune_translations: bool = False,
     ) -> None:
         """Process and filter cards with comprehensive validation.
         
@@ -153,12 +175,17 @@ class CardFilterService:
         4. Manages schema validation and output
         
         Args:
-            input_file: Validated input JSON path
+            input_file: Validated input JSON path, or ``-`` for standard input.
+                Gzip, bzip2 and xz compressed inputs are decompressed transparently.
             output_file: Validated output path
             schema: Optional validated field list
             dump_schema: Optional schema output path
             filters: Optional type-checked filters
             additional_languages: Optional validated language codes
+            show_progress: Whether to display progress on a terminal
+            workers: Number of worker processes that filter sets in parallel
+            prune_translations: Whether to drop unrequested translations
+                before they are parsed
             
         Raises:
             FileNotFoundError: If input file is invalid
@@ -193,13 +220,13 @@ class CardFilterService:
         """
         try:
             # Validate input with type checking
-            if not self.file_service.validate_input_file(input_file):
+            if input_file != STDIN_PATH and not self.file_service.validate_input_file(input_file):
                 error_msg = f"Invalid input file: {input_file}"
                 self.logging.error(error_msg)
                 raise ValueError(error_msg)
 
             # Process streams with resource management
-            with self.file_service.open_file(input_file, mode='rb') as infile, \
+            with self._open_input(input_file) as infile, \
                  self.file_service.open_file(output_file, mode='wb') as outfile:
                 
                 try:
@@ -209,7 +236,10 @@ class CardFilterService:
                         card_processor=self.card_processor,
                         schema=schema,
                         filters=filters,
-                        additional_languages=additional_languages
+                        additional_languages=additional_languages,
+                        show_progress=show_progress,
+                        workers=workers,
+                        prune_foreign_data=prune_translations
                     )
                 except Exception as e:
                     error_msg = f"Error processing cards: {str(e)}"
@@ -11,8 +11,11 @@ Component Relationships:
 - Leverages shared interfaces for consistency
 
 Features:
-- Memory-efficient streaming using ijson for parsing
-- Progress tracking with tqdm
+- Memory-efficient single-pass streaming using ijson for parsing
+- Optional set-sharded filtering across worker processes
+- Translations in unrequested languages dropped before they are parsed
+- Support for pipes, standard input and compressed inputs
+- Byte-accurate, throttled progress tracking
 - Set-based card organization
 - Metadata handling and preservation
 - Error recovery and logging
@@ -21,11 +24,17 @@ Features:
 
 import json
 import ijson
-from typing import BinaryIO, Optional, List, Dict, Any, cast
-from tqdm import tqdm
+from typing import BinaryIO, Callable, Optional, List, Dict, Any, Union, cast
 
 from ..utils.container import Container
 from ..io.writers.card import CardSetWriter
+from ..io.parsers.card_stream import (
+    CardDumpScanner, CardStreamReader, ForeignDataPruner, load_input_buffer, open_input_stream
+)
+from .progress import StreamProgress
+from .parallel import ParallelSetFilter
+from ..processing.filters import FilterPlan, compile_filters
+from ..processing.projection import FOREIGN_DATA_FIELD, SchemaProjector, compile_schema, normalize_languages
 from ..utils.interfaces import LoggingInterface, CardProcessorInterface, FileHandlerInterface
 from ..core.errors import CardFilterError
 from ..core.config import CardFilterConfig
@@ -87,8 +96,8 @@ class FileProcessor:
         self,
         current_card: Dict[str, Any],
         card_processor: CardProcessorInterface,
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
+        filters: Optional[FilterPlan],
+        schema: Union[List[str], SchemaProjector, None],
         additional_languages: Optional[List[str]],
         set_writer: CardSetWriter
     ) -> None:
@@ -97,8 +106,8 @@ class FileProcessor:
         Args:
             current_card: Card data to process
             card_processor: Processor for card data
-            filters: Optional filter conditions
-            schema: Optional schema for field selection
+            filters: Optional compiled filter plan
+            schema: Optional schema for field selection, compiled or not
             additional_languages: Optional languages to include
             set_writer: Writer for card sets
             
@@ -116,66 +125,34 @@ class FileProcessor:
             self.logging.error(error_msg)
             raise StreamProcessingError(error_msg) from e
 
-    def _handle_prefix(
-        self,
-        prefix: str,
-        event: str,
-        value: Any,
-        current_state: Dict[str, Any],
-        set_writer: CardSetWriter,
-        card_processor: CardProcessorInterface,
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
-        additional_languages: Optional[List[str]]
-    ) -> None:
-        """Handle a single prefix event from the JSON parser.
+    def _write_metadata(self, outfile: BinaryIO, value: Any) -> None:
+        """Write the output header with metadata and open the data section.
+        
+        Used when ``meta`` is the first top-level key of the input.
         
         Args:
-            prefix: Current JSON path prefix
-            event: Parser event type
-            value: Current value
-            current_state: Current processing state
-            set_writer: Writer for card sets
-            card_processor: Processor for card data
-            filters: Optional filter conditions
-            schema: Optional schema for field selection
-            additional_languages: Optional languages to include
+            outfile: Output file stream
+            value: Metadata value to write
             
         Raises:
-            StreamProcessingError: If prefix handling fails
+            MetadataError: If metadata writing fails
         """
         try:
-            if prefix.startswith("data."):
-                if prefix.endswith(".block"):
-                    return
-
-                set_name = prefix.split(".")[1]
-                
-                if prefix.endswith(".cards.item"):
-                    if event == "start_map":
-                        current_state['current_card'] = {}
-                        if set_name != current_state['current_set']:
-                            set_writer.handle_set_transition(set_name)
-                            current_state['current_set'] = set_name
-                    elif event == "end_map":
-                        self._process_card(
-                            current_state['current_card'],
-                            card_processor,
-                            filters,
-                            schema,
-                            additional_languages,
-                            set_writer
-                        )
-                elif prefix.startswith(f"data.{set_name}.cards.item."):
-                    card_key = prefix.split(".")[-1]
-                    current_state['current_card'][card_key] = value
+            metadata_json = json.dumps(value).encode('utf-8')
+            outfile.write(b'{"meta":')
+            outfile.write(metadata_json)
+            # Write data section opening
+            outfile.write(b',"data":{')
         except Exception as e:
-            error_msg = f"Failed to handle prefix {prefix}: {str(e)}"
+            error_msg = f"Failed to write metadata: {str(e)}"
             self.logging.error(error_msg)
-            raise StreamProcessingError(error_msg) from e
+            raise MetadataError(error_msg) from e
 
-    def _write_metadata(self, outfile: BinaryIO, value: Any) -> None:
-        """Write metadata section to output file.
+    def _write_metadata_trailer(self, outfile: BinaryIO, value: Any) -> None:
+        """Close the data section and write deferred metadata as a trailer.
+        
+        Used when ``meta`` is not the first top-level key of the input or is
+        missing, so the envelope can still be written in a single pass.
         
         Args:
             outfile: Output file stream
@@ -185,88 +162,288 @@ class FileProcessor:
             MetadataError: If metadata writing fails
         """
         try:
-            # Just write the opening brace
-            outfile.write(b'{')
-            # Write metadata
             metadata_json = json.dumps(value).encode('utf-8')
-            outfile.write(b'"meta":')
+            outfile.write(b'},"meta":')
             outfile.write(metadata_json)
-            # Write data section opening
-            outfile.write(b',"data":{}')
+            outfile.write(b'}')
         except Exception as e:
             error_msg = f"Failed to write metadata: {str(e)}"
             self.logging.error(error_msg)
             raise MetadataError(error_msg) from e
 
+    def _open_data_section(
+        self,
+        outfile: BinaryIO,
+        meta_value: Any,
+        meta_first: Optional[bool],
+        current_state: Dict[str, Any]
+    ) -> None:
+        """Open the output data section, choosing the envelope layout.
+        
+        The metadata becomes the output header only when it is the first
+        top-level key of the input, so the layout depends on the input alone
+        and not on how far it has been read.
+        
+        Args:
+            outfile: Output file stream
+            meta_value: Metadata read so far, or None if not yet seen
+            meta_first: Whether ``meta`` is the first top-level key of the input
+            current_state: Current processing state
+        """
+        if current_state['data_open']:
+            return
+
+        if meta_first and meta_value is not None:
+            self._write_metadata(outfile, meta_value)
+            current_state['meta_written'] = True
+        else:
+            outfile.write(b'{"data":{')
+        current_state['data_open'] = True
+
+    def _close_envelope(
+        self,
+        outfile: BinaryIO,
+        set_writer: Optional[CardSetWriter],
+        meta_value: Any,
+        meta_first: Optional[bool],
+        current_state: Dict[str, Any]
+    ) -> None:
+        """Close the last set, the data section and the root object.
+        
+        Args:
+            outfile: Output file stream
+            set_writer: Writer for card sets, or None if sets were written
+                as complete fragments
+            meta_value: Metadata read from the input, or None if absent
+            meta_first: Whether ``meta`` is the first top-level key of the input
+            current_state: Current processing state
+        """
+        self._open_data_section(outfile, meta_value, meta_first, current_state)
+        if set_writer is not None:
+            set_writer.close()
+
+        if current_state['meta_written']:
+            outfile.write(b'}}')
+        else:
+            self._write_metadata_trailer(outfile, meta_value if meta_value is not None else {})
+
     def process_file_stream(
         self,
         infile: BinaryIO,
         outfile: BinaryIO,
         card_processor: CardProcessorInterface,
-        schema: Optional[List[str]] = None,
+        schema: Union[List[str], SchemaProjector, None] = None,
         filters: Optional[Dict[str, Any]] = None,
         additional_languages: Optional[List[str]] = None,
+        show_progress: bool = True,
+        workers: int = 1,
+        prune_foreign_data: bool = False,
     ) -> None:
-        """Process a file stream with progress tracking."""
+        """Process a file stream in a single pass with progress tracking.
+        
+        The input is read exactly once and never seeked, so pipes, standard
+        input and compressed streams are supported. Cards are streamed as whole
+        objects, so nested values such as ``legalities`` are preserved.
+        
+        With more than one worker, sets are filtered in parallel instead (see
+        ``_process_parallel``); the output is identical.
+        
+        Filters and the schema are compiled once up front, and the compiled
+        plan and schema filter and project every card, in this process or in
+        the workers. Sets that a ``setCode`` condition excludes are skipped
+        as a whole and do not appear in the output.
+        
+        The requested languages are normalized once into a set. With
+        ``prune_foreign_data``, and unless the filters read ``foreignData``,
+        translations in other languages are dropped from the raw input before
+        it is parsed (see ``ForeignDataPruner``), so they are never built into
+        objects. The output is the same either way; pruning trades some CPU
+        time for memory.
+        
+        The ``meta`` section is preserved wherever it appears in the input: if
+        it is the first top-level key it becomes the output header, otherwise
+        it is deferred and written after the data section.
+        
+        Args:
+            infile: Input stream, plain or gzip/bzip2/xz compressed
+            outfile: Output stream
+            card_processor: Processor for card data
+            schema: Optional schema for field selection, as field names or
+                dotted paths to nested fields
+            filters: Optional filter conditions
+            additional_languages: Optional languages to include
+            show_progress: Whether to display progress; it is only shown on a
+                terminal and costs nothing per card when disabled
+            workers: Number of worker processes; 1 processes the stream in
+                this process
+            prune_foreign_data: Whether to drop unrequested translations
+                while parsing; ignored when the filters read ``foreignData``
+            
+        Raises:
+            StreamProcessingError: If the input cannot be parsed or processed
+            MetadataError: If metadata writing fails
+            FileProcessorError: For any other processing failure
+        """
+        try:
+            plan = compile_filters(filters) if filters else None
+        except ValueError as e:
+            error_msg = f"Invalid filters: {str(e)}"
+            self.logging.error(error_msg)
+            raise FileProcessorError(error_msg) from e
+
+        if schema is not None:
+            try:
+                schema = compile_schema(schema)
+            except ValueError as e:
+                error_msg = f"Invalid schema: {str(e)}"
+                self.logging.error(error_msg)
+                raise FileProcessorError(error_msg) from e
+
+        include_set = plan.may_match_set if plan is not None else None
+        additional_languages = normalize_languages(additional_languages)
+        pruner = None
+        if prune_foreign_data and (plan is None or FOREIGN_DATA_FIELD not in plan.fields):
+            pruner = ForeignDataPruner(additional_languages or ())
+
+        if workers > 1:
+            self._process_parallel(
+                infile, outfile, card_processor, schema, plan, additional_languages, workers,
+                include_set, pruner
+            )
+            return
+
         try:
             set_writer = CardSetWriter(outfile, cast(CardFilterConfig, self.config))
-            
-            parser = ijson.parse(infile)
-            file_size = infile.seek(0, 2)
-            infile.seek(0)
+            progress = StreamProgress(infile, enabled=show_progress)
+            stream = open_input_stream(progress.source)
+            reader = CardStreamReader(stream if pruner is None else pruner.wrap(stream))
             
             current_state = {
                 'meta_written': False,
-                'current_card': {},
-                'current_set': None,
-                'meta_value': None
+                'data_open': False,
+                'current_set': None
             }
             
-            progress_bar = None
-            if isinstance(file_size, int):
-                progress_bar = tqdm(total=file_size, unit='B', unit_scale=True, desc="Processing file")
-            
             try:
-                # First pass: collect metadata
-                for prefix, event, value in parser:
-                    if prefix == 'meta':
-                        current_state['meta_value'] = value
-                        break
-                
-                # Reset file position for main processing
-                infile.seek(0)
-                
-                # Write metadata section
-                self._write_metadata(outfile, current_state['meta_value'] or {})
-                current_state['meta_written'] = True
-                
-                # Main processing pass
-                parser = ijson.parse(infile)
-                for prefix, event, value in parser:
-                    if prefix.startswith("data."):
-                        self._handle_prefix(
-                            prefix, event, value,
-                            current_state, set_writer,
-                            card_processor, filters,
-                            schema, additional_languages
-                        )
-                    if progress_bar:
-                        progress_bar.update(1)
+                for set_code, card in progress.track(reader.iter_cards(include_set)):
+                    if set_code != current_state['current_set']:
+                        self._open_data_section(outfile, reader.meta, reader.meta_first, current_state)
+                        set_writer.handle_set_transition(set_code)
+                        current_state['current_set'] = set_code
+                    self._process_card(
+                        card,
+                        card_processor,
+                        plan,
+                        schema,
+                        additional_languages,
+                        set_writer
+                    )
                         
             except ijson.JSONError as e:
                 error_msg = f"JSON parsing error: {str(e)}"
                 self.logging.error(error_msg)
                 raise StreamProcessingError(error_msg) from e
-            finally:
-                if progress_bar:
-                    progress_bar.close()
             
             # Close out the JSON structure
-            outfile.write(b"}")  # Close root object
+            self._close_envelope(outfile, set_writer, reader.meta, reader.meta_first, current_state)
             
         except Exception as e:
             if not isinstance(e, (StreamProcessingError, MetadataError)):
                 error_msg = f"File processing error: {str(e)}"
                 self.logging.error(error_msg)
                 raise FileProcessorError(error_msg) from e
-            raise
\ No newline at end of file
+            raise
+
+    def _process_parallel(
+        self,
+        infile: BinaryIO,
+        outfile: BinaryIO,
+        card_processor: CardProcessorInterface,
+        schema: Union[List[str], SchemaProjector, None],
+        filters: Optional[FilterPlan],
+        additional_languages: Optional[List[str]],
+        workers: int,
+        include_set: Optional[Callable[[str], bool]] = None,
+        pruner: Optional[ForeignDataPruner] = None
+    ) -> None:
+        """Filter the sets of a dump across worker processes.
+        
+        The uncompressed input is memory-mapped when it is a plain file and
+        read into memory otherwise. The sets are located without being parsed,
+        each set is filtered and serialized by a worker, and the fragments are
+        written in input order inside the same envelope as the single-process
+        path, so the output is byte-identical to it.
+        
+        Args:
+            infile: Input stream, plain or gzip/bzip2/xz compressed
+            outfile: Output stream
+            card_processor: Processor for card data; must be picklable
+            schema: Optional schema for field selection; a compiled schema
+                is pickled by its paths and compiled again in each worker
+            filters: Optional compiled filter plan; it is pickled by its
+                conditions and compiled again in each worker
+            additional_languages: Optional languages to include
+            workers: Number of worker processes
+            include_set: Optional predicate on set codes; rejected sets are
+                neither parsed nor sent to a worker
+            pruner: Optional pruner applied by the workers to each set before
+                parsing it
+            
+        Raises:
+            StreamProcessingError: If the input cannot be parsed or processed
+            MetadataError: If metadata writing fails
+            FileProcessorError: For any other processing failure
+        """
+        current_state = {
+            'meta_written': False,
+            'data_open': False,
+            'current_set': None
+        }
+
+        scanner: Optional[CardDumpScanner] = None
+        try:
+            scanner = CardDumpScanner(load_input_buffer(infile))
+            sets = (
+                (set_code, scanner.buffer[start:end])
+                for set_code, start, end in scanner.iter_set_ranges()
+                if include_set is None or include_set(set_code)
+            )
+            
+            with ParallelSetFilter(
+                card_processor,
+                cast(CardFilterConfig, self.config),
+                filters=filters,
+                schema=schema,
+                additional_languages=additional_languages,
+                workers=workers,
+                pruner=pruner
+            ) as pool:
+                try:
+                    for fragment in pool.map(sets):
+                        if not fragment:
+                            continue
+                        if current_state['data_open']:
+                            outfile.write(b',')
+                        self._open_data_section(outfile, scanner.meta, scanner.meta_first, current_state)
+                        outfile.write(fragment)
+                except json.JSONDecodeError as e:
+                    error_msg = f"JSON parsing error: {str(e)}"
+                    self.logging.error(error_msg)
+                    raise StreamProcessingError(error_msg) from e
+                except (ValueError, TypeError, KeyError) as e:
+                    error_msg = f"Failed to process card: {str(e)}"
+                    self.logging.error(error_msg)
+                    raise StreamProcessingError(error_msg) from e
+
+            self._close_envelope(outfile, None, scanner.meta, scanner.meta_first, current_state)
+
+        except Exception as e:
+            if not isinstance(e, (StreamProcessingError, MetadataError)):
+                error_msg = f"File processing error: {str(e)}"
+                self.logging.error(error_msg)
+                raise FileProcessorError(error_msg) from e
+            raise
+        finally:
+            # Release the memory map, if the input was mapped
+            if scanner is not None and hasattr(scanner.buffer, 'close'):
+                scanner.buffer.close()
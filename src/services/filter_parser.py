@@ -5,6 +5,7 @@ This module provides parsing functionality for both filter criteria and card dat
 Features:
 - JSON filter string parsing with automatic type inference
 - Structured filter format validation
+- Boolean filter expressions with $and, $or and $not
 - Streaming card data parsing
 - Metadata preservation and handling
 - Error recovery and detailed error reporting
@@ -18,6 +19,7 @@ from typing import Dict, Any, IO, Iterator, Tuple, Optional
 from ..utils.container import Container
 from ..utils.interfaces import LoggingInterface
 from ..core.errors import CardFilterError
+from ..processing.filters import AND_KEY, NOT_KEY, OR_KEY, parse_filter
 
 class ParserError(CardFilterError):
     """Base exception for parsing errors."""
@@ -49,6 +51,12 @@ class CardParser:
     def parse_filter_string(self, filter_str: str) -> Dict[str, Any]:
         """Parse filter string into structured format.
         
+        Fields map to ``{operator: value}`` conditions, or to a string or
+        number for ``eq`` and a list for ``in``. ``$and`` and ``$or`` combine
+        lists of such filters and ``$not`` negates one, for example
+        ``{"$or": [{"rarity": "mythic"}, {"$not": {"type": "Land"}}]}``.
+        The filter is validated by compiling it.
+        
         Args:
             filter_str: JSON string containing filter criteria
             
@@ -56,18 +64,13 @@ class CardParser:
             Dict containing structured filter conditions
             
         Raises:
-            FilterParseError: If filter parsing fails
+            FilterParseError: If filter parsing fails or the filter is invalid
         """
         try:
             raw_filters = json.loads(filter_str)
-            return {
-                k: (
-                    {"eq": v}
-                    if isinstance(v, (str, int, float))
-                    else {"in": v} if isinstance(v, list) else v
-                )
-                for k, v in raw_filters.items()
-            }
+            filters = self._expand_filter(raw_filters)
+            parse_filter(filters)
+            return filters
         except json.JSONDecodeError as e:
             error_msg = f"Invalid filter JSON: {str(e)}"
             self.logger.error(error_msg)
@@ -77,6 +80,35 @@ class CardParser:
             self.logger.error(error_msg)
             raise FilterParseError(error_msg) from e
 
+    def _expand_filter(self, raw_filter: Any) -> Any:
+        """Expand shorthand values into operator conditions.
+        
+        A string or number stands for ``eq`` and a list for ``in``, at any
+        depth below ``$and``, ``$or`` and ``$not``.
+        
+        Args:
+            raw_filter: Filter as decoded from JSON
+            
+        Returns:
+            Any: The filter with every field mapped to operator conditions;
+                malformed parts are left for validation to reject
+        """
+        if not isinstance(raw_filter, dict):
+            return raw_filter
+        filters = {}
+        for key, value in raw_filter.items():
+            if key in (AND_KEY, OR_KEY) and isinstance(value, list):
+                filters[key] = [self._expand_filter(clause) for clause in value]
+            elif key == NOT_KEY:
+                filters[key] = self._expand_filter(value)
+            elif isinstance(value, (str, int, float)):
+                filters[key] = {"eq": value}
+            elif isinstance(value, list):
+                filters[key] = {"in": value}
+            else:
+                filters[key] = value
+        return filters
+
     def validate_prefix(self, prefix: str) -> Tuple[bool, str]:
         """Validate the prefix format and extract set name.
         
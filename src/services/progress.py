@@ -0,0 +1,240 @@
+"""Progress reporting for streaming card processing.
+
+This module provides byte-accurate, throttled progress reporting for large
+card dumps. Progress is measured on the input stream itself, through a reader
+wrapper that counts the (possibly compressed) bytes consumed, so the bar's
+total and ETA match the file on disk.
+
+Features:
+- Byte-accurate progress measured where the input is read
+- Throughput in bytes/s and cards/s with an ETA when the size is known
+- Sampling every N cards and at most every M seconds instead of per event
+- No wrapper and no per-card work at all when progress is disabled
+
+Example:
+    ```python
+    with open("AllPrintings.json", "rb") as infile:
+        progress = StreamProgress(infile)
+        reader = CardStreamReader(open_input_stream(progress.source))
+        for set_code, card in progress.track(reader.iter_cards()):
+            ...
+    ```
+"""
+
+import io
+import os
+import sys
+import time
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, TextIO, TypeVar, cast
+
+from tqdm import tqdm
+
+T = TypeVar("T")
+
+# Cards between clock checks, and minimum seconds between bar refreshes
+DEFAULT_SAMPLE_EVERY = 1000
+DEFAULT_MIN_INTERVAL = 0.25
+
+
+class CountingReader(io.RawIOBase):
+    """Raw stream wrapper that counts the bytes read through it.
+
+    Attributes:
+        bytes_read (int): Total number of bytes read so far
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize the wrapper.
+
+        Args:
+            stream: Binary stream to read from
+        """
+        super().__init__()
+        self._stream = stream
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        """Return True; the wrapper is always readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read into a buffer, counting the bytes transferred.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            int: Number of bytes read, 0 at end of stream
+        """
+        readinto = getattr(self._stream, "readinto", None)
+        if readinto is not None:
+            count = readinto(buffer) or 0
+        else:
+            data = self._stream.read(len(buffer))
+            count = len(data)
+            buffer[:count] = data
+        self.bytes_read += count
+        return count
+
+
+def input_size(infile: BinaryIO) -> Optional[int]:
+    """Determine the remaining size of an input stream without consuming it.
+
+    Args:
+        infile: Binary input stream
+
+    Returns:
+        Optional[int]: Remaining size in bytes, or None if it cannot be known
+            (for example for pipes and standard input)
+    """
+    try:
+        size = os.fstat(infile.fileno()).st_size
+        if size:
+            return size - infile.tell()
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+
+    try:
+        if infile.seekable():
+            position = infile.tell()
+            end = infile.seek(0, os.SEEK_END)
+            infile.seek(position)
+            return end - position
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+class StreamProgress:
+    """Throttled progress display for a streamed input.
+
+    When enabled, the input is wrapped in a ``CountingReader`` exposed as
+    ``source``, and ``track`` samples it every ``sample_every`` items, redrawing
+    the bar at most every ``min_interval`` seconds. When disabled, ``source``
+    is the original stream and ``track`` returns its argument unchanged, so
+    there is no per-card cost.
+
+    Progress is only shown when explicitly enabled and the output stream is a
+    terminal.
+
+    Attributes:
+        source (BinaryIO): Stream to read the input from
+        enabled (bool): Whether progress is being reported
+        total_bytes (Optional[int]): Input size, if known
+    """
+
+    def __init__(
+        self,
+        infile: BinaryIO,
+        enabled: bool = True,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        output: Optional[TextIO] = None,
+        desc: str = "Processing file"
+    ):
+        """Initialize progress reporting for a stream.
+
+        Args:
+            infile: Binary input stream to measure
+            enabled: Whether progress was requested
+            sample_every: Number of items between clock checks
+            min_interval: Minimum seconds between display refreshes
+            output: Text stream to draw on, defaults to standard error
+            desc: Label shown before the bar
+        """
+        self.output = output if output is not None else sys.stderr
+        self.enabled = enabled and self.is_terminal(self.output)
+        self.sample_every = max(1, sample_every)
+        self.min_interval = min_interval
+        self.desc = desc
+        self.total_bytes: Optional[int] = None
+        self._counter: Optional[CountingReader] = None
+        self.source: BinaryIO = infile
+
+        if self.enabled:
+            self.total_bytes = input_size(infile)
+            self._counter = CountingReader(infile)
+            self.source = cast(BinaryIO, io.BufferedReader(self._counter))
+
+    @staticmethod
+    def is_terminal(output: Any) -> bool:
+        """Check whether a stream is attached to a terminal.
+
+        Args:
+            output: Stream to check
+
+        Returns:
+            bool: True if the stream is an interactive terminal
+        """
+        try:
+            return bool(output.isatty())
+        except (AttributeError, ValueError):
+            return False
+
+    @property
+    def bytes_read(self) -> int:
+        """Number of input bytes consumed so far."""
+        return self._counter.bytes_read if self._counter is not None else 0
+
+    def track(self, items: Iterable[T]) -> Iterable[T]:
+        """Report progress while iterating over items.
+
+        Args:
+            items: Items produced from the input, typically cards
+
+        Returns:
+            Iterable[T]: The items, unchanged; wrapped only when enabled
+        """
+        if not self.enabled:
+            return items
+        return self._track(items)
+
+    def _track(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield items while sampling the byte counter.
+
+        Args:
+            items: Items to pass through
+
+        Yields:
+            T: Each item, in order
+        """
+        bar = tqdm(
+            total=self.total_bytes,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            desc=self.desc,
+            file=self.output,
+            mininterval=self.min_interval,
+        )
+        started = last_refresh = time.monotonic()
+        count = 0
+        next_sample = self.sample_every
+
+        try:
+            for item in items:
+                yield item
+                count += 1
+                if count < next_sample:
+                    continue
+                next_sample += self.sample_every
+                now = time.monotonic()
+                if now - last_refresh >= self.min_interval:
+                    self._refresh(bar, count, now - started)
+                    last_refresh = now
+
+            self._refresh(bar, count, time.monotonic() - started)
+        finally:
+            bar.close()
+
+    def _refresh(self, bar: tqdm, count: int, elapsed: float) -> None:
+        """Update the bar with the bytes read and the card rate.
+
+        Args:
+            bar: Progress bar to update
+            count: Items processed so far
+            elapsed: Seconds since tracking started
+        """
+        bar.update(self.bytes_read - bar.n)
+        rate = count / elapsed if elapsed > 0 else 0.0
+        bar.set_postfix_str(f"{count} cards, {rate:,.0f} cards/s", refresh=False)
@@ -121,7 +121,8 @@ class Container(containers.DeclarativeContainer):
     batch_processor = providers.Singleton(
         BatchProcessor,
         card_processor=card_processor,
-        logger=logging_service
+        logger=logging_service,
+        config=config
     )
 
     # Deck List Processing
@@ -41,6 +41,9 @@ Example:
 
 from typing import Protocol, Any, Optional, Dict, List, IO, Union
 
+from ..processing.filters import FilterPlan
+from ..processing.projection import SchemaProjector
+
 
 class LoggingInterface(Protocol):
     """Protocol defining the standard logging interface used across the application.
@@ -127,28 +130,16 @@ class CardProcessorInterface(Protocol):
             def process_card(
                 self,
                 card_data: dict,
-                filters: Optional[Dict[str, Any]] = None,
-                schema: Optional[List[str]] = None,
+                filters: Union[Dict[str, Any], FilterPlan, None] = None,
+                schema: Union[List[str], SchemaProjector, None] = None,
                 additional_languages: Optional[List[str]] = None,
             ) -> Optional[dict]:
                 # Apply filters
-                if filters and not self._matches_filters(card_data, filters):
+                if filters and not compile_filters(filters)(card_data):
                     return None
                     
-                # Apply schema
-                if schema:
-                    result = {k: card_data[k] for k in schema if k in card_data}
-                else:
-                    result = card_data.copy()
-                    
-                # Add languages if requested
-                if additional_languages:
-                    result['foreignData'] = self._get_foreign_data(
-                        card_data,
-                        additional_languages
-                    )
-                    
-                return result
+                # Apply schema, with languages if requested
+                return compile_schema(schema)(card_data, additional_languages)
         
         # Usage
         processor = StandardCardProcessor()
@@ -162,19 +153,25 @@ class CardProcessorInterface(Protocol):
     def process_card(
         self,
         card_data: dict,
-        filters: Optional[Dict[str, Any]],
-        schema: Optional[List[str]],
+        filters: Union[Dict[str, Any], FilterPlan, None],
+        schema: Union[List[str], SchemaProjector, None],
         additional_languages: Optional[List[str]],
     ) -> Optional[dict]:
         """Process a single card according to specified criteria.
         
+        ``FileProcessor`` and ``BatchProcessor`` compile the filters and the
+        schema once per run and pass the ``FilterPlan`` and
+        ``SchemaProjector`` for every card.
+        
         Args:
             card_data (dict): Raw card data to process. Should contain all
                 standard MTG card fields.
-            filters (Optional[Dict[str, Any]]): Filter conditions to apply.
+            filters (Union[Dict[str, Any], FilterPlan, None]): Filter
+                conditions to apply, or a compiled plan.
                 Format: {"field": {"operator": value}}
-            schema (Optional[List[str]]): List of fields to include in output.
-                If None, includes all fields.
+            schema (Union[List[str], SchemaProjector, None]): List of fields
+                to include in output, or a compiled projector. If None,
+                includes all fields.
             additional_languages (Optional[List[str]]): List of language codes
                 to include in foreign data.
             
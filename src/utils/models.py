@@ -10,6 +10,7 @@ Features:
 - Statistics tracking for various operations
 - Card reference parsing and validation
 - Deck list processing statistics
+- Statistics mergeable across workers and exportable as flat records
 
 Example:
     Basic usage of models:
@@ -41,8 +42,8 @@ Note:
 """
 
 from enum import Enum, auto
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
 
 
 class WriterState(Enum):
@@ -89,6 +90,10 @@ class WriterStats:
     providing insights into the processing results and any issues
     encountered.
 
+    A writer owns its statistics and updates them without locking; writers
+    running in different threads or processes keep their own, which are
+    combined with ``merge``.
+
     Attributes:
         cards_written (int): Number of cards successfully written
         sets_processed (int): Number of card sets processed
@@ -119,6 +124,24 @@ class WriterStats:
     sets_processed: int = 0
     errors_encountered: int = 0
 
+    def merge(self, other: "WriterStats") -> None:
+        """Add the statistics of another writer.
+
+        Args:
+            other: Statistics to add
+        """
+        self.cards_written += other.cards_written
+        self.sets_processed += other.sets_processed
+        self.errors_encountered += other.errors_encountered
+
+    def to_record(self) -> Dict[str, Any]:
+        """Export the statistics as a JSON-serializable record.
+
+        Returns:
+            Dict[str, Any]: One entry per counter
+        """
+        return asdict(self)
+
 
 @dataclass
 class CardReference:
@@ -202,6 +225,9 @@ class DeckListStats:
     success rates and missing cards. It provides insights into the
     completeness and accuracy of deck list processing.
 
+    Each deck is resolved with its own statistics, so worker threads never
+    share them; the statistics of several decks are combined with ``merge``.
+
     Attributes:
         cards_found (int): Number of cards successfully found in archive
         cards_missing (int): Number of cards not found in archive
@@ -259,3 +285,54 @@ class DeckListStats:
         if self.total_cards == 0:
             return 0.0
         return (self.cards_found / self.total_cards) * 100
+
+    def merge(self, other: "DeckListStats") -> None:
+        """Add the card counts of another deck list.
+
+        Args:
+            other: Statistics to add
+        """
+        self.cards_found += other.cards_found
+        self.cards_missing += other.cards_missing
+        self.total_cards += other.total_cards
+
+    def to_record(self) -> Dict[str, Any]:
+        """Export the statistics as a JSON-serializable record.
+
+        Returns:
+            Dict[str, Any]: One entry per field, and the success rate
+        """
+        record = asdict(self)
+        record["success_rate"] = self.success_rate
+        return record
+
+
+@dataclass
+class DeckBatchStats(DeckListStats):
+    """Aggregated statistics for a batch of deck lists.
+
+    Card counts are summed over every deck that was extracted; decks that
+    could not be read or parsed are listed with their error instead.
+
+    Attributes:
+        decks_processed (int): Number of deck lists extracted
+        failed_decks (Dict[str, str]): Error message per deck list path that failed
+
+    Example:
+        ```python
+        batch = DeckBatchStats()
+        batch.add(DeckListStats(cards_found=58, cards_missing=2, total_cards=60))
+        print(f"{batch.decks_processed} decks, {batch.success_rate:.1f}% found")
+        ```
+    """
+    decks_processed: int = 0
+    failed_decks: Dict[str, str] = field(default_factory=dict)
+
+    def add(self, stats: DeckListStats) -> None:
+        """Add the statistics of one extracted deck list.
+
+        Args:
+            stats: Statistics of the deck list
+        """
+        self.merge(stats)
+        self.decks_processed += 1
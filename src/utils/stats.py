@@ -0,0 +1,249 @@
+"""Statistics primitives shared by batch processing, writers and deck extraction.
+
+Counters on the hot path are owned by a single worker and never locked: each
+task fills its own ``WorkerCounters``, which travel back with the task's
+results (pickled, for worker processes) and are merged into the shared
+statistics once per chunk. Only that merge takes a lock.
+
+Features:
+- Log-scale histograms of per-card processing time, mergeable across workers
+- A sliding window of recent throughput
+- Export of every statistics object to a flat, JSON-serializable record
+
+Example:
+    ```python
+    counters = WorkerCounters()
+    for card in chunk:
+        started = time.perf_counter()
+        process(card)
+        counters.processed += 1
+        counters.latency.record(time.perf_counter() - started)
+
+    stats.merge(counters)  # once per chunk, in the parent
+    print(json.dumps(stats.to_record()))
+    ```
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Histogram buckets: bucket 0 holds times under a microsecond and bucket i
+# times from 2**(i-1) up to 2**i microseconds; the last one holds the rest
+HISTOGRAM_BUCKETS = 40
+
+# Seconds of history used for the throughput of a RateWindow
+DEFAULT_RATE_WINDOW = 10.0
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of durations in power-of-two microsecond buckets.
+
+    Recording is a few arithmetic operations and two list updates, cheap
+    enough for every card. Histograms are not thread-safe: each worker
+    records into its own, and they are combined with ``merge``.
+
+    Attributes:
+        counts (List[int]): Number of durations per bucket
+        count (int): Number of durations recorded
+        total (float): Sum of the durations in seconds
+        max (float): Longest duration in seconds
+    """
+    counts: List[int] = field(default_factory=lambda: [0] * HISTOGRAM_BUCKETS)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.counts[bucket if bucket < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS - 1] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the durations of another histogram.
+
+        Args:
+            other: Histogram to add
+        """
+        for bucket, count in enumerate(other.counts):
+            if count:
+                self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds, 0 when empty."""
+        return self.total / self.count if self.count else 0.0
+
+    @staticmethod
+    def bucket_bound(bucket: int) -> float:
+        """Upper bound of a bucket in seconds.
+
+        Args:
+            bucket: Bucket index
+
+        Returns:
+            float: Longest duration counted in the bucket
+        """
+        return (1 << bucket) / 1_000_000
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the durations.
+
+        The estimate is the upper bound of the bucket holding the quantile,
+        so it is at most twice the true value, and never above ``max``.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            float: Estimated duration in seconds, 0 when empty
+
+        Raises:
+            ValueError: If q is not between 0 and 1
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if not self.count:
+            return 0.0
+        rank = max(1, q * self.count)
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bucket_bound(bucket), self.max)
+        return self.max
+
+    def to_record(self) -> Dict[str, Any]:
+        """Export the histogram as a JSON-serializable record.
+
+        Returns:
+            Dict[str, Any]: Count, total, mean, max and median, 90th and 99th
+                percentiles in seconds, and the non-empty buckets as
+                ``[upper bound, count]`` pairs
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                [self.bucket_bound(bucket), count] for bucket, count in enumerate(self.counts) if count
+            ],
+        }
+
+
+class RateWindow:
+    """Throughput over a sliding window of recent events.
+
+    Events are recorded in bulk, for instance once per chunk, so the window
+    holds one entry per chunk rather than one per card. Not thread-safe; it
+    belongs to whoever merges the statistics.
+
+    Attributes:
+        window (float): Seconds of history kept
+        started (float): ``time.perf_counter()`` when the window was created
+    """
+
+    def __init__(self, window: float = DEFAULT_RATE_WINDOW, now: Optional[float] = None):
+        """Create an empty window.
+
+        Args:
+            window: Seconds of history kept
+            now: Creation time, ``time.perf_counter()`` by default
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        self.window = window
+        self.started = time.perf_counter() if now is None else now
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._count = 0
+
+    def add(self, count: int, now: Optional[float] = None) -> None:
+        """Record events.
+
+        Args:
+            count: Number of events
+            now: Time of the events, ``time.perf_counter()`` by default
+        """
+        now = time.perf_counter() if now is None else now
+        self._events.append((now, count))
+        self._count += count
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        """Drop the events that left the window."""
+        horizon = now - self.window
+        while self._events and self._events[0][0] <= horizon:
+            self._count -= self._events.popleft()[1]
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Events per second over the window.
+
+        Until the window has been open for ``window`` seconds, the rate is
+        taken over the time since it was created.
+
+        Args:
+            now: Current time, ``time.perf_counter()`` by default
+
+        Returns:
+            float: Events per second, 0 before any time has passed
+        """
+        now = time.perf_counter() if now is None else now
+        self._expire(now)
+        span = min(self.window, now - self.started)
+        return self._count / span if span > 0 else 0.0
+
+
+@dataclass
+class WorkerCounters:
+    """Card counts and processing times gathered by one worker for one task.
+
+    Owned by the task that fills it, so it needs no lock; the statistics it
+    is merged into take care of synchronization.
+
+    Attributes:
+        processed (int): Cards processed successfully
+        filtered (int): Cards filtered out
+        failed (int): Cards that failed or overran their deadline
+        latency (LatencyHistogram): Processing time of every card
+    """
+    processed: int = 0
+    filtered: int = 0
+    failed: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def cards(self) -> int:
+        """Number of cards counted."""
+        return self.processed + self.filtered + self.failed
+
+    def merge(self, other: "WorkerCounters") -> None:
+        """Add the counts and times of another worker.
+
+        Args:
+            other: Counters to add
+        """
+        self.processed += other.processed
+        self.filtered += other.filtered
+        self.failed += other.failed
+        self.latency.merge(other.latency)
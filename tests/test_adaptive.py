@@ -0,0 +1,106 @@
+"""Tests for adaptive chunk sizing."""
+
+import pytest
+
+from src.processing.adaptive import (
+    SETTLE_CHUNKS,
+    AdaptiveBatchSizer,
+    current_rss,
+)
+
+
+def make_sizer(rss=None, **kwargs):
+    """Create a sizer reading a fixed resident memory."""
+    return AdaptiveBatchSizer(rss_reader=lambda: rss, **kwargs)
+
+
+def test_current_rss():
+    """Test that the resident memory of the process can be measured."""
+    rss = current_rss()
+    assert rss is None or rss > 1024 * 1024
+
+
+def test_invalid_settings():
+    """Test that out-of-range settings are rejected."""
+    with pytest.raises(ValueError, match="target_latency"):
+        AdaptiveBatchSizer(target_latency=0)
+    with pytest.raises(ValueError, match="memory_budget_mb"):
+        AdaptiveBatchSizer(memory_budget_mb=-1)
+    with pytest.raises(ValueError, match="batch size bounds"):
+        AdaptiveBatchSizer(min_batch_size=100, max_batch_size=10)
+
+
+def test_batch_size_grows_toward_target_latency():
+    """Test that fast chunks grow, at most twofold per chunk, up to the bound."""
+    sizer = make_sizer(target_latency=1.0, max_batch_size=1000)
+    sizer.reset(100, 1)
+
+    decision = sizer.record(100, latency=0.01, interval=0.01)
+    assert decision.batch_size == 200
+    assert decision.chunk == 0
+    assert "latency" in decision.reason
+
+    for _ in range(5):
+        sizer.record(sizer.batch_size, latency=0.01, interval=0.01)
+    assert sizer.batch_size == 1000
+
+
+def test_batch_size_shrinks_and_settles():
+    """Test that slow chunks shrink and chunks near the target are kept."""
+    sizer = make_sizer(target_latency=1.0)
+    sizer.reset(1000, 1)
+
+    assert sizer.record(1000, latency=4.0, interval=4.0).batch_size == 500
+    assert sizer.record(500, latency=1.25, interval=1.25).batch_size == 400
+    assert sizer.record(400, latency=1.05, interval=1.05) is None
+    assert sizer.batch_size == 400
+
+
+def test_memory_budget_shrinks_and_caps_growth():
+    """Test that chunks shrink above the budget and stop growing near it."""
+    budget = 100 * 1024 * 1024
+    sizer = make_sizer(rss=budget + 1, memory_budget_mb=100)
+    sizer.reset(400, 1)
+    decision = sizer.record(400, latency=0.01, interval=0.01)
+    assert decision.batch_size == 200
+    assert decision.rss_bytes == budget + 1
+    assert "memory" in decision.reason
+
+    sizer = make_sizer(rss=int(budget * 0.95), memory_budget_mb=100)
+    sizer.reset(400, 1)
+    assert sizer.record(400, latency=0.01, interval=0.01) is None
+    assert sizer.batch_size == 400
+
+
+def test_workers_hill_climb():
+    """Test that worker changes are kept while throughput holds and undone otherwise."""
+    sizer = make_sizer(target_latency=1.0)
+    sizer.reset(100, 4)
+    assert sizer.workers == 4
+
+    # Fewer workers, same throughput: keep going down
+    assert sizer.record(100, latency=1.0, interval=1.0).workers == 3
+    assert sizer.record(100, latency=1.0, interval=1.0).workers == 2
+
+    # Throughput fell: back to three workers, then settle
+    decision = sizer.record(100, latency=1.0, interval=2.0)
+    assert decision.workers == 3
+    assert "throughput fell" in decision.reason
+    for _ in range(SETTLE_CHUNKS):
+        assert sizer.record(100, latency=1.0, interval=1.0) is None
+
+    # Probing resumes upward
+    assert sizer.record(100, latency=1.0, interval=1.0).workers == 4
+
+
+def test_workers_stay_within_pool():
+    """Test that probing turns around at the bounds of the pool."""
+    sizer = make_sizer(target_latency=1.0)
+    sizer.reset(100, 2)
+    assert sizer.record(100, latency=1.0, interval=1.0).workers == 1
+    assert sizer.record(100, latency=1.0, interval=1.0).workers == 2
+    assert sizer.workers == 2
+
+    sizer.reset(100, 1)
+    assert sizer.record(100, latency=1.0, interval=1.0) is None
+    assert sizer.workers == 1
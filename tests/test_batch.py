@@ -6,7 +6,7 @@ extended coverage cases, and parallel processing scenarios.
 
 import pytest
 from typing import List, Dict, Any
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import ANY, Mock, MagicMock, patch
 from concurrent.futures import TimeoutError, Future, ThreadPoolExecutor, wait, ALL_COMPLETED
 from src.analysis.cards import CardProcessorInterface
 from src.core.config import CardFilterConfig
@@ -16,8 +16,12 @@ from src.processing.batch import (
     BatchStatistics,
     BatchErrorHandler,
     ParallelProcessor,
-    LoggingInterface
+    LoggingInterface,
+    ExecutorBackend
 )
+from src.processing.adaptive import AdaptiveBatchSizer
+from src.processing.filters import FilterPlan
+from src.processing.projection import SchemaProjector
 
 # Fixtures and Mock Classes
 
@@ -292,7 +296,7 @@ def test_batch_processor_with_filters():
     card_processor = MagicMock()
     processor = BatchProcessor(card_processor=card_processor, logger=logger)
     
-    filters = {"type": "Creature"}
+    filters = {"type": {"eq": "Creature"}}
     schema = ["name", "type"]
     additional_languages = ["jp", "de"]
     
@@ -306,10 +310,28 @@ def test_batch_processor_with_filters():
     
     card_processor.process_card.assert_called_with(
         card_data=cards[0],
-        filters=filters,
-        schema=schema,
-        additional_languages=additional_languages
+        filters=ANY,
+        schema=ANY,
+        additional_languages=frozenset(additional_languages)
     )
+    call = card_processor.process_card.call_args.kwargs
+    assert isinstance(call["filters"], FilterPlan)
+    assert call["filters"].conditions == filters
+    assert isinstance(call["schema"], SchemaProjector)
+    assert call["schema"].schema == tuple(schema)
+
+    with pytest.raises(ValueError, match="mapping of operators"):
+        list(processor.process_batch(cards, filters={"type": "Creature"}))
+
+def test_batch_processor_compiles_filters_once(config, mock_logger):
+    """Test that filters are compiled once per batch rather than looked up per card."""
+    processor = BatchProcessor(card_processor=CardProcessorInterface(config), logger=mock_logger)
+    cards = [{"name": f"Card {i}", "type": "Creature" if i % 2 else "Instant"} for i in range(20)]
+
+    with patch("src.analysis.cards.compile_filters") as per_card:
+        results = list(processor.process_batch(cards, filters={"type": {"eq": "Creature"}}, batch_size=5))
+    per_card.assert_not_called()
+    assert sum(len(chunk) for chunk, _ in results) == 10
 
 def test_batch_processor_large_batch():
     """Test batch processor with a large number of cards."""
@@ -445,7 +467,7 @@ def test_parallel_processor_future_exception():
     mock_future.cancelled.return_value = False
     
     mock_executor = MagicMock(spec=ThreadPoolExecutor)
-    mock_executor.__enter__.return_value.submit.return_value = mock_future
+    mock_executor.submit.return_value = mock_future
     
     def mock_wait(futures, timeout, return_when):
         assert return_when == ALL_COMPLETED
@@ -470,3 +492,495 @@ def test_parallel_processor_future_exception():
         error_messages = [msg for msg in logger.messages if msg[0] == "ERROR"]
         assert len(error_messages) == 1
         assert "Future error" in error_messages[0][1]
+
+
+# Executor Backend Tests
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_batch_processor_backends_agree(config, mock_logger, sample_cards, backend):
+    """Test that every backend produces the same cards in input order."""
+    cards = [dict(card, name=f"{card['name']} #{i}") for i in range(8) for card in sample_cards]
+    cards.append({"invalid": "data"})
+    with BatchProcessor(
+        CardProcessorInterface(config), mock_logger, backend=backend, max_workers=2
+    ) as processor:
+        results = list(processor.process_batch(
+            cards, filters={"type": {"eq": "Creature"}}, schema=["name"], batch_size=10
+        ))
+
+    names = [card["name"] for chunk, _ in results for card in chunk]
+    assert names == [card["name"] for card in cards if card.get("type") == "Creature"]
+    final_stats = results[-1][1]
+    assert final_stats.processed_cards == 16
+    assert final_stats.filtered_cards == 8
+    assert final_stats.failed_cards == 1
+    mock_logger.error.assert_called_once()
+    assert processor._executor is None
+
+
+def test_batch_processor_process_backend_chunk(config, mock_logger, sample_cards):
+    """Test that a chunk processed outside process_batch uses the process pool."""
+    with BatchProcessor(CardProcessorInterface(config), mock_logger, backend=ExecutorBackend.PROCESS) as processor:
+        processed_cards, filtered_count, failed_count = processor.process_batch_chunk(
+            sample_cards * 3, filters=None, schema=["name"], additional_languages=None
+        )
+    assert [card["name"] for card in processed_cards] == [card["name"] for card in sample_cards * 3]
+    assert (filtered_count, failed_count) == (0, 0)
+
+
+def test_batch_processor_split_chunk(processor):
+    """Test that chunks are split into contiguous per-worker sub-chunks."""
+    processor.max_workers = 3
+    assert processor._split_chunk(list(range(7))) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert processor._split_chunk([0, 1]) == [[0], [1]]
+
+
+def test_batch_processor_invalid_backend(config, mock_logger):
+    """Test that unknown and unavailable backends are rejected."""
+    with pytest.raises(ValueError, match="Unknown executor backend"):
+        BatchProcessor(CardProcessorInterface(config), mock_logger, backend="fiber")
+
+    import concurrent.futures
+    if not hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        with pytest.raises(ValueError, match="Python 3.14"):
+            BatchProcessor(CardProcessorInterface(config), mock_logger, backend="interpreter")
+
+
+def test_batch_processor_persistent_pool(config, mock_logger, sample_cards):
+    """Test that one lazily started pool serves every chunk until closed."""
+    processor = BatchProcessor(CardProcessorInterface(config), mock_logger, max_workers=2)
+    assert processor._executor is None
+
+    for _ in range(2):
+        list(processor.process_batch(sample_cards * 10, batch_size=10))
+    pool = processor._executor
+    assert isinstance(pool, ThreadPoolExecutor)
+
+    with patch.object(pool, "submit", wraps=pool.submit) as submit:
+        list(processor.process_batch(sample_cards * 10, batch_size=10))
+    assert processor._executor is pool
+    # Three chunks of ten cards, each submitted as one task per worker
+    assert submit.call_count == 6
+
+    processor.close()
+    assert processor._executor is None
+    processor.close()
+
+    # A closed processor starts a new pool when used again
+    processed_cards, _, _ = processor.process_batch_chunk(sample_cards * 3, None, None, None)
+    assert len(processed_cards) == 9
+    assert processor._executor is not pool
+    processor.close()
+
+
+def test_batch_processor_max_workers_from_config(mock_logger):
+    """Test that max_workers comes from the configuration unless given."""
+    card_processor = CardProcessorInterface(CardFilterConfig())
+    assert BatchProcessor(card_processor, mock_logger).workers == 10
+    assert BatchProcessor(card_processor, mock_logger, config=CardFilterConfig(max_workers=3)).workers == 3
+    assert BatchProcessor(
+        card_processor, mock_logger, max_workers=2, config=CardFilterConfig(max_workers=3)
+    ).workers == 2
+
+    with pytest.raises(ValueError):
+        CardFilterConfig(max_workers=0)
+
+
+# Streaming Input Tests
+
+def test_process_batch_streamed_input(processor, sample_cards):
+    """Test that any iterable is processed, with the total known once exhausted."""
+    cards = (dict(card) for card in sample_cards * 4)
+    results = [(len(chunk), stats.total_cards, stats.total_known)
+               for chunk, stats in processor.process_batch(cards, batch_size=5)]
+
+    assert [count for count, _, _ in results] == [5, 5, 2]
+    assert [(total, known) for _, total, known in results] == [(5, False), (10, False), (12, True)]
+
+
+def test_process_batch_streamed_estimate(processor, sample_cards):
+    """Test that an estimate is reported until the input is exhausted."""
+    cards = iter(sample_cards * 4)
+    totals = [(stats.total_cards, stats.total_known)
+              for _, stats in processor.process_batch(cards, batch_size=5, total_estimate=100)]
+    assert totals == [(100, False), (100, False), (12, True)]
+
+
+@pytest.mark.parametrize("prefetch_chunks", [0, 2])
+def test_process_batch_bounded_read_ahead(processor, sample_cards, prefetch_chunks):
+    """Test that a streamed input is read at most a few chunks ahead."""
+    read = []
+
+    def cards():
+        for i in range(1000):
+            read.append(i)
+            yield dict(sample_cards[i % 3], name=f"Card {i}")
+
+    batches = processor.process_batch(cards(), batch_size=10, prefetch_chunks=prefetch_chunks)
+    next(batches)
+    import time
+    time.sleep(0.2)  # Give the reader time to run ahead
+    # The current chunk, the look-ahead chunk, the queue and the reader's chunk
+    assert len(read) <= 10 * (prefetch_chunks + 3)
+    batches.close()
+
+    assert sum(1 for _ in processor.process_batch(cards(), batch_size=10)) == 100
+
+
+def test_process_batch_streamed_input_error(processor, sample_cards):
+    """Test that an error raised while reading the input reaches the caller."""
+    def cards():
+        yield from sample_cards * 3
+        raise ValueError("Broken stream")
+
+    with pytest.raises(ValueError, match="Broken stream"):
+        list(processor.process_batch(cards(), batch_size=2))
+
+
+def test_prefetch_stops_reader_on_close():
+    """Test that closing the consumer stops the background reader."""
+    from src.processing.batch import prefetch
+    import threading
+
+    read = []
+
+    def items():
+        for i in range(10_000):
+            read.append(i)
+            yield i
+
+    consumer = prefetch(items(), 2)
+    assert next(consumer) == 0
+    consumer.close()
+
+    for thread in threading.enumerate():
+        if thread.name == "batch-prefetch":
+            thread.join(timeout=2)
+    assert len(read) < 10
+
+
+# Pipelined Delivery Tests
+
+class RecordingCardProcessor:
+    """Card processor recording which cards were started, slowest first."""
+
+    def __init__(self):
+        import threading
+        self.started = []
+        self.lock = threading.Lock()
+
+    def process_card(self, card_data, filters=None, schema=None, additional_languages=None):
+        import time
+        with self.lock:
+            self.started.append(card_data["index"])
+        # Earlier cards take longer, so later chunks tend to finish first
+        time.sleep(0.002 * (30 - card_data["index"] % 30) / 30)
+        return {"name": card_data["name"]}
+
+
+def indexed_cards(count):
+    """Create cards numbered in input order."""
+    return [{"name": f"Card {i}", "index": i} for i in range(count)]
+
+
+@pytest.mark.parametrize("pipeline_depth", [1, 3])
+def test_process_batch_pipelined_keeps_order(mock_logger, pipeline_depth):
+    """Test that chunks come back in input order whatever the window."""
+    with BatchProcessor(RecordingCardProcessor(), mock_logger, max_workers=4) as processor:
+        results = list(processor.process_batch(
+            indexed_cards(90), batch_size=10, pipeline_depth=pipeline_depth
+        ))
+
+    assert [card["name"] for chunk, _ in results for card in chunk] == [f"Card {i}" for i in range(90)]
+    assert [len(chunk) for chunk, _ in results] == [10] * 9
+    assert results[-1][1].processed_cards == 90
+    mock_logger.error.assert_not_called()
+
+
+def test_process_batch_pipelined_overlaps_consumer(mock_logger):
+    """Test that the next chunks are processed while the caller holds one."""
+    import time
+
+    card_processor = RecordingCardProcessor()
+    with BatchProcessor(card_processor, mock_logger, max_workers=2) as processor:
+        batches = processor.process_batch(indexed_cards(50), batch_size=10, pipeline_depth=3)
+        next(batches)
+        time.sleep(0.2)  # The caller writes the first chunk out
+        # The next two chunks are in flight, the ones after are not
+        assert sorted(card_processor.started) == list(range(30))
+        batches.close()
+
+    card_processor = RecordingCardProcessor()
+    with BatchProcessor(card_processor, mock_logger, max_workers=2) as processor:
+        batches = processor.process_batch(indexed_cards(50), batch_size=10)
+        next(batches)
+        time.sleep(0.2)
+        assert sorted(card_processor.started) == list(range(10))
+        batches.close()
+
+
+def test_process_batch_pipelined_serial_backend(config, mock_logger, sample_cards):
+    """Test that the serial backend ignores the window."""
+    processor = BatchProcessor(CardProcessorInterface(config), mock_logger, backend="serial")
+    results = list(processor.process_batch(sample_cards * 4, batch_size=5, pipeline_depth=3))
+    assert [len(chunk) for chunk, _ in results] == [5, 5, 2]
+    assert processor._executor is None
+
+
+def test_process_batch_invalid_pipeline_depth(processor, sample_cards):
+    """Test that a window of less than one chunk is rejected."""
+    with pytest.raises(ValueError, match="pipeline_depth"):
+        list(processor.process_batch(sample_cards, pipeline_depth=0))
+
+
+def test_parallel_processor_keeps_card_order():
+    """Test that per-card futures are merged in submission order."""
+    import time
+
+    processor = ParallelProcessor(BatchErrorHandler(MockLogger()))
+    cards = [{"name": f"Card {i}"} for i in range(8)]
+
+    def process_func(card):
+        time.sleep(0.01 * (8 - int(card["name"].split()[1])))
+        return card, False, False
+
+    results, _, _ = processor.process_parallel(cards, process_func, timeout=5.0, max_workers=8)
+    assert results == cards
+
+
+def test_process_batch_pipelined_refused_submission(mock_logger):
+    """Test that chunks the pool refuses are counted as failed."""
+    with BatchProcessor(RecordingCardProcessor(), mock_logger, max_workers=2) as processor:
+        with patch.object(processor.executor, "submit", side_effect=RuntimeError("Pool is broken")):
+            results = list(processor.process_batch(indexed_cards(20), batch_size=10, pipeline_depth=2))
+
+    assert [chunk for chunk, _ in results] == [[], []]
+    assert results[-1][1].failed_cards == 20
+    assert "Pool is broken" in mock_logger.error.call_args[0][0]
+
+
+# Adaptive Sizing Tests
+
+def test_process_batch_adaptive_grows_chunks(config, mock_logger, sample_cards):
+    """Test that fast chunks grow and the decisions are reported."""
+    cards = [dict(card, name=f"{card['name']} #{i}") for i in range(200) for card in sample_cards]
+    sizer = AdaptiveBatchSizer(target_latency=10.0, min_batch_size=10)
+    processor = BatchProcessor(CardProcessorInterface(config), mock_logger, backend="serial")
+    results = [(list(chunk), stats.batch_size) for chunk, stats in processor.process_batch(
+        cards, batch_size=10, adaptive=sizer
+    )]
+
+    names = [card["name"] for chunk, _ in results for card in chunk]
+    assert names == [card["name"] for card in cards]
+    sizes = [size for _, size in results]
+    assert sizes[0] == 20 and sizes == sorted(sizes)
+
+    final_stats = list(processor.process_batch(cards, batch_size=10, adaptive=sizer))[-1][1]
+    assert final_stats.processed_cards == len(cards)
+    assert final_stats.workers == 1
+    assert final_stats.sizing_decisions[0].chunk == 0
+    assert final_stats.sizing_decisions[0].cards == 10
+    assert final_stats.batch_size == final_stats.sizing_decisions[-1].batch_size
+
+
+def test_process_batch_adaptive_workers(mock_logger):
+    """Test that the chosen worker count splits chunks, one worker running inline."""
+    sizer = AdaptiveBatchSizer(target_latency=10.0, min_batch_size=10, max_batch_size=10)
+    with BatchProcessor(RecordingCardProcessor(), mock_logger, max_workers=2) as processor:
+        with patch.object(processor, "_split_chunk", wraps=processor._split_chunk) as split:
+            results = list(processor.process_batch(indexed_cards(60), batch_size=10, adaptive=sizer))
+
+    assert [card["name"] for chunk, _ in results for card in chunk] == [f"Card {i}" for i in range(60)]
+    assert results[-1][1].sizing_decisions[0].workers == 1
+    # The first chunk is split across both workers; the second, probing one
+    # worker, runs in the calling thread
+    assert split.call_args_list[0].args[1] == 2
+    assert split.call_count < len(results)
+
+
+def test_process_batch_bounds_sizing_history(mock_logger, monkeypatch):
+    """Test that long adaptive runs keep only the latest sizing decisions."""
+    monkeypatch.setattr("src.processing.batch.MAX_SIZING_DECISIONS", 5)
+    sizer = AdaptiveBatchSizer(target_latency=10.0, min_batch_size=1, max_batch_size=1)
+    with BatchProcessor(RecordingCardProcessor(), mock_logger, max_workers=2) as processor:
+        stats = list(processor.process_batch(indexed_cards(200), batch_size=1, adaptive=sizer))[-1][1]
+
+    assert stats.sizing_changes > 5
+    assert len(stats.sizing_decisions) == 5
+    assert stats.sizing_decisions[-1].chunk > 5
+    assert stats.to_record()["sizing_decisions"] == stats.sizing_changes
+
+def test_process_batch_reports_fixed_settings(processor, sample_cards):
+    """Test that statistics report the settings when sizing is fixed."""
+    stats = list(processor.process_batch(sample_cards * 4, batch_size=5))[-1][1]
+    assert (stats.batch_size, stats.workers, list(stats.sizing_decisions)) == (5, 10, [])
+
+
+# Deadline Tests
+
+class SlowCardProcessor:
+    """Card processor that is slow on cards named "Slow", checking deadlines or not."""
+
+    def __init__(self, cooperative=True, release=None):
+        self.cooperative = cooperative
+        self.release = release
+
+    def process_card(self, card_data, filters=None, schema=None, additional_languages=None):
+        from src.processing.deadlines import checkpoint
+        import time
+        if card_data["name"].startswith("Slow"):
+            if self.release is not None:
+                self.release.wait(10)
+            for _ in range(100):
+                time.sleep(0.01)
+                if self.cooperative:
+                    checkpoint()
+        return card_data
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread"])
+def test_process_batch_quarantines_slow_cards(mock_logger, backend):
+    """Test that a slow card is stopped at a checkpoint and quarantined."""
+    import time
+    cards = [{"name": f"Card {i}"} for i in range(10)]
+    cards[3] = {"name": "Slow Card"}
+
+    start = time.perf_counter()
+    with BatchProcessor(SlowCardProcessor(), mock_logger, backend=backend, max_workers=2) as processor:
+        results = list(processor.process_batch(cards, batch_size=10, timeout=0.05))
+    assert time.perf_counter() - start < 0.8
+
+    stats = results[-1][1]
+    assert [card["name"] for card in results[-1][0]] == [card["name"] for card in cards if card["name"] != "Slow Card"]
+    assert (stats.processed_cards, stats.failed_cards) == (9, 1)
+    assert [entry.name for entry in stats.quarantined] == ["Slow Card"]
+    assert 0.05 <= stats.quarantined[0].elapsed < 0.5
+    assert "deadline" in stats.quarantined[0].reason
+    assert [entry.name for entry in processor.quarantine.since(0)[0]] == ["Slow Card"]
+    assert "quarantined" in mock_logger.warning.call_args[0][0]
+
+
+def test_process_batch_quarantines_late_cards(config, mock_logger, sample_cards):
+    """Test that cards finishing past their deadline are dropped and quarantined."""
+    processor = BatchProcessor(CardProcessorInterface(config), mock_logger, backend="serial")
+    stats = list(processor.process_batch(sample_cards, timeout=1e-9))[-1][1]
+    assert stats.processed_cards == 0
+    assert stats.failed_cards == len(sample_cards)
+    assert len(stats.quarantined) == len(sample_cards)
+
+
+def test_process_backend_quarantines_in_workers(mock_logger):
+    """Test that cards quarantined in worker processes reach the parent."""
+    cards = [{"name": f"Card {i}"} for i in range(12)]
+    cards[7] = {"name": "Slow Card"}
+    with BatchProcessor(SlowCardProcessor(), mock_logger, backend="process", max_workers=2) as processor:
+        stats = list(processor.process_batch(cards, timeout=0.2))[-1][1]
+    assert (stats.processed_cards, stats.failed_cards) == (11, 1)
+    assert [entry.name for entry in stats.quarantined] == ["Slow Card"]
+    assert "deadline" in stats.quarantined[0].reason
+
+
+def test_close_does_not_wait_for_stragglers(mock_logger):
+    """Test that shutting down does not block on tasks that ignore deadlines."""
+    import threading
+    import time
+    release = threading.Event()
+    cards = [{"name": "Slow Card"}] + [{"name": f"Card {i}"} for i in range(9)]
+    processor = BatchProcessor(SlowCardProcessor(cooperative=False, release=release), mock_logger, max_workers=2)
+    try:
+        stats = list(processor.process_batch(cards, batch_size=10, timeout=0.02))[-1][1]
+        assert stats.failed_cards == 5  # The slow card's whole sub-chunk
+        assert stats.processed_cards == 5
+
+        start = time.perf_counter()
+        processor.close()
+        assert time.perf_counter() - start < 0.5
+        assert "without waiting for 1 tasks" in mock_logger.warning.call_args[0][0]
+    finally:
+        release.set()
+
+
+def test_timed_out_tasks_are_cancelled(mock_logger):
+    """Test that an abandoned thread task skips its remaining cards."""
+    import threading
+    import time
+    release = threading.Event()
+    card_processor = SlowCardProcessor(release=release)
+    seen = []
+    original = card_processor.process_card
+
+    def process_card(card_data, *args, **kwargs):
+        seen.append(card_data["name"])
+        return original(card_data, *args, **kwargs)
+
+    card_processor.process_card = process_card
+    cards = [{"name": "Slow Card"}] + [{"name": f"Card {i}"} for i in range(9)]
+    with BatchProcessor(card_processor, mock_logger, max_workers=1) as processor:
+        processed, _, failed = processor.process_batch_chunk(cards, None, None, None, timeout=0.002)
+        assert (processed, failed) == ([], 10)
+        release.set()
+        time.sleep(0.1)
+    # The slow card stopped at its next checkpoint and the task gave up
+    assert seen == ["Slow Card"]
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_batch_statistics_time_every_card(config, mock_logger, sample_cards, backend):
+    """Test that worker counters merged per chunk account for every card."""
+    import json
+    cards = sample_cards * 10
+    with BatchProcessor(CardProcessorInterface(config), mock_logger, backend=backend, max_workers=2) as processor:
+        stats = list(processor.process_batch(cards, filters={"type": {"eq": "Creature"}}, batch_size=12))[-1][1]
+
+    assert stats.processed_cards + stats.filtered_cards == len(cards)
+    assert stats.card_latency.count == len(cards)
+    assert stats.cards_per_second > 0
+
+    record = json.loads(json.dumps(stats.to_record()))
+    assert record["processed_cards"] == stats.processed_cards
+    assert record["card_latency"]["count"] == len(cards)
+    assert record["card_latency"]["p99"] <= record["card_latency"]["max"]
+
+
+def test_batch_statistics_concurrent_updates():
+    """Test that concurrent merges and updates lose no counts."""
+    import threading
+    from src.utils.stats import WorkerCounters
+    stats = BatchStatistics()
+    counters = WorkerCounters(processed=1, filtered=1)
+    counters.latency.record(0.001)
+
+    def work():
+        for _ in range(2000):
+            stats.merge(counters)
+            stats.update(processed=1, filtered=0, failed=1)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (stats.processed_cards, stats.filtered_cards, stats.failed_cards) == (32000, 16000, 16000)
+    assert stats.card_latency.count == 16000
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_process_batch_nested_schema(config, mock_logger, backend):
+    """Test that a schema compiled once projects nested fields on every backend."""
+    cards = [
+        {"name": f"Card {i}", "type": "Creature", "legalities": {"commander": "Legal", "modern": "Banned"}}
+        for i in range(20)
+    ]
+    with BatchProcessor(CardProcessorInterface(config), mock_logger, backend=backend, max_workers=2) as processor:
+        results = [
+            card
+            for chunk, _ in processor.process_batch(cards, schema=["name", "legalities.commander"], batch_size=6)
+            for card in chunk
+        ]
+
+    assert results == [{"name": f"Card {i}", "legalities": {"commander": "Legal"}} for i in range(20)]
+    with pytest.raises(ValueError, match="foreignData"):
+        list(BatchProcessor(CardProcessorInterface(config), mock_logger).process_batch(
+            cards, schema=["foreignData.name"]
+        ))
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock
+from src.analysis.card_index import CardIndex
 from src.analysis.card_resolver import CardMatcher
 from src.utils.models import CardReference
 
@@ -68,7 +69,7 @@ def test_get_cards_from_set(matcher):
 
 def test_find_exact_match(matcher, archive_data):
     """Test the _find_exact_match method."""
-    set_data = archive_data["data"]["SET1"]
+    index = CardIndex({"data": {"SET": archive_data["data"]["SET1"]}})
     
     # Test finding exact match
     card_ref = CardReference(
@@ -77,7 +78,7 @@ def test_find_exact_match(matcher, archive_data):
         collector_number="123",
         quantity=1
     )
-    match = matcher._find_exact_match(card_ref, set_data)
+    match = matcher._find_exact_match(card_ref, index)
     assert match is not None
     assert match["name"] == "Test Card"
     assert match["number"] == "123"
@@ -89,7 +90,7 @@ def test_find_exact_match(matcher, archive_data):
         collector_number="124",
         quantity=1
     )
-    match = matcher._find_exact_match(card_ref, set_data)
+    match = matcher._find_exact_match(card_ref, index)
     assert match is not None
     assert match["name"] == "Test Card // Side B"
     
@@ -100,7 +101,7 @@ def test_find_exact_match(matcher, archive_data):
         collector_number="999",
         quantity=1
     )
-    match = matcher._find_exact_match(card_ref, set_data)
+    match = matcher._find_exact_match(card_ref, index)
     assert match is None
 
 
@@ -113,7 +114,7 @@ def test_find_fallback_match(matcher, archive_data):
         collector_number="999",
         quantity=1
     )
-    match = matcher._find_fallback_match(card_ref, archive_data)
+    match = matcher._find_fallback_match(card_ref, CardIndex(archive_data))
     assert match is not None
     assert match["name"] == "Test Card"
     
@@ -124,10 +125,29 @@ def test_find_fallback_match(matcher, archive_data):
         collector_number="999",
         quantity=1
     )
-    match = matcher._find_fallback_match(card_ref, archive_data)
+    match = matcher._find_fallback_match(card_ref, CardIndex(archive_data))
     assert match is None
 
 
+def test_find_fallback_match_stops_at_first_candidate(matcher, archive_data, capsys):
+    """Test that the fallback search ends at the first usable candidate, silently without debug."""
+    index = CardIndex(archive_data)
+    visited = []
+
+    class CountingLookup:
+        def cards_by_name(self, name):
+            for entry in index.cards_by_name(name):
+                visited.append(entry[:2])
+                yield entry
+
+    card_ref = CardReference(name="Test Card", set_code="SET", collector_number="999", quantity=1)
+    assert matcher._find_fallback_match(card_ref, CountingLookup())["number"] == "123"
+    assert visited == [("SET1", "123")]
+    assert capsys.readouterr().out == ""
+
+    matcher._find_fallback_match(card_ref, CountingLookup(), debug=True)
+    assert "Using fallback match for Test Card" in capsys.readouterr().out
+
 def test_find_card(matcher, archive_data):
     """Test the find_card method."""
     # Test exact match found
@@ -182,3 +202,52 @@ def test_find_card_with_debug(matcher, archive_data):
     
     assert match is not None
     matcher.logger.debug.assert_called_once()
+
+
+def test_card_index_lookups(archive_data):
+    """Test CardIndex lookups by set and number, by name and by front face."""
+    index = CardIndex(archive_data)
+    assert index.card_count == 4
+
+    assert [name for _, _, name, _ in index.cards_by_set_number("SET1", "124")] == ["Test Card // Side B"]
+    assert index.cards_by_set_number("SET1", "999") == []
+
+    # Exact names and front faces are merged in archive order
+    assert [(set_code, number) for set_code, number, _, _ in index.cards_by_name("Test Card")] == [
+        ("SET1", "123"), ("SET1", "124"), ("SET2", "002")
+    ]
+    assert [name for _, _, name, _ in index.cards_by_name("Side B")] == []
+    assert index.cards_by_name("Missing Card") == []
+
+
+def test_card_index_multiple_faces():
+    """Test that every leading face of a multi-face name is indexed."""
+    card = {"name": "A // B // C", "number": "1"}
+    index = CardIndex({"data": {"SET": {"cards": [card]}}})
+    assert index.cards_by_name("A")[0][3] is card
+    assert index.cards_by_name("A // B")[0][3] is card
+    assert index.cards_by_name("A // B // C")[0][3] is card
+    assert index.cards_by_name("B") == []
+
+
+def test_find_card_fallback_order(matcher, archive_data):
+    """Test that the fallback is the first match in archive order outside the requested set."""
+    archive_data = {"data": {"ONE": archive_data["data"]["SET1"], "TWO": archive_data["data"]["SET2"]}}
+
+    card_ref = CardReference(name="Test Card", set_code="ONE", collector_number="999", quantity=1)
+    assert matcher.find_card(card_ref, archive_data)["number"] == "002"
+
+    card_ref = CardReference(name="Test Card", set_code="TWO", collector_number="999", quantity=1)
+    assert matcher.find_card(card_ref, archive_data)["number"] == "123"
+
+
+def test_find_card_reuses_index(matcher, archive_data):
+    """Test that the index is built once per archive and rebuilt for another one."""
+    index = matcher.get_index(archive_data)
+    card_ref = CardReference(name="Another Card", set_code="SET", collector_number="001", quantity=1)
+    assert matcher.find_card(card_ref, archive_data) is archive_data["data"]["SET2"]["cards"][0]
+    assert matcher.get_index(archive_data) is index
+
+    other_archive = {"data": {"NEW": {"cards": [{"name": "Another Card", "number": "7"}]}}}
+    assert matcher.find_card(card_ref, other_archive)["number"] == "7"
+    assert matcher.get_index(other_archive) is not index
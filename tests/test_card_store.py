@@ -0,0 +1,146 @@
+"""Tests for the indexed card store."""
+
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.analysis.card_store import CardStore, normalize_name
+from src.analysis.card_resolver import CardMatcher
+from src.analysis.cards import CardProcessorInterface
+from src.analysis.decks import DeckExtractorService
+from src.core.config import CardFilterConfig
+from src.utils.models import CardReference
+
+
+ARCHIVE = {
+    "meta": {"version": "5.2.2"},
+    "data": {
+        "BLB": {"cards": [
+            {"name": "Shoreline Looter", "type": "Creature", "number": "70", "uuid": "u-70"},
+        ]},
+        "LCI": {"cards": [
+            {"name": "Lodestone Needle // Guidestone Compass", "type": "Artifact", "number": "62", "uuid": "u-62"},
+        ]},
+        "FDN": {"cards": [
+            {"name": "Temple of Deceit", "type": "Land", "number": "697", "uuid": "u-697"},
+        ]},
+        "THB": {"cards": [
+            {"name": "Temple of Deceit", "type": "Land", "number": "999", "uuid": "u-999"},
+        ]},
+    },
+}
+
+
+@pytest.fixture
+def archive_file(tmp_path):
+    """Write the sample archive."""
+    path = tmp_path / "cards.json"
+    path.write_text(json.dumps(ARCHIVE))
+    return path
+
+
+@pytest.fixture
+def store(archive_file, tmp_path):
+    """Build a store from the sample archive."""
+    path = tmp_path / "cards.db"
+    CardStore.build(str(archive_file), str(path))
+    with CardStore(str(path)) as card_store:
+        yield card_store
+
+
+def test_normalize_name():
+    """Test that names are keyed by their case-folded front face."""
+    assert normalize_name("Lodestone Needle // Guidestone Compass") == "lodestone needle"
+    assert normalize_name("Lodestone Needle") == "lodestone needle"
+
+
+def test_build_and_lookup(store):
+    """Test the store's index lookups."""
+    assert CardStore.is_store(store.path)
+    assert store.get_meta() == {"version": "5.2.2"}
+    assert store.card_by_uuid("u-70")["name"] == "Shoreline Looter"
+    assert store.card_by_uuid("missing") is None
+
+    [(set_code, number, name, card)] = store.cards_by_set_number("LCI", "62")
+    assert (set_code, number, name) == ("LCI", "62", "Lodestone Needle // Guidestone Compass")
+    assert card == ARCHIVE["data"]["LCI"]["cards"][0]
+
+    # Printings are returned in archive order
+    assert [entry[0] for entry in store.cards_by_name("Temple of Deceit")] == ["FDN", "THB"]
+    assert [entry[0] for entry in store.cards_by_name("lodestone needle")] == ["LCI"]
+
+
+def test_build_compressed_archive(tmp_path):
+    """Test building from a gzip compressed archive."""
+    archive = tmp_path / "cards.json.gz"
+    archive.write_bytes(gzip.compress(json.dumps(ARCHIVE).encode("utf-8")))
+
+    assert CardStore.build(str(archive), str(tmp_path / "cards.db")) == 4
+
+
+def test_build_errors(tmp_path):
+    """Test that invalid archives are reported and leave no store behind."""
+    with pytest.raises(FileNotFoundError):
+        CardStore.build(str(tmp_path / "missing.json"), str(tmp_path / "cards.db"))
+
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"data": {"BLB": {"cards": [')
+    with pytest.raises(ValueError):
+        CardStore.build(str(broken), str(tmp_path / "cards.db"))
+    assert not (tmp_path / "cards.db").exists()
+    assert not (tmp_path / "cards.db.tmp").exists()
+
+
+def test_open_invalid_store(archive_file):
+    """Test that a file that is not a store is rejected on first use."""
+    assert not CardStore.is_store(str(archive_file))
+    with pytest.raises(ValueError):
+        CardStore(str(archive_file)).get_meta()
+
+
+def test_matcher_store_matches_archive(store):
+    """Test that store lookups follow the archive matching rules."""
+    matcher = CardMatcher(Mock())
+    references = [
+        CardReference("Lodestone Needle", "LCI", "62", 1),
+        CardReference("Temple of Deceit", "THB", "245", 1),
+        CardReference("Shoreline Looter", "XXX", "1", 1),
+        CardReference("Missing Card", "BLB", "70", 1),
+    ]
+
+    for reference in references:
+        assert matcher.find_card(reference, store) == matcher.find_card(reference, ARCHIVE)
+
+
+def test_extract_deck_from_store(archive_file, tmp_path):
+    """Test that extraction from a store writes the same cards as from the archive."""
+    decklist = tmp_path / "deck.txt"
+    decklist.write_text("4 Lodestone Needle (LCI) 62\n1 Temple of Deceit (THB) 245\n1 Missing Card (XXX) 99\n")
+    service = DeckExtractorService(CardProcessorInterface(CardFilterConfig()), Mock())
+    store_path = tmp_path / "cards.db"
+    assert service.build_index(str(archive_file), str(store_path)) == 4
+
+    from_archive = tmp_path / "archive_output.json"
+    from_store = tmp_path / "store_output.json"
+    archive_stats = service.extract_deck_cards(str(archive_file), str(decklist), str(from_archive))
+    store_stats = service.extract_deck_cards(str(store_path), str(decklist), str(from_store))
+
+    assert store_stats == archive_stats
+    assert json.loads(from_store.read_text())["data"] == json.loads(from_archive.read_text())["data"]
+
+
+def test_extract_decks_from_store_in_threads(store, tmp_path):
+    """Test that worker threads can share one card store."""
+    decks = tmp_path / "decks"
+    decks.mkdir()
+    for index in range(8):
+        (decks / f"deck{index}.txt").write_text("2 Lodestone Needle (LCI) 62\n1 Test Card (XXX) 1\n")
+
+    service = DeckExtractorService(CardProcessorInterface(CardFilterConfig()), Mock())
+    stats = service.extract_decks(store.path, str(decks), str(tmp_path / "decks.jsonl"), jsonl=True, workers=4)
+
+    assert stats.decks_processed == 8
+    assert not stats.failed_decks
+    assert (stats.cards_found, stats.cards_missing) == (8, 8)
@@ -0,0 +1,312 @@
+"""Tests for the streaming card dump reader."""
+
+import bz2
+import gzip
+import io
+import lzma
+import json
+
+import ijson
+import pytest
+
+from src.io.parsers.card_stream import (
+    CardDumpScanner, CardStreamReader, ForeignDataPruner, load_input_buffer, open_input_stream
+)
+
+
+SAMPLE = {"meta": {"version": "5.2.2"}, "data": {"LEA": {"cards": [{"name": "Serra Angel"}]}}}
+
+
+class PipeStream(io.RawIOBase):
+    """Raw, non-seekable stream without peek support."""
+
+    def __init__(self, payload: bytes):
+        self._source = io.BytesIO(payload)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._source.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+@pytest.mark.parametrize("compress", [
+    lambda payload: payload,
+    gzip.compress,
+    bz2.compress,
+    lzma.compress,
+])
+def test_open_input_stream_decompresses(compress):
+    """Test transparent decompression of supported formats."""
+    payload = json.dumps(SAMPLE).encode("utf-8")
+    stream = open_input_stream(io.BytesIO(compress(payload)))
+    assert stream.read() == payload
+
+
+def test_open_input_stream_without_peek_or_seek():
+    """Test that raw pipes are wrapped rather than seeked."""
+    payload = gzip.compress(json.dumps(SAMPLE).encode("utf-8"))
+    stream = open_input_stream(PipeStream(payload))  # type: ignore[arg-type]
+    assert json.loads(stream.read()) == SAMPLE
+
+
+def test_seekable_position_preserved():
+    """Test that peeking a seekable stream leaves its position unchanged."""
+    infile = io.BytesIO(b'{"data": {}}')
+    stream = open_input_stream(infile)
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize("document", [
+    '{"meta": {"version": "5.2.2"}, "data": {}}',
+    '{"data": {}, "meta": {"version": "5.2.2"}}',
+])
+def test_reader_captures_meta_anywhere(document):
+    """Test that meta is captured before or after the data section."""
+    reader = CardStreamReader(io.BytesIO(document.encode("utf-8")))
+    events = list(reader.events())
+
+    assert reader.meta == {"version": "5.2.2"}
+    assert all(not prefix.startswith("meta") for prefix, _, _ in events)
+    assert ("data", "start_map", None) in events
+
+
+def test_reader_without_meta():
+    """Test that a missing meta section leaves meta unset."""
+    reader = CardStreamReader(io.BytesIO(b'{"data": {"LEA": {"cards": []}}}'))
+    list(reader.events())
+    assert reader.meta is None
+
+
+def test_reader_yields_floats():
+    """Test that numbers are parsed as floats rather than Decimals."""
+    reader = CardStreamReader(io.BytesIO(b'{"data": {"LEA": {"cards": [{"cmc": 2.5}]}}}'))
+    values = [value for prefix, _, value in reader.events() if prefix.endswith(".cmc")]
+    assert values == [2.5] and isinstance(values[0], float)
+
+
+def test_iter_cards_yields_whole_objects():
+    """Test that cards are streamed with nested values intact."""
+    card = {
+        "name": "Serra Angel",
+        "legalities": {"commander": "Legal"},
+        "foreignData": [{"language": "German", "name": "Serra-Engel"}],
+        "convertedManaCost": 5.0,
+    }
+    document = {"meta": {"version": "5.2.2"}, "data": {
+        "LEA": {"block": None, "cards": [card]},
+        "EMP": {"block": None, "cards": []},
+        "LEB": {"cards": [{"name": "Shivan Dragon"}]},
+    }}
+    reader = CardStreamReader(io.BytesIO(json.dumps(document).encode("utf-8")))
+
+    assert list(reader.iter_cards()) == [("LEA", card), ("LEB", {"name": "Shivan Dragon"})]
+    assert reader.meta == {"version": "5.2.2"}
+
+
+def test_iter_cards_meta_after_data():
+    """Test that trailing metadata is captured by the card iterator."""
+    document = b'{"data": {"LEA": {"cards": [{"name": "Serra Angel"}]}}, "meta": {"version": "5.2.2"}}'
+    reader = CardStreamReader(io.BytesIO(document))
+
+    assert [card["name"] for _, card in reader.iter_cards()] == ["Serra Angel"]
+    assert reader.meta == {"version": "5.2.2"}
+
+
+class ChunkedStream(io.BytesIO):
+    """In-memory stream that returns at most a few bytes per read."""
+
+    def read(self, size=-1):
+        return super().read(7 if size < 0 else min(size, 7))
+
+
+@pytest.mark.parametrize("document, meta", [
+    (b'{"data": {"LEA": {"cards": [{"name": "Serra Angel"}]}}, "meta": {"version": "5.2.2"}, "extra": [1, "}"]}',
+     {"version": "5.2.2"}),
+    (b'{"data": {"meta": {"cards": [{"name": "Serra Angel", "meta": {"a": 1}}]}},\n "meta" : {"v": "}"}\n}',
+     {"v": "}"}),
+    (b'{"data": {"LEA": {"cards": [{"name": "Serra Angel", "text": "\\",\\"meta\\": 1}"}]}}}', None),
+    (b'{"data": {"meta": {"cards": [{"name": "Serra Angel", "meta": {"a": 1}}]}}}', None),
+])
+def test_iter_sets_recovers_trailing_meta(document, meta):
+    """Test that only a top-level meta following the data section is recovered."""
+    reader = CardStreamReader(ChunkedStream(document))
+
+    assert [card["name"] for _, card in reader.iter_cards()] == ["Serra Angel"]
+    assert reader.meta == meta
+
+
+def test_iter_sets_tokenizes_data_once(monkeypatch):
+    """Test that the metadata parser stops once the first set has been read."""
+    sent = []
+    items_coro = ijson.items_coro
+
+    def recording_items_coro(*args, **kwargs):
+        coro = items_coro(*args, **kwargs)
+
+        class Recorder:
+            def send(self, chunk):
+                sent.append(chunk)
+                coro.send(chunk)
+
+            def close(self):
+                coro.close()
+
+        return Recorder()
+
+    monkeypatch.setattr(ijson, "items_coro", recording_items_coro)
+    sets = {f"S{index:02d}": {"cards": [{"name": "Serra Angel"}]} for index in range(20)}
+    document = json.dumps({"data": sets, "meta": {"version": "5.2.2"}}).encode("utf-8")
+    reader = CardStreamReader(ChunkedStream(document))
+
+    assert len(list(reader.iter_sets())) == 20
+    assert reader.meta == {"version": "5.2.2"}
+    assert sum(len(chunk) for chunk in sent) < len(document) // 10
+
+
+@pytest.mark.parametrize("document, meta_first", [
+    (b' { "meta" : {}, "data": {"LEA": {"cards": []}}}', True),
+    (b'{"other": 1, "meta": {}, "data": {"LEA": {"cards": []}}}', False),
+    (b'{"data": {"LEA": {"cards": []}}, "meta": {}}', False),
+    (b'{"data": {"LEA": {"cards": []}}}', False),
+])
+def test_meta_first_agrees_across_readers(document, meta_first):
+    """Test that the reader and the scanner agree on whether meta leads."""
+    reader = CardStreamReader(ChunkedStream(document))
+    list(reader.iter_sets())
+    scanner = CardDumpScanner(document)
+    list(scanner.iter_set_ranges())
+
+    assert reader.meta_first is meta_first
+    assert scanner.meta_first is meta_first
+
+
+def test_iter_sets_preserves_order():
+    """Test that sets are yielded in input order."""
+    document = b'{"data": {"ZZZ": {"cards": []}, "AAA": {"cards": []}}}'
+    reader = CardStreamReader(io.BytesIO(document))
+    assert [set_code for set_code, _ in reader.iter_sets()] == ["ZZZ", "AAA"]
+
+
+def test_scanner_locates_sets():
+    """Test that set ranges cover exactly each set's raw JSON."""
+    document = (
+        b'{ "meta" : {"version": "5.2.2"} , "data" : {'
+        b' "LEA" : {"cards": [{"manaCost": "{3}{W}{W}", "text": "Say \\"]}\\""}]},'
+        b' "EMP": {} } }'
+    )
+    scanner = CardDumpScanner(document)
+
+    ranges = list(scanner.iter_set_ranges())
+
+    assert [set_code for set_code, _, _ in ranges] == ["LEA", "EMP"]
+    parsed = json.loads(document)["data"]
+    for set_code, start, end in ranges:
+        assert json.loads(document[start:end]) == parsed[set_code]
+    assert scanner.meta == {"version": "5.2.2"}
+
+
+def test_scanner_meta_after_data():
+    """Test that trailing metadata and extra members are handled."""
+    document = b'{"data": {"LEA": {"cards": []}}, "extra": [1, "]"], "meta": {"version": "5.2.2"}}'
+    scanner = CardDumpScanner(document)
+
+    assert [set_code for set_code, _, _ in scanner.iter_set_ranges()] == ["LEA"]
+    assert scanner.meta == {"version": "5.2.2"}
+
+
+def test_scanner_rejects_truncated_input():
+    """Test that a truncated document raises a decode error."""
+    scanner = CardDumpScanner(b'{"data": {"LEA": {"cards": [')
+    with pytest.raises(json.JSONDecodeError):
+        list(scanner.iter_set_ranges())
+
+
+def test_load_input_buffer_maps_plain_files(tmp_path):
+    """Test that plain files are mapped and compressed ones decompressed."""
+    payload = json.dumps(SAMPLE).encode("utf-8")
+    plain = tmp_path / "cards.json"
+    plain.write_bytes(payload)
+    packed = tmp_path / "cards.json.gz"
+    packed.write_bytes(gzip.compress(payload))
+
+    with open(plain, "rb") as infile:
+        buffer = load_input_buffer(infile)
+        assert buffer[:] == payload
+        assert not isinstance(buffer, bytes)
+        buffer.close()
+    with open(packed, "rb") as infile:
+        assert load_input_buffer(infile) == payload
+
+
+def test_iter_cards_skips_excluded_sets():
+    """Test that sets rejected by the set predicate are not yielded."""
+    document = b'{"data": {"LEA": {"cards": [{"name": "A"}]}, "LEB": {"cards": [{"name": "B"}]}}}'
+    reader = CardStreamReader(io.BytesIO(document))
+
+    assert list(reader.iter_cards(lambda set_code: set_code == "LEB")) == [("LEB", {"name": "B"})]
+
+
+TRANSLATED = {"meta": {"version": "5.2.2"}, "data": {"LEA": {"cards": [
+    {
+        "name": "Serra Angel",
+        "text": "Flying, \\\"foreignData\\\": [ {\\\"language\\\": \\\"French\\\"} ]",
+        "foreignData": [
+            {"identifiers": {"language": "German"}, "language": "French", "name": "Ange de Serra [{"},
+            {"language": "German", "name": "Serra-Engel"},
+            {"language": "Japanese", "name": "セラの天使"},
+            {"name": "No language"},
+        ],
+    },
+    {"name": "Shivan Dragon", "foreignData": []},
+]}}}
+
+
+@pytest.mark.parametrize("languages", [[], ["German"], ["German", "Japanese"]])
+def test_pruner_keeps_requested_translations(languages):
+    """Test that pruning drops exactly the entries select_foreign_data would."""
+    pruner = ForeignDataPruner(languages)
+    pruned = json.loads(pruner.prune(json.dumps(TRANSLATED, ensure_ascii=False).encode("utf-8")))
+
+    expected = json.loads(json.dumps(TRANSLATED))
+    for card in expected["data"]["LEA"]["cards"]:
+        card["foreignData"] = [entry for entry in card["foreignData"] if entry.get("language") in languages]
+    assert pruned == expected
+
+
+def test_pruner_decodes_escaped_languages():
+    """Test that escaped language values and non-object entries are handled."""
+    pruner = ForeignDataPruner({"German"})
+    assert json.loads(pruner.prune(b'{"foreignData": [{"language": "Germ\\u0061n"}, {"language": "French"}]}')) == {
+        "foreignData": [{"language": "German"}]
+    }
+    assert pruner.prune(b'{"foreignData": ["German", 1]}') == b'{"foreignData": ["German", 1]}'
+    with pytest.raises(json.JSONDecodeError):
+        pruner.prune(b'{"foreignData": [{"language": "German"}')
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 64, 65536])
+def test_pruning_reader_streams_any_chunking(read_size):
+    """Test that the pruning reader matches whole-document pruning across chunk boundaries."""
+    pruner = ForeignDataPruner({"German"})
+    document = json.dumps(TRANSLATED, indent=1).encode("utf-8")
+
+    class ChunkedStream(io.BytesIO):
+        def read(self, size=-1):
+            return super().read(min(read_size, size) if size >= 0 else read_size)
+
+    reader = pruner.wrap(ChunkedStream(document))
+    pieces = []
+    while True:
+        piece = reader.read(5)
+        if not piece:
+            break
+        pieces.append(piece)
+    assert b"".join(pieces) == pruner.prune(document)
+
+    reader = CardStreamReader(pruner.wrap(ChunkedStream(document)))
+    cards = [card for _, card in reader.iter_cards()]
+    assert [entry["name"] for entry in cards[0]["foreignData"]] == ["Serra-Engel"]
+    assert reader.meta == {"version": "5.2.2"}
@@ -0,0 +1,195 @@
+"""Tests for the columnar card table."""
+
+import pytest
+
+from src.analysis.card_table import CardTable
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.filters import compile_filters
+
+
+@pytest.fixture
+def cards():
+    """Create cards covering every column kind, defaults and missing fields."""
+    return [
+        {"name": "Opt", "type": "Instant", "colors": ["U"], "manaValue": 1, "rarity": "common",
+         "setCode": "XLN", "power": None},
+        {"name": "Sol Ring", "type": "Artifact", "manaValue": 1, "rarity": "uncommon", "setCode": "C21",
+         "edhrecSaltiness": 2.5},
+        {"name": "Lightning Helix", "type": "Instant", "colors": ["R", "W"], "manaValue": 2,
+         "rarity": "uncommon", "setCode": "RAV", "convertedManaCost": 2.0},
+        {"name": "Tarmogoyf", "type": "Creature", "colors": ["G"], "manaValue": 2, "rarity": "rare",
+         "setCode": "FUT", "power": "*", "toughness": "1+*"},
+        {"name": "Serra Angel", "type": "Creature", "colors": ["W"], "manaValue": 5, "rarity": "uncommon",
+         "setCode": "M19", "power": "4", "toughness": "4", "keywords": ["Flying", "Vigilance"]},
+        {"name": "Progenitus", "type": "Creature", "colors": ["W", "U", "B", "R", "G"], "manaValue": 10,
+         "rarity": "mythic", "setCode": "CON", "power": "10", "toughness": "10"},
+        {"name": "Token", "type": "Token", "colors": [], "setCode": "TXLN", "legalities": {"commander": "Legal"}},
+    ]
+
+
+@pytest.fixture
+def table(cards):
+    """Load the cards into a table."""
+    return CardTable(cards)
+
+
+def reference(cards, filters):
+    """Rows matching the filters card by card."""
+    plan = compile_filters(filters)
+    view = CardProcessorInterface.filter_view
+    return [row for row, card in enumerate(cards) if plan.matches(view(card, plan.fields))]
+
+
+@pytest.mark.parametrize("filters", [
+    None,
+    {},
+    {"type": {"eq": "Instant"}},
+    {"type": {"in": ["Instant", "Artifact"]}},
+    {"manaValue": {"gt": 1}},
+    {"manaValue": {"gte": 2, "lt": 10}},
+    {"manaValue": {"lte": 2}, "colors": {"contains": "W"}},
+    {"convertedManaCost": {"eq": 0}},
+    {"convertedManaCost": {"gte": 2}},
+    {"edhrecSaltiness": {"gt": 1}},
+    {"colors": {"eq": []}},
+    {"colors": {"contains": "U"}},
+    {"rarity": {"in": ["rare", "mythic"]}},
+    {"rarity": {"in": ["uncommon", "mythic"]}, "type": {"eq": "Creature"}},
+    {"setCode": {"eq": "XLN"}},
+    {"power": {"gte": 4}},
+    {"power": {"eq": None}},
+    {"toughness": {"contains": "*"}},
+    {"keywords": {"contains": "Flying"}},
+    {"legalities": {"eq": {"commander": "Legal"}}},
+    {"name": {"contains": "Ring"}, "rarity": {"eq": "uncommon"}},
+    {"rarity": {"not_in": ["common", "uncommon"]}},
+    {"keywords": {"contains_any": ["Haste", "Vigilance"]}},
+    {"colors": {"contains_all": ["W", "U"]}},
+    {"$or": [{"rarity": {"eq": "mythic"}}, {"colors": {"eq": []}}]},
+    {"$not": {"type": {"eq": "Creature"}}, "manaValue": {"lte": 2}},
+    {"$not": {"keywords": {}}},
+    {"$and": [{"$or": [{"type": {"eq": "Instant"}}, {"manaValue": {"gte": 5}}]}, {"$not": {"colors": {"contains": "R"}}}]},
+])
+def test_queries_match_card_filtering(cards, table, filters):
+    """Test that every operator selects the rows per-card filtering selects."""
+    expected = reference(cards, filters)
+
+    assert table.select(filters) == expected
+    assert table.select(compile_filters(filters)) == expected
+    assert table.count(filters) == len(expected)
+
+
+def test_masks_combine(cards, table):
+    """Test that masks combine with integer operators."""
+    instants = table.mask({"type": {"eq": "Instant"}})
+    cheap = table.mask({"manaValue": {"lte": 1}})
+
+    assert table.rows(instants & cheap) == [0]
+    assert table.rows(instants | cheap) == [0, 1, 2]
+    assert table.mask({"type": {"eq": "Land"}}) == 0
+    assert table.rows(0) == []
+
+
+def test_columns_load_lazily(table):
+    """Test that default columns load up front and others on first use."""
+    assert set(table._columns) >= {"manaValue", "colors", "rarity", "type", "setCode"}
+    assert "keywords" not in table._columns
+
+    table.select({"keywords": {"contains": "Flying"}})
+    column = table._columns["keywords"]
+    table.select({"keywords": {"contains": "Vigilance"}})
+    assert table.column("keywords") is column
+
+
+def test_values_are_encoded_once(table):
+    """Test that equal values share a code, and that types stay apart."""
+    assert table.column("rarity").values[1:] == ["common", "uncommon", "rare", "mythic"]
+    assert table.column("colors").values.count([]) == 1
+    assert len(table.column("convertedManaCost").values) == 3
+
+    mixed = CardTable([{"x": 1}, {"x": True}, {"x": 1.0}, {"x": 1}], columns=["x"])
+    assert len(mixed.column("x").values) == 4
+    assert mixed.select({"x": {"eq": 1}}) == [0, 1, 2, 3]
+
+
+def test_high_cardinality_columns():
+    """Test that columns with more distinct values than byte codes still mask."""
+    cards = [{"number": str(i), "manaValue": i % 7} for i in range(600)] + [{"manaValue": 0}]
+    table = CardTable(cards, columns=["number", "manaValue"])
+
+    assert table.column("number")._codes is None
+    for filters in (
+        {"number": {"in": ["3", "299", "599"]}},
+        {"number": {"gte": 590}, "manaValue": {"eq": 2}},
+        {"number": {"lte": 10}},
+    ):
+        assert table.select(filters) == reference(cards, filters)
+
+
+def test_records_project_matching_cards(cards, table):
+    """Test that records equal the output of card-by-card processing."""
+    processor = CardProcessorInterface(CardFilterConfig())
+    filters = {"type": {"eq": "Creature"}, "manaValue": {"lt": 10}}
+    schema = ["name", "legalities.commander", "colors"]
+    expected = [
+        result for result in (processor.process_card(card, filters, schema) for card in cards)
+        if result is not None
+    ]
+
+    assert table.records(filters, schema=schema) == expected
+    assert table.records({"setCode": {"eq": "TXLN"}}, schema=schema) == [
+        {"name": "Token", "legalities": {"commander": "Legal"}, "colors": []},
+    ]
+    assert table.records({"name": {"eq": "Opt"}}) == [processor.process_card(cards[0])]
+
+
+def test_from_archive_and_invalid_filters():
+    """Test loading an archive in order and rejecting invalid conditions."""
+    table = CardTable.from_archive({"data": {
+        "A": {"cards": [{"name": "One", "type": "Land"}]},
+        "B": {"cards": [{"name": "Two", "type": "Land"}, {"name": "Three", "type": "Land"}]},
+        "C": {},
+    }})
+
+    assert len(table) == 3
+    assert [table.cards[row]["name"] for row in table.select({"type": {"eq": "Land"}})] == ["One", "Two", "Three"]
+    assert len(CardTable([])) == 0 and CardTable([]).select(None) == []
+    with pytest.raises(ValueError):
+        table.select({"type": {"bogus": 1}})
+
+
+def test_identity_index(cards, table):
+    """Test that identity lookups select the cards allowed under each identity."""
+    identities = [["U"], ["W"], ["R", "W"], ["G"], ["W"], ["W", "U", "B", "R", "G"]]
+    cards = [dict(card, colorIdentity=identity) for card, identity in zip(cards, identities)] + cards[6:]
+    table = CardTable(cards)
+
+    assert table.rows(table.identity_mask("W")) == [1, 4, 6]
+    assert table.rows(table.identity_mask(["U", "W"])) == [0, 1, 4, 6]
+    assert table.rows(table.identity_mask([])) == [6]
+    assert table.count({"colorIdentity": {"subset": "RW"}}) == table.identity_mask("WR").bit_count() == 4
+    for identity in ("", "G", "UB", "WUBRG", "RG"):
+        assert table.rows(table.identity_mask(identity)) == reference(
+            cards, {"colorIdentity": {"subset": identity}}
+        )
+    assert table.identity_mask("W") is table.identity_mask("W")
+    with pytest.raises(ValueError):
+        table.identity_mask("WX")
+
+
+@pytest.mark.parametrize("filters", [
+    {"colors": {"superset": "W"}},
+    {"colors": {"exact": "RW"}},
+    {"colors": {"any": "UG"}, "manaValue": {"lte": 2}},
+    {"colorIdentity": {"subset": "G"}},
+])
+def test_color_queries_match_card_filtering(cards, table, filters):
+    """Test that color operators select the rows per-card filtering selects."""
+    assert table.select(filters) == reference(cards, filters)
+
+
+def test_non_numeric_values_do_not_match(table):
+    """Test that values a numeric condition cannot convert fail it, even negated."""
+    assert table.select({"power": {"gte": 4}}) == [4, 5]
+    assert table.select({"$not": {"power": {"gte": 4}}}) == [0, 1, 2, 3, 6]
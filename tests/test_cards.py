@@ -164,6 +164,7 @@ def test_filter_strategy():
     assert strategy.evaluate_condition(2, 3, "lt")
     assert strategy.evaluate_condition(3, 3, "gte")
     assert strategy.evaluate_condition(3, 3, "lte")
+    assert not strategy.evaluate_condition("*", 2, "gt")
     assert strategy.evaluate_condition(3, 3, "eq")
     
     # Test string operations
@@ -192,16 +193,24 @@ def test_error_handling(processor):
         )
     assert "invalid operator" in str(exc_info.value).lower()
     
-    # Test invalid numeric comparison
+    # Test invalid numeric filter value
     with pytest.raises(ValueError) as exc_info:
         processor.process_card(
-            {"name": "Test", "type": "Creature", "power": "X"},
-            {"power": {"gt": "2"}},
+            {"name": "Test", "type": "Creature", "power": "2"},
+            {"power": {"gt": "X"}},
             None,
             None
         )
     assert "invalid value type" in str(exc_info.value).lower()
 
+    # Non-numeric card values fail numeric comparisons
+    assert processor.process_card(
+        {"name": "Test", "type": "Creature", "power": "X"},
+        {"power": {"gt": "2"}},
+        None,
+        None
+    ) is None
+
 
 def test_process_card_with_schema_only(processor):
     """Test processing card with only schema specified."""
@@ -246,3 +255,68 @@ def test_process_card_with_languages_only(processor):
     assert result is not None
     assert len(result["foreignData"]) == 1
     assert result["foreignData"][0]["language"] == "Japanese"
+
+
+def test_filter_plan_reused(processor):
+    """Test that equal filters reuse one compiled plan and edits recompile it."""
+    filters = {"convertedManaCost": {"lt": 4}}
+    card = {"name": "Test Card", "type": "Creature", "convertedManaCost": 3}
+
+    plan = processor.get_filter_plan(filters)
+    assert processor.process_card(card, filters) is not None
+    assert processor.get_filter_plan(filters) is plan
+    assert processor.get_filter_plan(plan) is plan
+
+    filters["convertedManaCost"] = {"gt": 4}
+    assert processor.process_card(card, filters) is None
+    assert processor.get_filter_plan(filters) is not plan
+
+
+def test_filters_see_defaults_without_copy(processor):
+    """Test that raw cards are filtered with create_base_card defaults."""
+    card = {"name": "Test Card", "type": "Creature"}
+
+    assert processor.filter_view(card, ("name",)) is card
+    assert processor.filter_view(card, ("colors", "power")) == {"colors": []}
+    assert processor.process_card(card, {"convertedManaCost": {"eq": 0}}) is not None
+    assert processor.process_card(card, {"colors": {"contains": "W"}}) is None
+    assert processor.process_card(card, {"power": {"eq": "2"}}) is None
+
+
+@pytest.mark.parametrize("schema", [
+    None,
+    [],
+    ["name", "type"],
+    ["name", "foreignData", "colors", "language", "power"],
+    ["foreignData", "text", "availability"],
+])
+@pytest.mark.parametrize("languages", [None, [], ["German"]])
+def test_project_card_matches_copying_pipeline(processor, schema, languages):
+    """Test that the one-dict projection equals the former copy-based steps."""
+    cards = [
+        {
+            "name": "Full Card", "type": "Creature", "colors": ["W"], "text": "Flying",
+            "language": "English", "rulings": [{"text": "A ruling"}],
+            "foreignData": [{"language": "German", "name": "Karte"}, {"language": "French", "name": "Carte"}],
+        },
+        {"name": "Bare Card", "type": "Instant", "power": "2"},
+    ]
+    for card in cards:
+        original = {key: value for key, value in card.items()}
+        expected = processor._apply_final_schema(
+            processor._process_language_data(processor.create_base_card(card), card, languages), schema
+        )
+        result = processor.project_card(card, schema, languages)
+
+        assert result == expected
+        assert list(result) == list(expected)
+        assert card == original
+
+
+def test_project_card_copies_list_defaults(processor):
+    """Test that list defaults given to missing fields are not shared."""
+    first = processor.process_card({"name": "A", "type": "Instant"}, schema=["colors"])
+    second = processor.process_card({"name": "B", "type": "Instant"}, schema=None)
+    first["colors"].append("W")
+    assert second["colors"] == []
+    assert processor.process_card({"name": "C", "type": "Instant"}, schema=["colors"]) == {"colors": []}
@@ -205,3 +205,45 @@ def test_extract_deck_basic(temp_files, mock_container, mock_service, monkeypatc
         schema=None,
         debug=False  # Added debug parameter with default value
     )
+
+
+def test_no_progress_flag(temp_files, mock_container, mock_service, monkeypatch):
+    """Test that --no-progress disables progress reporting."""
+    test_args = ["prog", "filter", temp_files["input"], temp_files["output"], "--no-progress"]
+    monkeypatch.setattr("sys.argv", test_args)
+
+    with patch("src.interface.cli.CardFilterService", return_value=mock_service), \
+         patch("sys.exit") as mock_exit:
+        main()
+        mock_exit.assert_not_called()
+
+    _, kwargs = mock_service.process_cards.call_args
+    assert kwargs.get("show_progress") is False
+
+
+def test_workers_flag(temp_files, mock_container, mock_service, monkeypatch):
+    """Test that --workers is passed to the filter service."""
+    test_args = ["prog", "filter", temp_files["input"], temp_files["output"], "--workers", "4"]
+    monkeypatch.setattr("sys.argv", test_args)
+
+    with patch("src.interface.cli.CardFilterService", return_value=mock_service), \
+         patch("sys.exit") as mock_exit:
+        main()
+        mock_exit.assert_not_called()
+
+    _, kwargs = mock_service.process_cards.call_args
+    assert kwargs.get("workers") == 4
+
+
+def test_prune_translations_flag(temp_files, mock_container, mock_service, monkeypatch):
+    """Test that --prune-translations is passed to the filter service."""
+    test_args = ["prog", "filter", temp_files["input"], temp_files["output"], "--prune-translations"]
+    monkeypatch.setattr("sys.argv", test_args)
+
+    with patch("src.interface.cli.CardFilterService", return_value=mock_service), \
+         patch("sys.exit") as mock_exit:
+        main()
+        mock_exit.assert_not_called()
+
+    _, kwargs = mock_service.process_cards.call_args
+    assert kwargs.get("prune_translations") is True
@@ -3,8 +3,10 @@
 import pytest
 import json
 from unittest.mock import Mock, patch, mock_open
-from src.interface.cli import main, handle_extract_deck_command
-from src.utils.models import DeckListStats
+from src.interface.cli import (
+    main, handle_extract_deck_command, handle_extract_decks_command, handle_build_index_command
+)
+from src.utils.models import DeckBatchStats, DeckListStats
 
 
 @pytest.fixture
@@ -351,3 +353,89 @@ def test_extract_deck_statistics_output(mock_print, mock_container, sample_files
     mock_print.assert_any_call("Cards found: 3")
     mock_print.assert_any_call("Cards missing: 1")
     mock_print.assert_any_call("Success rate: 75.0%")
+
+
+def test_build_index_command(mock_container, sample_files, capsys):
+    """Test that build-index delegates to the deck extractor service."""
+    store = str(sample_files["archive"]) + ".db"
+    args = Mock(command="build-index", archive=str(sample_files["archive"]), store=store)
+    mock_container.deck_extractor_service.return_value.build_index.return_value = 2
+
+    handle_build_index_command(args, mock_container)
+
+    mock_container.deck_extractor_service.return_value.build_index.assert_called_once_with(
+        str(sample_files["archive"]), store
+    )
+    assert "Indexed 2 cards" in capsys.readouterr().out
+
+
+def test_build_index_command_error(mock_container, sample_files):
+    """Test that build-index exits on a missing archive."""
+    args = Mock(command="build-index", archive="missing.json", store="cards.db")
+    mock_container.deck_extractor_service.return_value.build_index.side_effect = FileNotFoundError("missing")
+
+    with pytest.raises(SystemExit):
+        handle_build_index_command(args, mock_container)
+
+
+def test_extract_decks_command(mock_container, sample_files, capsys):
+    """Test that extract-decks delegates to the service and reports aggregated statistics."""
+    args = Mock(
+        command="extract-decks",
+        archive=str(sample_files["archive"]),
+        decklists="decks/*.txt",
+        output="decks.jsonl",
+        schema=None,
+        jsonl=True,
+        workers=2,
+        debug=False
+    )
+    stats = DeckBatchStats(cards_found=3, cards_missing=1, total_cards=4, decks_processed=2)
+    stats.failed_decks["decks/empty.txt"] = "No valid card references found in deck list"
+    mock_container.deck_extractor_service.return_value.extract_decks.return_value = stats
+
+    handle_extract_decks_command(args, mock_container)
+
+    mock_container.deck_extractor_service.return_value.extract_decks.assert_called_once_with(
+        archive_path=str(sample_files["archive"]),
+        decklists="decks/*.txt",
+        output_path="decks.jsonl",
+        schema=None,
+        jsonl=True,
+        workers=2,
+        debug=False
+    )
+    output = capsys.readouterr().out
+    assert "decks/empty.txt: No valid card references" in output
+    assert "Decks extracted: 2" in output
+    assert "Success rate: 75.0%" in output
+
+
+def test_extract_decks_command_error(mock_container):
+    """Test that extract-decks exits when no deck list is found."""
+    args = Mock(command="extract-decks", archive="cards.json", decklists="missing/", output="out",
+                schema=None, jsonl=False, workers=1, debug=False)
+    mock_container.deck_extractor_service.return_value.extract_decks.side_effect = FileNotFoundError("missing")
+
+    with pytest.raises(SystemExit):
+        handle_extract_decks_command(args, mock_container)
+
+
+def test_extract_decks_end_to_end(sample_files, tmp_path, monkeypatch):
+    """Test extract-decks through main against real files."""
+    archive = tmp_path / "typed_cards.json"
+    archive.write_text(json.dumps({
+        "data": {"BLB": {"cards": [{"name": "Test Card", "setCode": "BLB", "number": "1", "type": "Creature"}]}}
+    }))
+    decks = tmp_path / "decks"
+    decks.mkdir()
+    for name in ("one", "two"):
+        (decks / f"{name}.txt").write_text(sample_files["decklist"].read_text())
+    output = tmp_path / "decks.jsonl"
+
+    monkeypatch.setattr("sys.argv", [
+        "orthodoxy", "extract-decks", str(archive), str(decks), str(output), "--jsonl"
+    ])
+    main()
+
+    assert [json.loads(line)["deck"] for line in output.read_text().splitlines()] == ["one", "two"]
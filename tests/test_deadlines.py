@@ -0,0 +1,89 @@
+"""Tests for per-card deadlines, cancellation and quarantine."""
+
+import threading
+import time
+
+import pytest
+
+from src.core.errors import CardProcessingError, CardTimeoutError
+from src.processing.deadlines import Quarantine, card_deadline, checkpoint
+
+
+def test_checkpoint_without_deadline():
+    """Test that checkpoints do nothing outside a deadline."""
+    checkpoint()
+
+
+def test_checkpoint_after_deadline():
+    """Test that a checkpoint stops a card past its deadline."""
+    with card_deadline(0.01) as deadline:
+        checkpoint()
+        time.sleep(0.02)
+        assert deadline.expired
+        with pytest.raises(CardTimeoutError, match="deadline") as error:
+            checkpoint()
+    assert isinstance(error.value, CardProcessingError)
+    assert error.value.elapsed >= 0.02
+    assert not error.value.cancelled
+
+    # The deadline is no longer current once the block is left
+    checkpoint()
+
+
+def test_deadline_restart():
+    """Test that restarting a deadline gives the next card its full time."""
+    with card_deadline(0.05) as deadline:
+        time.sleep(0.06)
+        assert deadline.expired
+        deadline.restart()
+        assert not deadline.expired
+        checkpoint()
+
+
+def test_checkpoint_after_cancellation():
+    """Test that a checkpoint stops a cancelled card."""
+    cancel = threading.Event()
+    with card_deadline(None, cancel):
+        checkpoint()
+        cancel.set()
+        with pytest.raises(CardTimeoutError, match="cancelled") as error:
+            checkpoint()
+    assert error.value.cancelled
+
+
+def test_deadlines_are_per_thread():
+    """Test that a deadline entered in one thread does not affect another."""
+    errors = []
+
+    def other_thread():
+        try:
+            checkpoint()
+        except CardTimeoutError as e:
+            errors.append(e)
+
+    with card_deadline(0.0):
+        time.sleep(0.001)
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+    assert errors == []
+
+
+def test_quarantine_since_and_bound():
+    """Test that the quarantine keeps the latest entries and reports new ones."""
+    quarantine = Quarantine(size=3)
+    entry = quarantine.add("Slow Card", 1.5, "Too slow")
+    assert (entry.name, entry.elapsed, entry.reason) == ("Slow Card", 1.5, "Too slow")
+
+    entries, mark = quarantine.since(0)
+    assert entries == [entry] and mark == 1
+
+    for i in range(4):
+        quarantine.add(f"Card {i}", 0.1, "Too slow")
+    entries, mark = quarantine.since(mark)
+    assert [e.name for e in entries] == ["Card 1", "Card 2", "Card 3"]
+    assert (len(quarantine), quarantine.total, mark) == (3, 5, 5)
+    assert quarantine.since(mark) == ([], 5)
+
+    quarantine.clear()
+    assert len(quarantine) == 0 and quarantine.total == 5
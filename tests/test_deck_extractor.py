@@ -4,7 +4,8 @@ import pytest
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch
-from src.analysis.decks import DeckExtractorService
+from src.analysis.card_index import CardIndex
+from src.analysis.decks import DeckExtractorService, find_deck_lists
 from src.analysis.cards import CardProcessorInterface
 from src.utils.models import DeckListStats
 from src.core.config import CardFilterConfig
@@ -504,3 +505,89 @@ def test_get_required_fields_attribute_errors(deck_extractor):
         }
     }
     assert deck_extractor._get_required_fields(schema3) is None
+
+
+@pytest.fixture
+def deck_directory(tmp_path, sample_decklist) -> Path:
+    """Creates a directory of deck lists, one of them empty."""
+    directory = tmp_path / "decks"
+    directory.mkdir()
+    (directory / "alpha.txt").write_text(sample_decklist.read_text())
+    (directory / "beta.txt").write_text("4 Shoreline Looter (BLB) 70\n")
+    (directory / "empty.txt").write_text("\n")
+    (directory / ".hidden").write_text("1 Shoreline Looter (BLB) 70\n")
+    return directory
+
+
+def test_find_deck_lists(deck_directory):
+    """Test listing deck lists from a directory and from a glob pattern."""
+    expected = [str(deck_directory / name) for name in ("alpha.txt", "beta.txt", "empty.txt")]
+    assert find_deck_lists(str(deck_directory)) == expected
+    assert find_deck_lists(str(deck_directory / "*.txt")) == expected
+    assert find_deck_lists(str(deck_directory.parent / "**" / "b*.txt")) == [expected[1]]
+
+    with pytest.raises(FileNotFoundError):
+        find_deck_lists(str(deck_directory / "*.dek"))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_extract_decks_to_directory(deck_extractor, sample_archive, deck_directory, tmp_path, workers):
+    """Test batch extraction writing one file per deck with aggregated statistics."""
+    output_dir = tmp_path / "out"
+    stats = deck_extractor.extract_decks(
+        str(sample_archive), str(deck_directory), str(output_dir), workers=workers
+    )
+
+    assert isinstance(stats, DeckListStats)
+    assert stats.decks_processed == 2
+    assert list(stats.failed_decks) == [str(deck_directory / "empty.txt")]
+    assert stats.total_cards == 7
+    assert stats.cards_found == 6
+    assert stats.cards_missing == 1
+
+    assert sorted(path.name for path in output_dir.iterdir()) == ["alpha.json", "beta.json"]
+    beta = json.loads((output_dir / "beta.json").read_text())
+    assert [card["name"] for card in beta["data"]["deck"]["cards"]] == ["Shoreline Looter"]
+
+    # The single-deck path writes the same cards
+    single_output = tmp_path / "alpha.json"
+    deck_extractor.extract_deck_cards(str(sample_archive), str(deck_directory / "alpha.txt"), str(single_output))
+    single = json.loads(single_output.read_text())["data"]
+    assert json.loads((output_dir / "alpha.json").read_text())["data"] == single
+
+
+def test_extract_decks_to_jsonl(deck_extractor, sample_archive, deck_directory, tmp_path):
+    """Test batch extraction writing a JSON Lines file in deck list order."""
+    output_file = tmp_path / "decks.jsonl"
+    stats = deck_extractor.extract_decks(
+        str(sample_archive), str(deck_directory / "*.txt"), str(output_file), jsonl=True
+    )
+
+    lines = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert [line["deck"] for line in lines] == ["alpha", "beta"]
+    assert lines[1]["path"] == str(deck_directory / "beta.txt")
+    assert len(lines[0]["cards"]) == stats.cards_found - 1
+
+
+def test_extract_decks_loads_archive_once(deck_extractor, sample_archive, deck_directory, tmp_path):
+    """Test that the archive is loaded and indexed once for the whole batch."""
+    with patch.object(deck_extractor, "_load_archive", wraps=deck_extractor._load_archive) as load_archive, \
+            patch("src.analysis.card_resolver.CardIndex", wraps=CardIndex) as index_class:
+        deck_extractor.extract_decks(str(sample_archive), str(deck_directory), str(tmp_path / "out"))
+
+    load_archive.assert_called_once_with(str(sample_archive))
+    index_class.assert_called_once()
+
+
+def test_extract_decks_duplicate_names(deck_extractor, sample_archive, deck_directory, tmp_path):
+    """Test that deck lists sharing an output name are rejected before extraction."""
+    (deck_directory / "beta.dek").write_text("4 Shoreline Looter (BLB) 70\n")
+
+    with pytest.raises(ValueError, match="beta"):
+        deck_extractor.extract_decks(str(sample_archive), str(deck_directory), str(tmp_path / "out"))
+
+    # Names may repeat in a JSON Lines file
+    stats = deck_extractor.extract_decks(
+        str(sample_archive), str(deck_directory), str(tmp_path / "decks.jsonl"), jsonl=True
+    )
+    assert stats.decks_processed == 3
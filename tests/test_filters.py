@@ -3,7 +3,18 @@
 This module contains tests for the filter functions used in card filtering.
 """
 
-from src.processing.filters import get_operator_function
+import pickle
+import random
+import sys
+import threading
+
+import pytest
+
+from src.analysis.cards import FilterStrategy
+from src.processing.filters import (
+    NOT_A_NUMBER, AllOf, AnyOf, Condition, FilterNode, FilterPlan, Not, coerce_number, color_mask,
+    compile_filters, get_operator_function, parse_filter,
+)
 
 
 def test_get_operator_function():
@@ -38,3 +49,372 @@ def test_get_operator_function():
 
     # Test invalid filter operation
     assert get_operator_function("invalid") is None
+
+
+def test_compile_filters():
+    """Tests that compiled plans match the per-operator semantics."""
+    plan = compile_filters({
+        "colors": {"contains": "W"},
+        "convertedManaCost": {"gte": "1", "lte": 4},
+    })
+
+    assert plan({"colors": ["W"], "convertedManaCost": 3.0}) is True
+    assert plan({"colors": ["W"], "convertedManaCost": "4"}) is True
+    assert plan({"colors": ["U"], "convertedManaCost": 3.0}) is False
+    assert plan({"colors": ["W"], "convertedManaCost": 5.0}) is False
+    assert plan({"colors": ["W"]}) is False  # Missing field
+    assert plan.fields == ("colors", "convertedManaCost")
+
+    # An empty or missing filter matches every card
+    assert compile_filters(None)({}) is True
+    assert compile_filters({})({"name": "Any"}) is True
+
+
+def test_compile_filters_validates_once():
+    """Tests that invalid filters are rejected when compiled."""
+    with pytest.raises(ValueError, match="Invalid operator"):
+        compile_filters({"name": {"invalid": "value"}})
+    with pytest.raises(ValueError, match="numeric operator"):
+        compile_filters({"power": {"gt": "X"}})
+    with pytest.raises(ValueError, match="mapping of operators"):
+        compile_filters({"type": "Creature"})
+
+    plan = compile_filters({"power": {"gt": 2}})
+    assert plan({"power": "*"}) is False
+
+
+def test_filter_plan_pickles():
+    """Tests that plans survive pickling for worker processes."""
+    plan = pickle.loads(pickle.dumps(compile_filters({"type": {"eq": "Instant"}})))
+
+    assert isinstance(plan, FilterPlan)
+    assert plan({"type": "Instant"}) is True
+    assert plan({"type": "Sorcery"}) is False
+
+
+def test_filter_plan_set_codes():
+    """Tests that setCode conditions restrict the sets that can match."""
+    assert compile_filters({"colors": {"contains": "W"}}).set_codes is None
+    assert compile_filters({"setCode": {"eq": "BLB"}}).set_codes == {"BLB"}
+
+    plan = compile_filters({"setCode": {"in": ["BLB", "DSK"], "eq": "DSK"}})
+    assert plan.set_codes == {"DSK"}
+    assert plan.may_match_set("DSK") is True
+    assert plan.may_match_set("BLB") is False
+
+    # Substring membership does not restrict the set code
+    assert compile_filters({"setCode": {"in": "BLBDSK"}}).set_codes is None
+
+
+def test_coerce_number():
+    """Tests that values are read as numbers once, without raising."""
+    assert coerce_number("3") == 3.0
+    assert coerce_number("2.5") == 2.5
+    assert coerce_number(4) == 4.0
+    number = 1.5
+    assert coerce_number(number) is number
+    assert coerce_number("3") is coerce_number("3")
+    for value in ("*", "1+*", "", None, [1]):
+        assert coerce_number(value) is NOT_A_NUMBER
+
+
+def test_numeric_operators_on_non_numeric_strings():
+    """Tests that strings such as "*" compare false, per card and compiled."""
+    assert get_operator_function("gte")("*", 2) is False
+    assert get_operator_function("lt")("1+*", 2) is False
+    assert get_operator_function("lte")("2", "*") is False
+
+    plan = compile_filters({"power": {"gte": 2}}, sample_size=0)
+    assert plan({"power": "3"}) is True
+    assert plan({"power": 1.0}) is False
+    assert plan({"power": "*"}) is False
+    assert plan({"power": None}) is False
+    assert compile_filters({"$not": {"power": {"gte": 2}}})({"power": "1+*"}) is True
+    with pytest.raises(ValueError, match="Invalid value type"):
+        compile_filters({"power": {"gte": "*"}})
+
+def test_color_mask():
+    """Tests the WUBRG bitmask encoding of colors."""
+    assert color_mask([]) == 0
+    assert color_mask("WUBRG") == 31
+    assert color_mask(["U", "W"]) == color_mask("WU") == 3
+    with pytest.raises(ValueError):
+        color_mask(["W", "C"])
+    with pytest.raises(ValueError):
+        color_mask(None)
+
+
+@pytest.mark.parametrize("op, filter_value, card_value, expected", [
+    ("subset", "WU", ["W"], True),
+    ("subset", "WU", [], True),
+    ("subset", "WU", ["U", "W"], True),
+    ("subset", "WU", ["W", "B"], False),
+    ("subset", [], ["G"], False),
+    ("superset", "WU", ["W", "U", "B"], True),
+    ("superset", "WU", ["W"], False),
+    ("superset", [], [], True),
+    ("exact", "WU", ["U", "W"], True),
+    ("exact", "WU", ["W"], False),
+    ("exact", [], [], True),
+    ("any", "WG", ["R", "G"], True),
+    ("any", "WG", ["U"], False),
+    ("any", "WUBRG", [], False),
+    ("subset", "WU", None, False),
+    ("subset", "WU", ["W", "X"], False),
+    ("any", "W", [["W"]], False),
+])
+def test_color_operators(op, filter_value, card_value, expected):
+    """Tests that compiled and per-card color operators agree."""
+    assert compile_filters({"colorIdentity": {op: filter_value}})({"colorIdentity": card_value}) is expected
+    assert get_operator_function(op)(card_value, filter_value) is expected
+    assert FilterStrategy.evaluate_condition(card_value, filter_value, op) is expected
+
+
+def test_color_operators_validate_colors():
+    """Tests that filter colors are validated when compiled."""
+    with pytest.raises(ValueError, match="color operator subset"):
+        compile_filters({"colorIdentity": {"subset": "WX"}})
+    with pytest.raises(ValueError, match="color operator any"):
+        compile_filters({"colors": {"any": 3}})
+    assert get_operator_function("subset")(["W"], 3) is False
+
+
+@pytest.mark.parametrize("op, filter_value, card_value, expected", [
+    ("in", ["Opt", "Ponder"], "Opt", True),
+    ("in", ["Opt", "Ponder"], "Brainstorm", False),
+    ("in", [1, 2], 1.0, True),
+    ("in", "Instant Sorcery", "Sorcery", True),
+    ("in", [["W"], ["U"]], ["W"], True),
+    ("in", ["W"], ["W"], False),
+    ("in", ["W"], None, False),
+    ("not_in", ["Opt", "Ponder"], "Brainstorm", True),
+    ("not_in", ["Opt", "Ponder"], "Opt", False),
+    ("not_in", ["W"], ["W"], True),
+    ("not_in", None, "Opt", False),
+    ("contains_any", ["Flying", "Haste"], ["Haste", "Trample"], True),
+    ("contains_any", ["Flying", "Haste"], ["Trample"], False),
+    ("contains_any", [], ["Trample"], False),
+    ("contains_any", ["Haste"], "Flying, Haste", True),
+    ("contains_any", [{"a": 1}], [{"a": 1}], True),
+    ("contains_any", ["Haste"], [{"a": 1}], False),
+    ("contains_any", ["Haste"], None, False),
+    ("contains_all", ["Flying", "Haste"], ("Haste", "Flying", "Trample"), True),
+    ("contains_all", ["Flying", "Haste"], ["Flying"], False),
+    ("contains_all", [], [], True),
+    ("contains_all", [], None, False),
+    ("contains_all", ["Fly", "ing"], "Flying", True),
+])
+def test_membership_operators(op, filter_value, card_value, expected):
+    """Tests that compiled and per-card membership operators agree."""
+    assert get_operator_function(op)(card_value, filter_value) is expected
+    assert compile_filters({"field": {op: filter_value}})({"field": card_value}) is expected
+
+
+def test_membership_operators_use_sets():
+    """Tests that large value lists are tested against a set built once."""
+    names = [f"Card {i}" for i in range(5000)]
+    plan = compile_filters({"name": {"in": names}, "keywords": {"contains_any": names[:100]}})
+
+    assert plan({"name": "Card 4999", "keywords": ["Card 42"]}) is True
+    assert plan({"name": "Card 5000", "keywords": ["Card 42"]}) is False
+    assert plan.conditions["name"]["in"] == names
+
+    with pytest.raises(ValueError, match="requires a list"):
+        compile_filters({"keywords": {"contains_all": "Flying"}})
+    assert get_operator_function("contains_any")(["Flying"], "Flying") is False
+
+
+@pytest.mark.parametrize("op, filter_value, card_value, expected", [
+    ("regex", r"draw (a|two) cards?", "When this enters, draw a card.", True),
+    ("regex", r"^draw", "When this enters, draw a card.", False),
+    ("regex", r"(?i)^when", "When this enters, draw a card.", True),
+    ("regex", r"draw", None, False),
+    ("regex", r"draw", ["draw"], False),
+    ("text_match", "Draw a card", "When this enters, draw a card.", True),
+    ("text_match", "card draw", "When this enters, draw a card.", True),
+    ("text_match", "draw a card", "Draw two cards.", False),
+    ("text_match", "raw", "Draw a card.", False),
+    ("text_match", "first strike", ["Flying", "First strike"], True),
+    ("text_match", "haste", ["Flying"], False),
+    ("text_match", "angel", None, False),
+])
+def test_text_operators(op, filter_value, card_value, expected):
+    """Tests that compiled and per-card text operators agree."""
+    assert get_operator_function(op)(card_value, filter_value) is expected
+    assert compile_filters({"field": {op: filter_value}})({"field": card_value}) is expected
+
+
+def test_text_operators_validate_once():
+    """Tests that patterns and queries are checked when compiled."""
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        compile_filters({"text": {"regex": "draw ("}})
+    with pytest.raises(ValueError, match="requires a query with words"):
+        compile_filters({"text": {"text_match": " ,. "}})
+    assert get_operator_function("regex")("draw", "draw (") is False
+    assert get_operator_function("text_match")("draw", "") is False
+
+
+def test_boolean_filters():
+    """Tests $and, $or and $not, including cards lacking fields."""
+    plan = compile_filters({
+        "$or": [{"rarity": {"eq": "mythic"}}, {"colors": {"eq": []}}],
+        "$not": {"type": {"contains": "Land"}},
+    })
+
+    assert plan({"rarity": "mythic", "colors": ["G"], "type": "Creature"}) is True
+    assert plan({"rarity": "common", "colors": [], "type": "Artifact"}) is True
+    assert plan({"rarity": "common", "colors": ["G"], "type": "Creature"}) is False
+    assert plan({"rarity": "mythic", "type": "Legendary Land"}) is False
+    assert plan({"rarity": "mythic"}) is True  # Lacks type, so is not a land
+    assert compile_filters({"$and": [{"power": {"gte": 4}}, {"toughness": {"gte": 4}}]})(
+        {"power": "4", "toughness": "5"}
+    ) is True
+    assert compile_filters({"$not": {"$not": {"name": {"eq": "Opt"}}}})({"name": "Opt"}) is True
+    assert compile_filters({"$not": {"keywords": {}}})({"name": "Opt"}) is True
+    assert compile_filters({"$not": {"keywords": {}}})({"keywords": []}) is False
+
+
+def test_parse_filter_builds_flat_tree():
+    """Tests the expression tree of nested filters."""
+    root = parse_filter({
+        "type": {"eq": "Instant", "contains": "Inst"},
+        "$and": [{"rarity": {"eq": "rare"}}],
+        "$or": [{"$or": [{"name": {"eq": "A"}}, {"name": {"eq": "B"}}]}, {"name": {"eq": "C"}}],
+        "$not": {"$not": {"setCode": {"eq": "XLN"}}},
+    })
+
+    assert isinstance(root, AllOf)
+    assert [type(clause) for clause in root.clauses] == [Condition, Condition, Condition, AnyOf, Condition]
+    assert [clause.value for clause in root.clauses[3].clauses] == ["A", "B", "C"]
+    assert isinstance(parse_filter({"$not": {"name": {"eq": "A"}}}), Not)
+    assert isinstance(parse_filter({"name": {"eq": "A"}}), Condition)
+
+
+@pytest.mark.parametrize("filters, message", [
+    ({"$or": []}, "non-empty list"),
+    ({"$and": {"name": {"eq": "A"}}}, "non-empty list"),
+    ({"$nor": [{"name": {"eq": "A"}}]}, "Invalid boolean operator"),
+    ({"$not": [{"name": {"eq": "A"}}]}, "expected a mapping"),
+    ({"$or": [{"name": "A"}]}, "mapping of operators"),
+    ({"$or": [{"name": {"bogus": 1}}]}, "Invalid operator"),
+])
+def test_boolean_filters_validate(filters, message):
+    """Tests that malformed boolean filters are rejected when compiled."""
+    with pytest.raises(ValueError, match=message):
+        compile_filters(filters)
+
+
+def test_clauses_ordered_by_cost_and_selectivity():
+    """Tests that cheap, selective conditions are evaluated first."""
+    plan = compile_filters({
+        "text": {"regex": "draw"},
+        "manaValue": {"lte": 3},
+        "rarity": {"eq": "mythic"},
+    }, sample_size=0)
+    assert [clause.op for clause in plan.root.clauses] == ["eq", "lte", "regex"]
+
+    # Under $or, conditions accepting more cards come first
+    plan = compile_filters({"$or": [{"rarity": {"eq": "mythic"}}, {"rarity": {"not_in": ["common"]}}]}, sample_size=0)
+    assert [clause.op for clause in plan.root.clauses] == ["not_in", "eq"]
+
+
+def test_plan_reorders_after_sampling():
+    """Tests that measured selectivity reorders clauses once the sample is taken."""
+    plan = compile_filters({"rarity": {"eq": "common"}, "manaValue": {"lte": 1}}, sample_size=20)
+    assert [clause.field for clause in plan.root.clauses] == ["rarity", "manaValue"]
+
+    cards = [{"rarity": "common", "manaValue": 5 if i % 10 else 0} for i in range(20)]
+    results = [plan(card) for card in cards]
+
+    assert results == [card["manaValue"] == 0 for card in cards]
+    assert [clause.field for clause in plan.root.clauses] == ["manaValue", "rarity"]
+    assert plan.root.clauses[1].selectivity == pytest.approx(21 / 22)
+    assert plan.matches is plan._predicate
+    assert plan({"rarity": "common", "manaValue": 0}) is True
+
+
+@pytest.mark.parametrize("filters", [
+    {"power": {"gte": 3}, "rarity": {"eq": "rare"}, "text": {"regex": "draw"}},
+    {"text": {"text_match": "draw card"}, "toughness": {"lt": 2}, "power": {"gt": 1}},
+    {"$or": [{"power": {"lte": 1}}, {"rarity": {"in": ["mythic"]}}], "$not": {"toughness": {"gte": 4}}},
+    {"$not": {"$or": [{"power": {"gte": 2}}, {"text": {"contains": "Flying"}}]}},
+])
+def test_reordering_keeps_selected_cards(filters):
+    """Tests that the clause order, however sampled, never changes which cards match."""
+    rng = random.Random(7)
+    cards = [{
+        "power": rng.choice(["*", "1+*", "0", "2", "3", "5", None]),
+        "toughness": rng.choice(["*", "1", "4", "7-*"]),
+        "rarity": rng.choice(["common", "rare", "mythic"]),
+        "text": rng.choice(["Flying", "Draw a card.", "When this enters, draw a card.", ""]),
+    } for _ in range(300)]
+    expected = [row for row, card in enumerate(cards) if parse_filter(filters).compile()(card)]
+
+    for sample_size in (0, 5, 50):
+        for seed in range(3):
+            # Each worker samples the first cards of its own sets
+            order = list(range(len(cards)))
+            random.Random(seed).shuffle(order)
+            plan = compile_filters(filters, sample_size=sample_size)
+            assert sorted(row for row in order if plan(cards[row])) == expected
+
+    with pytest.raises(TypeError):
+        FilterNode()
+
+def _evaluate_in_threads(plan, cards, threads=8):
+    """Evaluate cards with one plan shared by several threads."""
+    results, errors = {}, []
+
+    def evaluate(start):
+        try:
+            for row in range(start, len(cards), threads):
+                results[row] = plan(cards[row])
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=evaluate, args=(start,)) for start in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert errors == []
+    return [results[row] for row in range(len(cards))]
+
+
+def test_plan_samples_safely_across_threads():
+    """Tests that threads sharing a plan count every sampled card once and reorder once."""
+    filters = {
+        "$or": [{"rarity": {"eq": "mythic"}}, {"text": {"regex": "draw"}}],
+        "manaValue": {"lte": 3},
+        "power": {"gte": 2},
+    }
+    cards = [{"rarity": ["common", "mythic"][i % 2], "text": ["", "draw"][i % 3 == 0],
+              "manaValue": i % 6, "power": ["*", "1", "3"][i % 3]} for i in range(400)]
+    expected = [parse_filter(filters).compile()(card) for card in cards]
+
+    # Switch threads as often as possible, so that they interleave while sampling
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            plan = compile_filters(filters, sample_size=100)
+            assert _evaluate_in_threads(plan, cards) == expected
+            assert plan._sampled == 100
+            assert all(condition.observed == 100 for condition in plan._observed)
+            assert plan.matches is plan._predicate
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_boolean_set_codes_and_pickling():
+    """Tests set code pushdown through $and, $or and $not, and pickling."""
+    assert compile_filters({"$or": [{"setCode": {"eq": "A"}}, {"setCode": {"in": ["B"]}}]}).set_codes == {"A", "B"}
+    assert compile_filters({"$or": [{"setCode": {"eq": "A"}}, {"name": {"eq": "B"}}]}).set_codes is None
+    assert compile_filters({"$and": [{"setCode": {"in": ["A", "B"]}}], "setCode": {"eq": "B"}}).set_codes == {"B"}
+    assert compile_filters({"$not": {"setCode": {"eq": "A"}}}).set_codes is None
+
+    filters = {"$or": [{"name": {"eq": "A"}}, {"$not": {"type": {"eq": "Land"}}}]}
+    plan = pickle.loads(pickle.dumps(compile_filters(filters, sample_size=5)))
+    assert plan.conditions == filters and plan.sample_size == 5
+    assert plan.fields == ("name", "type")
+    assert plan({"name": "B", "type": "Land"}) is False
@@ -126,3 +126,15 @@ def test_writer_stats_initialization():
     assert stats.cards_written == 15
     assert stats.sets_processed == 3
     assert stats.errors_encountered == 3
+
+def test_stats_merge_and_export():
+    """Test that writer and deck statistics merge and export as records."""
+    writer_stats = WriterStats(cards_written=3, sets_processed=1)
+    writer_stats.merge(WriterStats(cards_written=2, sets_processed=1, errors_encountered=1))
+    assert writer_stats.to_record() == {"cards_written": 5, "sets_processed": 2, "errors_encountered": 1}
+
+    deck_stats = DeckListStats(cards_found=3, cards_missing=1, total_cards=4)
+    deck_stats.merge(DeckListStats(cards_found=5, cards_missing=0, total_cards=5))
+    record = deck_stats.to_record()
+    assert (record["cards_found"], record["cards_missing"], record["total_cards"]) == (8, 1, 9)
+    assert record["success_rate"] == pytest.approx(800 / 9)
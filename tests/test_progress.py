@@ -0,0 +1,81 @@
+"""Tests for streaming progress reporting."""
+
+import io
+import json
+
+from src.io.parsers.card_stream import CardStreamReader, open_input_stream
+from src.services.progress import CountingReader, StreamProgress, input_size
+
+
+class FakeTerminal(io.StringIO):
+    """Text stream that reports itself as a terminal."""
+
+    def isatty(self):
+        return True
+
+
+class PipeStream(io.BytesIO):
+    """Binary stream that behaves like a pipe."""
+
+    def seekable(self):
+        return False
+
+
+def _document(cards: int = 10) -> bytes:
+    data = {"LEA": {"cards": [{"name": f"Card {n}", "type": "Creature"} for n in range(cards)]}}
+    return json.dumps({"meta": {}, "data": data}).encode("utf-8")
+
+
+def test_counting_reader_counts_bytes():
+    """Test that the counting reader tracks every byte read."""
+    reader = CountingReader(io.BytesIO(b"x" * 100))
+    buffered = io.BufferedReader(reader)
+    assert buffered.read() == b"x" * 100
+    assert reader.bytes_read == 100
+
+
+def test_input_size_seekable():
+    """Test that the remaining size of a seekable stream is reported."""
+    infile = io.BytesIO(b"0123456789")
+    infile.seek(4)
+    assert input_size(infile) == 6
+    assert infile.tell() == 4
+
+
+def test_input_size_pipe():
+    """Test that pipes report an unknown size."""
+    assert input_size(PipeStream(b"0123456789")) is None
+
+
+def test_disabled_progress_is_passthrough():
+    """Test that disabled progress adds no wrapper and no per-item work."""
+    infile = io.BytesIO(_document())
+    cards = iter([1, 2, 3])
+    progress = StreamProgress(infile, enabled=False, output=FakeTerminal())
+
+    assert progress.source is infile
+    assert progress.track(cards) is cards
+
+
+def test_progress_disabled_without_terminal():
+    """Test that progress is disabled when the output is not a terminal."""
+    infile = io.BytesIO(_document())
+    progress = StreamProgress(infile, enabled=True, output=io.StringIO())
+
+    assert progress.enabled is False
+    assert progress.source is infile
+
+
+def test_progress_reports_bytes_and_cards():
+    """Test that enabled progress measures bytes and reports card rates."""
+    payload = _document(cards=50)
+    output = FakeTerminal()
+    progress = StreamProgress(io.BytesIO(payload), output=output, sample_every=10, min_interval=0)
+    reader = CardStreamReader(open_input_stream(progress.source))
+
+    names = [card["name"] for _, card in progress.track(reader.iter_cards())]
+
+    assert len(names) == 50
+    assert progress.total_bytes == len(payload)
+    assert progress.bytes_read == len(payload)
+    assert "cards/s" in output.getvalue()
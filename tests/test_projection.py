@@ -0,0 +1,136 @@
+"""Tests for schema projectors compiled once per run."""
+
+import pickle
+
+import pytest
+
+from src.analysis.cards import CardProcessorInterface
+from src.core.config import CardFilterConfig
+from src.processing.projection import SchemaProjector, compile_schema, parse_schema
+
+
+@pytest.fixture
+def card():
+    """Create a card with nested values."""
+    return {
+        "name": "Sol Ring",
+        "type": "Artifact",
+        "legalities": {"commander": "Banned", "vintage": "Restricted", "modern": "Not Legal"},
+        "identifiers": {"scryfallId": "abc", "mtgoId": "42", "nested": {"deep": 1, "other": 2}},
+        "purchaseUrls": "not a mapping",
+        "foreignData": [{"language": "German", "name": "Solring"}, {"language": "French", "name": "Anneau"}],
+    }
+
+
+def test_parse_schema_merges_paths():
+    """Test that paths sharing a prefix merge and whole fields absorb subpaths."""
+    tree = parse_schema([
+        "name", "legalities.commander", "identifiers", "legalities.vintage", "identifiers.scryfallId",
+    ])
+    assert tree == {
+        "name": None,
+        "legalities": {"commander": None, "vintage": None},
+        "identifiers": None,
+    }
+    assert list(tree) == ["name", "legalities", "identifiers"]
+    assert parse_schema(["a.b.c", "a.b"]) == {"a": {"b": None}}
+
+
+@pytest.mark.parametrize("schema", [
+    ["name", ""],
+    ["legalities."],
+    [".name"],
+    ["name", 3],
+    ["foreignData.name"],
+])
+def test_invalid_paths_are_rejected(schema):
+    """Test that malformed paths fail at compile time."""
+    with pytest.raises(ValueError):
+        compile_schema(schema)
+
+
+def test_nested_paths_select_leaves(card):
+    """Test that dotted paths carry only the selected leaves."""
+    projector = compile_schema([
+        "name", "legalities.commander", "identifiers.nested.deep", "identifiers.mtgoId",
+        "purchaseUrls.tcgplayer", "rulings.text",
+    ])
+    result = projector(card)
+
+    assert result == {
+        "name": "Sol Ring",
+        "legalities": {"commander": "Banned"},
+        "identifiers": {"nested": {"deep": 1}, "mtgoId": "42"},
+    }
+    assert "modern" in card["legalities"]
+
+
+def test_defaults_apply_to_top_level_fields(card):
+    """Test that missing top-level fields get defaults and nested ones do not."""
+    projector = compile_schema(["colors", "legalities.pauper", "foreignData"])
+
+    assert projector({"name": "Bare"}) == {"colors": [], "foreignData": []}
+    assert projector(card) == {"colors": [], "foreignData": []}
+    assert projector(card, ["French"]) == {
+        "colors": [], "foreignData": [{"language": "French", "name": "Anneau"}],
+    }
+    assert projector(card)["colors"] is not projector(card)["colors"]
+
+
+@pytest.mark.parametrize("schema", [
+    None,
+    [],
+    ["name", "type"],
+    ["name", "foreignData", "colors", "language", "power"],
+    ["foreignData", "text", "availability"],
+])
+@pytest.mark.parametrize("languages", [None, ["German"]])
+def test_flat_schemas_match_card_processor(card, schema, languages):
+    """Test that flat schemas project exactly as the card processor did."""
+    result = compile_schema(schema)(card, languages)
+    processor = CardProcessorInterface(CardFilterConfig())
+    reference = processor._apply_final_schema(
+        processor._process_language_data(processor.create_base_card(card), card, languages), schema
+    )
+
+    assert result == reference
+    assert list(result) == list(reference)
+
+
+def test_projector_pickles(card):
+    """Test that projectors keep their paths and survive pickling."""
+    projector = SchemaProjector(["name", "legalities.commander"])
+    restored = pickle.loads(pickle.dumps(projector))
+
+    assert projector.schema == ("name", "legalities.commander")
+    assert projector == restored and projector != ["name", "legalities.commander"]
+    assert restored(card) == projector(card)
+    assert compile_schema(projector) is projector
+
+
+def test_projector_without_schema_keeps_every_field(card):
+    """Test that no schema, compiled or not, keeps every field, unlike an empty one."""
+    processor = CardProcessorInterface(CardFilterConfig())
+    full, empty = compile_schema(None), compile_schema([])
+
+    assert full.schema is None and empty.schema == ()
+    assert full(card)["legalities"] == card["legalities"]
+    assert empty(card) == {}
+    assert processor.process_card(card, schema=full) == processor.process_card(card, schema=None)
+    assert processor.process_card(card, schema=empty) == {}
+
+
+def test_card_processor_reuses_projector(card):
+    """Test that the card processor compiles a schema once while it is unchanged."""
+    processor = CardProcessorInterface(CardFilterConfig())
+    schema = ["name", "legalities.commander"]
+
+    projector = processor.get_projector(schema)
+    assert processor.process_card(card, schema=schema) == {
+        "name": "Sol Ring", "legalities": {"commander": "Banned"},
+    }
+    assert processor.get_projector(schema) is projector
+    assert processor.get_projector(projector) is projector
+
+    schema.append("type")
+    assert processor.get_projector(schema) is not projector
@@ -224,3 +224,17 @@ def test_error_propagation(service, mock_file_handler, mock_logger):
     with pytest.raises(CardFilterServiceError) as exc_info:
         service.process_cards("input.json", "output.json")
     assert "Test error" in str(exc_info.value)
+
+
+def test_process_cards_from_stdin(service, mock_file_handler):
+    """Test that '-' reads from standard input without file validation."""
+    stdin = Mock()
+    stdin.buffer = io.BytesIO(b'{"data": {}}')
+
+    with patch("src.services.analysis.sys.stdin", stdin):
+        service.process_cards(input_file="-", output_file="output.json")
+
+    mock_file_handler.validate_input_file.assert_not_called()
+    mock_file_handler.open_file.assert_called_once_with("output.json", mode='wb')
+    call_args = service.processor.process_file_stream.call_args[1]
+    assert call_args["infile"] is stdin.buffer
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch, mock_open, MagicMock
 from io import BytesIO
 import json
 
+from src.services.parallel import DEFAULT_SETS_PER_WORKER
 from src.services.file_stream import (
     FileProcessor,
     FileProcessorError,
@@ -135,53 +136,6 @@ def test_process_card_error(processor, mock_logger):
     processor.logging.error.assert_called_once()
 
 
-def test_handle_prefix(processor):
-    """Test handling prefix events."""
-    mock_set_writer = MagicMock()
-    current_state = {
-        'current_card': {},
-        'current_set': None
-    }
-    
-    processor._handle_prefix(
-        "data.LEA.cards.item",
-        "start_map",
-        None,
-        current_state,
-        mock_set_writer,
-        MagicMock(),
-        None,
-        None,
-        None
-    )
-    
-    assert current_state['current_card'] == {}
-    mock_set_writer.handle_set_transition.assert_called_once_with("LEA")
-
-
-def test_handle_prefix_error(processor, mock_logger):
-    """Test error handling in prefix handling."""
-    mock_set_writer = MagicMock()
-    mock_card_processor = MagicMock()
-    mock_card_processor.process_card.side_effect = Exception("Test error")
-    
-    with pytest.raises(StreamProcessingError):
-        processor._handle_prefix(
-            "data.LEA.cards.item",
-            "end_map",
-            None,
-            {'current_card': {'name': 'Test Card'}, 'current_set': 'LEA'},
-            mock_set_writer,
-            mock_card_processor,
-            None,
-            None,
-            None
-        )
-    # The error is logged twice: once for process_card and once for handle_prefix
-    assert processor.logging.error.call_count == 2
-    assert "Failed to process card: Test error" in processor.logging.error.call_args_list[0][0][0]
-    assert "Failed to handle prefix" in processor.logging.error.call_args_list[1][0][0]
-
 def test_process_file_stream(processor):
     """Test complete file stream processing."""
     input_data = {
@@ -237,3 +191,304 @@ def test_process_file_stream_error(processor, mock_logger):
     with pytest.raises(FileProcessorError):
         processor.process_file_stream(infile, outfile, mock_card_processor)
     processor.logging.error.assert_called()
+
+
+class NonSeekableStream(BytesIO):
+    """Binary stream that behaves like a pipe."""
+
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise OSError("Stream is not seekable")
+
+    def tell(self):
+        raise OSError("Stream is not seekable")
+
+
+@pytest.fixture
+def card_processor(mock_config):
+    """Create a real card processor."""
+    from src.analysis.cards import CardProcessorInterface
+    return CardProcessorInterface(mock_config)
+
+
+def _dump(meta_first=True):
+    """Build a small card dump with the meta section before or after the data."""
+    data = {"LEA": {"block": None, "cards": [
+        {"name": "Serra Angel", "type": "Creature", "convertedManaCost": 5.0},
+        {"name": "Counterspell", "type": "Instant", "convertedManaCost": 2.0},
+    ]}, "LEB": {"block": None, "cards": [
+        {"name": "Shivan Dragon", "type": "Creature", "convertedManaCost": 6.0},
+    ]}}
+    meta = {"date": "2024-11-23", "version": "5.2.2"}
+    parts = [("meta", meta), ("data", data)]
+    if not meta_first:
+        parts.reverse()
+    return "{" + ",".join(f'"{k}":{json.dumps(v)}' for k, v in parts) + "}"
+
+
+def test_process_file_stream_writes_cards(processor, card_processor):
+    """Test that filtered cards produce a valid output document."""
+    infile = BytesIO(_dump().encode('utf-8'))
+    outfile = BytesIO()
+
+    processor.process_file_stream(infile, outfile, card_processor, schema=["name", "type"])
+
+    result = json.loads(outfile.getvalue())
+    assert result["meta"] == {"date": "2024-11-23", "version": "5.2.2"}
+    assert result["data"]["LEA"]["cards"] == [
+        {"name": "Serra Angel", "type": "Creature"},
+        {"name": "Counterspell", "type": "Instant"},
+    ]
+    assert result["data"]["LEB"]["cards"] == [{"name": "Shivan Dragon", "type": "Creature"}]
+
+
+def test_process_file_stream_meta_after_data(processor, card_processor):
+    """Test that metadata following the data section is preserved as a trailer."""
+    infile = BytesIO(_dump(meta_first=False).encode('utf-8'))
+    outfile = BytesIO()
+
+    processor.process_file_stream(infile, outfile, card_processor, schema=["name", "type"])
+
+    result = json.loads(outfile.getvalue())
+    assert result["meta"]["version"] == "5.2.2"
+    assert len(result["data"]["LEA"]["cards"]) == 2
+
+
+def test_process_file_stream_non_seekable(processor, card_processor):
+    """Test single-pass processing of a pipe-like input."""
+    infile = NonSeekableStream(_dump().encode('utf-8'))
+    outfile = BytesIO()
+
+    processor.process_file_stream(infile, outfile, card_processor, schema=["name", "type"])
+
+    result = json.loads(outfile.getvalue())
+    assert result["meta"]["date"] == "2024-11-23"
+    assert len(result["data"]["LEB"]["cards"]) == 1
+
+
+def test_process_file_stream_gzip(processor, card_processor):
+    """Test processing of a gzip compressed, non-seekable input."""
+    import gzip
+    infile = NonSeekableStream(gzip.compress(_dump().encode('utf-8')))
+    outfile = BytesIO()
+
+    processor.process_file_stream(infile, outfile, card_processor, schema=["name", "type"])
+
+    result = json.loads(outfile.getvalue())
+    assert [card["name"] for card in result["data"]["LEA"]["cards"]] == ["Serra Angel", "Counterspell"]
+
+
+def test_process_file_stream_preserves_nested_values(processor, card_processor):
+    """Test that nested card values survive streaming."""
+    card = {
+        "name": "Serra Angel",
+        "type": "Creature",
+        "legalities": {"commander": "Legal"},
+        "identifiers": {"scryfallId": "abc"},
+    }
+    document = {"meta": {}, "data": {"LEA": {"cards": [card]}}}
+    infile = BytesIO(json.dumps(document).encode('utf-8'))
+    outfile = BytesIO()
+
+    processor.process_file_stream(
+        infile, outfile, card_processor, schema=["name", "type", "legalities", "identifiers"]
+    )
+
+    result = json.loads(outfile.getvalue())
+    assert result["data"]["LEA"]["cards"] == [card]
+
+
+def test_process_file_stream_invalid_json(processor, mock_logger):
+    """Test that malformed input raises a stream processing error."""
+    infile = BytesIO(b'{"meta": {"version": "1.0"}, "data": {"LEA": ')
+    outfile = BytesIO()
+
+    with pytest.raises(StreamProcessingError):
+        processor.process_file_stream(infile, outfile, MagicMock())
+
+
+@pytest.mark.parametrize("meta_first", [True, False])
+def test_process_file_stream_parallel_matches_serial(processor, card_processor, meta_first):
+    """Test that set-sharded processing writes the same bytes as streaming."""
+    document = json.loads(_dump(meta_first))
+    document["data"]["EMP"] = {"block": None, "cards": []}
+    payload = json.dumps(document).encode('utf-8')
+    filters = {"convertedManaCost": {"gt": 2}}
+
+    serial, parallel = BytesIO(), BytesIO()
+    processor.process_file_stream(
+        BytesIO(payload), serial, card_processor, schema=["name", "type"], filters=filters
+    )
+    processor.process_file_stream(
+        BytesIO(payload), parallel, card_processor, schema=["name", "type"], filters=filters,
+        workers=2
+    )
+
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_process_file_stream_parallel_meta_last_matches_serial(processor, card_processor):
+    """Test that trailing metadata stays a trailer when sets outnumber the pending limit."""
+    workers = 2
+    sets = {
+        f"S{index:02d}": {"block": None, "cards": [{"name": f"Card {index}", "type": "Creature"}]}
+        for index in range(workers * DEFAULT_SETS_PER_WORKER + 4)
+    }
+    payload = json.dumps({"data": sets, "meta": {"version": "5.2.2"}}).encode('utf-8')
+
+    serial, parallel = BytesIO(), BytesIO()
+    processor.process_file_stream(BytesIO(payload), serial, card_processor, schema=["name", "type"])
+    processor.process_file_stream(
+        BytesIO(payload), parallel, card_processor, schema=["name", "type"], workers=workers
+    )
+
+    assert parallel.getvalue() == serial.getvalue()
+    assert serial.getvalue().startswith(b'{"data":')
+    assert json.loads(serial.getvalue())["meta"] == {"version": "5.2.2"}
+
+
+def test_process_file_stream_parallel_error(processor, card_processor, mock_logger):
+    """Test that malformed input is reported by the parallel path."""
+    infile = BytesIO(b'{"data": {"LEA": {"cards": [{"name": }]}}}')
+
+    with pytest.raises(StreamProcessingError):
+        processor.process_file_stream(infile, BytesIO(), card_processor, workers=2)
+    mock_logger.error.assert_called()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_file_stream_skips_excluded_sets(processor, card_processor, workers):
+    """Test that sets excluded by a setCode filter are skipped entirely."""
+    document = json.loads(_dump())
+    for set_code, set_data in document["data"].items():
+        for card in set_data["cards"]:
+            card["setCode"] = set_code
+    outfile = BytesIO()
+
+    processor.process_file_stream(
+        BytesIO(json.dumps(document).encode('utf-8')), outfile, card_processor,
+        schema=["name", "type"], filters={"setCode": {"eq": "LEB"}}, workers=workers
+    )
+
+    result = json.loads(outfile.getvalue())
+    assert list(result["data"]) == ["LEB"]
+    assert result["data"]["LEB"]["cards"] == [{"name": "Shivan Dragon", "type": "Creature"}]
+
+
+def test_process_file_stream_compiles_filters_once(processor, card_processor, mock_config):
+    """Test that every card, serial or in a worker, is filtered by one compiled plan."""
+    from src.services import parallel
+
+    filters = {"type": {"eq": "Creature"}}
+    with patch("src.analysis.cards.compile_filters") as per_card:
+        outfile = BytesIO()
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), outfile, card_processor, schema=["name", "type"], filters=filters
+        )
+        assert [card["name"] for cards in json.loads(outfile.getvalue())["data"].values()
+                for card in cards["cards"]] == ["Serra Angel", "Shivan Dragon"]
+
+        parallel._init_worker(card_processor, mock_config, filters, ["name", "type"], None)
+        fragment = parallel.filter_set("LEA", json.dumps(json.loads(_dump())["data"]["LEA"]).encode('utf-8'))
+        assert b"Serra Angel" in fragment and b"Counterspell" not in fragment
+    per_card.assert_not_called()
+    assert parallel._worker_state["filters"].conditions == filters
+
+def test_process_file_stream_invalid_filters(processor, card_processor, mock_logger):
+    """Test that invalid filters are rejected before any output is written."""
+    outfile = BytesIO()
+
+    with pytest.raises(FileProcessorError, match="Invalid filters"):
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), outfile, card_processor,
+            filters={"name": {"invalid": "value"}}
+        )
+    assert outfile.getvalue() == b""
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_file_stream_nested_schema(processor, card_processor, workers):
+    """Test that dotted schema paths select nested values in either mode."""
+    card = {
+        "name": "Sol Ring",
+        "type": "Artifact",
+        "legalities": {"commander": "Banned", "vintage": "Restricted"},
+        "identifiers": {"scryfallId": "abc", "mtgoId": "42"},
+    }
+    document = {"meta": {}, "data": {"LEA": {"cards": [card]}}}
+    outfile = BytesIO()
+
+    processor.process_file_stream(
+        BytesIO(json.dumps(document).encode('utf-8')), outfile, card_processor,
+        schema=["name", "type", "legalities.commander", "identifiers.scryfallId"], workers=workers
+    )
+
+    result = json.loads(outfile.getvalue())
+    assert result["data"]["LEA"]["cards"] == [
+        {
+            "name": "Sol Ring", "type": "Artifact",
+            "legalities": {"commander": "Banned"}, "identifiers": {"scryfallId": "abc"},
+        }
+    ]
+
+
+def test_process_file_stream_invalid_schema(processor, card_processor, mock_logger):
+    """Test that an invalid schema is rejected before any output is written."""
+    outfile = BytesIO()
+
+    with pytest.raises(FileProcessorError, match="Invalid schema"):
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), outfile, card_processor, schema=["name", "legalities..x"]
+        )
+    assert outfile.getvalue() == b""
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("languages", [None, ["German"]])
+def test_process_file_stream_prunes_translations(processor, card_processor, workers, languages):
+    """Test that dropping unrequested translations while parsing leaves the output unchanged."""
+    card = {
+        "name": "Serra Angel",
+        "type": "Creature",
+        "foreignData": [
+            {"language": "French", "name": "Ange de Serra"},
+            {"language": "German", "name": "Serra-Engel"},
+        ],
+    }
+    document = json.dumps({"meta": {}, "data": {"LEA": {"cards": [card]}}}).encode('utf-8')
+    outputs = []
+    for prune in (False, True):
+        outfile = BytesIO()
+        processor.process_file_stream(
+            BytesIO(document), outfile, card_processor, schema=["name", "type", "foreignData"],
+            additional_languages=languages, workers=workers, prune_foreign_data=prune
+        )
+        outputs.append(outfile.getvalue())
+
+    assert outputs[0] == outputs[1]
+    expected = [{"language": "German", "name": "Serra-Engel"}] if languages else []
+    assert json.loads(outputs[1])["data"]["LEA"]["cards"][0]["foreignData"] == expected
+
+
+def test_process_file_stream_keeps_translations_for_filters(processor, card_processor):
+    """Test that translations are pruned only on request and when the filters do not read them."""
+    from src.io.parsers.card_stream import ForeignDataPruner
+    with patch('src.services.file_stream.ForeignDataPruner', wraps=ForeignDataPruner) as pruner:
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), BytesIO(), card_processor,
+            filters={"foreignData": {"eq": []}}, additional_languages=["German"], prune_foreign_data=True
+        )
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), BytesIO(), card_processor,
+            filters={"type": {"eq": "Creature"}}, additional_languages=["German"]
+        )
+        pruner.assert_not_called()
+
+        processor.process_file_stream(
+            BytesIO(_dump().encode('utf-8')), BytesIO(), card_processor,
+            filters={"type": {"eq": "Creature"}}, additional_languages=["German", "German"],
+            prune_foreign_data=True
+        )
+        pruner.assert_called_once_with(frozenset({"German"}))
@@ -62,6 +62,25 @@ def test_parse_filter_string_numeric(parser):
         "toughness": {"eq": 5.5}
     }
 
+def test_parse_filter_string_boolean(parser):
+    """Test parsing $and, $or and $not with shorthand values at any depth."""
+    result = parser.parse_filter_string(
+        '{"$or": [{"rarity": "mythic"}, {"colors": ["W", "U"]}],'
+        ' "$not": {"type": {"contains": "Land"}}, "$and": [{"power": 5}]}'
+    )
+    assert result == {
+        "$or": [{"rarity": {"eq": "mythic"}}, {"colors": {"in": ["W", "U"]}}],
+        "$not": {"type": {"contains": "Land"}},
+        "$and": [{"power": {"eq": 5}}],
+    }
+
+def test_parse_filter_string_invalid_boolean(parser):
+    """Test that malformed boolean filters are rejected when parsed."""
+    with pytest.raises(FilterParseError, match="non-empty list"):
+        parser.parse_filter_string('{"$or": {"rarity": "mythic"}}')
+    with pytest.raises(FilterParseError, match="Invalid operator"):
+        parser.parse_filter_string('{"$not": {"rarity": {"like": "myth"}}}')
+
 def test_validate_prefix_valid(parser):
     """Test validation of valid prefixes."""
     valid, set_name = parser.validate_prefix("data.m19")
@@ -0,0 +1,93 @@
+"""Tests for the statistics primitives shared by batch processing."""
+
+import json
+import pickle
+
+import pytest
+
+from src.utils.stats import HISTOGRAM_BUCKETS, LatencyHistogram, RateWindow, WorkerCounters
+
+
+def test_histogram_buckets():
+    """Test that durations land in power-of-two microsecond buckets."""
+    histogram = LatencyHistogram()
+    for seconds in (0.0000005, 0.000003, 0.000003, 0.001, 10 ** 9):
+        histogram.record(seconds)
+
+    assert histogram.counts[0] == 1  # Under a microsecond
+    assert histogram.counts[2] == 2  # 2 to 4 microseconds
+    assert histogram.counts[10] == 1  # 512 to 1024 microseconds
+    assert histogram.counts[HISTOGRAM_BUCKETS - 1] == 1  # Overflow
+    assert histogram.count == 5
+    assert histogram.max == 10 ** 9
+
+
+def test_histogram_quantiles():
+    """Test that quantiles are bucket bounds, capped at the maximum."""
+    histogram = LatencyHistogram()
+    assert histogram.quantile(0.5) == 0.0
+    assert histogram.mean == 0.0
+
+    for _ in range(90):
+        histogram.record(0.000100)
+    for _ in range(10):
+        histogram.record(0.010)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.000128)
+    assert histogram.quantile(0.9) == pytest.approx(0.000128)
+    assert histogram.quantile(0.99) == pytest.approx(0.010)
+    assert histogram.quantile(1.0) == pytest.approx(0.010)
+    assert histogram.mean == pytest.approx(0.00109)
+    with pytest.raises(ValueError, match="Quantile"):
+        histogram.quantile(1.5)
+
+
+def test_histogram_merge():
+    """Test that merging histograms equals recording into one."""
+    first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for index, seconds in enumerate([0.001, 0.002, 0.5, 0.00001, 0.03]):
+        (first if index % 2 else second).record(seconds)
+        combined.record(seconds)
+
+    first.merge(second)
+    assert first.counts == combined.counts
+    assert first.count == combined.count
+    assert first.total == pytest.approx(combined.total)
+    assert first.max == combined.max
+
+
+def test_histogram_record_is_json_serializable():
+    """Test that the exported record survives a JSON round trip."""
+    histogram = LatencyHistogram()
+    histogram.record(0.002)
+    record = json.loads(json.dumps(histogram.to_record()))
+    assert record["count"] == 1
+    assert record["buckets"] == [[pytest.approx(0.002048), 1]]
+    assert record["p50"] == pytest.approx(0.002)
+
+
+def test_rate_window():
+    """Test that the rate covers only the recent window."""
+    window = RateWindow(window=10.0, now=0.0)
+    assert window.rate(now=0.0) == 0.0
+
+    window.add(100, now=2.0)
+    assert window.rate(now=5.0) == pytest.approx(20.0)  # Over the 5s since creation
+
+    window.add(100, now=11.0)
+    assert window.rate(now=12.0) == pytest.approx(10.0)  # The first 100 left the window
+    assert window.rate(now=30.0) == 0.0
+
+    with pytest.raises(ValueError, match="window"):
+        RateWindow(window=0)
+
+
+def test_worker_counters_merge_and_pickle():
+    """Test that worker counters merge and survive the trip from a process."""
+    counters = WorkerCounters(processed=3, filtered=2, failed=1)
+    counters.latency.record(0.001)
+    other = pickle.loads(pickle.dumps(counters))
+
+    other.merge(counters)
+    assert (other.processed, other.filtered, other.failed, other.cards) == (6, 4, 2, 12)
+    assert other.latency.count == 2
@@ -0,0 +1,75 @@
+"""Tests for the word index over card text."""
+
+import pytest
+
+from src.analysis.card_table import CardTable
+from src.analysis.text_index import TEXT_FIELDS, TokenIndex
+from src.processing.filters import compile_filters
+
+
+@pytest.fixture
+def cards():
+    """Create cards with rules text, type lines and keywords."""
+    return [
+        {"name": "Opt", "type": "Instant", "text": "Scry 1. Draw a card."},
+        {"name": "Divination", "type": "Sorcery", "text": "Draw two cards."},
+        {"name": "Serra Angel", "type": "Creature — Angel", "text": "Flying, vigilance",
+         "keywords": ["Flying", "Vigilance"], "manaValue": 5},
+        {"name": "Elvish Visionary", "type": "Creature — Elf Shaman",
+         "text": "When this creature enters, draw a card.", "manaValue": 2},
+        {"name": "Vanilla", "type": "Creature — Bear", "manaValue": 2},
+    ]
+
+
+def test_rows_intersect_words(cards):
+    """Test that queries return the rows holding every word."""
+    index = TokenIndex(cards)
+
+    assert index.fields == TEXT_FIELDS
+    assert index.rows("text", "draw a card") == [0, 3]
+    assert index.rows("text", "Card DRAW") == [0, 3]
+    assert index.rows("type", "creature") == [2, 3, 4]
+    assert index.rows("keywords", "flying") == [2]
+    assert index.rows("text", "draw treasure") == []
+    with pytest.raises(KeyError):
+        index.rows("name", "opt")
+
+
+def test_candidates_cover_text_match_conditions(cards):
+    """Test that only plans with indexed text_match conditions get candidates."""
+    index = TokenIndex(cards, fields=["text", "type"])
+
+    assert index.candidates(compile_filters({"manaValue": {"eq": 2}})) is None
+    assert index.candidates(compile_filters({"keywords": {"text_match": "flying"}})) is None
+    assert index.candidates(compile_filters({
+        "text": {"text_match": "draw a card"}, "type": {"text_match": "creature"},
+    })) == [3]
+
+
+@pytest.mark.parametrize("filters", [
+    {"text": {"text_match": "draw a card"}},
+    {"text": {"text_match": "draw"}, "manaValue": {"eq": 2}},
+    {"type": {"text_match": "creature"}, "text": {"contains": "Flying"}},
+    {"keywords": {"text_match": "vigilance"}},
+    {"text": {"text_match": "flying"}, "keywords": {"text_match": "haste"}},
+    {"text": {"regex": r"draw (a|two) cards?"}},
+    {"keywords": {}, "text": {"text_match": "draw card"}},
+    {"manaValue": {}, "type": {"text_match": "creature"}},
+])
+def test_indexed_table_matches_plan(cards, filters):
+    """Test that indexed and unindexed tables agree with the plan."""
+    plan = compile_filters(filters)
+    expected = [row for row, card in enumerate(cards) if all(field in card for field in plan.fields) and plan(card)]
+
+    indexed = CardTable(cards, text_fields=TEXT_FIELDS)
+    assert indexed.select(filters) == expected
+    assert CardTable(cards).select(filters) == expected
+
+
+def test_residual_keeps_field_presence(cards):
+    """Test that fields required without conditions are left to evaluate."""
+    index = TokenIndex(cards)
+    plan = compile_filters({"keywords": {}, "text": {"text_match": "draw card"}})
+
+    assert index.residual(plan).conditions == {"keywords": {}}
+    assert index.residual(compile_filters({"text": {"text_match": "draw"}})).conditions == {}